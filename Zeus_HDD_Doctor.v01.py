@@ -2,258 +2,64 @@ import sys
 import subprocess
 import os
 import re
+import time
+
+# Arayüzsüz tarama (--json) ve arka plan kipi (--daemon) Qt ve aşağıdaki modüller yüklenmeden, pencere açılmadan çalışır
+if __name__ == "__main__" and ("--json" in sys.argv[1:] or "--daemon" in sys.argv[1:]):
+    from zeus_core.headless import main as headless_main
+    sys.exit(headless_main(sys.argv[1:]))
+
+from zeus_core.aio import AsyncSmartEngine
+from zeus_core.enumeration import DiskListError, get_disk_list as get_core_disk_list
+from zeus_core.history import attribute_series, disk_trend, history_disk_key, history_summary, record_history
+from zeus_core.hotplug import RESYNC_ACTION, open_uevent_monitor
+from zeus_core.parsing import parse_smart_attributes, parse_smart_info, parse_smart_snapshot
+from zeus_core.rollups import RESOLUTION_NAMES
+from zeus_core.result_cache import STALE, SmartResultCache, format_cache_stats, smart_cache_key
+from zeus_core.scoring import calculate_health_score, score_attributes
+from zeus_core.snapshots import is_standby_note
+from zeus_core.trends import DEGRADING_STATUS, format_trend_notes
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
     QTextEdit, QListWidget, QListWidgetItem, QSizePolicy, QMessageBox,
-    QDialog
+    QDialog, QComboBox
 )
 from PyQt5.QtGui import QColor, QFont, QPixmap
-from PyQt5.QtCore import Qt, QTimer, QSize, QProcess 
+from PyQt5.QtCore import Qt, QTimer, QSize, QProcess, QSocketNotifier, pyqtSignal
 
 # smartctl ve disk bilgileri ile ilgili fonksiyonlar
 def get_disk_list():
     """
     Sistemdeki diskleri listeler.
+    Diskler doğrudan /sys/block'tan okunur; sysfs kullanılamıyorsa lsblk'ye geri dönülür.
     """
     try:
-        output = subprocess.check_output(['lsblk', '-o', 'NAME,SIZE,TYPE,MODEL,VENDOR', '-n']).decode('utf-8')
-        disks = []
-        for line in output.splitlines():
-            parts = line.strip().split()
-            if len(parts) >= 3 and parts[2] == "disk":
-                disk_name = parts[0]
-                disk_size = parts[1]
-                model_vendor_parts = parts[3:]
-                full_model_vendor = " ".join(model_vendor_parts).strip() 
-
-                full_name = f"{disk_name} ({disk_size}) - {full_model_vendor}".strip()
-
-                disks.append({'path': f"/dev/{disk_name}", 'name': full_name})
-        return disks
-    except FileNotFoundError:
-        QMessageBox.critical(None, "Hata", "lsblk komutu bulunamadı. Lütfen yüklü olduğundan emin olun.")
-        return []
-    except subprocess.CalledProcessError as e:
-        error_detail = e.stderr.decode('utf-8').strip() if e.stderr else "Detay yok."
-        QMessageBox.critical(None, "Hata", f"lsblk komutu çalıştırılırken sorun oluştu: {error_detail}")
+        return get_core_disk_list()
+    except DiskListError as e:
+        QMessageBox.critical(None, "Hata", str(e))
         return []
 
-def get_smart_data(disk_path):
-    """
-    Belirtilen diskin SMART verilerini smartctl komutu ile alır.
-    Program zaten root yetkisiyle çalışacağı için 'sudo' veya 'pkexec' kullanmaya gerek yok.
-    """
-    attributes_output = None
-    info_output = None
-    error_message = ""
-
-    # Denenecek aygıt tipleri listesi
-    device_types = ['sat', 'nvme', 'usb', 'usbjm', 'usbscsi', 'jmicron', 'scsi', 'ata']
-
-    for dev_type in device_types:
-        try:
-            attributes_output = subprocess.check_output(['smartctl', '-A', '-d', dev_type, disk_path], stderr=subprocess.PIPE, timeout=20).decode('utf-8')
-            info_output = subprocess.check_output(['smartctl', '-i', '-d', dev_type, disk_path], stderr=subprocess.PIPE, timeout=20).decode('utf-8')
-
-            if "SMART support is: Disabled" in info_output or "SMART Disabled" in info_output:
-                error_message = f"Disk '{disk_path}' SMART özelliğini desteklemiyor veya devre dışı."
-                attributes_output = None
-                info_output = None
-                return None, None, error_message
-
-            return attributes_output, info_output, "" # Hata yok
-        except subprocess.CalledProcessError as e:
-            error_detail = e.stderr.decode('utf-8').strip() if e.stderr else "Detay yok."
-            error_message = f"smartctl '{dev_type}' tipiyle '{disk_path}' için çalıştırılamadı. Hata: {error_detail}"
-            attributes_output = None
-            info_output = None
-        except FileNotFoundError:
-            error_message = "smartctl komutu bulunamadı. Lütfen smartmontools yüklü olduğundan emin olun."
-            return None, None, error_message
-        except subprocess.TimeoutExpired:
-            error_message = f"smartctl '{dev_type}' tipiyle '{disk_path}' için zaman aşımına uğradı."
-            return None, None, error_message
-        except Exception as e:
-            error_message = f"Bilinmeyen bir hata oluştu: {e}"
-            return None, None, error_message
-
-    return None, None, error_message if error_message else f"Disk '{disk_path}' için SMART verileri alınamadı veya desteklenmiyor."
-
-
-def parse_smart_attributes(smart_attributes_output):
-    """
-    smartctl -A çıktısını ayrıştırarak SMART özniteliklerini bir sözlük listesi olarak döndürür.
-    Genişletilmiş regex ile tüm olası attribute satırlarını yakalamaya çalışır.
-    """
-    attributes = []
-
-    attribute_pattern = re.compile(
-        r'^\s*(\d+)\s+([a-zA-Z0-9_]+)\s+'     # 1: ID, 2: Name
-        r'(\S+)\s+'                         # 3: Flags (örn: 0x000f, or '---')
-        r'(\d+)\s+'                         # 4: Current Value
-        r'(\d+)\s+'                         # 5: Worst Value
-        r'(\d+)\s+'                         # 6: Threshold Value
-        r'(\S+)\s+'                         # 7: Type (Pre-fail, Old_age)
-        r'(\S+)\s+'                         # 8: Updated (Always, Offline)
-        r'(\S+)\s+'                         # 9: When_Failed (-, In_the_past)
-        r'([-]?\d+)$'                       # 10: Raw_Value (integer, possibly negative, at end of line)
-    )
-
-    start_parsing = False
-    for line in smart_attributes_output.splitlines():
-        if "ID# ATTRIBUTE_NAME" in line:
-            start_parsing = True
-            continue
-        if start_parsing:
-            if line.strip() == "" or "SMART Error Log" in line or "SMART Self-test Log" in line:
-                break
-
-            match = attribute_pattern.match(line)
-            if match:
-                try:
-                    attr = {
-                        "ID": int(match.group(1)),
-                        "Name": match.group(2),
-                        "Current": int(match.group(4)),
-                        "Worst": int(match.group(5)),
-                        "Threshold": int(match.group(6)),
-                        "Type": match.group(7),
-                        "Updated": match.group(8),
-                        "Raw_Value": int(match.group(10))
-                    }
-                    attributes.append(attr)
-                except ValueError as ve:
-                    raw_val_str = match.group(10)
-                    try:
-                        attr = {
-                            "ID": int(match.group(1)),
-                            "Name": match.group(2),
-                            "Current": int(match.group(4)),
-                            "Worst": int(match.group(5)),
-                            "Threshold": int(match.group(6)),
-                            "Type": match.group(7),
-                            "Updated": match.group(8),
-                            "Raw_Value": 0 if raw_val_str.strip() == '-' or not raw_val_str.strip() else int(raw_val_str)
-                        }
-                        attributes.append(attr)
-                    except Exception as e:
-                        pass
-            else:
-                pass
-    return attributes
-
-
-def parse_smart_info(smart_info_output):
-    """
-    smartctl -i çıktısından disk bilgilerini ayrıştırır.
-    """
-    info = {}
-    lines = smart_info_output.splitlines()
-    for line in lines:
-        if "Model Family:" in line:
-            info["Model Family"] = line.split(":", 1)[1].strip()
-        elif "Device Model:" in line:
-            info["Device Model"] = line.split(":", 1)[1].strip()
-        elif "Serial Number:" in line:
-            info["Serial Number"] = line.split(":", 1)[1].strip()
-        elif "Firmware Version:" in line:
-            info["Firmware Version"] = line.split(":", 1)[1].strip()
-        elif "User Capacity:" in line:
-            match = re.search(r'\[(.*?)\]', line)
-            info["User Capacity"] = match.group(1) if match else line.split(":", 1)[1].strip().split("bytes")[0].strip()
-        elif "Rotation Rate:" in line:
-            info["Rotation Rate"] = line.split(":", 1)[1].strip()
-        elif "SMART support is:" in line:
-            info["SMART Supported"] = "Enabled" if "Enabled" in line else "Disabled"
-        elif "Local Time is:" in line:
-            info["Local Time"] = line.split(":", 1)[1].strip()
-        elif "Power On Hours:" in line:
-            match = re.search(r'(\d+)\s+hours', line)
-            if match:
-                info["Power On Hours"] = match.group(1) + " hours"
-        elif "Power Cycle Count:" in line:
-            match = re.search(r'(\d+)', line)
-            if match:
-                info["Power Cycle Count"] = match.group(1)
-        elif "Wear_Leveling_Count" in line:
-             match = re.match(r'.*Wear_Leveling_Count\s+.*?\s+(\d+)', line)
-             if match:
-                 info["Wear Leveling"] = match.group(1)
-        elif "Media_Wearout_Indicator" in line:
-             match = re.match(r'.*Media_Wearout_Indicator\s+.*?\s+(\d+)', line)
-             if match:
-                 info["Media Wearout"] = match.group(1)
-        elif "Data Units Written:" in line:
-            info["Data Units Written"] = line.split(":", 1)[1].strip()
-        elif "Data Units Read:" in line:
-            info["Data Units Read"] = line.split(":", 1)[1].strip()
-
-    return info
-
-def calculate_health_score(attributes, disk_info):
-    """
-    SMART özniteliklerine göre basit bir sağlık puanı hesaplar (0-100).
-    """
-    score = 100
-    critical_raw_value_attributes_ids = {
-        1, 5, 7, 196, 197, 198, 199
-    }
-
-    warnings = []
-
-    for attr in attributes:
-        if attr["Threshold"] > 0 and attr["Current"] < attr["Threshold"]:
-            score -= 15
-            warnings.append(f"'{attr['Name']}' (ID:{attr['ID']}) kritik eşik ({attr['Threshold']}) altında ({attr['Current']})!")
-
-        if attr["ID"] in critical_raw_value_attributes_ids and attr["Raw_Value"] > 0:
-            score -= 10
-            warnings.append(f"'{attr['Name']}' (ID:{attr['ID']}) Raw Value'u 0'dan büyük ({attr['Raw_Value']})!")
-
-        if attr["ID"] == 194 or "Temperature" in attr["Name"]:
-            current_temp = attr["Raw_Value"] if attr["ID"] == 194 else attr["Current"]
-            if current_temp > 50:
-                score -= 5
-                warnings.append(f"Disk sıcaklığı yüksek ({current_temp}°C).")
-            elif current_temp > 60:
-                score -= 15
-                warnings.append(f"DİKKAT: Disk sıcaklığı çok yüksek ({current_temp}°C)!")
-
-        if attr["ID"] == 177 and attr["Raw_Value"] > 0:
-            if attr["Raw_Value"] > 50000:
-                score -= 5
-                warnings.append(f"SSD yıpranma düzeyi yüksek: {attr['Raw_Value']} (Wear_Leveling_Count).")
-        elif attr["ID"] == 233 and attr["Raw_Value"] < 100:
-            if attr["Raw_Value"] < 20:
-                score -= 20
-                warnings.append(f"SSD yıpranma düzeyi kritik: %{attr['Raw_Value']} (Media_Wearout_Indicator).")
-            elif attr["Raw_Value"] < 50:
-                score -= 10
-                warnings.append(f"SSD yıpranma düzeyi yüksek: %{attr['Raw_Value']} (Media_Wearout_Indicator).")
-
-
-    score = max(0, min(100, score))
-
-    health_status = ""
-    notes = ""
-    if score >= 85:
-        health_status = "MÜKEMMEL"
-        notes = "Disk durumu MÜKEMMEL. Herhangi bir işlem gerekli değildir."
-    elif score >= 70:
-        health_status = "İYİ"
-        notes = "Disk durumu İYİ. Bazı önemsiz uyarılar mevcut olabilir. Düzenli kontrol önerilir."
-    elif score >= 60:
-        health_status = "ORTA"
-        notes = "Disk durumu ORTA. Bazı sorunlar tespit edildi. Verilerinizi yedeklemenizi ve diski gözlemlemeniz önerilir."
-    else:
-        health_status = "KÖTÜ / KRİTİK"
-        notes = "Disk durumu KÖTÜ veya KRİTİK. Acil yedekleme yapın ve diski değiştirin. Veri kaybı riski çok yüksek!"
-
-    if warnings:
-        notes += "\n\nTespit Edilen Uyarılar:\n" + "\n".join([f"- {w}" for w in warnings])
-
-    return score, health_status, notes
+# Denenecek aygıt tipleri listesi
+SMART_DEVICE_TYPES = ['sat', 'nvme', 'usb', 'usbjm', 'usbscsi', 'jmicron', 'scsi', 'ata']
+
+def format_disk_info(disk_info):
+    """Disk bilgisi alanının metnini oluşturur (okuma sürerken eksik alanlar N/A görünür)."""
+    info_text = f"Device Model: {disk_info.get('Device Model', 'N/A')}\n" \
+                f"Serial Number: {disk_info.get('Serial Number', 'N/A')}\n" \
+                f"Firmware: {disk_info.get('Firmware Version', 'N/A')}\n" \
+                f"Capacity: {disk_info.get('User Capacity', 'N/A')}\n" \
+                f"Rotation Rate: {disk_info.get('Rotation Rate', 'N/A')}\n" \
+                f"Power On: {disk_info.get('Power On Hours', 'N/A')}\n" \
+                f"Power Cycles: {disk_info.get('Power Cycle Count', 'N/A')}\n" \
+                f"SMART Supported: {disk_info.get('SMART Supported', 'N/A')}"
+
+    if "Data Units Written" in disk_info:
+        info_text += f"\nData Units Written: {disk_info.get('Data Units Written', 'N/A')}"
+    if "Data Units Read" in disk_info:
+        info_text += f"\nData Units Read: {disk_info.get('Data Units Read', 'N/A')}"
+    return info_text
 
 # Hakkında penceresi sınıfı
 class AboutDialog(QDialog):
@@ -295,7 +101,105 @@ class AboutDialog(QDialog):
         self.setLayout(layout)
 
 
+# Geçmiş penceresindeki süreler (gün) ve seçilen özniteliğin bu süreye bölündüğü yaklaşık satır sayısı;
+# okuma geçmişi bu aralığı yanıtlayan en kaba özetten (saatlik/günlük) okunur
+HISTORY_PERIODS = [("Son 24 saat", 1), ("Son 7 gün", 7), ("Son 30 gün", 30), ("Son 1 yıl", 365)]
+HISTORY_POINTS = 48
+
+
+class HistoryDialog(QDialog):
+    """Bir diskin okuma geçmişi: seçilen süredeki öznitelik özetleri ve seçilen özniteliğin zaman çizelgesi."""
+
+    def __init__(self, disk_key, disk_name, parent=None):
+        super().__init__(parent)
+        self.disk_key = disk_key
+        self.summary = []
+        self.setWindowTitle(f"Okuma Geçmişi - {disk_name}")
+        self.resize(800, 600)
+        self.init_ui()
+        self.load_summary()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        period_layout = QHBoxLayout()
+        period_layout.addWidget(QLabel("Süre:"))
+        self.period_combo = QComboBox()
+        for label, days in HISTORY_PERIODS:
+            self.period_combo.addItem(label, days)
+        self.period_combo.setCurrentIndex(2) # Son 30 gün
+        self.period_combo.currentIndexChanged.connect(self.load_summary)
+        period_layout.addWidget(self.period_combo)
+        period_layout.addStretch(1)
+        layout.addLayout(period_layout)
+
+        self.summary_table = QTableWidget()
+        self.summary_table.setColumnCount(6)
+        self.summary_table.setHorizontalHeaderLabels(["ID", "Name", "Min", "Max", "Son", "Değişim"])
+        self.summary_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.summary_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.summary_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.summary_table.itemSelectionChanged.connect(self.load_series)
+        layout.addWidget(self.summary_table)
+
+        self.series_label = QLabel("Zaman çizelgesi için bir öznitelik seçin.")
+        self.series_label.setFont(QFont("Arial", 10, QFont.Bold))
+        layout.addWidget(self.series_label)
+
+        self.series_table = QTableWidget()
+        self.series_table.setColumnCount(6)
+        self.series_table.setHorizontalHeaderLabels(["Zaman", "Min", "Max", "Son", "Değişim", "Okuma"])
+        self.series_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.series_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.series_table)
+
+        close_button = QPushButton("Kapat")
+        close_button.clicked.connect(self.accept)
+        layout.addWidget(close_button, alignment=Qt.AlignRight)
+
+        self.setLayout(layout)
+
+    def period_range(self):
+        """Seçili sürenin (başlangıç, bitiş) zamanları."""
+        now = time.time()
+        return now - self.period_combo.currentData() * 86400, now
+
+    def load_summary(self):
+        since, now = self.period_range()
+        self.summary = history_summary(self.disk_key, since, now=now)
+        self.summary_table.setRowCount(len(self.summary))
+        for row, item in enumerate(self.summary):
+            values = [item['id'], item['name'], item['min'], item['max'], item['last'], f"{item['delta']:+d}"]
+            for column, value in enumerate(values):
+                self.summary_table.setItem(row, column, QTableWidgetItem(str(value)))
+        self.series_table.setRowCount(0)
+        if not self.summary:
+            self.series_label.setText("Bu süre için kayıtlı okuma geçmişi yok.")
+        else:
+            self.series_label.setText("Zaman çizelgesi için bir öznitelik seçin.")
+
+    def load_series(self):
+        rows = self.summary_table.selectionModel().selectedRows()
+        if not rows or rows[0].row() >= len(self.summary):
+            return
+        attribute = self.summary[rows[0].row()]
+        since, now = self.period_range()
+        resolution, buckets = attribute_series(self.disk_key, attribute['id'], since, now, (now - since) / HISTORY_POINTS)
+        self.series_label.setText(f"{attribute['name']} (ID:{attribute['id']}) - {RESOLUTION_NAMES[resolution]} "
+                                  f"({len(buckets)} satır)")
+        self.series_table.setRowCount(len(buckets))
+        for row, (start, minimum, maximum, last, delta, samples) in enumerate(reversed(buckets)): # En yeni üstte
+            values = [time.strftime("%d.%m.%Y %H:%M", time.localtime(start)), minimum, maximum, last, f"{delta:+d}", samples]
+            for column, value in enumerate(values):
+                self.series_table.setItem(row, column, QTableWidgetItem(str(value)))
+
+
 class ZeusHDDDoctor(QMainWindow):
+    # Arka plan motorundan gelen SMART sonucu (disk yolu, get_smart_data üçlüsü)
+    smart_data_ready = pyqtSignal(str, object)
+    # Okuma sürerken gelen disk bilgisi/öznitelik satırı (disk yolu, zeus_core.streaming olayı)
+    smart_data_progress = pyqtSignal(str, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Zeus HDD Doctor v1.0.1")
@@ -311,8 +215,29 @@ class ZeusHDDDoctor(QMainWindow):
         # Stderr buffer'ı başlat
         self.stderr_buffer = ""
 
+        # Okunmuş SMART verileri disk kimliğiyle saklanır (ZEUS_SMART_CACHE_TTL saniye taze kalır).
+        # Eski kayıt hemen gösterilir ve arka planda yeniden okunur; disk yolu -> önbellek anahtarı
+        self.smart_cache = SmartResultCache()
+        self.disk_cache_keys = {}
+
+        # smartctl ana iş parçacığında çalışmaz: okumalar asyncio motorunda yapılır, sonuç sinyalle gelir.
+        # Takılan bir disk en fazla kendi bütçesi kadar bekletir; okunmakta olan diskler: yol -> Future
+        self.smart_engine = AsyncSmartEngine(SMART_DEVICE_TYPES)
+        self.pending_smart_reads = {}
+        self.smart_data_ready.connect(self.on_smart_data_ready)
+
+        # smartctl çalışırken gelen satırlar okuma bitene kadar disk başına biriktirilir ve disk seçiliyse
+        # hemen gösterilir; yol -> {'info': sözlük, 'attributes': liste}. Akışı gösterilen disk:
+        self.streamed_reads = {}
+        self.streaming_disk = None
+        self.smart_data_progress.connect(self.on_smart_data_progress)
+
+        # Okunan disklerin geçmiş anahtarları (Geçmiş penceresi): yol -> anahtar
+        self.disk_history_keys = {}
+
         self.init_ui()
         self.load_disks()
+        self.start_hotplug_watcher()
 
     def init_ui(self):
         central_widget = QWidget()
@@ -423,6 +348,12 @@ class ZeusHDDDoctor(QMainWindow):
         self.about_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         button_layout.addWidget(self.about_button)
 
+        # Okuma geçmişi düğmesi
+        self.history_button = QPushButton("Geçmiş")
+        self.history_button.clicked.connect(self.show_history_dialog)
+        self.history_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        button_layout.addWidget(self.history_button)
+
         # Yenile düğmesi
         self.refresh_button = QPushButton("Seçili Diski Yenile")
         self.refresh_button.clicked.connect(self.refresh_selected_disk)
@@ -435,6 +366,9 @@ class ZeusHDDDoctor(QMainWindow):
 
     def load_disks(self):
         self.disk_list_widget.clear()
+        self.disk_cache_keys.clear() # Kimlikle tutulan kayıtlar korunur, yalnızca yol eşlemesi yenilenir
+        for disk_path in list(self.pending_smart_reads):
+            self.cancel_disk_read(disk_path)
         self.disks = get_disk_list()
         if not self.disks:
             QMessageBox.warning(self, "Disk Bulunamadı", "Sistemde depolama diski bulunamadı veya listelenemedi.")
@@ -449,6 +383,184 @@ class ZeusHDDDoctor(QMainWindow):
             self.disk_list_widget.setCurrentRow(0)
             self.on_disk_selected(self.disk_list_widget.currentItem())
 
+    def start_hotplug_watcher(self):
+        """
+        Disk takma/çıkarma olaylarını çekirdeğin uevent soketinden dinler.
+        Liste yeniden yüklenmez; yalnızca değişen disk eklenir veya çıkarılır.
+        """
+        self.hotplug_monitor = open_uevent_monitor()
+        if self.hotplug_monitor is None:
+            print("Uyarı: Disk takma/çıkarma olayları izlenemiyor (netlink soketi açılamadı).")
+            return
+        self.hotplug_notifier = QSocketNotifier(self.hotplug_monitor.fileno(), QSocketNotifier.Read, self)
+        self.hotplug_notifier.activated.connect(self.on_hotplug_activity)
+
+    def on_hotplug_activity(self):
+        for event in self.hotplug_monitor.read_events():
+            if event['action'] == RESYNC_ACTION:
+                self.resync_disk_entries()
+            elif event['action'] == 'add':
+                self.add_disk_entry(event['disk'])
+            elif event['action'] == 'remove':
+                self.remove_disk_entry(event['path'])
+            else: # change: ortam değişti (ör. kart okuyucu), yalnızca bu diskin verileri geçersiz
+                self.invalidate_disk_data(event['path'])
+
+    def resync_disk_entries(self):
+        """
+        Uevent kuyruğu taşıp olaylar kaybolduğunda güncel disk listesini mevcut girdilerle karşılaştırır;
+        liste yeniden yüklenmez, yalnızca farklı olan diskler eklenir, çıkarılır veya güncellenir.
+        """
+        try:
+            disks = get_core_disk_list()
+        except DiskListError as e:
+            print(f"Uyarı: Disk listesi yenilenemedi: {e}")
+            return
+        current = {disk['path']: disk for disk in self.disks}
+        paths = {disk['path'] for disk in disks}
+        for disk_path in [path for path in current if path not in paths]:
+            self.remove_disk_entry(disk_path)
+        for disk in disks:
+            previous = current.get(disk['path'])
+            if previous is None:
+                self.add_disk_entry(disk)
+            elif previous != disk: # Aynı yola başka disk takılmış veya ortam değişmiş olabilir
+                self.disks = [disk if entry['path'] == disk['path'] else entry for entry in self.disks]
+                self.find_disk_item(disk['path']).setText(disk['name'])
+                self.invalidate_disk_data(disk['path'])
+
+    def find_disk_item(self, disk_path):
+        for row in range(self.disk_list_widget.count()):
+            item = self.disk_list_widget.item(row)
+            if item.data(Qt.UserRole) == disk_path:
+                return item
+        return None
+
+    def add_disk_entry(self, disk):
+        """Takılan diski listeye ekler; seçili disk ve gösterilen veriler korunur."""
+        if self.find_disk_item(disk['path']) is not None:
+            self.invalidate_disk_data(disk['path'])
+            return
+        self.disks.append(disk)
+        item = QListWidgetItem(disk['name'])
+        item.setData(Qt.UserRole, disk['path'])
+        self.disk_list_widget.addItem(item)
+        if self.disk_list_widget.currentItem() is None: # Liste boştuysa yeni diski göster
+            self.disk_list_widget.setCurrentItem(item)
+            self.on_disk_selected(item)
+
+    def remove_disk_entry(self, disk_path):
+        """Çıkarılan diski listeden kaldırır; diğer disklerin seçimi ve verileri korunur."""
+        item = self.find_disk_item(disk_path)
+        if item is None:
+            return
+        was_current = item is self.disk_list_widget.currentItem()
+        self.disk_list_widget.takeItem(self.disk_list_widget.row(item))
+        self.disks = [disk for disk in self.disks if disk['path'] != disk_path]
+        self.invalidate_disk_data(disk_path)
+        if was_current:
+            self.disk_list_widget.setCurrentItem(None)
+            self.clear_display()
+
+    def disk_cache_key(self, disk_path):
+        """Disk yolunun önbellek anahtarını döndürür; disk çıkarıldıktan sonra da bulunabilmesi için saklanır."""
+        if disk_path not in self.disk_cache_keys:
+            self.disk_cache_keys[disk_path] = smart_cache_key(disk_path)
+        return self.disk_cache_keys[disk_path]
+
+    def invalidate_disk_data(self, disk_path):
+        """Yalnızca verilen diskin önbellekteki SMART verilerini siler; diğer diskler etkilenmez."""
+        self.smart_cache.invalidate(self.disk_cache_key(disk_path))
+        self.disk_cache_keys.pop(disk_path, None) # Aynı yola başka bir disk takılabilir
+        self.cancel_disk_read(disk_path)
+
+    def update_cache_status(self):
+        """Önbellek isabet/ıska sayılarını durum çubuğunda gösterir."""
+        self.statusBar().showMessage(format_cache_stats(self.smart_cache.stats()))
+
+    def cancel_disk_read(self, disk_path):
+        """Disk için süren okumayı iptal eder; motor smartctl sürecini öldürür."""
+        future = self.pending_smart_reads.pop(disk_path, None)
+        self.streamed_reads.pop(disk_path, None)
+        if future is not None:
+            future.cancel()
+
+    def request_disk_data(self, disk_path):
+        """Diskin SMART verilerini arka planda okutur; aynı disk zaten okunuyorsa yeni okuma başlatılmaz."""
+        if disk_path not in self.pending_smart_reads:
+            self.streamed_reads[disk_path] = {'info': {}, 'attributes': []}
+            self.pending_smart_reads[disk_path] = self.smart_engine.submit(
+                disk_path, self.smart_data_ready.emit, self.smart_data_progress.emit)
+
+    def on_smart_data_progress(self, disk_path, event):
+        """Okuma sürerken gelen satırı biriktirir; disk yükleniyor olarak gösteriliyorsa tabloya/bilgiye ekler."""
+        streamed = self.streamed_reads.get(disk_path)
+        if streamed is None:
+            return # Okuma bitti veya iptal edildi
+        shown = self.streaming_disk == disk_path
+        if event['event'] == 'attempt': # Başka bir aygıt tipiyle yeniden deneniyor: önceki satırlar geçersiz
+            streamed['info'].clear()
+            del streamed['attributes'][:]
+            if shown:
+                self.attributes_table.setRowCount(0)
+                self.health_status_label.setText("Sağlık: Yükleniyor...")
+        elif event['event'] == 'info':
+            streamed['info'][event['key']] = event['value']
+            if shown:
+                self.disk_details_text.setText(format_disk_info(streamed['info']))
+        elif event['event'] == 'attribute':
+            streamed['attributes'].append(event['attribute'])
+            if shown:
+                row = self.attributes_table.rowCount()
+                self.attributes_table.setRowCount(row + 1)
+                self.set_attribute_row(row, event['attribute'])
+                self.health_status_label.setText(f"Sağlık: Yükleniyor... ({row + 1} öznitelik alındı)")
+
+    def show_streamed_data(self, disk_path):
+        """Süren okumada o ana kadar gelen satırları gösterir; sonraki satırlar geldikçe eklenir."""
+        self.streaming_disk = disk_path
+        streamed = self.streamed_reads.get(disk_path)
+        if not streamed:
+            return
+        if streamed['info']:
+            self.disk_details_text.setText(format_disk_info(streamed['info']))
+        self.attributes_table.setRowCount(len(streamed['attributes']))
+        for row, attr in enumerate(streamed['attributes']):
+            self.set_attribute_row(row, attr)
+
+    def on_smart_data_ready(self, disk_path, result):
+        """Motordan gelen sonucu önbelleğe alır; disk hâlâ seçiliyse gösterir."""
+        if self.pending_smart_reads.pop(disk_path, None) is None:
+            return # Okuma bu arada iptal edildi (disk çıkarıldı veya liste yenilendi)
+        self.streamed_reads.pop(disk_path, None)
+        self.smart_cache.store(self.disk_cache_key(disk_path), result)
+        self.update_cache_status()
+        self.record_disk_history(disk_path, result)
+        current_item = self.disk_list_widget.currentItem()
+        if current_item and current_item.data(Qt.UserRole) == disk_path:
+            self.render_disk_data(disk_path, result)
+
+    def record_disk_history(self, disk_path, result):
+        """Yeni okumayı geçmişe yazar; bekleme kipindeki diskin gösterilen eski kaydı yazılmaz."""
+        attributes_output, info_output, error_message = result
+        if not (attributes_output and info_output) or is_standby_note(error_message):
+            return
+        snapshot = parse_smart_snapshot(attributes_output, info_output)
+        if snapshot.info.get("SMART Supported") != "Enabled" or not snapshot:
+            return
+        record_history([(self.history_key(disk_path, snapshot.info), snapshot, score_attributes(snapshot)[0])])
+
+    def history_key(self, disk_path, disk_info):
+        """Diskin geçmişteki anahtarı (kimlik listeden, yoksa seri numarasından); Geçmiş penceresi için saklanır."""
+        identity = next((disk.get('identity') for disk in self.disks if disk['path'] == disk_path), None)
+        self.disk_history_keys[disk_path] = history_disk_key(identity, disk_info, disk_path)
+        return self.disk_history_keys[disk_path]
+
+    def closeEvent(self, event):
+        """Pencere kapanırken süren smartctl okumalarını durdurur."""
+        self.smart_engine.shutdown()
+        super().closeEvent(event)
+
     def on_disk_selected(self, item):
         if item:
             selected_disk_path = item.data(Qt.UserRole)
@@ -460,11 +572,23 @@ class ZeusHDDDoctor(QMainWindow):
         current_item = self.disk_list_widget.currentItem()
         if current_item:
             selected_disk_path = current_item.data(Qt.UserRole)
-            self.display_disk_data(selected_disk_path)
+            self.display_disk_data(selected_disk_path, use_cache=False)
         else:
             QMessageBox.information(self, "Yenile", "Lütfen yenilemek için bir disk seçin.")
             self.clear_display()
 
+    def show_history_dialog(self):
+        """Seçili diskin okuma geçmişi penceresini açar."""
+        current_item = self.disk_list_widget.currentItem()
+        if not current_item:
+            QMessageBox.information(self, "Geçmiş", "Lütfen geçmişini görmek için bir disk seçin.")
+            return
+        disk_key = self.disk_history_keys.get(current_item.data(Qt.UserRole))
+        if disk_key is None:
+            QMessageBox.information(self, "Geçmiş", "Bu disk için kayıtlı okuma geçmişi yok.")
+            return
+        HistoryDialog(disk_key, current_item.text(), self).exec_()
+
     def show_about_dialog(self):
         """Hakkında penceresini açar."""
         about_dialog = AboutDialog(self)
@@ -572,7 +696,7 @@ class ZeusHDDDoctor(QMainWindow):
                                  f"Çıkış kodu: {exit_code}\n"
                                  f"Detay: {error_output if error_output.strip() else 'Detay yok.'}")
         # Disk bilgilerini tekrar yükle (işlem sonrası durumu görmek için)
-        self.display_disk_data(self.selected_disk_path)
+        self.display_disk_data(self.selected_disk_path, use_cache=False)
 
     def shred_error_occurred(self, error):
         """
@@ -594,7 +718,7 @@ class ZeusHDDDoctor(QMainWindow):
         QMessageBox.critical(self, "Komut Çalıştırma Hatası", error_message)
 
 
-    def display_disk_data(self, disk_path):
+    def display_disk_data(self, disk_path, use_cache=True):
         self.clear_display()
 
         self.disk_details_text.setText(f"'{disk_path}' diski için bilgiler yükleniyor...")
@@ -605,36 +729,54 @@ class ZeusHDDDoctor(QMainWindow):
         # Notlar için varsayılan nötr renk
         self.notes_text.setStyleSheet("background-color: #e0ffe0; border: 1px solid #c0c0c0; padding: 5px; border-radius: 5px;")
 
+        cache_key = self.disk_cache_key(disk_path)
+        if not use_cache: # "Seçili Diski Yenile": önbellek atlanır
+            self.smart_cache.invalidate(cache_key)
+            self.request_disk_data(disk_path)
+            self.show_streamed_data(disk_path)
+            return
 
-        attributes_output, info_output, error_message = get_smart_data(disk_path)
+        result, state = self.smart_cache.lookup(cache_key)
+        self.update_cache_status()
+        if result is None:
+            self.request_disk_data(disk_path)
+            self.show_streamed_data(disk_path)
+            return
+        self.render_disk_data(disk_path, result)
+        if state == STALE:
+            self.request_disk_data(disk_path) # Eski veri gösterilirken arka planda yenilenir
+
+    def render_disk_data(self, disk_path, result):
+        """get_smart_data sonucunu ayrıştırıp disk bilgisi, sağlık ve öznitelik alanlarına yazar."""
+        attributes_output, info_output, error_message = result
+        self.streaming_disk = None # Tam sonuç gösteriliyor; akış satırları artık eklenmez
 
         if attributes_output and info_output:
             smart_attributes = parse_smart_attributes(attributes_output)
             disk_info = parse_smart_info(info_output)
 
-            info_text = f"Device Model: {disk_info.get('Device Model', 'N/A')}\n" \
-                        f"Serial Number: {disk_info.get('Serial Number', 'N/A')}\n" \
-                        f"Firmware: {disk_info.get('Firmware Version', 'N/A')}\n" \
-                        f"Capacity: {disk_info.get('User Capacity', 'N/A')}\n" \
-                        f"Rotation Rate: {disk_info.get('Rotation Rate', 'N/A')}\n" \
-                        f"Power On: {disk_info.get('Power On Hours', 'N/A')}\n" \
-                        f"Power Cycles: {disk_info.get('Power Cycle Count', 'N/A')}\n" \
-                        f"SMART Supported: {disk_info.get('SMART Supported', 'N/A')}"
-
-            if "Data Units Written" in disk_info:
-                info_text += f"\nData Units Written: {disk_info.get('Data Units Written', 'N/A')}"
-            if "Data Units Read" in disk_info:
-                info_text += f"\nData Units Read: {disk_info.get('Data Units Read', 'N/A')}"
-
-            self.disk_details_text.setText(info_text)
+            self.disk_details_text.setText(format_disk_info(disk_info))
 
             if smart_attributes:
                 health_score, health_status, notes = calculate_health_score(smart_attributes, disk_info)
-                self.health_status_label.setText(f"Sağlık: %{health_score} ({health_status})")
-                self.notes_text.setText(notes)
-
-                # Kullanıcının sağladığı dereceli renk mantığı
-                if health_score >= 85:
+                trend = disk_trend(self.history_key(disk_path, disk_info)) if disk_info.get("SMART Supported") == "Enabled" else None
+                degrading = bool(trend and trend['degrading'])
+                notes = format_trend_notes(notes, trend)
+                if degrading:
+                    health_status = f"{health_status} - {DEGRADING_STATUS}"
+                if is_standby_note(error_message):
+                    # Disk bekleme kipinde: gösterilen değerler son kayıtlı okumadan
+                    self.health_status_label.setText(f"Sağlık: %{health_score} ({health_status}) - Bekleme modu")
+                    self.notes_text.setText(f"{error_message}\n\n{notes}")
+                else:
+                    self.health_status_label.setText(f"Sağlık: %{health_score} ({health_status})")
+                    self.notes_text.setText(notes)
+
+                # Kullanıcının sağladığı dereceli renk mantığı; hızla kötüleşen disk puanı ne olursa olsun kırmızı
+                if degrading:
+                    self.health_status_label.setStyleSheet("background-color: #E0666C; padding: 10px; border-radius: 5px;")
+                    self.notes_text.setStyleSheet("background-color: #ffe0e0; border: 1px solid #c0c0c0; padding: 5px; border-radius: 5px;")
+                elif health_score >= 85:
                     self.health_status_label.setStyleSheet("background-color: #57E389; padding: 10px; border-radius: 5px;")
                     self.notes_text.setStyleSheet("background-color: #e0ffe0; border: 1px solid #c0c0c0; padding: 5px; border-radius: 5px;")
                 elif health_score >= 70:
@@ -649,14 +791,9 @@ class ZeusHDDDoctor(QMainWindow):
 
                 self.attributes_table.setRowCount(len(smart_attributes))
                 for row, attr in enumerate(smart_attributes):
-                    self.attributes_table.setItem(row, 0, QTableWidgetItem(str(attr['ID'])))
-                    self.attributes_table.setItem(row, 1, QTableWidgetItem(attr['Name']))
-                    self.attributes_table.setItem(row, 2, QTableWidgetItem(str(attr['Current'])))
-                    self.attributes_table.setItem(row, 3, QTableWidgetItem(str(attr['Worst'])))
-                    self.attributes_table.setItem(row, 4, QTableWidgetItem(str(attr['Threshold'])))
-                    self.attributes_table.setItem(row, 5, QTableWidgetItem(attr['Type']))
-                    self.attributes_table.setItem(row, 6, QTableWidgetItem(str(attr['Raw_Value'])))
+                    self.set_attribute_row(row, attr)
             else:
+                self.attributes_table.setRowCount(0) # Akışla gelmiş satırlar kalmasın
                 self.health_status_label.setText("Sağlık: Bilgi Yok (Ayrıştırılamadı)")
                 self.notes_text.setText(f"'{disk_path}' için SMART öznitelikleri ayrıştırılamadı. SMART desteklemiyor olabilir veya veri formatı GSmartControl'den farklı olabilir.\n"
                                         f"Detay: {error_message if error_message else 'Bilinmiyor'}")
@@ -664,6 +801,7 @@ class ZeusHDDDoctor(QMainWindow):
                 self.health_status_label.setStyleSheet("background-color: #E0666C; padding: 10px; border-radius: 5px;")
                 self.notes_text.setStyleSheet("background-color: #ffe0e0; border: 1px solid #c0c0c0; padding: 5px; border-radius: 5px;")
         else: # attributes_output or info_output is None (SMART data not retrieved - error state)
+            self.attributes_table.setRowCount(0)
             self.health_status_label.setText("Sağlık: HATA / Desteklenmiyor")
             self.notes_text.setText(f"Disk '{disk_path}' için SMART verileri alınamadı.\n"
                                      f"Muhtemel Nedenler:\n"
@@ -677,7 +815,18 @@ class ZeusHDDDoctor(QMainWindow):
             self.notes_text.setStyleSheet("background-color: #ffe0e0; border: 1px solid #c0c0c0; padding: 5px; border-radius: 5px;")
 
 
+    def set_attribute_row(self, row, attr):
+        """Öznitelik tablosunun verilen satırını bir SmartAttribute ile doldurur."""
+        self.attributes_table.setItem(row, 0, QTableWidgetItem(str(attr.id)))
+        self.attributes_table.setItem(row, 1, QTableWidgetItem(attr.name))
+        self.attributes_table.setItem(row, 2, QTableWidgetItem(str(attr.current)))
+        self.attributes_table.setItem(row, 3, QTableWidgetItem(str(attr.worst)))
+        self.attributes_table.setItem(row, 4, QTableWidgetItem(str(attr.threshold)))
+        self.attributes_table.setItem(row, 5, QTableWidgetItem(attr.type))
+        self.attributes_table.setItem(row, 6, QTableWidgetItem(str(attr.raw_value)))
+
     def clear_display(self):
+        self.streaming_disk = None
         self.disk_details_text.clear()
         self.health_status_label.setText("Sağlık: N/A")
         self.health_status_label.setStyleSheet("background-color: lightgray; padding: 10px; border-radius: 5px;")
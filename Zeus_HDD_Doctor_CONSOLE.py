@@ -1,11 +1,39 @@
 import sys
-import subprocess
 import os
-import re
-from colorama import init, Fore, Style # Renkli çıktı için
-
-# Renkli çıktıları başlat
-init(autoreset=True)
+import time
+
+# Arayüzsüz tarama (--json) ve arka plan kipi (--daemon): menü, renkler ve aşağıdaki modüller yüklenmeden
+if __name__ == "__main__" and ("--json" in sys.argv[1:] or "--daemon" in sys.argv[1:]):
+    from zeus_core.headless import main as headless_main
+    sys.exit(headless_main(sys.argv[1:]))
+
+# asyncio motoru (aio), uevent izleme (hotplug) ve okuma geçmişi (history) kullanıldıkları işlevlerde
+# yüklenir; menü bunları beklemeden açılır
+from zeus_core.enumeration import DiskListError, get_disk_list
+from zeus_core.lazy import LazyAttribute
+from zeus_core.parsing import parse_smart_snapshot
+from zeus_core.result_cache import FRESH, SmartResultCache, format_cache_stats, smart_cache_key
+from zeus_core.rules import get_rule_engine
+from zeus_core.scoring import (
+    UNKNOWN_NOTES, UNKNOWN_SCORE, UNKNOWN_STATUS, health_grade, score_attributes,
+    calculate_health_score as calculate_core_health_score
+)
+from zeus_core.snapshots import is_standby_note
+from zeus_core.trends import DEGRADING_STATUS, format_trend_notes
+
+# Renkli çıktı için colorama ilk renkli yazdırmada yüklenir ve başlatılır; arayüzsüz tarama (--json) yüklemez
+Fore = LazyAttribute('colorama', 'Fore', on_import=lambda colorama: colorama.init(autoreset=True))
+Style = LazyAttribute('colorama', 'Style', on_import=lambda colorama: colorama.init(autoreset=True))
+
+# Aynı anda sorgulanacak en fazla disk sayısı (ZEUS_SMART_WORKERS ile değiştirilebilir)
+DEFAULT_SMART_WORKERS = 8
+
+# Detaylı görünümde özetlenen okuma geçmişi süresi (gün)
+HISTORY_SUMMARY_DAYS = 30
+
+# Analizler arasında SMART sonuçları disk kimliğiyle saklanır; ZEUS_SMART_CACHE_TTL saniye içinde
+# tekrarlanan analizde smartctl yeniden çalıştırılmaz
+smart_cache = SmartResultCache()
 
 # --- Temel Fonksiyonlar ---
 
@@ -26,281 +54,66 @@ def print_separator():
 
 def get_disk_list_linux():
     """
-    Linux sistemindeki fiziksel diskleri lsblk kullanarak listeler.
+    Linux sistemindeki fiziksel diskleri listeler.
+    Diskler doğrudan /sys/block'tan okunur; sysfs kullanılamıyorsa lsblk'ye geri dönülür.
     """
-    disks = []
     try:
-        # lsblk -o NAME,SIZE,TYPE,MODEL,VENDOR -n:
-        # -o: Çıktı formatını belirler (İsim, Boyut, Tip, Model, Üretici)
-        # -n: Başlıkları göstermez
-        output = subprocess.check_output(['lsblk', '-o', 'NAME,SIZE,TYPE,MODEL,VENDOR', '-n'], stderr=subprocess.PIPE).decode('utf-8')
-        for line in output.splitlines():
-            parts = line.strip().split()
-            if len(parts) >= 3 and parts[2] == "disk": # Sadece 'disk' tipindeki cihazları al
-                disk_name = parts[0] # sda, sdb gibi
-                disk_size = parts[1] # 1T, 500G gibi
-                
-                # Model ve Vendor'ı birleştir
-                model_vendor_parts = parts[3:] if len(parts) > 3 else []
-                full_model_vendor = " ".join(model_vendor_parts).strip()
-
-                full_name = f"{disk_name} ({disk_size}) - {full_model_vendor}".strip()
-                disks.append({'path': f"/dev/{disk_name}", 'name': full_name})
-        return disks
-    except FileNotFoundError:
-        print(Fore.RED + "Hata: 'lsblk' komutu bulunamadı. Lütfen 'util-linux' paketinin yüklü olduğundan emin olun." + Style.RESET_ALL)
-        return []
-    except subprocess.CalledProcessError as e:
-        print(Fore.RED + f"Hata: 'lsblk' çalıştırılırken sorun oluştu: {e.stderr.decode('utf-8', errors='ignore').strip()}" + Style.RESET_ALL)
+        return get_disk_list()
+    except DiskListError as e:
+        print(Fore.RED + f"Hata: {e}" + Style.RESET_ALL)
         return []
     except Exception as e:
         print(Fore.RED + f"Hata: Disk listeleme başarısız oldu: {e}" + Style.RESET_ALL)
         return []
 
-def get_smart_data_linux(disk_path):
-    """
-    Linux için smartctl komutunu kullanarak belirtilen diskin SMART verilerini alır.
-    """
-    attributes_output = None
-    info_output = None
-    error_message = ""
-
-    # smartctl genellikle cihaz yolunu ve aygıt tipini otomatik olarak algılar.
-    # Ancak bazı durumlarda -d parametresi gerekebilir. Yaygın tipleri deneyelim.
-    device_types = ['auto', 'sat', 'nvme', 'scsi'] # 'auto' genellikle yeterlidir
-
-    for dev_type in device_types:
-        try:
-            print(f"  {Fore.YELLOW}-> smartctl -A -d {dev_type} {disk_path} deneniyor..." + Style.RESET_ALL)
-            # -A: SMART verileri
-            attributes_output = subprocess.check_output(['smartctl', '-A', '-d', dev_type, disk_path], stderr=subprocess.PIPE, timeout=30).decode('utf-8', errors='ignore')
-
-            print(f"  {Fore.YELLOW}-> smartctl -i -d {dev_type} {disk_path} deneniyor..." + Style.RESET_ALL)
-            # -i: Cihaz bilgileri
-            info_output = subprocess.check_output(['smartctl', '-i', '-d', dev_type, disk_path], stderr=subprocess.PIPE, timeout=30).decode('utf-8', errors='ignore')
-
-            # SMART desteği kapalı ise özel bir hata mesajı dön
-            if "SMART support is: Disabled" in info_output or "SMART Disabled" in info_output:
-                error_message = f"Disk '{disk_path}' SMART özelliğini desteklemiyor veya devre dışı."
-                return None, None, error_message # Bu özel hata durumu için döngüyü kır
-            
-            return attributes_output, info_output, "" # Başarılı dönüş
-        except FileNotFoundError:
-            error_message = Fore.RED + "Hata: 'smartctl' komutu bulunamadı. Lütfen 'smartmontools' paketinin yüklü olduğundan emin olun." + Style.RESET_ALL
-            return None, None, error_message # smartctl yoksa hiçbiri çalışmaz, direkt çık
-        except subprocess.CalledProcessError as e:
-            # Hata mesajını daha okunur hale getir
-            stderr_output = e.stderr.decode('utf-8', errors='ignore').strip()
-            if "SCSI error" in stderr_output or "Error SMART" in stderr_output:
-                 error_message = Fore.YELLOW + f"smartctl '{dev_type}' tipiyle '{disk_path}' için çalıştırılamadı (hata: {stderr_output[:100]}...). Başka tip deneniyor." + Style.RESET_ALL
-            else:
-                error_message = Fore.RED + f"smartctl '{dev_type}' tipiyle '{disk_path}' için çalıştırılamadı. Hata: {stderr_output}" + Style.RESET_ALL
-            # Diğer tipleri denemek için hatayı geç, bu hatayı son dönüşte kullanırız
-        except subprocess.TimeoutExpired:
-            error_message = Fore.RED + f"smartctl '{dev_type}' tipiyle '{disk_path}' için zaman aşımına uğradı." + Style.RESET_ALL
-        except Exception as e:
-            error_message = Fore.RED + f"Bilinmeyen bir hata oluştu: {e}" + Style.RESET_ALL
-
-    # Tüm tipler denendi ve başarısız oldu
-    return None, None, error_message if error_message else Fore.RED + f"Disk '{disk_path}' için SMART verileri alınamadı veya desteklenmiyor." + Style.RESET_ALL
-
+# smartctl genellikle cihaz yolunu ve aygıt tipini otomatik olarak algılar.
+# Ancak bazı durumlarda -d parametresi gerekebilir. Yaygın tipleri deneyelim.
+SMART_DEVICE_TYPES = ['auto', 'sat', 'nvme', 'scsi'] # 'auto' genellikle yeterlidir
 
-def parse_smart_attributes(smart_attributes_output):
+def get_smart_worker_count():
     """
-    smartctl -A çıktısını ayrıştırarak SMART özniteliklerini bir sözlük listesi olarak döndürür.
+    Eşzamanlı SMART sorgusu sayısını döndürür.
+    ZEUS_SMART_WORKERS ortam değişkeni geçerli bir pozitif sayı ise o kullanılır.
     """
-    attributes = []
-
-    attribute_pattern = re.compile(
-        r'^\s*(\d+)\s+([a-zA-Z0-9_]+)\s+'     # 1: ID, 2: Name
-        r'(\S+)\s+'                         # 3: Flags
-        r'(\d+)\s+'                         # 4: Current Value
-        r'(\d+)\s+'                         # 5: Worst Value
-        r'(\d+)\s+'                         # 6: Threshold Value
-        r'(\S+)\s+'                         # 7: Type
-        r'(\S+)\s+'                         # 8: Updated
-        r'(\S+)\s+'                         # 9: When_Failed
-        r'([-]?\d+)$'                       # 10: Raw_Value (Negatif değerler de olabilir)
-    )
-
-    start_parsing = False
-    for line in smart_attributes_output.splitlines():
-        if "ID# ATTRIBUTE_NAME" in line:
-            start_parsing = True
-            continue
-        if start_parsing:
-            # Raporun sonunu belirten satırları kontrol et
-            if line.strip() == "" or "SMART Error Log" in line or "SMART Self-test Log" in line or "Vendor Specific SMART Attributes" in line:
-                break
-
-            match = attribute_pattern.match(line)
-            if match:
-                try:
-                    attr = {
-                        "ID": int(match.group(1)),
-                        "Name": match.group(2),
-                        "Current": int(match.group(4)),
-                        "Worst": int(match.group(5)),
-                        "Threshold": int(match.group(6)),
-                        "Type": match.group(7),
-                        "Updated": match.group(8),
-                        "Raw_Value": int(match.group(10))
-                    }
-                    attributes.append(attr)
-                except ValueError:
-                    # Raw Value boş veya tire (-) ise 0 olarak al
-                    raw_val_str = match.group(10)
-                    try:
-                        attr = {
-                            "ID": int(match.group(1)),
-                            "Name": match.group(2),
-                            "Current": int(match.group(4)),
-                            "Worst": int(match.group(5)),
-                            "Threshold": int(match.group(6)),
-                            "Type": match.group(7),
-                            "Updated": match.group(8),
-                            "Raw_Value": 0 if raw_val_str.strip() == '-' or not raw_val_str.strip() else int(raw_val_str)
-                        }
-                        attributes.append(attr)
-                    except Exception as ve:
-                        # Ayrıştırma hatası olursa yoksay veya logla
-                        # print(f"Hata: SMART öznitelik satırı ayrıştırılamadı: {line} - {ve}")
-                        pass
-            else:
-                pass # Eşleşmeyen satırları (boş satırlar, başlıklar vb.) atla
-    return attributes
-
+    try:
+        workers = int(os.environ.get('ZEUS_SMART_WORKERS', DEFAULT_SMART_WORKERS))
+    except ValueError:
+        workers = DEFAULT_SMART_WORKERS
+    return max(1, workers)
 
-def parse_smart_info(smart_info_output):
+def collect_smart_data_parallel(disks, max_workers=None):
     """
-    smartctl -i çıktısından disk bilgilerini ayrıştırır.
+    Verilen disklerin SMART verilerini asyncio motoruyla (zeus_core.aio) aynı anda toplar.
+    Sonuçlar bitiş sırasına göre (index, disk, attributes_output, info_output, error_message, süre)
+    olarak üretilir; böylece toplam süre tüm disklerin toplamı değil, en yavaş diskin süresi kadar olur.
+    Her disk ZEUS_SMART_BUDGET saniyelik bütçeyi aşarsa smartctl öldürülür ve hata olarak bildirilir.
     """
-    info = {}
-    lines = smart_info_output.splitlines()
-    for line in lines:
-        if "Model Family:" in line:
-            info["Model Family"] = line.split(":", 1)[1].strip()
-        elif "Device Model:" in line:
-            info["Device Model"] = line.split(":", 1)[1].strip()
-        elif "Serial Number:" in line:
-            info["Serial Number"] = line.split(":", 1)[1].strip()
-        elif "Firmware Version:" in line:
-            info["Firmware Version"] = line.split(":", 1)[1].strip()
-        elif "User Capacity:" in line:
-            match = re.search(r'\[(.*?)\]', line) # Köşeli parantez içindeki kapasiteyi al
-            info["User Capacity"] = match.group(1) if match else line.split(":", 1)[1].strip().split("bytes")[0].strip()
-        elif "Rotation Rate:" in line:
-            info["Rotation Rate"] = line.split(":", 1)[1].strip()
-        elif "SMART support is:" in line:
-            info["SMART Supported"] = "Enabled" if "Enabled" in line else "Disabled"
-        elif "Local Time is:" in line:
-            info["Local Time"] = line.split(":", 1)[1].strip()
-        elif "Power On Hours:" in line:
-            match = re.search(r'(\d+)\s+hours', line)
-            if match:
-                info["Power On Hours"] = match.group(1) + " hours"
-        elif "Power Cycle Count:" in line:
-            match = re.search(r'(\d+)', line)
-            if match:
-                info["Power Cycle Count"] = match.group(1)
-        elif "Wear_Leveling_Count" in line: # SSD'ler için
-             match = re.match(r'.*Wear_Leveling_Count\s+.*?\s+(\d+)', line)
-             if match:
-                 info["Wear Leveling"] = match.group(1)
-        elif "Media_Wearout_Indicator" in line: # SSD'ler için
-             match = re.match(r'.*Media_Wearout_Indicator\s+.*?\s+(\d+)', line)
-             if match:
-                 info["Media Wearout"] = match.group(1)
-        elif "Data Units Written:" in line:
-            info["Data Units Written"] = line.split(":", 1)[1].strip()
-        elif "Data Units Read:" in line:
-            info["Data Units Read"] = line.split(":", 1)[1].strip()
-    return info
+    from zeus_core.aio import iter_smart_results_sync
+    yield from iter_smart_results_sync(disks, SMART_DEVICE_TYPES, concurrency=max_workers or get_smart_worker_count())
+
+
+def health_color(health_score):
+    """Sağlık puanının konsoldaki rengini döndürür (dereceler zeus_core.scoring.HEALTH_GRADES'tedir)."""
+    if isinstance(health_score, str): # "Bilinmiyor"
+        return Style.DIM + Fore.WHITE # Gri tonu
+    grade_colors = {
+        "MÜKEMMEL": Style.BRIGHT + Fore.LIGHTGREEN_EX, # Çok Parlak Yeşil
+        "İYİ": Fore.LIGHTGREEN_EX, # Açık Yeşil
+        "ORTA": Fore.YELLOW, # Açık Sarı
+    }
+    return grade_colors.get(health_grade(health_score)[0], Fore.LIGHTRED_EX) # Kötü / Kritik: Açık Kırmızı
 
 def calculate_health_score(attributes, disk_info, smart_data_available):
     """
-    SMART özniteliklerine göre basit bir sağlık puanı hesaplar (0-100).
-    smart_data_available: SMART verisine erişilip erişilemediğini belirtir.
+    SMART özniteliklerine göre sağlık puanını (0-100) hesaplar ve durumu renklendirir.
+    smart_data_available: SMART verisine erişilip erişilemediğini belirtir; erişilemiyorsa
+    puan olarak "Bilinmiyor" metni döner.
     """
-    score = 100
-    warnings = []
-    
     if not smart_data_available:
-        # SMART verisine erişilemiyorsa özel durum
-        health_status = Style.DIM + Fore.WHITE + "BİLİNMİYOR" + Style.RESET_ALL # Gri tonu
-        notes = "Aygıtın SMART verilerine erişilemediği için sağlık durumu bilinmiyor."
-        return "Bilinmiyor", health_status, notes # Puan olarak "Bilinmiyor" stringi döndür
-
-    # Kritik Raw Value'a sahip SMART Öznitelik ID'leri
-    critical_raw_value_attributes_ids = {
-        1,   # Raw Read Error Rate
-        5,   # Reallocated Sector Count
-        7,   # Seek Error Rate
-        196, # Reallocated Event Count
-        197, # Current Pending Sector Count
-        198, # Uncorrectable Sector Count
-        199  # UDMA CRC Error Count
-    }
+        return UNKNOWN_SCORE, health_color(UNKNOWN_SCORE) + UNKNOWN_STATUS + Style.RESET_ALL, UNKNOWN_NOTES
 
-    for attr in attributes:
-        # 1. Eşik Değer Kontrolü (Threshold)
-        # Threshold > 0 ve Current değer Threshold'dan küçükse
-        if attr["Threshold"] > 0 and attr["Current"] < attr["Threshold"]:
-            score -= 15
-            warnings.append(f"'{attr['Name']}' (ID:{attr['ID']}) kritik eşik ({attr['Threshold']}) altında ({attr['Current']})!")
-
-        # 2. Kritik Raw Value Kontrolü (Raw_Value'nun 0'dan büyük olması)
-        if attr["ID"] in critical_raw_value_attributes_ids and attr["Raw_Value"] > 0:
-            score -= 10
-            warnings.append(f"'{attr['Name']}' (ID:{attr['ID']}) Raw Value'u 0'dan büyük ({attr['Raw_Value']})!")
-
-        # 3. Sıcaklık Kontrolü
-        if attr["ID"] == 194 or "Temperature" in attr["Name"]: # ID 194 genellikle sıcaklık, bazı disklerde isimde de geçebilir
-            current_temp = attr["Raw_Value"] if attr["ID"] == 194 else attr["Current"] # Raw_Value veya Current'i kullan
-            if current_temp > 50:
-                score -= 5
-                warnings.append(f"Disk sıcaklığı yüksek ({current_temp}°C).")
-            elif current_temp > 60:
-                score -= 15
-                warnings.append(f"DİKKAT: Disk sıcaklığı çok yüksek ({current_temp}°C)!")
-
-        # 4. SSD Sağlığı (Wear Leveling ve Media Wearout Indicator)
-        # ID 177: Wear_Leveling_Count (SSD'nin ne kadar yıprandığını gösterir, yüksek değerler kötü olabilir)
-        if attr["ID"] == 177 and attr["Raw_Value"] > 0:
-            if attr["Raw_Value"] > 50000: # Örnek bir eşik, üreticiye göre değişebilir
-                score -= 5
-                warnings.append(f"SSD yıpranma düzeyi yüksek: {attr['Raw_Value']} (Wear_Leveling_Count).")
-        # ID 233: Media_Wearout_Indicator (SSD'nin kalan ömrü yüzdesi, 100 en iyi, 0 en kötü)
-        elif attr["ID"] == 233 and attr["Raw_Value"] < 100:
-            if attr["Raw_Value"] < 20:
-                score -= 20
-                warnings.append(f"SSD yıpranma düzeyi kritik: %{attr['Raw_Value']} (Media_Wearout_Indicator).")
-            elif attr["Raw_Value"] < 50:
-                score -= 10
-                warnings.append(f"SSD yıpranma düzeyi yüksek: %{attr['Raw_Value']} (Media_Wearout_Indicator).")
-
-    score = max(0, min(100, score)) # Puanı 0-100 arasına sıkıştır
-
-    health_status = ""
-    notes = ""
-    # Derecelendirme ve Renklendirme (Güncel Taleplere Göre)
-    if score > 85: # Mükemmel Durum (Çok Parlak Yeşil)
-        health_status = Style.BRIGHT + Fore.LIGHTGREEN_EX + "MÜKEMMEL" + Style.RESET_ALL
-        notes = "Disk durumu MÜKEMMEL. Herhangi bir işlem gerekli değildir."
-    elif score > 70: # İyi Durum (Açık Yeşil)
-        health_status = Fore.LIGHTGREEN_EX + "İYİ" + Style.RESET_ALL
-        notes = "Disk durumu İYİ. Bazı önemsiz uyarılar mevcut olabilir. Düzenli kontrol önerilir."
-    elif score > 60: # Orta / Dikkat Gerektiren Durum (Açık Sarı)
-        health_status = Fore.YELLOW + "ORTA" + Style.RESET_ALL
-        notes = "Disk durumu ORTA. Bazı sorunlar tespit edildi. Verilerinizi yedeklemeniz ve diski gözlemlemeniz önerilir."
-    else: # Kötü / Kritik Durum (Açık Kırmızı)
-        health_status = Fore.LIGHTRED_EX + "KÖTÜ / KRİTİK" + Style.RESET_ALL
-        notes = "Disk durumu KÖTÜ veya KRİTİK. Acil yedekleme yapın ve diski değiştirin. Veri kaybı riski çok yüksek!"
-
-    if warnings:
-        notes += "\n\nTespit Edilen Uyarılar:\n" + "\n".join([f"- {w}" for w in warnings])
-
-    return score, health_status, notes
+    score, health_status, notes = calculate_core_health_score(attributes, disk_info)
+    return score, health_color(score) + health_status + Style.RESET_ALL, notes
 
 # --- Programın Menü ve Ana Akışı ---
 
@@ -339,23 +152,96 @@ def main_menu():
         print ("Lisans: GNU-GPLv3 \nBu program, @Zeus tarafından geliştirilmiştir.")
         print_separator()
         print(f"1. Diskleri Analiz Et")
-        print(f"2. Hakkında")
-        print(f"3. Çıkış")
+        print(f"2. Disk Takma/Çıkarma Olaylarını İzle")
+        print(f"3. Hakkında")
+        print(f"4. Çıkış")
         print_separator()
 
-        choice = input(Fore.LIGHTYELLOW_EX + "Seçiminizi yapın (1-3): " + Style.RESET_ALL).strip()
+        choice = input(Fore.LIGHTYELLOW_EX + "Seçiminizi yapın (1-4): " + Style.RESET_ALL).strip()
 
         if choice == '1':
             analyze_disks()
         elif choice == '2':
-            about_menu()
+            watch_disk_events()
         elif choice == '3':
+            about_menu()
+        elif choice == '4':
             print(Fore.GREEN + "\nProgramdan çıkıldı. Hoşça kalın! Terminali kullanmaya devam edebilirsiniz." + Style.RESET_ALL)
             sys.exit(0)
         else:
             print(Fore.RED + "\nGeçersiz seçim. Lütfen tekrar deneyin." + Style.RESET_ALL)
             input(Fore.CYAN + "Devam etmek için Enter tuşuna basın..." + Style.RESET_ALL) # Renk değiştirildi
 
+def watch_disk_events():
+    """
+    Disk takma/çıkarma olaylarını çekirdeğin uevent akışından canlı olarak gösterir.
+    Yeni takılan disk için SMART özeti hemen alınır. Olaylar kaybolursa (uevent kuyruğu taştıysa)
+    güncel disk listesi bilinen disklerle karşılaştırılır. Ctrl+C ile ana menüye dönülür.
+    """
+    import asyncio
+    from zeus_core.aio import acquire_smart_data
+    from zeus_core.history import disk_trend, history_disk_key, record_history
+    from zeus_core.hotplug import RESYNC_ACTION, iter_disk_events, open_uevent_monitor
+
+    print_header("DİSK TAKMA/ÇIKARMA İZLEME")
+    monitor = open_uevent_monitor()
+    if monitor is None:
+        print(Fore.RED + "Disk olayları izlenemiyor: çekirdek uevent soketi açılamadı." + Style.RESET_ALL)
+        input(Fore.CYAN + "\nAna menüye dönmek için Enter tuşuna basın..." + Style.RESET_ALL)
+        return
+
+    def show_added(disk, stamp):
+        print(f"{Fore.GREEN}[{stamp}] Disk takıldı: {disk['name']} ({disk['path']}){Style.RESET_ALL}")
+        # Yavaş USB köprülerinde bilgiler ve öznitelik satırları smartctl bitmeden, geldikçe yazdırılır
+        attributes_output, info_output, error_message = asyncio.run(
+            acquire_smart_data(disk['path'], SMART_DEVICE_TYPES, on_event=make_stream_printer()))
+        if attributes_output and info_output:
+            snapshot = parse_smart_snapshot(attributes_output, info_output)
+            smart_data_available = snapshot.info.get("SMART Supported") == "Enabled"
+            health_score, health_status, _ = calculate_health_score(snapshot, snapshot.info, smart_data_available)
+            if smart_data_available and not is_standby_note(error_message):
+                key = history_disk_key(disk.get('identity'), snapshot.info, disk['path'])
+                record_history([(key, snapshot, health_score)])
+                trend = disk_trend(key)
+                if trend and trend['degrading']:
+                    health_status = f"{health_status} - {DEGRADING_STATUS}"
+            score_display = health_score if isinstance(health_score, str) else f"%{health_score}"
+            print(f"  {Style.BRIGHT}Sağlık Puanı:{Style.RESET_ALL} {score_display} ({health_status})")
+            if is_standby_note(error_message):
+                print(Fore.YELLOW + f"  {error_message}" + Style.RESET_ALL)
+        else:
+            print(Fore.RED + f"  SMART verisi alınamadı: {error_message}" + Style.RESET_ALL)
+
+    known = {disk['path']: disk for disk in get_disk_list_linux()}
+    print(Fore.CYAN + "Olaylar bekleniyor... Ana menüye dönmek için Ctrl+C tuşlarına basın.\n" + Style.RESET_ALL)
+    try:
+        for event in iter_disk_events(timeout=1.0, monitor=monitor):
+            if event is None:
+                continue
+            stamp = time.strftime("%H:%M:%S")
+            if event['action'] == RESYNC_ACTION:
+                print(f"{Fore.YELLOW}[{stamp}] Bazı disk olayları kaçırıldı; disk listesi yeniden okunuyor.{Style.RESET_ALL}")
+                disks = {disk['path']: disk for disk in get_disk_list_linux()}
+                for path in known.keys() - disks.keys():
+                    print(f"{Fore.LIGHTRED_EX}[{stamp}] Disk çıkarıldı: {path}{Style.RESET_ALL}")
+                for path, disk in disks.items():
+                    if known.get(path) != disk:
+                        show_added(disk, stamp)
+                known = disks
+            elif event['action'] == 'add':
+                known[event['path']] = event['disk']
+                show_added(event['disk'], stamp)
+            elif event['action'] == 'remove':
+                known.pop(event['path'], None)
+                print(f"{Fore.LIGHTRED_EX}[{stamp}] Disk çıkarıldı: {event['path']}{Style.RESET_ALL}")
+            else:
+                known[event['path']] = event['disk']
+                print(f"{Fore.YELLOW}[{stamp}] Disk değişti (ortam/bölüm tablosu): {event['path']}{Style.RESET_ALL}")
+    except KeyboardInterrupt:
+        pass
+    print()
+    input(Fore.CYAN + "Ana menüye dönmek için Enter tuşuna basın..." + Style.RESET_ALL)
+
 def analyze_disks():
     """Disk analiz sürecini başlatır ve raporlar."""
     print_header("DİSK ANALİZİ")
@@ -371,60 +257,101 @@ def analyze_disks():
     disk_summary_results = [] # Özet rapor için
     detailed_disk_data = [] # Detaylı çıktı için
 
+    # Önbellekte taze sonucu olan diskler yeniden okunmaz; eski kayıtlar okuma başarısız olursa kullanılır
+    smart_results = [None] * len(disks)
+    cache_keys = [smart_cache_key(disk['path']) for disk in disks]
+    stale_results = {}
+    disks_to_read = []
+    for i, disk in enumerate(disks):
+        result, state = smart_cache.lookup(cache_keys[i])
+        if state == FRESH:
+            smart_results[i] = result
+        else:
+            if result is not None:
+                stale_results[i] = result
+            disks_to_read.append(i)
+    if len(disks_to_read) < len(disks):
+        print(Fore.CYAN + f"{len(disks) - len(disks_to_read)} disk için önbellekteki güncel sonuç kullanılıyor." + Style.RESET_ALL)
+
+    # Kalan disklerin SMART verilerini aynı anda topla, biten her diski hemen bildir
+    workers = min(get_smart_worker_count(), max(1, len(disks_to_read)))
+    if disks_to_read:
+        print(Fore.CYAN + f"{len(disks_to_read)} disk için SMART verileri toplanıyor (eşzamanlı sorgu: {workers})..." + Style.RESET_ALL)
+    read_disks = [disks[i] for i in disks_to_read]
+    fresh_reads = set() # Bu analizde smartctl'den yeni okunan diskler (geçmişe yazılır)
+    for done, (j, disk, attributes_output, info_output, error_message, elapsed) in enumerate(collect_smart_data_parallel(read_disks, workers), 1):
+        i = disks_to_read[j]
+        if attributes_output and info_output:
+            smart_cache.store(cache_keys[i], (attributes_output, info_output, error_message))
+            if not is_standby_note(error_message):
+                fresh_reads.add(i)
+        elif i in stale_results:
+            attributes_output, info_output, error_message = stale_results[i] # Okunamadı: son sonuç gösterilir
+        smart_results[i] = (attributes_output, info_output, error_message)
+        if is_standby_note(error_message):
+            result_text = Fore.YELLOW + "bekleme modunda, uyandırılmadı"
+        else:
+            result_text = Fore.GREEN + "tamam" if attributes_output and info_output else Fore.RED + "veri alınamadı"
+        print(f"  [{done}/{len(disks_to_read)}] {disk['path']} ({elapsed:.1f} sn): {result_text}{Style.RESET_ALL}")
+    print(Fore.CYAN + format_cache_stats(smart_cache.stats()) + Style.RESET_ALL)
+
+    from zeus_core.history import disk_trend, history_disk_key, record_history
+
+    # Disk bilgileri ve öznitelikler sütunlu SmartSnapshot'ta tutulur (oturum boyunca bellekte kalır)
+    snapshots = [parse_smart_snapshot(attributes_output, info_output) if attributes_output and info_output else None
+                 for attributes_output, info_output, _ in smart_results]
+    history_keys = {i: history_disk_key(disk.get('identity'), snapshots[i].info, disk['path'])
+                    for i, disk in enumerate(disks)
+                    if snapshots[i] and snapshots[i].info.get("SMART Supported") == "Enabled"}
+    # Yeni okumalar tek işlemde geçmişe yazılır; önbellekten gelen sonuçlar zaten yazılmıştır
+    record_history((history_keys[i], snapshots[i], score_attributes(snapshots[i])[0])
+                   for i in sorted(fresh_reads) if i in history_keys)
+    # Geçmişteki sayaç eğilimleri (hızlı bozulma); geçmiş kapalıysa boş kalır
+    trends = {i: disk_trend(key) for i, key in history_keys.items()}
+
     for i, disk in enumerate(disks):
         print(f"\n{Fore.CYAN}--- Disk {i+1}: {disk['name']} ({disk['path']}) ---{Style.RESET_ALL}")
         print_separator()
 
-        smart_attributes_output, smart_info_output, error_message = get_smart_data_linux(disk['path'])
+        smart_attributes_output, smart_info_output, error_message = smart_results[i]
 
         health_score = None # Başlangıçta None olarak ayarla
         health_status = ""
         notes = ""
-        disk_details = {}
-        smart_attributes = []
-        smart_data_available = False 
 
         if smart_attributes_output and smart_info_output:
-            parsed_disk_details = parse_smart_info(smart_info_output)
-            if parsed_disk_details.get("SMART Supported") == "Enabled":
-                smart_data_available = True
-                disk_details = parsed_disk_details 
-                smart_attributes = parse_smart_attributes(smart_attributes_output)
-            else:
-                smart_data_available = False
-                disk_details = parsed_disk_details 
-            
+            snapshot = snapshots[i]
+            smart_data_available = snapshot.info.get("SMART Supported") == "Enabled"
+            disk_details = snapshot.info
+
             # calculate_health_score, smart_data_available False ise "Bilinmiyor" stringi döndürecek
-            health_score, health_status, notes = calculate_health_score(smart_attributes, disk_details, smart_data_available)
-
-            color_code_summary = Style.RESET_ALL 
-            if isinstance(health_score, str): # Eğer health_score string ise (örn: "Bilinmiyor")
-                color_code_summary = Style.DIM + Fore.WHITE # Gri tonu
-                score_display = health_score # % işaretini ekleme
-            else: # Sayı ise
-                score_display = f"%{health_score}" 
-                if health_score > 85:
-                    color_code_summary = Style.BRIGHT + Fore.LIGHTGREEN_EX
-                elif health_score > 70:
-                    color_code_summary = Fore.LIGHTGREEN_EX
-                elif health_score > 60:
-                    color_code_summary = Fore.YELLOW
-                else: 
-                    color_code_summary = Fore.LIGHTRED_EX
+            health_score, health_status, notes = calculate_health_score(snapshot, disk_details, smart_data_available)
+            trend = trends.get(i)
+            notes = format_trend_notes(notes, trend)
+            if trend and trend['degrading']:
+                health_status = f"{health_status} - {DEGRADING_STATUS}"
+
+            color_code_summary = Fore.LIGHTRED_EX if trend and trend['degrading'] else health_color(health_score)
+            # Eğer health_score string ise (örn: "Bilinmiyor") % işaretini ekleme
+            score_display = health_score if isinstance(health_score, str) else f"%{health_score}"
 
+            standby_mark = " (bekleme modu, son okuma)" if is_standby_note(error_message) else ""
             disk_summary_results.append(
-                f"{color_code_summary}{disk['name'].split('(')[0].strip()} ==> {score_display} {health_status}{Style.RESET_ALL}"
+                f"{color_code_summary}{disk['name'].split('(')[0].strip()} ==> {score_display} {health_status}{standby_mark}{Style.RESET_ALL}"
             )
             detailed_disk_data.append({
                 'disk_info': disk,
-                'disk_details': disk_details,
-                'smart_attributes': smart_attributes,
+                'history_key': history_keys.get(i),
+                'snapshot': snapshot,
                 'health_score': health_score,
                 'health_status': health_status,
                 'notes': notes,
                 'error': None
             })
 
+            if is_standby_note(error_message):
+                print(Fore.YELLOW + f"\n{error_message}" + Style.RESET_ALL)
+
             print(Fore.CYAN + "\n--- Genel Disk Bilgileri ---" + Style.RESET_ALL)
             for key, value in disk_details.items():
                 print(f"  {Style.BRIGHT}{key}:{Style.RESET_ALL} {value}")
@@ -497,6 +424,68 @@ def analyze_disks():
     input(Fore.CYAN + "Ana menüye dönmek için Enter tuşuna basın..." + Style.RESET_ALL)
 
 
+def print_attribute_header():
+    print(f"{Style.BRIGHT}{'ID':<4} {'Name':<25} {'Cur':<6} {'Wor':<6} {'Thr':<6} {'Type':<12} {'Raw Value':<12}{Style.RESET_ALL}")
+    print("-" * 80)
+
+def print_attribute_row(attr, rule_set):
+    """Öznitelik tablosunun bir satırını, puanlama kurallarıyla (zeus_core.rules) uyumlu renkte yazdırır."""
+    color = Style.RESET_ALL
+    categories = [rule.category for rule, _ in rule_set.check(attr)]
+    if 'threshold' in categories:
+        color = Fore.LIGHTRED_EX # Eşik altında ise açık kırmızı
+    elif categories:
+        color = Fore.YELLOW # Diğer uyarılarda (kritik raw, sıcaklık, yıpranma) sarı
+
+    print(f"{color}{attr.id:<4} {attr.name:<25} {attr.current:<6} {attr.worst:<6} {attr.threshold:<6} {attr.type:<12} {attr.raw_value:<12}{Style.RESET_ALL}")
+
+def print_history_summary(disk_key):
+    """Diskin son HISTORY_SUMMARY_DAYS gününü okuma geçmişinin saatlik/günlük özetlerinden yazdırır."""
+    print(Fore.CYAN + f"\n--- Son {HISTORY_SUMMARY_DAYS} Gün (Okuma Geçmişi) ---" + Style.RESET_ALL)
+    from zeus_core.history import history_summary
+    from zeus_core.rollups import RESOLUTION_NAMES
+
+    summary = history_summary(disk_key, time.time() - HISTORY_SUMMARY_DAYS * 86400) if disk_key else []
+    if not summary:
+        print(f"  {Style.DIM + Fore.WHITE}Bu disk için kayıtlı okuma geçmişi yok.{Style.RESET_ALL}")
+        return
+    print(f"{Style.BRIGHT}{'ID':<4} {'Name':<25} {'Min':<12} {'Max':<12} {'Son':<12} {'Değişim':<12}{Style.RESET_ALL}")
+    print("-" * 80)
+    trend_ids = get_rule_engine().trends.attribute_ids
+    for row in summary:
+        # İzlenen sayaçlardaki artış sarı gösterilir
+        color = Fore.YELLOW if row['id'] in trend_ids and row['delta'] > 0 else Style.RESET_ALL
+        print(f"{color}{row['id']:<4} {row['name']:<25} {row['min']:<12} {row['max']:<12} {row['last']:<12} "
+              f"{row['delta']:<+12}{Style.RESET_ALL}")
+    resolutions = sorted({RESOLUTION_NAMES[row['resolution']] for row in summary})
+    print(f"{Style.DIM + Fore.WHITE}({max(row['samples'] for row in summary)} okuma, "
+          f"{'/'.join(resolutions)} özetlerden){Style.RESET_ALL}")
+
+def make_stream_printer():
+    """
+    acquire_smart_data için on_event işlevi döndürür: smartctl çalışırken gelen disk bilgilerini ve
+    öznitelik satırlarını hemen yazdırır (zeus_core.streaming).
+    """
+    state = {'attempts': 0, 'info': {}, 'rule_set': None}
+
+    def on_event(event):
+        if event['event'] == 'attempt':
+            state['attempts'] += 1
+            state['info'] = {}
+            state['rule_set'] = None
+            if state['attempts'] > 1:
+                print(Style.DIM + f"  ('{event['device_type']}' aygıt tipiyle yeniden deneniyor...)" + Style.RESET_ALL)
+        elif event['event'] == 'info':
+            state['info'][event['key']] = event['value']
+            print(f"  {Style.BRIGHT}{event['key']}:{Style.RESET_ALL} {event['value']}")
+        elif event['event'] == 'attribute':
+            if state['rule_set'] is None: # Disk bilgileri tablodan önce gelir; kurallar modele göre seçilir
+                state['rule_set'] = get_rule_engine().rule_set_for(state['info'])
+                print()
+                print_attribute_header()
+            print_attribute_row(event['attribute'], state['rule_set'])
+    return on_event
+
 def display_detailed_smart_attributes(data):
     """Belirli bir diskin detaylı SMART verilerini gösterir."""
     # SMART verisine erişilemiyorsa veya hata varsa bu durumu ele al
@@ -504,8 +493,8 @@ def display_detailed_smart_attributes(data):
         print_header(f"DETAYLI SMART BİLGİSİ - {data['disk_info']['name']}")
         print(f"{Fore.CYAN}Genel Bilgiler:{Style.RESET_ALL}")
         # Disk bilgileri varsa yazdır
-        if 'disk_details' in data and data['disk_details']:
-            for key, value in data['disk_details'].items():
+        if data.get('snapshot') is not None and data['snapshot'].info:
+            for key, value in data['snapshot'].info.items():
                 print(f"  {Style.BRIGHT}{key}:{Style.RESET_ALL} {value}")
         else:
              print(f"  {Style.DIM + Fore.WHITE}Disk bilgileri sınırlı veya mevcut değil.{Style.RESET_ALL}")
@@ -523,7 +512,7 @@ def display_detailed_smart_attributes(data):
     # SMART verisi mevcutsa detaylı tabloyu göster
     print_header(f"DETAYLI SMART BİLGİSİ - {data['disk_info']['name']}")
     print(f"{Fore.CYAN}Genel Bilgiler:{Style.RESET_ALL}")
-    for key, value in data['disk_details'].items():
+    for key, value in data['snapshot'].info.items():
         print(f"  {Style.BRIGHT}{key}:{Style.RESET_ALL} {value}")
 
     print(f"\n{Fore.CYAN}SMART Sağlık Durumu:{Style.RESET_ALL}")
@@ -531,20 +520,11 @@ def display_detailed_smart_attributes(data):
     print(f"  {Style.BRIGHT}Notlar:{Style.RESET_ALL}\n{data['notes']}")
 
     print(Fore.CYAN + "\n--- Detaylı SMART Verileri ---" + Style.RESET_ALL)
-    print(f"{Style.BRIGHT}{'ID':<4} {'Name':<25} {'Cur':<6} {'Wor':<6} {'Thr':<6} {'Type':<12} {'Raw Value':<12}{Style.RESET_ALL}")
-    print("-" * 80)
-    for attr in data['smart_attributes']:
-        color = Style.RESET_ALL
-        # Renklendirme mantığı (Derecelendirme ile uyumlu)
-        critical_raw_value_attributes_ids = {1, 5, 7, 196, 197, 198, 199}
-        if attr["Threshold"] > 0 and attr["Current"] < attr["Threshold"]:
-            color = Fore.LIGHTRED_EX # Eşik altında ise açık kırmızı
-        elif attr["ID"] in critical_raw_value_attributes_ids and attr["Raw_Value"] > 0:
-            color = Fore.YELLOW # Kritik raw değeri varsa sarı
-        elif (attr["ID"] == 194 or "Temperature" in attr["Name"]) and (attr["Raw_Value"] if attr["ID"] == 194 else attr["Current"]) > 50:
-             color = Fore.YELLOW # Sıcaklık yüksekse sarı
-
-        print(f"{color}{attr['ID']:<4} {attr['Name']:<25} {attr['Current']:<6} {attr['Worst']:<6} {attr['Threshold']:<6} {attr['Type']:<12} {attr['Raw_Value']:<12}{Style.RESET_ALL}")
+    print_attribute_header()
+    rule_set = get_rule_engine().rule_set_for(data['snapshot'].info)
+    for attr in data['snapshot']:
+        print_attribute_row(attr, rule_set)
+    print_history_summary(data.get('history_key'))
     print_separator()
     input(Fore.CYAN + "Ana menüye dönmek için Enter'a basın..." + Style.RESET_ALL)
 
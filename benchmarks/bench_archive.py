@@ -0,0 +1,123 @@
+"""
+Sütunlu okuma arşivinin (zeus_core.archive) yazma ve okuma hızı.
+
+İki ölçüm yapılır:
+- uzun seri: bir diskin --days gün boyunca dakikalık sıcaklık okuması tek dosyaya yazılır; dosya
+  boyutu, kayıt başına bayt ve serinin tamamını / son 30 gününü NumPy dizisine yükleme süresi
+  (--sqlite ile aynı serinin SQLite geçmişinden sorgulanma süresi de)
+- yoklama: örnek smartctl çıktılarından N diskli yoklamalar arşive eklenir (her disk/öznitelik ayrı dosya)
+
+Örnek:
+    python3 benchmarks/bench_archive.py --days 365 --disks 500 --polls 20
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import numpy as np
+
+from common import load_fixtures
+from zeus_core.archive import SnapshotArchive, append_series, load_series
+from zeus_core.history import HistoryStore
+from zeus_core.model import SmartAttribute, SmartSnapshot
+from zeus_core.parsing import parse_smart_snapshot
+from zeus_core.smartctl import split_smart_output
+
+TEMPERATURE_ID = 194
+QUERY_DAYS = 30
+REPEAT = 20
+
+
+def temperature_series(days, end):
+    """Dakikalık, yavaş dalgalanan sıcaklık serisi: (zamanlar, değerler) listeleri."""
+    count = int(days * 1440)
+    rng = np.random.default_rng(0)
+    values = np.clip(38 + np.cumsum(rng.integers(-1, 2, count)) // 16, 25, 65)
+    start = int(end) - count * 60
+    return list(range(start, start + count * 60, 60)), values.tolist()
+
+
+def median_time(function, repeat=REPEAT):
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - started)
+    durations.sort()
+    return durations[len(durations) // 2], result
+
+
+def bench_series(directory, days, compare_sqlite):
+    now = time.time()
+    times, values = temperature_series(days, now)
+    path = os.path.join(directory, f"{TEMPERATURE_ID}.zcol")
+    started = time.perf_counter()
+    append_series(path, zip(times, values))
+    elapsed = time.perf_counter() - started
+    size = os.path.getsize(path)
+    print(f"{days:g} gün dakikalık sıcaklık: {len(times)} kayıt, {size / 1e6:.2f} MB "
+          f"({size / len(times):.2f} bayt/kayıt), toplu yazma {elapsed:.2f} sn")
+
+    elapsed, (loaded_times, loaded_values) = median_time(lambda: load_series(path))
+    assert loaded_times.tolist() == times and loaded_values.tolist() == values
+    print(f"tüm seri: {len(loaded_times)} kayıt, ortanca {elapsed * 1000:.2f} ms")
+    since = now - QUERY_DAYS * 86400
+    elapsed, (recent, _) = median_time(lambda: load_series(path, since))
+    print(f"son {QUERY_DAYS} gün: {len(recent)} kayıt, ortanca {elapsed * 1000:.2f} ms")
+
+    if compare_sqlite:
+        store = HistoryStore(os.path.join(directory, "history.sqlite3"), retention_days=0, background_rollup=False)
+        for i in range(0, len(times), 10000):
+            store.record((
+                "bench:disk", SmartSnapshot([SmartAttribute(TEMPERATURE_ID, "Temperature_Celsius", 100, 100, 0,
+                                                            raw_value=value)], timestamp=taken_at), 100)
+                for taken_at, value in zip(times[i:i + 10000], values[i:i + 10000]))
+        elapsed, rows = median_time(lambda: store.attribute_history("bench:disk", TEMPERATURE_ID), repeat=3)
+        print(f"SQLite geçmişinden aynı seri: {len(rows)} satır, ortanca {elapsed * 1000:.2f} ms")
+        store.close()
+
+
+def bench_polls(directory, disk_count, polls):
+    templates = []
+    for _, smart_output in load_fixtures():
+        snapshot = parse_smart_snapshot(*split_smart_output(smart_output))
+        if snapshot:
+            templates.append(snapshot)
+    archive = SnapshotArchive(directory)
+    now = time.time()
+    durations = []
+    for step in range(polls):
+        taken_at = now - (polls - step) * 60
+        entries = []
+        for i in range(disk_count):
+            template = templates[i % len(templates)]
+            attributes = list(template)
+            for attr in attributes:
+                attr.raw_value += step
+            entries.append((f"bench:disk{i:05d}", SmartSnapshot(attributes, template.info, timestamp=taken_at), 100))
+        started = time.perf_counter()
+        files = archive.record(entries)
+        durations.append(time.perf_counter() - started)
+    durations.sort()
+    print(f"{polls} yoklama x {disk_count} disk ({files} dosya): ortanca {durations[len(durations) // 2] * 1000:.1f} ms, "
+          f"en kötü {durations[-1] * 1000:.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sütunlu okuma arşivi yazma/okuma hızı")
+    parser.add_argument("--days", type=float, default=365.0)
+    parser.add_argument("--disks", type=int, default=500)
+    parser.add_argument("--polls", type=int, default=20)
+    parser.add_argument("--sqlite", action="store_true", help="Aynı seriyi SQLite geçmişinden de sorgula (yavaş)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        bench_series(directory, args.days, args.sqlite)
+        bench_polls(os.path.join(directory, "archive"), args.disks, args.polls)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Toplu (NumPy) puanlamanın tek tek puanlamaya göre hızı ve doğruluğu.
+
+Örnek smartctl çıktılarındaki öznitelik tablolarından N okuma üretilir; değerler her okumada
+kuralların tüm dallarını (eşik altı, kritik raw, sıcaklık, SSD yıpranması) tetikleyecek şekilde
+rastgele değiştirilir; okumalar örneğin disk bilgisini taşır, böylece modele özel kurallar (profiller)
+da denenir. Aynı okumalar:
+- tek tek: scoring.score_attributes + health_grade
+- toplu: batch_scoring.FleetMatrix.from_snapshots (yerleştirme) + batch_score
+ile puanlanır; puan, durum ve uyarı sayılarının birebir aynı olduğu her ölçümde denetlenir.
+
+Örnek:
+    python3 benchmarks/bench_batch_scoring.py --snapshots 10000 --snapshots 100000
+"""
+import sys
+import time
+import random
+import argparse
+
+from common import load_fixtures
+from zeus_core.model import SmartAttribute, SmartSnapshot
+from zeus_core.parsing import parse_smart_attributes, parse_smart_info
+from zeus_core.scoring import health_grade, score_attributes
+from zeus_core.smartctl import split_smart_output
+
+DEFAULT_SIZES = (10000, 100000)
+
+
+def fixture_tables():
+    """Öznitelik tablosu olan örneklerin (SmartAttribute listesi, disk bilgisi) ikilileri."""
+    tables = []
+    for _, smart_output in load_fixtures():
+        attributes_output, info_output = split_smart_output(smart_output)
+        attributes = parse_smart_attributes(attributes_output)
+        if attributes:
+            tables.append((attributes, parse_smart_info(info_output)))
+    return tables
+
+
+def vary_attribute(attr, rng):
+    """Özniteliğin değerlerini, puanlama kurallarının dallarına düşecek şekilde rastgele değiştirir."""
+    current, raw_value = attr.current, attr.raw_value
+    if attr.threshold > 0 and rng.random() < 0.02:
+        current = rng.randint(0, attr.threshold) # Bazen eşik altı (veya tam eşikte)
+    if rng.random() < 0.1:
+        raw_value = rng.choice((0, 0, 1, rng.randint(2, 5000)))
+    if attr.id == 194 or "Temperature" in attr.name:
+        raw_value = rng.randint(20, 70)
+    elif attr.id == 177:
+        raw_value = rng.randint(0, 100000)
+    elif attr.id == 233:
+        raw_value = rng.randint(0, 120)
+    return SmartAttribute(attr.id, attr.name, current, attr.worst, attr.threshold, attr.type, attr.updated, raw_value)
+
+
+def make_snapshots(tables, count, seed):
+    rng = random.Random(seed)
+    # SSD yıpranma kuralları için örneklere 177/233 eklenmiş bir tablo da kullanılır
+    ssd_table = tables[0][0] + [SmartAttribute(177, "Wear_Leveling_Count", 90, 90, 0),
+                                SmartAttribute(233, "Media_Wearout_Indicator", 80, 80, 0)]
+    choices = tables + [(ssd_table, {}), ([], {})]
+    snapshots = []
+    for _ in range(count):
+        attributes, info = rng.choice(choices)
+        snapshots.append(SmartSnapshot([vary_attribute(attr, rng) for attr in attributes], info, timestamp=0))
+    return snapshots
+
+
+def score_scalar(snapshots):
+    scores, statuses, warning_counts = [], [], []
+    for snapshot in snapshots:
+        score, warnings = score_attributes(snapshot)
+        scores.append(score)
+        statuses.append(health_grade(score)[0])
+        warning_counts.append(len(warnings))
+    return scores, statuses, warning_counts
+
+
+def check_identical(scalar, batch):
+    """Toplu sonuçların tek tek sonuçlarla aynı olmadığı ilk okumayı döndürür (aynıysa None)."""
+    scores, statuses, warning_counts = scalar
+    for i, expected in enumerate(zip(scores, statuses, warning_counts)):
+        got = (int(batch['score'][i]), batch['status'][i], int(batch['warning_count'][i]))
+        if got != expected:
+            return i, expected, got
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NumPy ile toplu sağlık puanlaması karşılaştırması")
+    parser.add_argument("--snapshots", type=int, action="append", help="Okuma sayısı (birden fazla verilebilir)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    try:
+        from zeus_core.batch_scoring import FleetMatrix, batch_score
+    except ImportError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    tables = fixture_tables()
+    print(f"{'okuma':>8}{'tek tek sn':>12}{'yerleştirme sn':>16}{'toplu sn':>10}{'okuma/sn (toplu)':>18}{'hızlanma':>10}  sonuç")
+    mismatches = 0
+    for count in args.snapshots or DEFAULT_SIZES:
+        snapshots = make_snapshots(tables, count, args.seed)
+
+        started = time.perf_counter()
+        scalar = score_scalar(snapshots)
+        scalar_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        matrix = FleetMatrix.from_snapshots(snapshots)
+        pack_elapsed = time.perf_counter() - started
+        started = time.perf_counter()
+        batch = batch_score(matrix)
+        batch_elapsed = time.perf_counter() - started
+
+        mismatch = check_identical(scalar, batch)
+        mismatches += mismatch is not None
+        verdict = "aynı" if mismatch is None else f"FARK: okuma {mismatch[0]} beklenen {mismatch[1]}, bulunan {mismatch[2]}"
+        print(f"{count:>8}{scalar_elapsed:>12.3f}{pack_elapsed:>16.3f}{batch_elapsed:>10.3f}"
+              f"{count / batch_elapsed:>18.0f}{scalar_elapsed / batch_elapsed:>9.0f}x  {verdict}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+smartctl metin tablosu ayrıştırıcısının bytes/memoryview girdiyle karşılaştırması.
+
+Metin biçimindeki örnekler (eski smartmontools, -j yok) için öznitelik tablosunu ayrıştırmanın
+borudan gelen çıktıdan başlayarak maliyetini ölçer:
+- satır: önceki ayrıştırıcı (çözme + splitlines + satır başına alt dizgi kontrolleri ve düzenli ifade);
+  karşılaştırma için burada aynen tutulur
+- str: çözme + parse_smart_attributes (tamponda konumla ilerleyen ayrıştırıcı)
+- bytes / memoryview: parse_smart_attributes çıktıyı çözmeden doğrudan işler
+
+Örnek:
+    python3 benchmarks/bench_bytes_parser.py --min-time 0.5
+"""
+import re
+import sys
+import argparse
+
+from bench_parsers import time_stage
+from common import load_fixtures
+from zeus_core.model import SmartAttribute
+from zeus_core.parsing import parse_smart_attributes
+
+LEGACY_ATTRIBUTE_LINE_PATTERN = re.compile(
+    r'^\s*(\d+)\s+([a-zA-Z0-9_]+)\s+(\S+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+([-]?\d+)$'
+)
+
+
+def legacy_parse_smart_attributes(smart_attributes_output):
+    """Satır tabanlı önceki ayrıştırıcı (yalnızca bu karşılaştırma için)."""
+    attributes = []
+    start_parsing = False
+    for line in smart_attributes_output.splitlines():
+        if "ID# ATTRIBUTE_NAME" in line:
+            start_parsing = True
+            continue
+        if start_parsing:
+            if line.strip() == "" or "SMART Error Log" in line or "SMART Self-test Log" in line or "Vendor Specific SMART Attributes" in line:
+                break
+            match = LEGACY_ATTRIBUTE_LINE_PATTERN.match(line)
+            if match:
+                attributes.append(SmartAttribute(
+                    int(match.group(1)), match.group(2), int(match.group(4)), int(match.group(5)),
+                    int(match.group(6)), sys.intern(match.group(7)), sys.intern(match.group(8)), int(match.group(10))
+                ))
+    return attributes
+
+
+VARIANTS = (
+    ("satır", lambda raw: legacy_parse_smart_attributes(raw.decode('utf-8', errors='ignore'))),
+    ("str", lambda raw: parse_smart_attributes(raw.decode('utf-8', errors='ignore'))),
+    ("bytes", parse_smart_attributes),
+    ("memoryview", lambda raw: parse_smart_attributes(memoryview(raw))),
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="bytes/memoryview öznitelik tablosu ayrıştırıcısı karşılaştırması")
+    parser.add_argument("--fixture", action="append", help="Yalnızca bu örnekleri kullan (uzantısız ad)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Biçim başına en az ölçüm süresi (sn)")
+    args = parser.parse_args(argv)
+
+    print(f"{'örnek':<28}{'öznitelik':>10}" + "".join(f"{name + ' µs':>16}" for name, _ in VARIANTS) + f"{'hızlanma':>10}")
+    for name, smart_output in load_fixtures(names=args.fixture):
+        if smart_output.lstrip().startswith("{"):
+            continue # -j çıktısı metin tablosu içermez
+        raw = smart_output.encode('utf-8')
+        if not parse_smart_attributes(raw):
+            continue
+        # İki ayrı tampon dönüşümlü kullanılır; aynı nesne art arda verilmez
+        inputs = [raw, raw + b"\n"]
+        timings = [time_stage(func, inputs, args.min_time) for _, func in VARIANTS]
+        row = f"{name:<28}{len(parse_smart_attributes(raw)):>10}" + "".join(f"{t * 1e6:>16.1f}" for t in timings)
+        print(row + f"{timings[0] / timings[2]:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
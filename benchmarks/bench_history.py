@@ -0,0 +1,111 @@
+"""
+SQLite okuma geçmişinin (zeus_core.history) yazma ve sorgu hızı.
+
+Örnek smartctl çıktılarından N diskli bir yoklama üretilir (her disk ayrı bir anahtar, raw değerler
+her yoklamada değişir) ve geçici bir veritabanına --polls kez, --interval saniye arayla geriye doğru
+yazılır. Ölçülenler:
+- yoklama başına yazma süresi (tek işlemde tüm diskler)
+- "bir diskin 5 numaralı özniteliğinin son 30 günü" sorgusunun süresi ve SQLite sorgu planı
+- tüm okumaların saatlik/günlük özetlere işlenmesi ve aynı sorgunun özetlerden (saatlik) süresi
+
+Örnek:
+    python3 benchmarks/bench_history.py --disks 500 --polls 200
+"""
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import tempfile
+
+from common import load_fixtures
+from zeus_core.history import HistoryStore
+from zeus_core.model import SmartSnapshot
+from zeus_core.parsing import parse_smart_snapshot
+from zeus_core.smartctl import split_smart_output
+
+QUERY_ATTRIBUTE_ID = 5
+QUERY_DAYS = 30
+
+
+def fixture_snapshots():
+    """Öznitelik tablosu olan örneklerin SmartSnapshot'ları."""
+    snapshots = []
+    for _, smart_output in load_fixtures():
+        snapshot = parse_smart_snapshot(*split_smart_output(smart_output))
+        if snapshot:
+            snapshots.append(snapshot)
+    return snapshots
+
+
+def make_poll(templates, disk_count, taken_at, step):
+    """N diskli bir yoklamanın (anahtar, SmartSnapshot, puan) üçlüleri."""
+    entries = []
+    for i in range(disk_count):
+        template = templates[i % len(templates)]
+        attributes = list(template)
+        for attr in attributes:
+            attr.raw_value += step
+        entries.append((f"bench:disk{i:05d}", SmartSnapshot(attributes, template.info, timestamp=taken_at), 100))
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQLite okuma geçmişi yazma/sorgu hızı")
+    parser.add_argument("--disks", type=int, default=500)
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=3600.0, help="Yoklamalar arası süre (sn)")
+    args = parser.parse_args(argv)
+
+    templates = fixture_snapshots()
+    with tempfile.TemporaryDirectory() as directory:
+        # Özetleme yazma ölçümüne karışmasın diye en sonda ayrıca çalıştırılır
+        store = HistoryStore(os.path.join(directory, "history.sqlite3"), retention_days=0,
+                             rollup_retention_days={}, background_rollup=False)
+        now = time.time()
+        durations = []
+        cells = 0
+        for step in range(args.polls):
+            entries = make_poll(templates, args.disks, now - (args.polls - step) * args.interval, step)
+            cells += sum(len(snapshot) for _, snapshot, _ in entries)
+            started = time.perf_counter()
+            store.record(entries)
+            durations.append(time.perf_counter() - started)
+
+        durations.sort()
+        print(f"{args.polls} yoklama x {args.disks} disk, {cells} öznitelik satırı")
+        print(f"yoklama yazma: ortanca {durations[len(durations) // 2] * 1000:.1f} ms, "
+              f"en kötü {durations[-1] * 1000:.1f} ms, satır başına {sum(durations) / cells * 1e6:.2f} us")
+
+        disk_key = "bench:disk00000"
+        since = now - QUERY_DAYS * 86400
+        started = time.perf_counter()
+        rows = store.attribute_history(disk_key, QUERY_ATTRIBUTE_ID, since)
+        elapsed = time.perf_counter() - started
+        print(f"son {QUERY_DAYS} gün, öznitelik {QUERY_ATTRIBUTE_ID}: {len(rows)} satır, {elapsed * 1000:.2f} ms")
+
+        started = time.perf_counter()
+        processed = store.rollup()
+        print(f"özetleme: {processed} okuma, {time.perf_counter() - started:.2f} sn")
+        started = time.perf_counter()
+        resolution, buckets = store.series(disk_key, QUERY_ATTRIBUTE_ID, since, step=3600)
+        elapsed = time.perf_counter() - started
+        print(f"son {QUERY_DAYS} gün, öznitelik {QUERY_ATTRIBUTE_ID}, {resolution} sn özet: {len(buckets)} kova, "
+              f"{elapsed * 1000:.2f} ms")
+
+        store.close()
+        conn = sqlite3.connect(os.path.join(directory, "history.sqlite3"))
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT a.taken_at, a.raw_value FROM disks d JOIN attributes a ON a.disk_id = d.disk_id "
+            "AND a.attribute_id = ? AND a.taken_at BETWEEN ? AND ? WHERE d.disk_key = ? AND a.occurrence = 0",
+            (QUERY_ATTRIBUTE_ID, since, now, disk_key)).fetchall()
+        conn.close()
+        print("sorgu planı:")
+        for row in plan:
+            print(f"  {row[-1]}")
+        print(f"veritabanı boyutu: {os.path.getsize(store.path) / 1e6:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+İçe aktarma (başlangıç) süresi karşılaştırması.
+
+Her hedef yeni bir Python sürecinde 'python3 -X importtime' ile birkaç kez yüklenir; duvar saati
+süresinin ortancası ve boş yorumlayıcıya göre farkı yazılır. --top ile hedef başına en pahalı
+modüller (kümülatif süre) listelenir. Arayüzsüz taramanın (--json) Qt/colorama yüklemediği
+'zeus_core.headless' satırından görülür; --max-ms ile bu süre için bir üst sınır konabilir.
+
+Örnek:
+    python3 benchmarks/bench_import.py
+    python3 benchmarks/bench_import.py --runs 10 --top 5
+    python3 benchmarks/bench_import.py --target zeus_core.headless --max-ms 60
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+from common import FRONTENDS, REPO_ROOT
+
+_LOAD_FRONTEND = (
+    "import importlib.util; "
+    "spec = importlib.util.spec_from_file_location('zeus_{name}', {path!r}); "
+    "module = importlib.util.module_from_spec(spec); spec.loader.exec_module(module)"
+)
+
+# Hedef adı -> yeni süreçte çalıştırılacak kod
+TARGETS = {
+    "baseline": "pass",
+    "zeus_core.headless": "import zeus_core.headless",
+    "console": _LOAD_FRONTEND.format(name="console", path=os.path.join(REPO_ROOT, FRONTENDS["console"])),
+    "console+colorama": _LOAD_FRONTEND.format(name="console", path=os.path.join(REPO_ROOT, FRONTENDS["console"]))
+                        + "; module.Fore.RED",
+    "gui": _LOAD_FRONTEND.format(name="gui", path=os.path.join(REPO_ROOT, FRONTENDS["gui"])),
+}
+
+
+def parse_importtime(stderr_text):
+    """-X importtime çıktısını [(kümülatif_us, modül)] listesine çevirir."""
+    entries = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, fields = line.partition(":")
+        parts = [part.strip() for part in fields.split("|")]
+        if len(parts) == 3 and parts[1].isdigit():
+            entries.append((int(parts[1]), parts[2].strip()))
+    return entries
+
+
+def measure_target(code, runs):
+    """Kodu 'runs' kez yeni süreçte çalıştırır; (süreler_ms, importtime girdileri) döndürür, hata olursa None."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])))
+    durations = []
+    entries = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, cwd=REPO_ROOT)
+        durations.append((time.perf_counter() - started) * 1000)
+        if completed.returncode != 0:
+            error_lines = completed.stderr.strip().splitlines()
+            return None, error_lines[-1] if error_lines else f"çıkış kodu {completed.returncode}"
+        entries = parse_importtime(completed.stderr)
+    return durations, entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Başlangıç/içe aktarma süresi karşılaştırması")
+    parser.add_argument("--target", choices=list(TARGETS), action="append", help="Ölçülecek hedef (varsayılan: hepsi)")
+    parser.add_argument("--runs", type=int, default=5, help="Hedef başına süreç sayısı")
+    parser.add_argument("--top", type=int, default=0, help="Hedef başına en pahalı N modülü listele")
+    parser.add_argument("--max-ms", type=float, help="zeus_core.headless için boş yorumlayıcıya göre en fazla fark (ms)")
+    args = parser.parse_args(argv)
+    targets = ["baseline"] + [name for name in (args.target or TARGETS) if name != "baseline"]
+
+    baseline = None
+    failed = False
+    print(f"{'hedef':<20}{'ortanca ms':>12}{'en iyi ms':>12}{'fark ms':>10}")
+    for name in targets:
+        durations, entries = measure_target(TARGETS[name], max(1, args.runs))
+        if durations is None:
+            print(f"{name:<20}  atlandı ({entries})")
+            continue
+        median = statistics.median(durations)
+        if name == "baseline":
+            baseline = median
+        extra = median - baseline
+        print(f"{name:<20}{median:>12.1f}{min(durations):>12.1f}{extra:>10.1f}")
+        for cumulative_us, module_name in sorted(entries, reverse=True)[:args.top]:
+            print(f"    {cumulative_us / 1000:>8.1f} ms  {module_name}")
+        if name == "zeus_core.headless" and args.max_ms is not None and extra > args.max_ms:
+            print(f"  Uyarı: zeus_core.headless {extra:.1f} ms > {args.max_ms:g} ms", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Bellekte tutulan SMART okumalarının boyutu için karşılaştırma.
+
+Örnek smartctl çıktılarından N okuma üretilir (her okumada raw değerler değiştirilir) ve her biçim
+okumayı ayrıştırıcının yaptığı gibi metin alanlarından kurar; tracemalloc ile okuma başına kalıcı
+olarak ayrılan bellek ölçülür:
+- dict: eski biçim, öznitelik başına 8 anahtarlı sözlük listesi ve disk bilgisi sözlüğü
+- SmartAttribute: __slots__ kullanan öznitelik nesneleri listesi
+- SmartSnapshot: array tabanlı sütunlar (zeus_core.model)
+
+Örnek:
+    python3 benchmarks/bench_memory.py --snapshots 5000
+"""
+import sys
+import argparse
+import tracemalloc
+
+from common import load_fixtures
+from zeus_core.model import SmartAttribute, SmartSnapshot
+from zeus_core.parsing import parse_smart_attributes, parse_smart_info
+from zeus_core.smartctl import split_smart_output
+
+
+def vary(attributes, step):
+    """
+    Okumalar arasında değişen raw değerlerle öznitelik satırlarını metin alanları olarak üretir.
+    Sayılar ayrıştırıcıdaki gibi ölçüm sırasında int() ile oluşturulur; böylece her biçim kendi
+    tam sayı nesnelerinin maliyetini taşır.
+    """
+    return [(str(attr.id), attr.name, str(attr.current), str(attr.worst), str(attr.threshold), attr.type,
+             attr.updated, str(attr.raw_value + 1000 + step)) for attr in attributes]
+
+
+def make_attributes(rows):
+    return [SmartAttribute(int(attr_id), name, int(current), int(worst), int(threshold), attr_type, updated, int(raw))
+            for attr_id, name, current, worst, threshold, attr_type, updated, raw in rows]
+
+
+def build_dict(rows, info):
+    return {'info': dict(info), 'attributes': [attr.to_dict() for attr in make_attributes(rows)]}
+
+
+def build_objects(rows, info):
+    return {'info': dict(info), 'attributes': make_attributes(rows)}
+
+
+def build_snapshot(rows, info):
+    return SmartSnapshot(make_attributes(rows), dict(info))
+
+
+LAYOUTS = (("dict", build_dict), ("SmartAttribute", build_objects), ("SmartSnapshot", build_snapshot))
+
+
+def measure(builder, readings):
+    """builder ile tüm okumaları oluşturur; okuma başına ayrılan bayt sayısını döndürür."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [builder(rows, info) for rows, info in readings]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return allocated / len(readings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SMART okumalarının bellek kullanımı")
+    parser.add_argument("--snapshots", type=int, default=2000, help="Örnek başına üretilecek okuma sayısı")
+    parser.add_argument("--fixture", action="append", help="Yalnızca bu örnekleri kullan (uzantısız ad)")
+    args = parser.parse_args(argv)
+
+    print(f"{'örnek':<28}{'öznitelik':>10}" + "".join(f"{name:>16}" for name, _ in LAYOUTS))
+    for name, smart_output in load_fixtures(names=args.fixture):
+        attributes_output, info_output = split_smart_output(smart_output)
+        attributes = parse_smart_attributes(attributes_output)
+        info = parse_smart_info(info_output)
+        if not attributes:
+            continue
+        # Metin girdiler ölçümden önce hazırlanır; ölçülen, okuma başına saklanan yapının boyutudur
+        readings = [(vary(attributes, step), info) for step in range(args.snapshots)]
+        sizes = [measure(builder, readings) for _, builder in LAYOUTS]
+        print(f"{name:<28}{len(attributes):>10}" + "".join(f"{size:>14.0f} B" for size in sizes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
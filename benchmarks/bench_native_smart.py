@@ -0,0 +1,451 @@
+"""
+Yerel SMART arka ucunun (zeus_core.native_smart) sahte bir ioctl katmanıyla ölçülmesi ve denetimi.
+
+Gerçek disk yerine NativeSmartBackend'in ioctl/opener/closer kancalarına, smartctl -j örneklerinden
+(benchmarks/fixtures/smartctl/*.json) üretilmiş sektörlerle yanıt veren bir katman verilir. SG_IO
+isteklerinde komut bloğu (CDB) okunur, veri ve sense tamponları ctypes.memmove ile yerinde yazılır;
+NVMe yönetici komutlarında veri 'addr' adresine yazılır.
+
+--check şunları denetler:
+- IDENTIFY DEVICE, SMART READ DATA ve READ THRESHOLDS: öznitelikler ve disk bilgileri, aynı örneğin
+  -j ayrıştırmasıyla aynı çıkar
+- CHECK POWER MODE: bekleme kipindeki disk için DiskInStandby fırlatılır ve başka komut gönderilmez
+- NVMe Identify ve SMART/Health günlüğü: sağlık alanları örnektekilerle aynıdır
+- hata sense verisi (ILLEGAL REQUEST), bozuk sağlama toplamı, ioctl hatası ve NVMe durum kodunda
+  okuma None döner; ZEUS_NATIVE_SMART=1 iken get_smart_data sahte smartctl'ye geri döner
+- her durumda açılan aygıt kapatılır
+Varsayılan kipte okuma başına süre (ioctl + ayrıştırma + puanlama) ölçülür.
+
+Örnek:
+    python3 benchmarks/bench_native_smart.py --check
+    python3 benchmarks/bench_native_smart.py --min-time 0.5
+"""
+import os
+import sys
+import json
+import time
+import ctypes
+import argparse
+import tempfile
+
+from common import load_fixtures
+from fake_env import build_fake_environment
+from zeus_core import native_smart
+from zeus_core.native_smart import (
+    ATA_CHECK_POWER_MODE, ATA_IDENTIFY_DEVICE, ATA_SMART, NVME_ADMIN_GET_LOG_PAGE, NVME_ADMIN_IDENTIFY,
+    NVME_IOCTL_ADMIN_CMD, SECTOR_SIZE, SG_IO, SMART_READ_DATA, SMART_READ_THRESHOLDS,
+    DiskInStandby, NativeSmartBackend, NativeSmartError, read_native_smart
+)
+from zeus_core.parsing import parse_smart_snapshot
+from zeus_core.scoring import score_attributes
+
+ATA_FIXTURES = ("sata_hdd_wd_red", "failing_ssd_intel")
+NVME_FIXTURES = ("nvme_wd_sn770",)
+
+# Karşılaştırılan disk bilgileri (iki yolda da aynı alanlardan üretilenler)
+COMPARED_INFO = ("Device Model", "Serial Number", "Firmware Version", "User Capacity", "Rotation Rate",
+                 "SMART Supported", "Power On Hours", "Power Cycle Count")
+
+# CHECK POWER MODE yanıtının sector count değeri
+POWER_MODE_ACTIVE = 0xFF
+POWER_MODE_STANDBY = 0x00
+
+CHECK_CONDITION = 2
+SENSE_ILLEGAL_REQUEST = 0x05
+
+
+def ata_string(text, words):
+    """Metni ATA IDENTIFY biçimine (boşlukla doldurulmuş, bayt çiftleri yer değiştirmiş) çevirir."""
+    raw = bytearray(text.encode('ascii').ljust(words * 2)[:words * 2])
+    raw[0::2], raw[1::2] = raw[1::2], raw[0::2]
+    return bytes(raw)
+
+
+def with_checksum(sector):
+    """SMART veri yapısının son baytını 512 baytlık toplam 0 olacak şekilde yazar."""
+    sector[SECTOR_SIZE - 1] = -sum(sector[:SECTOR_SIZE - 1]) & 0xFF
+    return bytes(sector)
+
+
+def ata_sectors(document):
+    """-j örneğinden IDENTIFY DEVICE, SMART READ DATA ve READ THRESHOLDS sektörlerini üretir."""
+    identify = bytearray(SECTOR_SIZE)
+
+    def put_word(index, value):
+        identify[index * 2:index * 2 + 2] = (value & 0xFFFF).to_bytes(2, 'little')
+
+    identify[20:40] = ata_string(document['serial_number'], 10)
+    identify[46:54] = ata_string(document['firmware_version'], 4)
+    identify[54:94] = ata_string(document['model_name'], 20)
+    blocks = document['user_capacity']['blocks']
+    lba28 = min(blocks, 0x0FFFFFFF)
+    put_word(60, lba28)
+    put_word(61, lba28 >> 16)
+    for i in range(4):
+        put_word(100 + i, blocks >> (16 * i))
+    rotation = document.get('rotation_rate')
+    if rotation is not None:
+        put_word(217, 1 if rotation == 0 else rotation)
+    support = document.get('smart_support', {})
+    put_word(82, 1 if support.get('available') else 0)
+    put_word(85, 1 if support.get('enabled') else 0)
+
+    smart_data = bytearray(SECTOR_SIZE)
+    thresholds = bytearray(SECTOR_SIZE)
+    smart_data[0:2] = thresholds[0:2] = (0x0010).to_bytes(2, 'little')
+    for i, entry in enumerate(document['ata_smart_attributes']['table'][:30]):
+        offset = 2 + i * 12
+        smart_data[offset] = thresholds[offset] = entry['id']
+        smart_data[offset + 1:offset + 3] = entry['flags']['value'].to_bytes(2, 'little')
+        smart_data[offset + 3] = entry['value']
+        smart_data[offset + 4] = entry['worst']
+        smart_data[offset + 5:offset + 11] = entry['raw']['value'].to_bytes(6, 'little')
+        thresholds[offset + 1] = entry['thresh']
+    return bytes(identify), with_checksum(smart_data), with_checksum(thresholds)
+
+
+def nvme_pages(document):
+    """-j örneğinden NVMe Identify Controller, Identify Namespace ve SMART/Health sayfalarını üretir."""
+    controller = bytearray(4096)
+    controller[4:24] = document['serial_number'].encode('ascii').ljust(20)
+    controller[24:64] = document['model_name'].encode('ascii').ljust(40)
+    controller[64:72] = document['firmware_version'].encode('ascii').ljust(8)
+    controller[280:296] = document.get('nvme_total_capacity', 0).to_bytes(16, 'little')
+
+    namespace = bytearray(4096)
+    size = document['user_capacity']
+    namespace[0:8] = size['blocks'].to_bytes(8, 'little')
+    namespace[128 + 2] = (size['bytes'] // size['blocks']).bit_length() - 1 # LBA biçimi 0: lbads
+
+    health = document['nvme_smart_health_information_log']
+    log = bytearray(SECTOR_SIZE)
+    log[0] = health['critical_warning']
+    log[1:3] = (health['temperature'] + 273).to_bytes(2, 'little')
+    log[3] = health['available_spare']
+    log[4] = health['available_spare_threshold']
+    log[5] = health['percentage_used']
+    for offset, field in ((32, 'data_units_read'), (48, 'data_units_written'), (64, 'host_reads'),
+                          (80, 'host_writes'), (96, 'controller_busy_time'), (112, 'power_cycles'),
+                          (128, 'power_on_hours'), (144, 'unsafe_shutdowns'), (160, 'media_errors'),
+                          (176, 'num_err_log_entries')):
+        log[offset:offset + 16] = health[field].to_bytes(16, 'little')
+    return bytes(controller), bytes(namespace), bytes(log)
+
+
+def ata_status_sense(sector_count, descriptor=True):
+    """CK_COND ile dönen ATA yazmaçları: NO SENSE, ATA PASS-THROUGH bilgisi mevcut (00/1D)."""
+    if descriptor:
+        sense = bytearray(22)
+        sense[0], sense[1], sense[2], sense[3], sense[7] = 0x72, 0x00, 0x00, 0x1D, 14
+        sense[8], sense[9] = 0x09, 0x0C # ATA Status Return tanımlayıcısı
+        sense[13] = sector_count
+        return bytes(sense)
+    sense = bytearray(18)
+    sense[0], sense[2], sense[6], sense[7], sense[13] = 0x70, 0x00, sector_count, 10, 0x1D
+    return bytes(sense)
+
+
+def illegal_request_sense():
+    """Komutu desteklemeyen köprünün yanıtı: ILLEGAL REQUEST, INVALID COMMAND OPERATION CODE (20/00)."""
+    return bytes([0x72, SENSE_ILLEGAL_REQUEST, 0x20, 0x00, 0, 0, 0, 0])
+
+
+class FakeDisk:
+    """
+    Tek bir diskin ioctl yanıtları. ATA diskler için sectors (identify, veri, eşikler), NVMe diskler
+    için pages (denetleyici, isim alanı, günlük) verilir. fail, hatalı yanıt verilecek komut
+    ('identify', 'smart' ...) ve biçimidir: 'sense', 'checksum', 'oserror' veya 'status'.
+    """
+
+    def __init__(self, sectors=None, pages=None, power_mode=POWER_MODE_ACTIVE, descriptor_sense=True, fail=None):
+        self.sectors = sectors
+        self.pages = pages
+        self.power_mode = power_mode
+        self.descriptor_sense = descriptor_sense
+        self.fail = fail or (None, None)
+        self.commands = [] # gönderilen komutların adları, sırayla
+
+
+class FakeIoctl:
+    """NativeSmartBackend'e verilen sahte opener, closer ve ioctl; aygıt yolu -> FakeDisk."""
+
+    def __init__(self, disks):
+        self.disks = disks
+        self.open_fds = {} # fd -> FakeDisk
+        self.next_fd = 100
+        self.opened = self.closed = 0
+
+    def backend(self):
+        return NativeSmartBackend(ioctl=self.ioctl, opener=self.opener, closer=self.closer)
+
+    def opener(self, path):
+        if path not in self.disks:
+            raise FileNotFoundError(2, "No such device", path)
+        self.next_fd += 1
+        self.open_fds[self.next_fd] = self.disks[path]
+        self.opened += 1
+        return self.next_fd
+
+    def closer(self, fd):
+        del self.open_fds[fd]
+        self.closed += 1
+
+    def ioctl(self, fd, request, arg):
+        disk = self.open_fds[fd]
+        if request == SG_IO:
+            return self._sg_io(disk, arg)
+        if request == NVME_IOCTL_ADMIN_CMD:
+            return self._nvme_admin(disk, arg)
+        raise OSError(25, "Inappropriate ioctl for device")
+
+    def _sg_io(self, disk, hdr):
+        cdb = ctypes.string_at(hdr.cmdp, hdr.cmd_len)
+        command, features = cdb[14], cdb[4]
+        identify, smart_data, thresholds = disk.sectors or (None, None, None)
+        if command == ATA_CHECK_POWER_MODE:
+            name, data = 'power', None
+        elif command == ATA_IDENTIFY_DEVICE:
+            name, data = 'identify', identify
+        elif command == ATA_SMART and features == SMART_READ_DATA:
+            name, data = 'smart', smart_data
+        elif command == ATA_SMART and features == SMART_READ_THRESHOLDS:
+            name, data = 'thresholds', thresholds
+        else:
+            name, data = f"0x{command:02x}", None
+        disk.commands.append(name)
+
+        failing, mode = disk.fail
+        if failing == name and mode == 'oserror':
+            raise OSError(5, "Input/output error")
+        if failing == name and mode == 'sense' or data is None and name != 'power':
+            self._write_sense(hdr, illegal_request_sense())
+            return 0
+        if name == 'power':
+            self._write_sense(hdr, ata_status_sense(disk.power_mode, disk.descriptor_sense))
+            return 0
+        if failing == name and mode == 'checksum':
+            data = data[:-1] + bytes([(data[-1] + 1) & 0xFF])
+        ctypes.memmove(hdr.dxferp, data, min(len(data), hdr.dxfer_len))
+        hdr.status = 0
+        return 0
+
+    @staticmethod
+    def _write_sense(hdr, sense):
+        length = min(len(sense), hdr.mx_sb_len)
+        ctypes.memmove(hdr.sbp, sense, length)
+        hdr.sb_len_wr = length
+        hdr.status = CHECK_CONDITION
+        hdr.driver_status = 0x08 # DRIVER_SENSE
+
+    def _nvme_admin(self, disk, cmd):
+        controller, namespace, log = disk.pages or (None, None, None)
+        if cmd.opcode == NVME_ADMIN_IDENTIFY:
+            name, data = ('controller', controller) if cmd.cdw10 == 1 else ('namespace', namespace)
+        elif cmd.opcode == NVME_ADMIN_GET_LOG_PAGE:
+            name, data = 'log', log
+        else:
+            name, data = f"0x{cmd.opcode:02x}", None
+        disk.commands.append(name)
+
+        failing, mode = disk.fail
+        if failing == name and mode == 'oserror':
+            raise OSError(5, "Input/output error")
+        if data is None or failing == name and mode == 'status':
+            return 0x4002 # DNR + Invalid Field in Command
+        ctypes.memmove(cmd.addr, data, min(len(data), cmd.data_len))
+        return 0
+
+
+def fixture_documents(names):
+    return {name: json.loads(text) for name, text in load_fixtures(names=names)}
+
+
+def compare_snapshots(label, native_snapshot, expected_snapshot):
+    """Yerel okuma ile -j ayrıştırmasının özniteliklerini ve disk bilgilerini karşılaştırır."""
+    problems = []
+
+    def columns(snapshot):
+        return [(a.id, a.current, a.worst, a.threshold, a.raw_value, a.type, a.updated) for a in snapshot]
+
+    got, want = columns(native_snapshot), columns(expected_snapshot)
+    if got != want:
+        problems.append(f"{label}: öznitelikler farklı\n  beklenen {want}\n  bulunan  {got}")
+    for key in COMPARED_INFO:
+        if native_snapshot.info.get(key) != expected_snapshot.info.get(key):
+            problems.append(f"{label}: '{key}' beklenen {expected_snapshot.info.get(key)!r}, "
+                            f"bulunan {native_snapshot.info.get(key)!r}")
+    # Uyarı metinleri karşılaştırılmaz: -j örneğindeki adlar drivedb'den, yerel arka ucunkiler varsayılan adlardır
+    if score_attributes(native_snapshot)[0] != score_attributes(expected_snapshot)[0]:
+        problems.append(f"{label}: puan farklı")
+    return problems
+
+
+def check_ata(documents):
+    problems = []
+    for name, document in documents.items():
+        for descriptor_sense in (True, False):
+            disk = FakeDisk(ata_sectors(document), descriptor_sense=descriptor_sense)
+            fake = FakeIoctl({"/dev/sdx": disk})
+            data = read_native_smart("/dev/sdx", fake.backend(), check_standby=True)
+            label = f"{name} ({'tanımlayıcı' if descriptor_sense else 'sabit'} sense)"
+            if data is None:
+                problems.append(f"{label}: okunamadı ({disk.commands})")
+                continue
+            if disk.commands != ['power', 'identify', 'smart', 'thresholds']:
+                problems.append(f"{label}: beklenmeyen komut sırası {disk.commands}")
+            problems += compare_snapshots(label, parse_smart_snapshot(data, data),
+                                          parse_smart_snapshot(document, document))
+
+        # Bekleme kipi: CHECK POWER MODE dışında komut gönderilmez, disk uyandırılmaz
+        for descriptor_sense in (True, False):
+            disk = FakeDisk(ata_sectors(document), power_mode=POWER_MODE_STANDBY, descriptor_sense=descriptor_sense)
+            try:
+                read_native_smart("/dev/sdx", FakeIoctl({"/dev/sdx": disk}).backend(), check_standby=True)
+                problems.append(f"{name}: bekleme kipindeki disk için DiskInStandby fırlatılmadı")
+            except DiskInStandby:
+                if disk.commands != ['power']:
+                    problems.append(f"{name}: bekleme kipinde komut gönderildi {disk.commands}")
+        # Bekleme denetimi kapalıyken güç kipi sorulmaz
+        disk = FakeDisk(ata_sectors(document), power_mode=POWER_MODE_STANDBY)
+        if read_native_smart("/dev/sdx", FakeIoctl({"/dev/sdx": disk}).backend()) is None or 'power' in disk.commands:
+            problems.append(f"{name}: bekleme denetimi kapalıyken okuma beklendiği gibi değil {disk.commands}")
+    return problems
+
+
+def check_nvme(documents):
+    problems = []
+    for name, document in documents.items():
+        disk = FakeDisk(pages=nvme_pages(document), power_mode=POWER_MODE_STANDBY)
+        data = read_native_smart("/dev/nvme0n1", FakeIoctl({"/dev/nvme0n1": disk}).backend(), check_standby=True)
+        if data is None:
+            problems.append(f"{name}: okunamadı ({disk.commands})")
+            continue
+        if disk.commands != ['controller', 'namespace', 'log']:
+            problems.append(f"{name}: beklenmeyen komut sırası {disk.commands}")
+        expected = document['nvme_smart_health_information_log']
+        for field, value in data['nvme_smart_health_information_log'].items():
+            if expected.get(field) != value:
+                problems.append(f"{name}: sağlık alanı '{field}' beklenen {expected.get(field)!r}, bulunan {value!r}")
+        for key in ("model_name", "serial_number", "firmware_version", "user_capacity", "nvme_total_capacity"):
+            if data.get(key) != document.get(key):
+                problems.append(f"{name}: '{key}' beklenen {document.get(key)!r}, bulunan {data.get(key)!r}")
+        problems += compare_snapshots(name, parse_smart_snapshot(data, data), parse_smart_snapshot(document, document))
+
+        # İsim alanı okunamazsa kapasite denetleyiciden, okuma yine başarılı
+        disk = FakeDisk(pages=nvme_pages(document), fail=('namespace', 'status'))
+        data = read_native_smart("/dev/nvme0n1", FakeIoctl({"/dev/nvme0n1": disk}).backend())
+        if data is None or "user_capacity" in data or data.get("nvme_total_capacity") != document.get("nvme_total_capacity"):
+            problems.append(f"{name}: isim alanı okunamayınca sonuç beklendiği gibi değil")
+    return problems
+
+
+def check_failures(ata_document, nvme_document):
+    """Hatalı yanıtlarda okuma None döner (çağıran smartctl'ye geçer) ve aygıt her zaman kapatılır."""
+    problems = []
+    cases = [
+        ("IDENTIFY ILLEGAL REQUEST", "/dev/sdx", FakeDisk(ata_sectors(ata_document), fail=('identify', 'sense'))),
+        ("READ DATA ILLEGAL REQUEST", "/dev/sdx", FakeDisk(ata_sectors(ata_document), fail=('smart', 'sense'))),
+        ("READ DATA sağlama toplamı", "/dev/sdx", FakeDisk(ata_sectors(ata_document), fail=('smart', 'checksum'))),
+        ("CHECK POWER MODE ioctl hatası", "/dev/sdx", FakeDisk(ata_sectors(ata_document), fail=('power', 'oserror'))),
+        ("boş IDENTIFY", "/dev/sdx", FakeDisk((bytes(SECTOR_SIZE),) + ata_sectors(ata_document)[1:])),
+        ("NVMe günlük durum kodu", "/dev/nvme0n1", FakeDisk(pages=nvme_pages(nvme_document), fail=('log', 'status'))),
+        ("NVMe ioctl hatası", "/dev/nvme0n1", FakeDisk(pages=nvme_pages(nvme_document), fail=('controller', 'oserror'))),
+    ]
+    for label, path, disk in cases:
+        fake = FakeIoctl({path: disk})
+        try:
+            data = read_native_smart(path, fake.backend(), check_standby=True)
+        except NativeSmartError as e:
+            problems.append(f"{label}: hata dışarı taşındı ({e})")
+            continue
+        if data is not None:
+            problems.append(f"{label}: okuma başarılı sayıldı")
+        if fake.opened != 1 or fake.closed != 1 or fake.open_fds:
+            problems.append(f"{label}: aygıt kapatılmadı (açılan {fake.opened}, kapatılan {fake.closed})")
+    # Çözülmesi gereken bir eşik sektörü bozuksa eşikler atlanır, okuma sürer
+    disk = FakeDisk(ata_sectors(ata_document), fail=('thresholds', 'checksum'))
+    data = read_native_smart("/dev/sdx", FakeIoctl({"/dev/sdx": disk}).backend())
+    if data is None or any(entry['thresh'] for entry in data['ata_smart_attributes']['table']):
+        problems.append("READ THRESHOLDS sağlama toplamı: eşikler atlanmadı")
+    if read_native_smart("/dev/sdy", FakeIoctl({}).backend()) is not None:
+        problems.append("açılamayan aygıt: okuma başarılı sayıldı")
+    return problems
+
+
+def check_smartctl_fallback(ata_document):
+    """ZEUS_NATIVE_SMART=1 iken yerel arka uç ILLEGAL REQUEST alırsa get_smart_data smartctl'ye geçer."""
+    from zeus_core.acquisition import get_smart_data
+
+    problems = []
+    saved_environ, saved_backend = dict(os.environ), native_smart._backend
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            os.environ.update(build_fake_environment(directory, 2, latency=0.0, jitter=0.0))
+            os.environ['ZEUS_NATIVE_SMART'] = '1'
+            os.environ['ZEUS_STANDBY_CHECK'] = '0'
+            for fail in (('identify', 'sense'), ('identify', 'oserror')):
+                disk = FakeDisk(ata_sectors(ata_document), fail=fail)
+                fake = FakeIoctl({"/dev/sda": disk})
+                native_smart._backend = fake.backend()
+                attributes_output, info_output, error_message = get_smart_data("/dev/sda", ['auto', 'sat', 'nvme', 'scsi'])
+                if not disk.commands or 'identify' not in disk.commands:
+                    problems.append(f"smartctl'ye geçiş ({fail[1]}): yerel arka uç denenmedi")
+                if isinstance(info_output, dict) or not (attributes_output and info_output) or error_message:
+                    problems.append(f"smartctl'ye geçiş ({fail[1]}): smartctl sonucu alınamadı ({error_message!r})")
+                if fake.open_fds:
+                    problems.append(f"smartctl'ye geçiş ({fail[1]}): aygıt kapatılmadı")
+        finally:
+            native_smart._backend = saved_backend
+            os.environ.clear()
+            os.environ.update(saved_environ)
+    return problems
+
+
+def run_checks():
+    ata_documents = fixture_documents(ATA_FIXTURES)
+    nvme_documents = fixture_documents(NVME_FIXTURES)
+    problems = check_ata(ata_documents)
+    problems += check_nvme(nvme_documents)
+    problems += check_failures(ata_documents[ATA_FIXTURES[0]], nvme_documents[NVME_FIXTURES[0]])
+    problems += check_smartctl_fallback(ata_documents[ATA_FIXTURES[0]])
+    for problem in problems:
+        print(problem)
+    print(f"{len(ata_documents)} ATA, {len(nvme_documents)} NVMe örneği: "
+          + (f"{len(problems)} sorun" if problems else "tümü beklendiği gibi"))
+    return 1 if problems else 0
+
+
+def time_reads(path, disk, min_time):
+    """Okuma + ayrıştırma + puanlama başına süre (sn)."""
+    backend = FakeIoctl({path: disk}).backend()
+    count, started = 0, time.perf_counter()
+    while True:
+        data = backend.read(path, check_standby=True)
+        score_attributes(parse_smart_snapshot(data, data))
+        count += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            return elapsed / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel SMART arka ucu, sahte ioctl katmanıyla")
+    parser.add_argument("--check", action="store_true", help="Sahte ioctl yanıtlarıyla doğruluk denetimi, ölçüm yapma")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Örnek başına en az ölçüm süresi (sn)")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        return run_checks()
+
+    print(f"{'örnek':<24}{'okuma µs':>10}{'okuma/sn':>10}")
+    for name, document in fixture_documents(ATA_FIXTURES).items():
+        per_read = time_reads("/dev/sdx", FakeDisk(ata_sectors(document)), args.min_time)
+        print(f"{name:<24}{per_read * 1e6:>10.1f}{1 / per_read:>10.0f}")
+    for name, document in fixture_documents(NVME_FIXTURES).items():
+        per_read = time_reads("/dev/nvme0n1", FakeDisk(pages=nvme_pages(document)), args.min_time)
+        print(f"{name:<24}{per_read * 1e6:>10.1f}{1 / per_read:>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+SMART ayrıştırıcıları ve sağlık puanı için mikro karşılaştırma.
+
+benchmarks/fixtures/smartctl altındaki gerçek smartctl çıktıları (SATA HDD/SSD, NVMe, SAS,
+USB köprüleri, arızalı diskler; metin ve -j biçimi) üzerinde her ön yüzün
+parse_smart_attributes, parse_smart_info ve calculate_health_score işlevlerini ölçer ve
+örnek başına işlem hızını (snapshot/sn) yazar.
+
+Doğruluk için sonuçlar fixtures/smartctl_expected.json ile karşılaştırılır (--check); davranış bilerek
+değiştirildiğinde --update ile yenilenir. Hız gerilemeleri için bir ölçüm --save ile
+kaydedilip sonraki ölçüm --compare ile karşılaştırılabilir.
+
+Örnek:
+    python3 benchmarks/bench_parsers.py --check
+    python3 benchmarks/bench_parsers.py --save /tmp/once.json
+    python3 benchmarks/bench_parsers.py --compare /tmp/once.json --tolerance 0.15
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+from common import FIXTURE_DIR, FRONTENDS, load_available_frontends, load_fixtures
+from zeus_core import parsing
+from zeus_core.smartctl import split_smart_output
+
+EXPECTED_FILE = os.path.join(os.path.dirname(FIXTURE_DIR), "smartctl_expected.json")
+STAGES = ("split", "attributes", "info", "score")
+
+
+def frontend_parsers(module):
+    """
+    Ön yüzün kullandığı (parse_smart_attributes, parse_smart_info) ikilisini döndürür.
+    Ayrıştırıcıları kendi ad alanına almayan ön yüzler (konsol: parse_smart_snapshot) ortak çekirdeği kullanır.
+    """
+    return (getattr(module, "parse_smart_attributes", parsing.parse_smart_attributes),
+            getattr(module, "parse_smart_info", parsing.parse_smart_info))
+
+
+def score_snapshot(module, attributes, info):
+    """Ön yüzün calculate_health_score imzasına göre puanı hesaplar (konsol SMART durumunu da ister)."""
+    if module.calculate_health_score.__code__.co_argcount >= 3:
+        return module.calculate_health_score(attributes, info, info.get("SMART Supported") == "Enabled")
+    return module.calculate_health_score(attributes, info)
+
+
+def analyze_snapshot(module, smart_output):
+    """Bir smartctl çıktısını ön yüzün hattından geçirir ve karşılaştırma için özetini döndürür."""
+    parse_attributes, parse_info = frontend_parsers(module)
+    attributes_output, info_output = split_smart_output(smart_output)
+    attributes = parse_attributes(attributes_output)
+    info = parse_info(info_output)
+    score, status, _ = score_snapshot(module, attributes, info)
+    return {
+        "attribute_ids": [attr.id for attr in attributes],
+        "raw_values": {str(attr.id): attr.raw_value for attr in attributes},
+        "info": info,
+        "score": score,
+        "status": status,
+    }
+
+
+def time_stage(func, inputs, min_time):
+    """
+    func'ı girdiler üzerinde en az min_time saniye döndürür; çağrı başına en iyi süreyi döndürür.
+    Girdiler dönüşümlü kullanılır (aynı metin nesnesi art arda verilmez, JSON çözümü önbelleğe takılmaz).
+    """
+    best = float("inf")
+    total_elapsed = 0.0
+    loops = 1
+    while total_elapsed < min_time:
+        started = time.perf_counter()
+        for i in range(loops):
+            func(inputs[i % len(inputs)])
+        elapsed = time.perf_counter() - started
+        total_elapsed += elapsed
+        best = min(best, elapsed / loops)
+        loops *= 2
+    return best
+
+
+def run_pipeline(module, smart_output):
+    """GUI/konsolun bir disk için yaptığı tam akış: bölme, iki ayrıştırma ve puanlama."""
+    parse_attributes, parse_info = frontend_parsers(module)
+    attributes_output, info_output = split_smart_output(smart_output)
+    attributes = parse_attributes(attributes_output)
+    info = parse_info(info_output)
+    return score_snapshot(module, attributes, info)
+
+
+def benchmark_snapshot(module, smart_output, min_time):
+    """
+    Bir örnek için aşama başına çağrı süresini (saniye) döndürür. JSON çıktısında çözme maliyeti
+    her iki ayrıştırma aşamasında da görünür; 'total' gerçek akışı (tek çözme) ayrıca ölçer.
+    """
+    # İkinci kopya: load_smart_json son çözülen nesneyi hatırladığından, ölçüm her turda gerçek çözümü içersin
+    outputs = [smart_output, smart_output + "\n"]
+    split_outputs = [split_smart_output(output) for output in outputs]
+    parse_attributes, parse_info = frontend_parsers(module)
+    attributes = parse_attributes(split_outputs[0][0])
+    info = parse_info(split_outputs[0][1])
+    timings = {
+        "split": time_stage(split_smart_output, outputs, min_time),
+        "attributes": time_stage(lambda parts: parse_attributes(parts[0]), split_outputs, min_time),
+        "info": time_stage(lambda parts: parse_info(parts[1]), split_outputs, min_time),
+        "score": time_stage(lambda _: score_snapshot(module, attributes, info), [None], min_time),
+    }
+    timings["total"] = time_stage(lambda output: run_pipeline(module, output), outputs, min_time)
+    return timings
+
+
+def check_results(modules, fixtures, expected):
+    """Ayrıştırma/puan sonuçlarını beklenen değerlerle karşılaştırır; farkların listesini döndürür."""
+    problems = []
+    for frontend, module in modules.items():
+        for name, smart_output in fixtures:
+            want = expected.get(frontend, {}).get(name)
+            got = json.loads(json.dumps(analyze_snapshot(module, smart_output)))
+            if want is None:
+                problems.append(f"{frontend}/{name}: beklenen sonuç yok (--update ile ekleyin)")
+                continue
+            for key in sorted(set(want) | set(got)):
+                if want.get(key) != got.get(key):
+                    problems.append(f"{frontend}/{name}: '{key}' beklenen {want.get(key)!r}, bulunan {got.get(key)!r}")
+    return problems
+
+
+def update_expected(modules, fixtures, path=EXPECTED_FILE):
+    """Yüklenebilen ön yüzlerin güncel sonuçlarını beklenen değer dosyasına yazar (diğer ön yüzlerin kayıtları korunur)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+    except (OSError, ValueError):
+        expected = {}
+    for frontend, module in modules.items():
+        expected[frontend] = {name: analyze_snapshot(module, smart_output) for name, smart_output in fixtures}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(expected, f, indent=1, ensure_ascii=False, sort_keys=True)
+        f.write("\n")
+
+
+def print_report(results):
+    """Aşama başına mikro saniye ve tam akışın snapshot/sn değerini yazar."""
+    header = f"{'ön yüz':<8} {'örnek':<28}" + "".join(f"{stage + ' µs':>14}" for stage in STAGES) + f"{'snapshot/sn':>14}"
+    print(header)
+    print("-" * len(header))
+    for frontend, per_fixture in results.items():
+        for name, timings in per_fixture.items():
+            row = f"{frontend:<8} {name:<28}" + "".join(f"{timings[stage] * 1e6:>14.1f}" for stage in STAGES)
+            print(row + f"{1 / timings['total']:>14.0f}")
+
+
+def compare_results(results, baseline, tolerance):
+    """Toplam süresi temel ölçüme göre 'tolerance' oranından fazla artan örnekleri döndürür."""
+    regressions = []
+    for frontend, per_fixture in results.items():
+        for name, timings in per_fixture.items():
+            before = baseline.get(frontend, {}).get(name, {}).get("total")
+            if before and timings["total"] > before * (1 + tolerance):
+                regressions.append(f"{frontend}/{name}: {before * 1e6:.1f} µs -> {timings['total'] * 1e6:.1f} µs "
+                                   f"(%{(timings['total'] / before - 1) * 100:.0f} yavaş)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SMART ayrıştırıcı ve puanlama mikro karşılaştırması")
+    parser.add_argument("--frontend", choices=sorted(FRONTENDS), action="append",
+                        help="Yalnızca verilen ön yüzü ölç (birden fazla verilebilir)")
+    parser.add_argument("--fixture", action="append", help="Yalnızca verilen örneği kullan (uzantısız ad)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Aşama başına en az ölçüm süresi (sn)")
+    parser.add_argument("--check", action="store_true", help="Sonuçları beklenen değerlerle karşılaştır, ölçüm yapma")
+    parser.add_argument("--update", action="store_true", help="Beklenen değerleri güncel sonuçlarla yeniden yaz")
+    parser.add_argument("--save", help="Ölçümleri JSON olarak bu dosyaya kaydet")
+    parser.add_argument("--compare", help="Ölçümleri daha önce --save ile kaydedilen dosyayla karşılaştır")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="--compare için izin verilen yavaşlama oranı")
+    args = parser.parse_args(argv)
+
+    modules = load_available_frontends(args.frontend or sorted(FRONTENDS))
+    if not modules:
+        print("Hiçbir ön yüz yüklenemedi.", file=sys.stderr)
+        return 2
+    fixtures = load_fixtures(names=args.fixture)
+
+    if args.update:
+        update_expected(modules, fixtures)
+        print(f"{EXPECTED_FILE} güncellendi.")
+        return 0
+    if args.check:
+        with open(EXPECTED_FILE, 'r', encoding='utf-8') as f:
+            problems = check_results(modules, fixtures, json.load(f))
+        for problem in problems:
+            print(problem)
+        print(f"{len(fixtures)} örnek, {len(modules)} ön yüz: " + (f"{len(problems)} fark" if problems else "tümü beklendiği gibi"))
+        return 1 if problems else 0
+
+    results = {frontend: {name: benchmark_snapshot(module, smart_output, args.min_time)
+                          for name, smart_output in fixtures}
+               for frontend, module in modules.items()}
+    print_report(results)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            regressions = compare_results(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print("Gerileme: " + regression)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Ajan → toplayıcı gönderim hattının (zeus_core.push, zeus_core.collector) bant genişliği ve toplayıcı işi.
+
+Toplayıcı geri döngü (loopback) adresinde, geçici bir geçmiş veritabanıyla aynı süreçte çalışır;
+ajan örnek smartctl çıktılarından N diskli yoklamalar üretir. Her yoklamada disklerin --change oranı
+kadarında iki özniteliğin raw değeri değişir, diğerleri aynı kalır. Yoklama başına ölçülenler:
+- gönderilen (sıkıştırılmış) bayt ve aynı yoklamanın tamamını gönderseydik gidecek bayt
+- toplayıcının gönderimi uygulayıp geçmişe yazma süresi
+Sonunda toplayıcı yeniden başlatılmış gibi durumu silinir; ajanın baştan gönderimi (409) sonrası
+toplayıcıdaki disk durumlarının ajandakilerle aynı olduğu denetlenir.
+
+Örnek:
+    python3 benchmarks/bench_push.py --disks 500 --polls 20
+    python3 benchmarks/bench_push.py --disks 500 --change 0.05
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+
+from common import load_fixtures
+from zeus_core.collector import Collector, create_collector_server
+from zeus_core.history import HistoryStore
+from zeus_core.model import SmartSnapshot
+from zeus_core.parsing import parse_smart_snapshot
+from zeus_core.push import PushAgent, diff_states, encode_batch, snapshot_state
+from zeus_core.smartctl import split_smart_output
+
+CHANGE_RATES = (0.0, 0.01, 0.1, 1.0)
+
+
+class TimedCollector(Collector):
+    """Uygulama süresini ölçen toplayıcı."""
+
+    def __init__(self, record):
+        super().__init__(record)
+        self.durations = []
+
+    def apply(self, document, size=0):
+        started = time.perf_counter()
+        result = super().apply(document, size)
+        self.durations.append(time.perf_counter() - started)
+        return result
+
+
+def fixture_snapshots():
+    snapshots = []
+    for _, smart_output in load_fixtures():
+        snapshot = parse_smart_snapshot(*split_smart_output(smart_output))
+        if snapshot:
+            snapshots.append(snapshot)
+    return snapshots
+
+
+def make_poll(templates, disk_count, counters, change, taken_at, rng):
+    """Yoklama okumaları; disklerin 'change' oranında ilk iki özniteliğin raw değeri artar."""
+    entries = []
+    for i in range(disk_count):
+        template = templates[i % len(templates)]
+        if rng.random() < change:
+            counters[i] += 1
+        attributes = list(template)
+        for attr in attributes[:2]:
+            attr.raw_value += counters[i]
+        entries.append((f"bench:disk{i:05d}", SmartSnapshot(attributes, template.info, timestamp=taken_at), 100))
+    return entries
+
+
+def run_rate(directory, templates, disk_count, polls, change):
+    store = HistoryStore(os.path.join(directory, f"collector-{change:g}.sqlite3"), retention_days=0,
+                         background_rollup=False)
+    collector = TimedCollector(store.record)
+    server = create_collector_server("127.0.0.1", 0, collector)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    agent = PushAgent(f"http://{host}:{port}/push", host="bench")
+    rng = random.Random(0)
+    counters = [0] * disk_count
+    now = time.time()
+    sent, full, durations = [], [], []
+    try:
+        for step in range(polls + 1):
+            entries = make_poll(templates, disk_count, counters, change, now - (polls - step) * 60, rng)
+            agent.add(entries)
+            before, applied = agent.stats['bytes'], len(collector.durations)
+            assert agent.flush()
+            if step == 0:
+                continue # İlk gönderim tüm durumu taşır
+            sent.append(agent.stats['bytes'] - before)
+            durations.append(sum(collector.durations[applied:]))
+            full.append(len(encode_batch({'entries': [
+                dict(diff_states(None, snapshot_state(snapshot, score)), k=key, t=snapshot.timestamp)
+                for key, snapshot, score in entries]})))
+
+        # Toplayıcı yeniden başlatıldı: durum yok, ajan 409 alıp baştan gönderir
+        collector.sessions.clear()
+        agent.add(make_poll(templates, disk_count, counters, 1.0, now + 60, rng))
+        assert agent.flush()
+        disks = collector.sessions["bench"]['disks']
+        for disk_key, state in agent.tip.items():
+            assert disks[disk_key]['attributes'] == state['attributes'] and disks[disk_key]['score'] == state['score']
+        assert agent.stats['resyncs'] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+        store.close()
+    sent.sort()
+    durations.sort()
+    middle = len(sent) // 2
+    print(f"değişim %{change * 100:g}: yoklama başına {sent[middle] / 1024:.1f} KB "
+          f"(tamamı {full[middle] / 1024:.1f} KB), toplayıcı {durations[middle] * 1000:.1f} ms; "
+          f"{collector.stats['entries']} okuma yazıldı")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ajan → toplayıcı gönderim hattı")
+    parser.add_argument("--disks", type=int, default=500)
+    parser.add_argument("--polls", type=int, default=20)
+    parser.add_argument("--change", type=float, help="Her yoklamada değişen disk oranı (varsayılan: birkaç oran)")
+    args = parser.parse_args(argv)
+
+    templates = fixture_snapshots()
+    with tempfile.TemporaryDirectory() as directory:
+        for change in ([args.change] if args.change is not None else CHANGE_RATES):
+            run_rate(directory, templates, args.disks, args.polls, change)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
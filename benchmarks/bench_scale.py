@@ -0,0 +1,236 @@
+"""
+Uçtan uca ölçek karşılaştırması: N sahte disk üzerinde konsol analizini ve GUI disk gösterimini çalıştırır.
+
+Sahte smartctl/lsblk ve sysfs ağacı fake_env.py ile kurulur; gecikme, takılma ve hata oranları
+ayarlanabilir. Her kip için duvar saati süresi, komut çalıştırma (fork) sayısı, en yüksek bellek
+(RSS) ve aşama başına gecikme raporlanır. Birden fazla kip verildiğinde her biri ayrı bir süreçte
+çalıştırılır; böylece bellek ölçümleri birbirine karışmaz.
+
+Örnek:
+    python3 benchmarks/bench_scale.py --disks 500 --latency 0.2 --timeout-rate 0.01 --budget 5
+    python3 benchmarks/bench_scale.py --mode console --disks 100 --repeat 2 --json
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import resource
+import subprocess
+import contextlib
+
+from common import load_frontend
+from fake_env import build_fake_environment, count_forks
+
+MODES = ("console", "gui")
+
+
+class StageTimer:
+    """Modül işlevlerini sarmalayarak aşama başına çağrı sayısı ve toplam süre toplar."""
+
+    def __init__(self):
+        self.stages = {}
+        self.disk_latencies = []
+
+    def add(self, stage, elapsed):
+        calls, total = self.stages.get(stage, (0, 0.0))
+        self.stages[stage] = (calls + 1, total + elapsed)
+
+    def wrap(self, owner, name, stage):
+        func = getattr(owner, name)
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - started)
+        setattr(owner, name, timed)
+
+    def wrap_generator(self, owner, name, stage, latency_index=None):
+        """Üreteç işlevini, tükenene kadar geçen süreyi ölçecek şekilde sarmalar."""
+        func = getattr(owner, name)
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                for item in func(*args, **kwargs):
+                    if latency_index is not None:
+                        self.disk_latencies.append(item[latency_index])
+                    yield item
+            finally:
+                self.add(stage, time.perf_counter() - started)
+        setattr(owner, name, timed)
+
+    def report(self):
+        return {stage: {"calls": calls, "total_s": total} for stage, (calls, total) in self.stages.items()}
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def scripted_input(prompt=""):
+    """Konsolun sorularını yanıtlar: detay menüsünden 'm' ile çıkar, diğerlerinde Enter'a basar."""
+    return "m" if "'m'" in prompt else ""
+
+
+def run_console(repeat):
+    """Konsolun analyze_disks akışını etkileşimsiz çalıştırır."""
+    module = load_frontend("console")
+    timer = StageTimer()
+    timer.wrap(module, "get_disk_list_linux", "enumerate")
+    timer.wrap_generator(module, "collect_smart_data_parallel", "collect", latency_index=5)
+    timer.wrap(module, "parse_smart_snapshot", "parse")
+    timer.wrap(module, "calculate_health_score", "score")
+    module.clear_screen = lambda: None # 'clear' komutu her ekranda fork eder, ölçümü bozmasın
+    module.input = scripted_input
+
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            module.analyze_disks()
+        runs.append(time.perf_counter() - started)
+    return timer, runs
+
+
+def run_gui(repeat):
+    """GUI'yi ekransız açar ve her diski sırayla seçip verisi gösterilene kadar bekler."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    module = load_frontend("gui")
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    timer = StageTimer()
+    timer.wrap(module, "get_disk_list", "enumerate")
+    timer.wrap(module, "parse_smart_attributes", "parse_attributes")
+    timer.wrap(module, "parse_smart_info", "parse_info")
+    timer.wrap(module, "calculate_health_score", "score")
+    timer.wrap(module.ZeusHDDDoctor, "render_disk_data", "render")
+
+    started = time.perf_counter()
+    window = module.ZeusHDDDoctor()
+    timer.add("window", time.perf_counter() - started)
+
+    runs = []
+    try:
+        for _ in range(repeat):
+            run_started = time.perf_counter()
+            for row in range(window.disk_list_widget.count()):
+                item = window.disk_list_widget.item(row)
+                disk_path = item.data(Qt.UserRole)
+                selected = time.perf_counter()
+                window.disk_list_widget.setCurrentItem(item)
+                window.display_disk_data(disk_path)
+                while disk_path in window.pending_smart_reads:
+                    app.processEvents()
+                    time.sleep(0.001)
+                timer.disk_latencies.append(time.perf_counter() - selected)
+            runs.append(time.perf_counter() - run_started)
+    finally:
+        window.smart_engine.shutdown()
+        window.close()
+    return timer, runs
+
+
+def run_mode(mode, repeat, fork_log):
+    """Kipi bu süreçte çalıştırır ve ölçüm sözlüğünü döndürür."""
+    timer, runs = (run_console if mode == "console" else run_gui)(repeat)
+    latencies = timer.disk_latencies
+    return {
+        "mode": mode,
+        "runs_s": runs,
+        "forks": count_forks(fork_log),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "children_peak_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+        "stages": timer.report(),
+        "disk_latency_s": {
+            "count": len(latencies),
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "max": max(latencies) if latencies else 0.0,
+        },
+    }
+
+
+def print_result(result, disk_count):
+    runs = ", ".join(f"{run:.2f}" for run in result["runs_s"])
+    forks = ", ".join(f"{tool}={count}" for tool, count in sorted(result["forks"].items())) or "yok"
+    print(f"== {result['mode']}: {disk_count} disk")
+    print(f"  duvar saati (sn, tur başına): {runs}")
+    print(f"  fork: {forks}")
+    print(f"  en yüksek RSS: {result['peak_rss_mb']:.1f} MB (alt süreçler: {result['children_peak_rss_mb']:.1f} MB)")
+    latency = result["disk_latency_s"]
+    print(f"  disk başına gecikme: p50 {latency['p50'] * 1000:.0f} ms, p95 {latency['p95'] * 1000:.0f} ms, "
+          f"en fazla {latency['max'] * 1000:.0f} ms ({latency['count']} ölçüm)")
+    print(f"  {'aşama':<18}{'çağrı':>8}{'toplam sn':>12}{'ort. ms':>10}")
+    for stage, values in result["stages"].items():
+        mean_ms = values["total_s"] / values["calls"] * 1000 if values["calls"] else 0.0
+        print(f"  {stage:<18}{values['calls']:>8}{values['total_s']:>12.3f}{mean_ms:>10.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sahte disklerle uçtan uca ölçek karşılaştırması")
+    parser.add_argument("--mode", choices=MODES, action="append", help="Çalıştırılacak kip (varsayılan: ikisi de)")
+    parser.add_argument("--disks", type=int, default=100, help="Sahte disk sayısı")
+    parser.add_argument("--latency", type=float, default=0.05, help="smartctl çağrısı başına gecikme (sn)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="Gecikmeye eklenen en fazla sapma (sn)")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Takılan disk oranı (0-1)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Açılamayan disk oranı (0-1)")
+    parser.add_argument("--nvme-ratio", type=float, default=0.2, help="NVMe disk oranı (0-1)")
+    parser.add_argument("--enumeration", choices=("sysfs", "lsblk"), default="sysfs", help="Disk listeleme yolu")
+    parser.add_argument("--budget", type=float, default=10.0, help="Disk başına SMART okuma bütçesi (ZEUS_SMART_BUDGET)")
+    parser.add_argument("--workers", type=int, help="Eşzamanlı sorgu sayısı (ZEUS_SMART_WORKERS)")
+    parser.add_argument("--repeat", type=int, default=1, help="Aynı süreçte tekrar sayısı (önbellek etkisini görmek için)")
+    parser.add_argument("--seed", type=int, default=0, help="Disk seçimlerinin tohumu")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yaz")
+    parser.add_argument("--env-dir", help=argparse.SUPPRESS) # Alt süreçler üst sürecin kurduğu ortamı kullanır
+    args = parser.parse_args(argv)
+    modes = args.mode or list(MODES)
+
+    with tempfile.TemporaryDirectory(prefix="zeus-scale-") as scratch:
+        env_dir = args.env_dir or scratch
+        if not args.env_dir:
+            fake_env = build_fake_environment(env_dir, args.disks, args.latency, args.jitter, args.timeout_rate,
+                                              args.failure_rate, args.seed, args.enumeration, args.nvme_ratio)
+            fake_env["ZEUS_SMART_BUDGET"] = str(args.budget)
+            if args.workers:
+                fake_env["ZEUS_SMART_WORKERS"] = str(args.workers)
+            os.environ.update(fake_env)
+
+        results = []
+        for mode in modes:
+            if len(modes) == 1:
+                try:
+                    results.append(run_mode(mode, args.repeat, os.environ["ZEUS_FAKE_FORK_LOG"]))
+                except ImportError as e:
+                    print(f"Uyarı: '{mode}' kipi atlanıyor ({e})", file=sys.stderr)
+                continue
+            # Her kip kendi sürecinde: RSS ve fork sayıları ayrı ölçülür, önbellekler paylaşılmaz
+            child_dir = os.path.join(env_dir, mode)
+            os.makedirs(child_dir, exist_ok=True)
+            child_env = dict(os.environ, ZEUS_FAKE_FORK_LOG=os.path.join(child_dir, "forks.log"),
+                             ZEUS_CACHE_DIR=os.path.join(child_dir, "cache"))
+            child_args = [sys.executable, os.path.abspath(__file__), "--mode", mode, "--repeat", str(args.repeat),
+                          "--disks", str(args.disks), "--json", "--env-dir", env_dir]
+            completed = subprocess.run(child_args, env=child_env, stdout=subprocess.PIPE, text=True)
+            if completed.stdout.strip():
+                results.extend(json.loads(completed.stdout))
+
+    if args.json:
+        print(json.dumps(results, indent=1))
+    else:
+        for result in results:
+            print_result(result, args.disks)
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
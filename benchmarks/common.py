@@ -0,0 +1,55 @@
+"""
+Karşılaştırma (benchmark) betiklerinin ortak yardımcıları.
+
+GUI ve konsol betikleri paket olmadığı için dosya yolundan modül olarak yüklenir; smartctl
+örnek çıktıları benchmarks/fixtures/smartctl altından okunur.
+"""
+import os
+import sys
+import importlib.util
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(REPO_ROOT, "benchmarks", "fixtures", "smartctl")
+
+# zeus_core benchmarks/ içinden çalıştırılan betiklerden de içe aktarılabilsin
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+FRONTENDS = {
+    "gui": "Zeus_HDD_Doctor.v01.py",
+    "console": "Zeus_HDD_Doctor_CONSOLE.py",
+}
+
+
+def load_frontend(name):
+    """
+    Ön yüz betiğini ('gui' veya 'console') modül olarak yükler.
+    Gerekli bir paket (PyQt5, colorama) kurulu değilse ImportError fırlatır.
+    """
+    spec = importlib.util.spec_from_file_location(f"zeus_{name}", os.path.join(REPO_ROOT, FRONTENDS[name]))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_available_frontends(names):
+    """Yüklenebilen ön yüzleri {ad: modül} olarak döndürür; yüklenemeyenler için uyarı yazar."""
+    modules = {}
+    for name in names:
+        try:
+            modules[name] = load_frontend(name)
+        except ImportError as e:
+            print(f"Uyarı: '{name}' yüklenemedi, atlanıyor ({e})", file=sys.stderr)
+    return modules
+
+
+def load_fixtures(directory=FIXTURE_DIR, names=None):
+    """Örnek smartctl çıktılarını (ad, metin) listesi olarak döndürür; ad uzantısız dosya adıdır."""
+    fixtures = []
+    for file_name in sorted(os.listdir(directory)):
+        name, ext = os.path.splitext(file_name)
+        if ext not in (".txt", ".json") or (names and name not in names):
+            continue
+        with open(os.path.join(directory, file_name), 'r', encoding='utf-8') as f:
+            fixtures.append((name, f.read()))
+    return fixtures
@@ -0,0 +1,115 @@
+"""
+Sahte disk ortamı: N disklik bir sysfs ağacı ve PATH'in başına konan sahte smartctl/lsblk.
+
+Ön yüzler sysfs kökünü ZEUS_SYSFS_ROOT'tan, önbellek dizinini ZEUS_CACHE_DIR'den okuduğu için
+ortam değişkenleri ayarlandığında hiçbir gerçek diske dokunulmaz.
+"""
+import os
+import sys
+import stat
+
+from common import FIXTURE_DIR, REPO_ROOT
+
+BENCHMARK_DIR = os.path.join(REPO_ROOT, "benchmarks")
+
+
+def sd_name(index):
+    """Çekirdeğin adlandırması: sda..sdz, sdaa..sdzz, sdaaa..."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('a') + remainder) + letters
+    return "sd" + letters
+
+
+def disk_names(count, nvme_ratio=0.2):
+    """count adet disk adı üretir; her 1/nvme_ratio diskten biri NVMe'dir."""
+    names = []
+    sd_index = nvme_index = 0
+    nvme_every = int(1 / nvme_ratio) if nvme_ratio else 0
+    for i in range(count):
+        if nvme_every and i % nvme_every == nvme_every - 1:
+            names.append(f"nvme{nvme_index}n1")
+            nvme_index += 1
+        else:
+            names.append(sd_name(sd_index))
+            sd_index += 1
+    return names
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def build_sysfs(root, names):
+    """Her disk için /sys/block/<ad> bağlantısını ve gerçek aygıt dizinini oluşturur."""
+    os.makedirs(os.path.join(root, "block"), exist_ok=True)
+    for i, name in enumerate(names):
+        if name.startswith("nvme"):
+            device_dir = os.path.join(root, "devices", "pci0000:00", f"0000:00:{i % 32:02x}.0", "nvme", name[:-2], name)
+            model, serial = "Samsung SSD 970 EVO Plus 1TB", f"S4EWNX0R{i:06d}"
+        else:
+            device_dir = os.path.join(root, "devices", "pci0000:00", "0000:00:17.0", f"ata{i + 1}", f"host{i}",
+                                      f"target{i}:0:0", f"{i}:0:0:0", "block", name)
+            model, serial = "ST2000DM008-2FR1", f"ZFL{i:05d}"
+        _write(os.path.join(device_dir, "size"), "3907029168\n")
+        _write(os.path.join(device_dir, "removable"), "0\n")
+        _write(os.path.join(device_dir, "dev"), f"{259 if name.startswith('nvme') else 8}:{i * 16}\n")
+        _write(os.path.join(device_dir, "queue", "rotational"), "0\n" if name.startswith("nvme") else "1\n")
+        _write(os.path.join(device_dir, "device", "model"), model + "\n")
+        _write(os.path.join(device_dir, "device", "vendor"), "ATA\n")
+        _write(os.path.join(device_dir, "device", "serial"), serial + "\n")
+        _write(os.path.join(device_dir, "device", "wwid"), f"naa.5000c500{i:08x}\n")
+        os.symlink(device_dir, os.path.join(root, "block", name))
+
+
+def _write_tool(bin_dir, tool, script):
+    path = os.path.join(bin_dir, tool)
+    _write(path, f"#!/bin/sh\nexec {sys.executable} {os.path.join(BENCHMARK_DIR, script)} \"$@\"\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+def build_fake_environment(directory, disk_count, latency=0.05, jitter=0.02, timeout_rate=0.0,
+                           failure_rate=0.0, seed=0, enumeration="sysfs", nvme_ratio=0.2):
+    """
+    Sahte ortamı 'directory' altında kurar ve ön yüzleri çalıştırmadan önce os.environ'a
+    uygulanacak değişkenleri döndürür.
+    """
+    names = disk_names(disk_count, nvme_ratio)
+    sysfs_root = os.path.join(directory, "sys")
+    build_sysfs(sysfs_root, names)
+    bin_dir = os.path.join(directory, "bin")
+    _write_tool(bin_dir, "smartctl", "fake_smartctl.py")
+    _write_tool(bin_dir, "lsblk", "fake_lsblk.py")
+    _write(os.path.join(directory, "disks.txt"), "\n".join(names) + "\n")
+
+    return {
+        "PATH": bin_dir + os.pathsep + os.environ.get("PATH", ""),
+        # lsblk kipinde sysfs kökü bulunmayan bir dizine yönlendirilir; ön yüzler lsblk'ye geri döner
+        "ZEUS_SYSFS_ROOT": sysfs_root if enumeration == "sysfs" else os.path.join(directory, "no-sysfs"),
+        "ZEUS_CACHE_DIR": os.path.join(directory, "cache"),
+        "ZEUS_FAKE_FIXTURE_DIR": FIXTURE_DIR,
+        "ZEUS_FAKE_DISKS": os.path.join(directory, "disks.txt"),
+        "ZEUS_FAKE_FORK_LOG": os.path.join(directory, "forks.log"),
+        "ZEUS_FAKE_LATENCY": str(latency),
+        "ZEUS_FAKE_JITTER": str(jitter),
+        "ZEUS_FAKE_TIMEOUT_RATE": str(timeout_rate),
+        "ZEUS_FAKE_FAILURE_RATE": str(failure_rate),
+        "ZEUS_FAKE_SEED": str(seed),
+    }
+
+
+def count_forks(fork_log):
+    """Sahte komutların kaç kez çalıştırıldığını {komut: sayı} olarak döndürür."""
+    counts = {}
+    try:
+        with open(fork_log, 'r', encoding='utf-8') as f:
+            for line in f:
+                tool = line.split(" ", 1)[0]
+                counts[tool] = counts.get(tool, 0) + 1
+    except OSError:
+        pass
+    return counts
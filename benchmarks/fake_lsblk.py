@@ -0,0 +1,27 @@
+"""
+Ölçek karşılaştırması için lsblk yerine geçen sahte komut.
+
+'lsblk -o NAME,SIZE,TYPE,MODEL,VENDOR -n' çıktısını ZEUS_FAKE_DISKS dosyasındaki disk
+adlarından (her satırda bir ad) üretir; her çağrı ZEUS_FAKE_FORK_LOG'a yazılır.
+"""
+import os
+import sys
+
+
+def main(argv):
+    fork_log = os.environ.get("ZEUS_FAKE_FORK_LOG")
+    if fork_log:
+        with open(fork_log, 'a') as f:
+            f.write("lsblk " + " ".join(argv) + "\n")
+    with open(os.environ["ZEUS_FAKE_DISKS"], 'r', encoding='utf-8') as f:
+        names = [line.strip() for line in f if line.strip()]
+    for name in names:
+        model = "Samsung SSD 970 EVO Plus 1TB" if name.startswith("nvme") else "ST2000DM008-2FR102 ATA"
+        sys.stdout.write(f"{name:<10} 1.8T disk {model}\n")
+        if not name.startswith("nvme"):
+            sys.stdout.write(f"`-{name}1   1.8T part\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
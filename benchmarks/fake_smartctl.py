@@ -0,0 +1,107 @@
+"""
+Ölçek karşılaştırması için smartctl yerine geçen sahte komut.
+
+benchmarks/fixtures/smartctl altındaki çıktılardan birini disk adına göre (her çalıştırmada
+aynı) seçip yazar. Metin çıktısı, gerçek smartctl gibi satır satır (her satırdan sonra flush) yazılır:
+sürenin yarısı ilk satırdan önce, kalanı satırlar arasında geçer. Davranış ortam değişkenleriyle ayarlanır:
+
+    ZEUS_FAKE_FIXTURE_DIR   örnek çıktı dizini
+    ZEUS_FAKE_LATENCY       her çağrının ortalama süresi (sn)
+    ZEUS_FAKE_JITTER        süreye eklenen en fazla rastgele sapma (sn)
+    ZEUS_FAKE_TIMEOUT_RATE  hiç yanıt vermeyen (takılan) disklerin oranı
+    ZEUS_FAKE_FAILURE_RATE  açılamayan disklerin oranı
+    ZEUS_FAKE_SEED          disk seçimlerinin tohumu
+    ZEUS_FAKE_FORK_LOG      her çağrıda bir satır eklenen günlük dosyası (fork sayımı için)
+"""
+import os
+import sys
+import time
+import random
+
+FIXTURE_GROUPS = {
+    "nvme": ("nvme_samsung", "nvme_wd_sn770"),
+    "ata": ("sata_hdd_seagate", "sata_hdd_wd_red", "sata_ssd_samsung", "usb_bridge_wd_elements",
+            "failing_hdd_wd_blue", "failing_ssd_intel"),
+    "scsi": ("sas_hdd_seagate", "sas_hdd_hgst", "usb_bridge_jmicron_nodata"),
+}
+# Aygıt tipine göre okunabilen disk grupları ('auto' hepsini tanır)
+TYPE_GROUPS = {
+    "auto": ("nvme", "ata", "scsi"),
+    "nvme": ("nvme",),
+    "sat": ("ata",),
+    "ata": ("ata",),
+    "usb": ("ata",),
+    "usbjm": ("ata",),
+    "usbscsi": ("ata",),
+    "jmicron": ("ata",),
+    "scsi": ("scsi", "ata"),
+}
+
+
+def env_float(name, default=0.0):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def disk_rng(device, purpose):
+    """Disk ve amaç başına belirlenimci rastgele sayı üreteci."""
+    return random.Random(f"{os.environ.get('ZEUS_FAKE_SEED', '0')}:{purpose}:{device}")
+
+
+def disk_group(device):
+    """Diskin grubunu adından çıkarır: nvme*, ardından sd* disklerinin %15'i SAS/SCSI."""
+    if os.path.basename(device).startswith("nvme"):
+        return "nvme"
+    return "scsi" if disk_rng(device, "group").random() < 0.15 else "ata"
+
+
+def pick_fixture(device, use_json):
+    fixture_dir = os.environ["ZEUS_FAKE_FIXTURE_DIR"]
+    names = FIXTURE_GROUPS[disk_group(device)]
+    ext = ".json" if use_json else ".txt"
+    candidates = [name for name in names if os.path.exists(os.path.join(fixture_dir, name + ext))]
+    if not candidates: # Bu biçimde örnek yoksa diğer biçime düş
+        ext = ".txt" if use_json else ".json"
+        candidates = [name for name in names if os.path.exists(os.path.join(fixture_dir, name + ext))]
+    name = disk_rng(device, "fixture").choice(candidates)
+    with open(os.path.join(fixture_dir, name + ext), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def main(argv):
+    fork_log = os.environ.get("ZEUS_FAKE_FORK_LOG")
+    if fork_log:
+        with open(fork_log, 'a') as f:
+            f.write("smartctl " + " ".join(argv) + "\n")
+
+    dev_type = argv[argv.index("-d") + 1] if "-d" in argv else "auto"
+    device = argv[-1]
+    use_json = "-j" in argv
+
+    latency = env_float("ZEUS_FAKE_LATENCY") + disk_rng(device, time.time()).uniform(0, env_float("ZEUS_FAKE_JITTER"))
+    if disk_rng(device, "timeout").random() < env_float("ZEUS_FAKE_TIMEOUT_RATE"):
+        time.sleep(3600) # Takılan USB köprüsü gibi: süreç dışarıdan öldürülene kadar bekler
+    time.sleep(latency if use_json else latency / 2)
+
+    if disk_rng(device, "failure").random() < env_float("ZEUS_FAKE_FAILURE_RATE"):
+        sys.stdout.write(f"Smartctl open device: {device} failed: No such device\n")
+        return 2
+    if disk_group(device) not in TYPE_GROUPS.get(dev_type, ()):
+        sys.stdout.write(f"{device}: Unknown device type '{dev_type}' for this device\n")
+        return 1 if dev_type not in TYPE_GROUPS else 2
+    output = pick_fixture(device, use_json)
+    if use_json:
+        sys.stdout.write(output) # smartctl -j tüm belgeyi sonda yazar
+        return 0
+    lines = output.splitlines(True)
+    for line in lines:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        time.sleep(latency / 2 / len(lines))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,13 @@
+"""
+Zeus HDD Doctor ortak çekirdeği.
+GUI (Zeus_HDD_Doctor.v01.py) ve konsol (Zeus_HDD_Doctor_CONSOLE.py) sürümlerinin birlikte
+kullandığı, arayüz bağımlılığı olmayan modülleri içerir: disk listeleme (enumeration),
+SMART okuma (acquisition, aio), ayrıştırma (parsing), puanlama (scoring, rules), okuma geçmişi
+(history) ve saatlik/günlük özetleri (rollups), uzun dönem sütunlu arşiv (archive) ve geçmişteki
+sayaç eğilimleri (trends). Çok sayıda okumanın toplu puanlanması (batch_scoring) ve arşivin okunması
+isteğe bağlı olarak NumPy gerektirir.
+'python3 -m zeus_core --json' arayüzsüz tarama yapar (bkz. headless); '--daemon' diskleri
+zamanlayıcıyla sürekli yoklar (bkz. daemon), '--metrics-port' ile Prometheus metrikleri sunar
+(metrics) ve '--push' ile okumaların farklarını merkezi toplayıcıya ('--collector') gönderir
+(push, collector).
+"""
@@ -0,0 +1,6 @@
+"""python3 -m zeus_core: arayüzsüz disk taraması (bkz. zeus_core.headless)."""
+import sys
+
+from zeus_core.headless import main
+
+sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Bir diskin SMART verilerinin eşzamanlı (bloklayan) olarak okunması.
+
+Arayüzler için zeus_core.aio kullanılır; bu modül tek bir diski sırayla okuyan basit akıştır,
+asyncio yüklemediği için arayüzsüz taramanın (zeus_core.headless) başlangıcını hızlı tutar.
+aio ile aynı (attributes_output, info_output, error_message) üçlüsünü döndürür.
+"""
+import os
+import time
+import subprocess
+
+from zeus_core.enumeration import disk_identity
+from zeus_core.native_smart import DiskInStandby, native_smart_enabled, read_native_smart
+from zeus_core.probe_cache import get_probe_cache, order_device_types
+from zeus_core.smartctl import (
+    run_smartctl, smartctl_error_detail, smart_support_disabled, split_smart_output,
+    smartctl_output_usable, smartctl_in_standby, standby_check_enabled
+)
+from zeus_core.snapshots import remember_smart_data, standby_result
+
+# Tek bir smartctl çağrısının zaman aşımı (saniye)
+DEFAULT_SMARTCTL_TIMEOUT = 20
+
+# Bir diskin tüm denemeleri için toplam süre (saniye); ZEUS_SMART_BUDGET ile değiştirilebilir
+DEFAULT_SMART_BUDGET = 60.0
+
+
+def get_smart_budget():
+    """Disk başına SMART okuma bütçesini döndürür."""
+    try:
+        budget = float(os.environ.get('ZEUS_SMART_BUDGET', DEFAULT_SMART_BUDGET))
+    except ValueError:
+        budget = DEFAULT_SMART_BUDGET
+    return budget if budget > 0 else DEFAULT_SMART_BUDGET
+
+
+def get_smart_data(disk_path, device_types, timeout=DEFAULT_SMARTCTL_TIMEOUT, budget=None):
+    """
+    Belirtilen diskin SMART verilerini smartctl komutu ile alır.
+    Kimlik ve öznitelikler tek bir 'smartctl -a' çağrısıyla okunup bölümlerine ayrılır.
+    Disk bekleme (standby) kipindeyse uyandırılmaz: son kayıtlı okuma, üçüncü alanda
+    zeus_core.snapshots.STANDBY_NOTE ile başlayan bir notla döndürülür.
+    budget verilirse tüm denemeler toplam bu kadar saniyeyle sınırlanır; her smartctl çağrısı
+    en fazla kalan süre kadar bekletilir.
+    Program zaten root yetkisiyle çalışacağı için 'sudo' veya 'pkexec' kullanmaya gerek yok.
+    """
+    error_message = ""
+    deadline = time.monotonic() + budget if budget else None
+
+    # İsteğe bağlı yerel arka uç (ZEUS_NATIVE_SMART=1): smartctl çalıştırmadan SG_IO / NVMe ioctl ile okur.
+    # Sonuç smartctl -j yapısında bir sözlüktür; okunamazsa smartctl ile devam edilir.
+    # Bekleme kipindeki disk uyandırılmaz (-n standby / CHECK POWER MODE); son kayıtlı okuma bir notla döner.
+    identity = disk_identity(disk_path)
+    if native_smart_enabled():
+        try:
+            native_data = read_native_smart(disk_path, check_standby=standby_check_enabled())
+        except DiskInStandby:
+            return standby_result(disk_path, identity)
+        if native_data is not None:
+            if smart_support_disabled(native_data):
+                return None, None, f"Disk '{disk_path}' SMART özelliğini desteklemiyor veya devre dışı."
+            remember_smart_data(disk_path, identity, native_data, native_data)
+            return native_data, native_data, ""
+
+    # Bu disk için daha önce çalışan tip varsa önce o denenir; çalışmazsa tüm liste sırayla denenir
+    probe_cache = get_probe_cache()
+
+    for dev_type in order_device_types(device_types, probe_cache.preferred_type(identity)):
+        call_timeout = timeout
+        if deadline is not None:
+            call_timeout = min(timeout, deadline - time.monotonic())
+            if call_timeout <= 0:
+                return None, None, f"'{disk_path}' için SMART verileri {budget:g} saniye içinde alınamadı; smartctl durduruldu."
+        try:
+            returncode, smart_output, stderr_text = run_smartctl(disk_path, dev_type, call_timeout)
+
+            if smartctl_in_standby(smart_output):
+                probe_cache.record_success(identity, dev_type)
+                return standby_result(disk_path, identity)
+
+            if not smartctl_output_usable(returncode, smart_output):
+                # smartctl hata mesajlarını çoğunlukla stdout'a yazar
+                error_detail = smartctl_error_detail(smart_output, stderr_text) or "Detay yok."
+                error_message = f"smartctl '{dev_type}' tipiyle '{disk_path}' için çalıştırılamadı. Hata: {error_detail}"
+                continue
+
+            probe_cache.record_success(identity, dev_type)
+            attributes_output, info_output = split_smart_output(smart_output)
+
+            if smart_support_disabled(info_output):
+                return None, None, f"Disk '{disk_path}' SMART özelliğini desteklemiyor veya devre dışı."
+
+            remember_smart_data(disk_path, identity, attributes_output, info_output)
+            return attributes_output, info_output, "" # Hata yok
+        except FileNotFoundError:
+            return None, None, "smartctl komutu bulunamadı. Lütfen smartmontools yüklü olduğundan emin olun."
+        except subprocess.TimeoutExpired:
+            error_message = f"smartctl '{dev_type}' tipiyle '{disk_path}' için zaman aşımına uğradı."
+        except Exception as e:
+            return None, None, f"Bilinmeyen bir hata oluştu: {e}"
+
+    return None, None, error_message or f"Disk '{disk_path}' için SMART verileri alınamadı veya desteklenmiyor."
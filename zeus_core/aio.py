@@ -0,0 +1,283 @@
+"""
+smartctl'yi asyncio ile çalıştıran SMART okuma motoru.
+
+Her disk için tek bir toplam süre (bütçe) verilir; tek tek denemeler için ayrı zaman aşımı yoktur.
+Bütçe dolduğunda veya okuma iptal edildiğinde smartctl kendi süreç grubunda başlatıldığı için
+tüm grup SIGKILL ile sonlandırılır; takılan bir USB köprüsü ne GUI'yi ne de diğer diskleri bekletir.
+
+- iter_smart_results(): sonuçları bitiş sırasına göre üreten asenkron üreteç
+- iter_smart_results_sync(): aynı akışın konsol için eşzamanlı sürümü
+- AsyncSmartEngine: kendi iş parçacığında olay döngüsü çalıştıran, GUI'den iş alan motor
+
+acquire_smart_data'ya on_event verilirse smartctl çıktısı okunurken disk bilgileri ve öznitelik
+satırları geldikçe bildirilir (zeus_core.streaming).
+"""
+import asyncio
+import os
+import signal
+import threading
+import time
+
+from zeus_core.acquisition import get_smart_budget
+from zeus_core.enumeration import disk_identity
+from zeus_core.native_smart import DiskInStandby, native_smart_enabled, read_native_smart
+from zeus_core.probe_cache import get_probe_cache, order_device_types
+from zeus_core.smartctl import (
+    json_attempt_failed, json_mode_enabled, smart_support_disabled, smartctl_command,
+    smartctl_error_detail, smartctl_in_standby, smartctl_output_usable, split_smart_output,
+    standby_check_enabled
+)
+from zeus_core.snapshots import remember_smart_data, standby_result
+from zeus_core.streaming import SmartStreamParser, attempt_event, streaming_supported
+
+# Akışlı okumada stdout'tan tek seferde okunacak en fazla bayt
+STREAM_CHUNK_SIZE = 65536
+
+
+def _kill_process_group(proc):
+    """smartctl'yi ve başlattığı tüm alt süreçleri sonlandırır."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _read_streaming(proc, on_output):
+    """stdout'u parçalar halinde okur ve her parçayı on_output'a verir; (stdout, stderr) döndürür."""
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+    chunks = []
+    try:
+        while True:
+            chunk = await proc.stdout.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            on_output(chunk)
+        stderr = await stderr_task
+    finally:
+        stderr_task.cancel()
+    await proc.wait()
+    return b"".join(chunks), stderr
+
+
+async def _communicate(command, on_output=None):
+    """
+    Komutu yeni bir süreç grubunda çalıştırır; iptal edilirse grubu öldürüp sürecin bitmesini bekler.
+    on_output verilirse stdout, süreç çalışırken geldikçe parça parça bu işleve de verilir.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, start_new_session=True)
+    try:
+        if on_output is None:
+            stdout, stderr = await proc.communicate()
+        else:
+            stdout, stderr = await _read_streaming(proc, on_output)
+    except BaseException:
+        _kill_process_group(proc)
+        await asyncio.shield(proc.wait()) # Zombi süreç bırakma
+        raise
+    return proc.returncode, stdout.decode('utf-8', errors='ignore'), stderr.decode('utf-8', errors='ignore')
+
+
+async def run_smartctl_async(disk_path, dev_type, on_event=None):
+    """
+    zeus_core.smartctl.run_smartctl'nin asenkron karşılığı; (returncode, çıktı, stderr) döndürür.
+    on_event verilirse ve disk akışa uygunsa metin kipinde okunur, gelen satırlar olay olarak bildirilir.
+    """
+    if on_event is not None and streaming_supported(disk_path, dev_type):
+        parser = SmartStreamParser()
+
+        def on_output(chunk):
+            for event in parser.feed(chunk):
+                on_event(event)
+        result = await _communicate(smartctl_command(disk_path, dev_type, False), on_output)
+        for event in parser.close():
+            on_event(event)
+        return result
+    if json_mode_enabled():
+        returncode, smart_output, stderr_text = await _communicate(smartctl_command(disk_path, dev_type, True))
+        if not json_attempt_failed(returncode, smart_output):
+            return returncode, smart_output, stderr_text
+    return await _communicate(smartctl_command(disk_path, dev_type, False))
+
+
+async def _probe_disk(disk_path, device_types, on_event=None):
+    """
+    Yerel arka ucu ve ardından smartctl aygıt tiplerini sırayla dener.
+    Son okuma kaydı ve aygıt tipi önbelleği dosyada tutulduğu için yürütücüde (executor) okunup yazılır;
+    olay döngüsü dosya işlemlerini beklemez.
+    """
+    loop = asyncio.get_running_loop()
+    identity = disk_identity(disk_path)
+    if native_smart_enabled():
+        try:
+            native_data = await loop.run_in_executor(None, read_native_smart, disk_path, None, standby_check_enabled())
+        except DiskInStandby:
+            return await loop.run_in_executor(None, standby_result, disk_path, identity)
+        if native_data is not None:
+            if smart_support_disabled(native_data):
+                return None, None, f"Disk '{disk_path}' SMART özelliğini desteklemiyor veya devre dışı."
+            await loop.run_in_executor(None, remember_smart_data, disk_path, identity, native_data, native_data)
+            return native_data, native_data, ""
+
+    probe_cache = get_probe_cache()
+    error_message = ""
+    for dev_type in order_device_types(device_types, probe_cache.preferred_type(identity)):
+        if on_event is not None:
+            on_event(attempt_event(dev_type))
+        returncode, smart_output, stderr_text = await run_smartctl_async(disk_path, dev_type, on_event)
+        if smartctl_in_standby(smart_output):
+            await loop.run_in_executor(None, probe_cache.record_success, identity, dev_type)
+            return await loop.run_in_executor(None, standby_result, disk_path, identity)
+        if not smartctl_output_usable(returncode, smart_output):
+            error_detail = smartctl_error_detail(smart_output, stderr_text) or "Detay yok."
+            error_message = f"smartctl '{dev_type}' tipiyle '{disk_path}' için çalıştırılamadı. Hata: {error_detail}"
+            continue
+
+        await loop.run_in_executor(None, probe_cache.record_success, identity, dev_type)
+        attributes_output, info_output = split_smart_output(smart_output)
+        if smart_support_disabled(info_output):
+            return None, None, f"Disk '{disk_path}' SMART özelliğini desteklemiyor veya devre dışı."
+        await loop.run_in_executor(None, remember_smart_data, disk_path, identity, attributes_output, info_output)
+        return attributes_output, info_output, ""
+
+    return None, None, error_message or f"Disk '{disk_path}' için SMART verileri alınamadı veya desteklenmiyor."
+
+
+async def acquire_smart_data(disk_path, device_types, budget=None, on_event=None):
+    """
+    Diskin SMART verilerini en fazla 'budget' saniyede okur.
+    get_smart_data ile aynı (attributes_output, info_output, error_message) üçlüsünü döndürür;
+    disk bekleme kipindeyse son kayıt ve zeus_core.snapshots.STANDBY_NOTE ile başlayan bir not döner.
+    on_event(olay), okuma sürerken gelen disk bilgisi ve öznitelik satırları için çağrılır.
+    """
+    budget = budget or get_smart_budget()
+    try:
+        return await asyncio.wait_for(_probe_disk(disk_path, device_types, on_event), budget)
+    except asyncio.TimeoutError:
+        return None, None, f"'{disk_path}' için SMART verileri {budget:g} saniye içinde alınamadı; smartctl durduruldu."
+    except FileNotFoundError:
+        return None, None, "smartctl komutu bulunamadı. Lütfen smartmontools yüklü olduğundan emin olun."
+    except Exception as e:
+        return None, None, f"Bilinmeyen bir hata oluştu: {e}"
+
+
+async def iter_smart_results(disks, device_types, budget=None, concurrency=None):
+    """
+    Disklerin SMART verilerini aynı anda okur ve sonuçları bitiş sırasına göre
+    (index, disk, attributes_output, info_output, error_message, süre) olarak üretir.
+    Üreteç erken kapatılır veya iptal edilirse bekleyen tüm okumalar durdurulur.
+    """
+    if not disks:
+        return
+    semaphore = asyncio.Semaphore(concurrency or len(disks))
+
+    async def read_one(i, disk):
+        async with semaphore:
+            started = time.monotonic() # Bütçe sıra beklerken değil, okuma başladığında işler
+            attributes_output, info_output, error_message = await acquire_smart_data(disk['path'], device_types, budget)
+            return i, disk, attributes_output, info_output, error_message, time.monotonic() - started
+
+    tasks = [asyncio.ensure_future(read_one(i, disk)) for i, disk in enumerate(disks)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _cancel_pending_tasks(loop):
+    """Döngüdeki bekleyen görevleri iptal eder ve temizlenmelerini (süreçlerin öldürülmesini) bekler."""
+    tasks = asyncio.all_tasks(loop)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def iter_smart_results_sync(disks, device_types, budget=None, concurrency=None):
+    """
+    iter_smart_results'ın eşzamanlı sürümü (konsol için). Her sonuç hazır olduğunda döner.
+    Ctrl+C ile kesilirse çalışan smartctl süreçleri öldürülür.
+    """
+    loop = asyncio.new_event_loop()
+    results = iter_smart_results(disks, device_types, budget, concurrency)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        try:
+            _cancel_pending_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+class AsyncSmartEngine:
+    """
+    Arka plandaki bir iş parçacığında asyncio döngüsü çalıştırır.
+    submit() hemen döner; sonuç callback(disk_path, (attributes_output, info_output, error_message))
+    ile motorun iş parçacığından bildirilir (Qt'de sinyal üzerinden ana iş parçacığına aktarılmalıdır).
+    """
+
+    def __init__(self, device_types, budget=None, concurrency=None):
+        self.device_types = device_types
+        self.budget = budget
+        self.concurrency = concurrency
+        self.semaphore = None
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name="zeus-smart-aio", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _acquire(self, disk_path, on_event=None):
+        if self.concurrency is None:
+            return await acquire_smart_data(disk_path, self.device_types, self.budget, on_event)
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        async with self.semaphore:
+            return await acquire_smart_data(disk_path, self.device_types, self.budget, on_event)
+
+    def submit(self, disk_path, callback=None, on_event=None):
+        """
+        Disk okumasını başlatır ve concurrent.futures.Future döndürür.
+        future.cancel() okumayı ve çalışan smartctl sürecini durdurur; iptal edilen okuma için callback çağrılmaz.
+        on_event(disk_path, olay) okuma sürerken motorun iş parçacığından çağrılır (zeus_core.streaming).
+        """
+        def notify_event(event):
+            on_event(disk_path, event)
+        future = asyncio.run_coroutine_threadsafe(
+            self._acquire(disk_path, notify_event if on_event is not None else None), self.loop)
+        if callback is not None:
+            def notify(done):
+                if not done.cancelled():
+                    callback(disk_path, done.result())
+            future.add_done_callback(notify)
+        return future
+
+    def shutdown(self, timeout=5):
+        """Bekleyen tüm okumaları iptal eder ve döngüyü durdurur."""
+        if self.loop.is_closed():
+            return
+
+        async def cancel_all():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_all(), self.loop).result(timeout)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout)
+            if not self.thread.is_alive():
+                self.loop.close()
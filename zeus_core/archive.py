@@ -0,0 +1,318 @@
+"""
+Uzun dönem okuma arşivi: disk ve öznitelik başına sütunlu, yalnızca sona eklenen dosyalar.
+
+SQLite geçmişi (zeus_core.history) satır satır sorgulanır ve ZEUS_HISTORY_RETENTION_DAYS ile
+budanır; yıllarca dakikalık okumayı grafiğe dökmek için her satırın ayrıştırılması çok yavaştır.
+Arşivde her disk bir dizin, her öznitelik (raw değer) ve sağlık puanı ayrı bir dosyadır:
+
+    <arşiv>/<disk anahtarı>/<öznitelik ID>.zcol, <arşiv>/<disk anahtarı>/score.zcol
+
+Dosya sabit boyutlu (SEGMENT_SIZE) kesimlerden oluşur. Kesim başlığı kayıt sayısını, gövdede
+kullanılan bayt sayısını ve kesimin ilk/son (zaman, değer) çiftini tutar; gövdede sonraki kayıtlar
+bir öncekine göre fark olarak (zigzag + varint; dakikalık sıcaklık okuması çoğunlukla 2 bayt)
+yazılır. Yeni okuma son kesime eklenir, sığmazsa yeni kesim açılır; yazılmış kesimler değişmez.
+
+Okuma (load_series) dosyayı mmap ile açar, kesim başlıklarını ve gövdeleri NumPy dizisi olarak
+doğrudan eşler; varint çözümü ve farkların toplanması satır satır değil dizi işlemleriyle yapılır.
+Zaman aralığı verilirse yalnızca aralıkla kesişen kesimler çözülür. Yazma NumPy gerektirmez; okuma
+gerektirir (GUI, konsol ve arayüzsüz tarama yalnızca yazar).
+
+Arşiv geçmişle birlikte yazılır (ZEUS_HISTORY=0 ikisini de kapatır); varsayılan dizin önbellek
+dizinindeki history-archive'dır, ZEUS_HISTORY_ARCHIVE başka bir dizin gösterebilir, 0 arşivi
+kapatır. Arşiv budanmaz.
+"""
+import os
+import mmap
+import struct
+import threading
+from urllib.parse import quote, unquote
+
+from zeus_core.probe_cache import get_cache_dir
+
+ARCHIVE_DIR = "history-archive"
+ARCHIVE_SUFFIX = ".zcol"
+SCORE_COLUMN = "score"
+
+SEGMENT_SIZE = 4096
+SEGMENT_MAGIC = b"ZCS1"
+# magic, kayıt sayısı, gövdede kullanılan bayt, ilk zaman, ilk değer, son zaman, son değer
+SEGMENT_HEADER = struct.Struct("<4sIIqqqq20x")
+SEGMENT_BODY = SEGMENT_SIZE - SEGMENT_HEADER.size
+
+# Zaman damgaları saniye, değerler int64 olarak saklanır; sığmayan raw değerler arşive yazılmaz
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+_UINT64_MASK = 2 ** 64 - 1
+
+
+class ArchiveError(ValueError):
+    """Arşiv dosyası bozuk veya bu sürümün biçiminde değil."""
+
+
+def archive_enabled():
+    """Okumalar geçmişle birlikte arşive de yazılır; ZEUS_HISTORY_ARCHIVE=0 (veya no/false) kapatır."""
+    return os.environ.get('ZEUS_HISTORY_ARCHIVE', '') not in ('0', 'no', 'false')
+
+
+def get_archive_dir():
+    """Arşiv dizini; ZEUS_HISTORY_ARCHIVE ile değiştirilebilir."""
+    return os.environ.get('ZEUS_HISTORY_ARCHIVE') or os.path.join(get_cache_dir(), ARCHIVE_DIR)
+
+
+def _encode_delta(delta, out):
+    """Farkı int64'e sarıp zigzag + varint olarak out'a ekler (okumada uint64 toplamı aynı sarmayı yapar)."""
+    delta = ((delta - _INT64_MIN) & _UINT64_MASK) + _INT64_MIN
+    value = ((delta << 1) ^ (delta >> 63)) & _UINT64_MASK
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _new_segment(taken_at, value):
+    segment = bytearray(SEGMENT_SIZE)
+    SEGMENT_HEADER.pack_into(segment, 0, SEGMENT_MAGIC, 1, 0, taken_at, value, taken_at, value)
+    return segment
+
+
+def _append_records(segment, records):
+    """
+    Kayıtları son kesime (bytearray, None olabilir) ekler. Güncellenen son kesimi ve sonrasında
+    açılan kesimleri, eklenen kayıt sayısıyla birlikte döndürür.
+    """
+    segments = [segment] if segment is not None else []
+    header = SEGMENT_HEADER.unpack_from(segment, 0) if segment is not None else None
+    added = 0
+    encoded = bytearray()
+    for taken_at, value in records:
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            continue
+        if header is None:
+            segments.append(_new_segment(taken_at, value))
+            header = SEGMENT_HEADER.unpack_from(segments[-1], 0)
+            added += 1
+            continue
+        _, count, used, first_time, first_value, last_time, last_value = header
+        if taken_at <= last_time:
+            continue # Yalnızca sona eklenir; daha eski veya aynı anki okuma atlanır
+        encoded.clear()
+        _encode_delta(taken_at - last_time, encoded)
+        _encode_delta(value - last_value, encoded)
+        if used + len(encoded) > SEGMENT_BODY:
+            segments.append(_new_segment(taken_at, value))
+        else:
+            body = SEGMENT_HEADER.size + used
+            segments[-1][body:body + len(encoded)] = encoded
+            SEGMENT_HEADER.pack_into(segments[-1], 0, SEGMENT_MAGIC, count + 1, used + len(encoded),
+                                     first_time, first_value, taken_at, value)
+        header = SEGMENT_HEADER.unpack_from(segments[-1], 0)
+        added += 1
+    return segments, added
+
+
+def append_series(path, records):
+    """
+    (zaman, değer) kayıtlarını (zaman sırasıyla, saniye ve tamsayı) dosyanın sonuna ekler; eklenen
+    kayıt sayısını döndürür. Son kesim ve yeni kesimler tek bir yazmayla diske gider; yarım kalmış
+    son kesim (çökme) atılır.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        size = os.fstat(fd).st_size
+        whole = size - size % SEGMENT_SIZE
+        offset = max(0, whole - SEGMENT_SIZE)
+        segment = None
+        if whole:
+            segment = bytearray(os.pread(fd, SEGMENT_SIZE, offset))
+            if segment[:4] != SEGMENT_MAGIC:
+                raise ArchiveError(f"{path}: geçersiz kesim başlığı")
+        segments, added = _append_records(segment, records)
+        if added:
+            os.pwrite(fd, b"".join(segments), offset)
+        if size != whole:
+            os.ftruncate(fd, offset + SEGMENT_SIZE * len(segments))
+    finally:
+        os.close(fd)
+    return added
+
+
+def _numpy():
+    """
+    NumPy yalnızca okumada, ilk kullanımda yüklenir; yazma (her yoklamada geçmişle birlikte) ve
+    arayüzsüz tarama onu yüklemeden başlar.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Arşiv okumak için NumPy gerekli (pip install numpy).") from None
+    return numpy
+
+
+def _segment_dtype():
+    np = _numpy()
+    return np.dtype([
+        ('magic', 'S4'), ('count', '<u4'), ('used', '<u4'),
+        ('first_time', '<i8'), ('first_value', '<i8'), ('last_time', '<i8'), ('last_value', '<i8'),
+        ('pad', 'V20'), ('body', 'u1', (SEGMENT_BODY,)),
+    ])
+
+
+def _decode_varints(data):
+    """Art arda yazılmış zigzag varint'leri int64 dizisine çözer (satır satır döngü yok)."""
+    np = _numpy()
+    if not data.size:
+        return np.zeros(0, dtype=np.int64)
+    if not (data & 0x80).any(): # Tüm değerler tek bayt (en sık durum): küçük tiple çözülür
+        values = data.astype(np.int16)
+        return ((values >> 1) ^ -(values & 1)).astype(np.int64)
+    ends = (data & 0x80) == 0
+    starts = np.flatnonzero(np.concatenate(([True], ends[:-1])))
+    group = np.cumsum(ends) - ends
+    shifts = (np.arange(data.size) - starts[group]) * 7
+    values = np.bitwise_or.reduceat((data & 0x7F).astype(np.uint64) << shifts.astype(np.uint64), starts)
+    values = values.view(np.int64)
+    sign = values & 1
+    np.negative(sign, out=sign)
+    values >>= 1
+    values &= _INT64_MAX # Aritmetik kaydırmanın taşıdığı işaret biti silinir (mantıksal kaydırma)
+    values ^= sign
+    return values
+
+
+def load_series(path, since=None, until=None):
+    """
+    Dosyadaki kayıtları (zamanlar, değerler) int64 NumPy dizileri olarak döndürür; since/until
+    (saniye, dahil) verilirse yalnızca aralıktakiler. Dosya yoksa boş diziler döner.
+    """
+    np = _numpy()
+    empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return empty
+    try:
+        count = os.fstat(fd).st_size // SEGMENT_SIZE
+        if not count:
+            return empty
+        mapped = mmap.mmap(fd, count * SEGMENT_SIZE, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    segments = selected = None
+    try:
+        segments = np.frombuffer(mapped, dtype=_segment_dtype(), count=count)
+        if (segments['magic'] != SEGMENT_MAGIC).any():
+            raise ArchiveError(f"{path}: geçersiz kesim başlığı")
+        # Kesimler zaman sırasında: aralıkla kesişenler bir dilimdir
+        lo = 0 if since is None else int(np.searchsorted(segments['last_time'], since, side='left'))
+        hi = count if until is None else int(np.searchsorted(segments['first_time'], until, side='right'))
+        if lo >= hi:
+            return empty
+        # Gövdeden yalnızca kullanılan baytlar kopyalanır; başlık alanları da kopya olarak alınır
+        selected = segments[lo:hi]
+        used = selected['used'].astype(np.intp)
+        data = selected['body'][np.arange(SEGMENT_BODY) < used[:, None]]
+        records = selected['count'].astype(np.intp)
+        first_time, first_value = selected['first_time'].copy(), selected['first_value'].copy()
+        last_time, last_value = selected['last_time'].copy(), selected['last_value'].copy()
+    finally:
+        segments = selected = None # mmap üzerindeki görünümler kapatmadan önce bırakılmalı
+        mapped.close()
+
+    deltas = _decode_varints(data).reshape(-1, 2)
+    if len(deltas) != records.sum() - len(records):
+        raise ArchiveError(f"{path}: kesim gövdesi kayıt sayısıyla uyuşmuyor")
+    # Kesim başlarına önceki kesimin son kaydına göre fark yazılır; böylece tek bir toplam yeterli
+    starts = np.cumsum(records) - records
+    is_start = np.zeros(records.sum(), dtype=bool)
+    is_start[starts] = True
+    time_deltas = np.empty(len(is_start), dtype=np.int64)
+    value_deltas = np.empty(len(is_start), dtype=np.int64)
+    time_deltas[~is_start] = deltas[:, 0]
+    value_deltas[~is_start] = deltas[:, 1]
+    with np.errstate(over='ignore'):
+        time_deltas[starts] = first_time - np.concatenate(([0], last_time[:-1]))
+        value_deltas[starts] = first_value - np.concatenate(([0], last_value[:-1]))
+        times = np.cumsum(time_deltas)
+        values = np.cumsum(value_deltas)
+    if since is not None or until is not None:
+        begin = 0 if since is None else np.searchsorted(times, since, side='left')
+        end = len(times) if until is None else np.searchsorted(times, until, side='right')
+        times, values = times[begin:end], values[begin:end]
+    return times, values
+
+
+class SnapshotArchive:
+    """
+    Disk/öznitelik dosyalarından oluşan arşiv dizini. Dizin oluşturulamazsa (salt okunur sistem,
+    yetki yok) kayıtlar sessizce atlanır. Birden fazla iş parçacığından güvenle kullanılabilir.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or get_archive_dir()
+        self._lock = threading.Lock()
+
+    def disk_dir(self, disk_key):
+        return os.path.join(self.directory, quote(disk_key, safe=''))
+
+    def column_path(self, disk_key, column):
+        """Sütun dosyasının yolu; sütun öznitelik ID'si veya SCORE_COLUMN."""
+        return os.path.join(self.disk_dir(disk_key), f"{column}{ARCHIVE_SUFFIX}")
+
+    def record(self, entries):
+        """
+        (disk anahtarı, SmartSnapshot, puan) üçlülerindeki raw değerleri ve puanları arşive ekler;
+        yazılan dosya sayısını döndürür. Aynı ID'nin tekrarı (bazı USB köprüleri) aynı zamanlı olduğundan
+        yalnızca ilk haliyle yazılır.
+        """
+        columns = {}
+        for disk_key, snapshot, score in entries:
+            taken_at = int(round(snapshot.timestamp))
+            for attr_id, raw_value in zip(snapshot.ids, snapshot.raw_values):
+                columns.setdefault((disk_key, attr_id), []).append((taken_at, raw_value))
+            if isinstance(score, int):
+                columns.setdefault((disk_key, SCORE_COLUMN), []).append((taken_at, score))
+        written = 0
+        with self._lock:
+            for (disk_key, column), records in columns.items():
+                path = self.column_path(disk_key, column)
+                try:
+                    try:
+                        added = append_series(path, records)
+                    except FileNotFoundError:
+                        os.makedirs(os.path.dirname(path), exist_ok=True)
+                        added = append_series(path, records)
+                except (OSError, ArchiveError):
+                    continue # Bozuk dosya veya yazılamayan dizin: okuma gösterilmeye devam eder
+                written += bool(added)
+        return written
+
+    def disks(self):
+        """Arşivde dosyası olan disk anahtarları."""
+        try:
+            return sorted(unquote(name) for name in os.listdir(self.directory))
+        except OSError:
+            return []
+
+    def columns(self, disk_key):
+        """Diskin arşivdeki sütunları: öznitelik ID'leri (sıralı) ve varsa SCORE_COLUMN."""
+        try:
+            names = [name[:-len(ARCHIVE_SUFFIX)] for name in os.listdir(self.disk_dir(disk_key))
+                     if name.endswith(ARCHIVE_SUFFIX)]
+        except OSError:
+            return []
+        return sorted(int(name) for name in names if name.isdigit()) + [n for n in names if n == SCORE_COLUMN]
+
+    def load(self, disk_key, column, since=None, until=None):
+        """Sütunun (zamanlar, değerler) dizileri; bkz. load_series."""
+        return load_series(self.column_path(disk_key, column), since, until)
+
+
+_snapshot_archive = None
+
+
+def get_snapshot_archive():
+    """Süreç boyunca paylaşılan SnapshotArchive örneğini döndürür."""
+    global _snapshot_archive
+    if _snapshot_archive is None:
+        _snapshot_archive = SnapshotArchive()
+    return _snapshot_archive
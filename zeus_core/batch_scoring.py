@@ -0,0 +1,248 @@
+"""
+Çok sayıda SMART okumasının NumPy ile toplu (vektörel) puanlanması.
+
+Geçmiş okumaların yeniden puanlanması gibi on binlerce okumanın işlendiği durumlar içindir; tek bir
+disk için zeus_core.scoring yeterlidir. Okumalar bir FleetMatrix'e (okuma x öznitelik sütunu)
+yerleştirilir, zeus_core.rules kuralları tüm matris üzerinde bir kerede uygulanır. Sonuçlar (puan,
+durum, uyarı sayısı) scoring.score_attributes ve scoring.health_grade ile birebir aynıdır.
+
+NumPy isteğe bağlıdır; GUI, konsol ve arayüzsüz tarama bu modülü yüklemez.
+"""
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("Toplu puanlama için NumPy gerekli (pip install numpy).") from e
+
+from zeus_core.rules import CATEGORY_FLAGS, get_rule_engine
+from zeus_core.scoring import HEALTH_GRADES
+
+# warning_flags bitleri: okumada ilgili türden en az bir uyarı üretildiğini gösterir (bkz. zeus_core.rules)
+WARN_BELOW_THRESHOLD = CATEGORY_FLAGS['threshold']
+WARN_CRITICAL_RAW = CATEGORY_FLAGS['critical_raw']
+WARN_TEMPERATURE = CATEGORY_FLAGS['temperature']
+WARN_WEAR_LEVELING = CATEGORY_FLAGS['wear_leveling']
+WARN_MEDIA_WEAROUT = CATEGORY_FLAGS['media_wearout']
+
+# Kuralların profil seçiminde kullandığı disk bilgisi alanları
+MODEL_FIELDS = ('Model Family', 'Device Model')
+
+# Kural alanlarının FleetMatrix'teki karşılıkları
+MATRIX_FIELDS = {'current': 'current', 'worst': 'worst', 'threshold': 'threshold', 'raw_value': 'raw_values'}
+
+# SmartSnapshot sütunlarının array tip kodlarına karşılık gelen NumPy tipleri
+ARRAY_DTYPES = {'H': np.uint16, 'q': np.int64}
+
+
+def _concat_column(columns, dtype):
+    """
+    Okumaların aynı sütununu tek bir diziye birleştirir. SmartSnapshot sütunları array olduğundan
+    tampon olarak tek seferde birleştirilir; liste/tuple sütun (taşma, SmartAttribute listesi) varsa
+    değer değer dönüştürülür.
+    """
+    if not columns:
+        return np.zeros(0, dtype=dtype)
+    typecode = getattr(columns[0], 'typecode', None)
+    if typecode in ARRAY_DTYPES:
+        try:
+            return np.frombuffer(b"".join(columns), dtype=ARRAY_DTYPES[typecode]).astype(dtype)
+        except TypeError:
+            pass # Aralarında tuple sütun var
+    return np.concatenate([np.asarray(column, dtype=dtype) for column in columns])
+
+
+def _name_codes(names, cache, name_index):
+    """Ad demetindeki adların kodlarını (name_index sırası) int32 baytları olarak döndürür."""
+    codes = cache.get(names)
+    if codes is None:
+        codes = cache[names] = np.array([name_index.setdefault(name, len(name_index)) for name in names],
+                                        dtype=np.int32).tobytes()
+    return codes
+
+
+class FleetMatrix:
+    """
+    Okumaların (satır) öznitelik sütunları: current, worst, threshold ve raw değer matrisleri.
+
+    Her sütun tek bir öznitelik ID'sidir (column_ids); bir okumada aynı ID birden fazla kez geçerse
+    sonraki tekrarlar ayrı sütunlara yerleşir, böylece hiçbir satır kaybolmaz. Okumada bulunmayan
+    hücreler present=False'tur. Ad diskten diske değişebildiği için hücre başına tutulur: name_codes,
+    names demetindeki sırayı verir (boş hücrede -1). model_codes her okumanın models listesindeki
+    disk bilgisidir; kurallar (zeus_core.rules) modele göre seçilir.
+    """
+
+    __slots__ = ('column_ids', 'present', 'name_codes', 'names', 'model_codes', 'models',
+                 'current', 'worst', 'threshold', 'raw_values')
+
+    def __init__(self, column_ids, present, name_codes, names, model_codes, models, current, worst, threshold, raw_values):
+        self.column_ids = column_ids
+        self.present = present
+        self.name_codes = name_codes
+        self.names = names
+        self.model_codes = model_codes
+        self.models = models
+        self.current = current
+        self.worst = worst
+        self.threshold = threshold
+        self.raw_values = raw_values
+
+    def __len__(self):
+        return self.present.shape[0]
+
+    @classmethod
+    def from_snapshots(cls, snapshots):
+        """SmartSnapshot (veya SmartAttribute listesi) dizisinden matrisi oluşturur."""
+        snapshots = [snapshot if hasattr(snapshot, 'ids') else _AttributeColumns(snapshot) for snapshot in snapshots]
+        lengths = np.fromiter((len(snapshot.ids) for snapshot in snapshots), dtype=np.int64, count=len(snapshots))
+        cell_count = int(lengths.sum())
+        rows = np.repeat(np.arange(len(snapshots)), lengths)
+
+        def concat(field, dtype):
+            return _concat_column([getattr(snapshot, field) for snapshot in snapshots], dtype)
+
+        ids = concat('ids', np.int64)
+        # Aynı okumada tekrar eden ID'lerin sırası (0: ilk geçiş): (satır, ID) sıralamasında ardışık eşitler sayılır
+        order = np.lexsort((np.arange(cell_count), ids, rows))
+        sorted_rows, sorted_ids = rows[order], ids[order]
+        group_start = np.ones(cell_count, dtype=bool)
+        group_start[1:] = (sorted_rows[1:] != sorted_rows[:-1]) | (sorted_ids[1:] != sorted_ids[:-1])
+        positions = np.arange(cell_count)
+        occurrence = np.empty(cell_count, dtype=np.int64)
+        occurrence[order] = positions - np.maximum.accumulate(np.where(group_start, positions, 0))
+
+        keys, columns = np.unique(ids * 256 + occurrence, return_inverse=True)
+        shape = (len(snapshots), len(keys))
+        present = np.zeros(shape, dtype=bool)
+        present[rows, columns] = True
+        # Aynı modeldeki disklerin okumaları aynı adları taşır; adlar her farklı ad demeti için bir kez kodlanır
+        name_index, name_cache = {}, {}
+        name_bytes = b"".join(_name_codes(tuple(snapshot.names), name_cache, name_index) for snapshot in snapshots)
+        name_codes = np.full(shape, -1, dtype=np.int32)
+        name_codes[rows, columns] = np.frombuffer(name_bytes, dtype=np.int32)
+
+        model_index, models = {}, []
+        model_codes = np.empty(len(snapshots), dtype=np.int32)
+        for i, snapshot in enumerate(snapshots):
+            info = getattr(snapshot, 'info', None) or {}
+            key = tuple(info.get(field) for field in MODEL_FIELDS)
+            code = model_index.get(key)
+            if code is None:
+                code = model_index[key] = len(models)
+                models.append({field: value for field, value in zip(MODEL_FIELDS, key) if value is not None})
+            model_codes[i] = code
+
+        matrices = []
+        for field, dtype in (('current', np.int32), ('worst', np.int32), ('threshold', np.int32), ('raw_values', np.int64)):
+            matrix = np.zeros(shape, dtype=dtype)
+            matrix[rows, columns] = concat(field, dtype)
+            matrices.append(matrix)
+        return cls(keys // 256, present, name_codes, tuple(name_index), model_codes, models, *matrices)
+
+
+class _AttributeColumns:
+    """SmartAttribute listesini FleetMatrix.from_snapshots için SmartSnapshot sütunları gibi gösterir."""
+
+    __slots__ = ('ids', 'names', 'current', 'worst', 'threshold', 'raw_values')
+
+    def __init__(self, attributes):
+        self.ids = [attr.id for attr in attributes]
+        self.names = [attr.name for attr in attributes]
+        self.current = [attr.current for attr in attributes]
+        self.worst = [attr.worst for attr in attributes]
+        self.threshold = [attr.threshold for attr in attributes]
+        self.raw_values = [attr.raw_value for attr in attributes]
+
+
+def _cells(values, rows, columns):
+    """Matrisin seçili satır ve sütunları (ikisi de dizi ise np.ix_ ile)."""
+    if isinstance(rows, slice) or isinstance(columns, slice):
+        return values[rows, columns]
+    return values[np.ix_(rows, columns)]
+
+
+def _apply_rules(rule_set, matrix, rows, penalty, warning_count, warning_flags):
+    """
+    Kural kümesini matrisin verilen satırlarına uygular; ceza, uyarı sayısı ve bitleri yerinde artırır.
+    Seviyeler skaler puanlamadaki gibi sırayla denenir: bir hücrede tutan seviye sonrakileri devre dışı bırakır.
+    """
+    for rule in rule_set.rules:
+        column_mask = (np.ones(len(matrix.column_ids), dtype=bool) if rule.ids is None
+                       else np.isin(matrix.column_ids, list(rule.ids)))
+        name_cells = None
+        if rule.name_contains is not None:
+            # Son eleman boş hücrelerin (-1) karşılığıdır
+            name_hits = np.array([rule.name_contains in name for name in matrix.names] + [False], dtype=bool)
+            name_cells = name_hits[_cells(matrix.name_codes, rows, slice(None))]
+            column_mask = column_mask | name_cells.any(axis=0)
+        columns = slice(None) if column_mask.all() else np.flatnonzero(column_mask)
+        applicable = _cells(matrix.present, rows, columns)
+        if name_cells is not None and rule.ids is not None:
+            applicable = applicable & (np.isin(matrix.column_ids[columns], list(rule.ids))[None, :] | name_cells[:, columns])
+        if not applicable.any():
+            continue
+
+        fields = {}
+
+        def field(name):
+            if name not in fields:
+                fields[name] = (matrix.column_ids[columns][None, :] if name == 'id'
+                                else _cells(getattr(matrix, MATRIX_FIELDS[name]), rows, columns))
+            return fields[name]
+
+        remaining = applicable
+        for level in rule.levels:
+            hit = remaining.copy()
+            for check in level.checks:
+                other = check.value if check.other_field is None else field(check.other_field)
+                hit &= check.compare(field(check.field), other)
+            hits = hit.sum(axis=1)
+            penalty[rows] += level.penalty * hits
+            warning_count[rows] += hits
+            warning_flags[rows] |= np.where(hits > 0, rule.flag, 0).astype(np.uint8)
+            remaining = remaining & ~hit
+
+
+def batch_score(matrix, engine=None):
+    """
+    FleetMatrix'teki her okumanın puanını, okumanın modeline göre seçilen kurallarla hesaplar.
+    Sözlük döndürür:
+    - 'score': puanlar (0-100, int dizisi)
+    - 'status': HEALTH_GRADES durum metinleri (object dizisi)
+    - 'warning_flags': WARN_* bitleri (uint8 dizisi)
+    - 'warning_count': skaler işlevin döndüreceği uyarı sayısı
+    """
+    engine = engine or get_rule_engine()
+    count = len(matrix)
+    penalty = np.zeros(count, dtype=np.int64)
+    warning_count = np.zeros(count, dtype=np.int64)
+    warning_flags = np.zeros(count, dtype=np.uint8)
+
+    # Aynı kural kümesini kullanan modeller birlikte puanlanır; çoğu zaman tüm okumalar tek gruptadır
+    groups = {}
+    for code, info in enumerate(matrix.models):
+        rule_set = engine.rule_set_for(info)
+        groups.setdefault(id(rule_set), (rule_set, []))[1].append(code)
+    for rule_set, codes in groups.values():
+        if len(groups) == 1:
+            rows = slice(None)
+        else:
+            rows = np.flatnonzero(np.isin(matrix.model_codes, codes))
+        _apply_rules(rule_set, matrix, rows, penalty, warning_count, warning_flags)
+
+    score = np.clip(100 - penalty, 0, 100)
+
+    # HEALTH_GRADES en yüksek eşikten başlar: puandan büyük eşiklerin sayısı derecenin sırasıdır
+    grade_minimums = np.array([min_score for min_score, _, _ in HEALTH_GRADES])
+    grade_index = np.minimum((score[:, None] < grade_minimums[None, :]).sum(axis=1), len(HEALTH_GRADES) - 1)
+    statuses = np.array([status for _, status, _ in HEALTH_GRADES], dtype=object)
+
+    return {
+        'score': score,
+        'status': statuses[grade_index],
+        'warning_flags': warning_flags,
+        'warning_count': warning_count,
+    }
+
+
+def score_snapshots(snapshots):
+    """Okuma listesini matrise yerleştirip puanlar (bkz. batch_score)."""
+    return batch_score(FleetMatrix.from_snapshots(snapshots))
@@ -0,0 +1,153 @@
+"""
+Toplayıcı (collector): ajanların (zeus_core.push) gönderdiği fark kayıtlarını uygular ve okumaları
+tek bir geçmiş veritabanına (zeus_core.history) yazar.
+    python3 -m zeus_core --collector --collector-port 9634 [--collector-address 0.0.0.0]
+
+Her sunucunun (ajan oturumunun) disk durumları bellekte tutulur; bir fark kaydı geldiğinde yalnızca o
+disk güncellenir ve tam okuma oluşturulup yazılır, değişmeyen diskler için hiçbir iş yapılmaz. Bir
+gönderimdeki tüm okumalar tek işlemde yazılır. Toplayıcı yeniden başlatıldığında durumlar kaybolur;
+ajanlar 409 yanıtı alınca son durumlarını baştan gönderir. Kalıcı kimliği bulunamamış ve disk yoluyla
+anahtarlanmış diskler, sunucular arasında karışmasın diye sunucu adıyla öneklenir.
+"""
+import sys
+import json
+import signal
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from zeus_core.history import history_enabled, record_history
+from zeus_core.push import CONTENT_ENCODING, PushError, apply_delta, decode_batch, state_snapshot
+
+DEFAULT_COLLECTOR_ADDRESS = "127.0.0.1"
+DEFAULT_COLLECTOR_PORT = 9634
+PUSH_PATH = "/push"
+
+# Tek bir gönderimin en büyük (sıkıştırılmış) boyutu
+MAX_BATCH_BYTES = 64 * 1024 * 1024
+
+
+def collector_disk_key(host, disk_key):
+    """Toplayıcıdaki geçmiş anahtarı: disk yolları sunucu adıyla öneklenir, kimlikler olduğu gibi kalır."""
+    return f"{host}:{disk_key}" if disk_key.startswith("/") else disk_key
+
+
+class Collector:
+    """
+    Gönderimleri sırayla uygular. Oturum kaydı: {'session', 'seq', 'disks'}; disks disk anahtarı ->
+    zeus_core.push durumudur. record, (anahtar, SmartSnapshot, puan) listesini yazan işlevdir.
+    """
+
+    def __init__(self, record=record_history):
+        self.record = record
+        self.sessions = {} # sunucu adı -> oturum kaydı
+        self.lock = threading.Lock()
+        self.stats = {'batches': 0, 'entries': 0, 'bytes': 0, 'resyncs': 0, 'rejected': 0}
+
+    def apply(self, document, size=0):
+        """Çözülmüş gönderimi uygular; (HTTP durum kodu, yanıt sözlüğü) döndürür."""
+        host = document['host']
+        with self.lock:
+            session = self.sessions.get(host)
+            if session is not None and session['session'] == document['session'] and session['seq'] == document['seq']:
+                return 200, {'ack': document['seq']} # Yanıtı kaybolmuş gönderimin tekrarı
+            if document['base'] == 0:
+                session = {'session': document['session'], 'seq': 0, 'disks': {}}
+            elif session is None or session['session'] != document['session'] or session['seq'] != document['base']:
+                self.stats['resyncs'] += 1
+                return 409, {'resync': True}
+
+            readings = []
+            try:
+                for entry in document['entries']:
+                    disk_key = entry['k']
+                    state = apply_delta(session['disks'].get(disk_key), entry)
+                    session['disks'][disk_key] = state
+                    readings.append((collector_disk_key(host, disk_key), state_snapshot(state, entry['t']),
+                                     state['score']))
+            except (PushError, KeyError, IndexError, TypeError, AttributeError) as e:
+                # Durum yarıda değişti: oturum atılır, ajanın sonraki gönderimi 409 ile baştan başlar
+                self.sessions.pop(host, None)
+                self.stats['rejected'] += 1
+                return 400, {'error': f"Geçersiz fark kaydı: {e}"}
+            self.record(readings)
+            session['seq'] = document['seq']
+            self.sessions[host] = session
+            self.stats['batches'] += 1
+            self.stats['entries'] += len(readings)
+            self.stats['bytes'] += size
+            return 200, {'ack': document['seq']}
+
+
+class _CollectorHandler(BaseHTTPRequestHandler):
+    server_version = "zeus-hdd-doctor"
+
+    def _reply(self, status, document):
+        body = json.dumps(document, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path != PUSH_PATH:
+            self.send_error(404)
+            return
+        if self.headers.get("Content-Encoding") != CONTENT_ENCODING:
+            self._reply(415, {'error': f"Content-Encoding '{CONTENT_ENCODING}' olmalı."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._reply(411, {'error': "Content-Length gerekli."})
+            return
+        if not 0 < length <= MAX_BATCH_BYTES:
+            self._reply(413, {'error': "Gönderim çok büyük."})
+            return
+        try:
+            document = decode_batch(self.rfile.read(length))
+        except PushError as e:
+            self._reply(400, {'error': str(e)})
+            return
+        self._reply(*self.server.collector.apply(document, length))
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_collector_server(address, port, collector=None):
+    """Toplayıcının HTTP sunucusunu oluşturur (serve_forever çağıranın işidir); açılamazsa OSError."""
+    server = ThreadingHTTPServer((address, port), _CollectorHandler)
+    server.daemon_threads = False # server_close() süren istekleri bekler
+    server.collector = collector or Collector()
+    return server
+
+
+def run_collector(port=None, address=None):
+    """Toplayıcıyı SIGTERM/SIGINT gelene kadar çalıştırır; başlatılamazsa 1 döndürür."""
+    port = DEFAULT_COLLECTOR_PORT if port is None else port
+    address = address or DEFAULT_COLLECTOR_ADDRESS
+    if not history_enabled():
+        print("Hata: geçmiş kaydı kapalı (ZEUS_HISTORY=0); toplayıcı okumaları yazamaz.", file=sys.stderr)
+        return 1
+    try:
+        server = create_collector_server(address, port)
+    except OSError as e:
+        print(f"Hata: toplayıcı {address}:{port} adresinde açılamadı: {e}", file=sys.stderr)
+        return 1
+
+    def stop(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start() # serve_forever'ı bu iş parçacığı çalıştırıyor
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, stop)
+    host, bound_port = server.server_address[:2]
+    print(f"Toplayıcı: http://{host}:{bound_port}{PUSH_PATH}", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close() # Süren gönderimlerin yazılması beklenir
+    stats = server.collector.stats
+    print(f"Toplayıcı durdu: {stats['batches']} gönderim, {stats['entries']} okuma, {stats['bytes']} bayt.",
+          file=sys.stderr, flush=True)
+    return 0
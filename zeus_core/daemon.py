@@ -0,0 +1,477 @@
+"""
+Arka plan (daemon) kipi: diskleri bir zamanlayıcıyla sürekli yoklar, puanlar ve geçmişe yazar.
+    python3 -m zeus_core --daemon [--json] [--interval 300] [--config /etc/zeus-hdd-doctor/daemon.json]
+    python3 Zeus_HDD_Doctor_CONSOLE.py --daemon
+
+Her disk kendi aralığıyla okunur; bir sonraki okuma zamanı aralığın ±'jitter' oranı kadar rastgele
+kaydırılır ve ilk okumalar başlangıçta yayılır, böylece onlarca disk aynı saniyede sorgulanmaz.
+Aynı anda en fazla 'workers' disk okunur; okuması süren disk yeniden sıraya alınmaz. Her okuma
+sonucu tek satır olarak (--json ile JSON Lines) standart çıktıya yazılır.
+
+Ayar dosyası (--config veya ZEUS_DAEMON_CONFIG), tümü isteğe bağlı:
+    {"interval": 300, "jitter": 0.1, "workers": 4,
+     "intervals": {"/dev/sda": 60, "sdb": 900, "sata:WD-WCC4E1234567": 3600}}
+'intervals' anahtarları disk yolu, aygıt adı veya kalıcı kimlik (zeus_core.enumeration) olabilir.
+
+Sinyaller:
+- SIGTERM/SIGINT: yeni okuma başlatılmaz, sürenler 'stop_grace' saniye beklenir, sonra durdurulur
+  (smartctl süreç grubu öldürülür); ikinci sinyal beklemeden durdurur
+- SIGHUP: ayar ve kural dosyaları yeniden okunur, disk listesi yenilenir; geçersiz dosyada önceki
+  ayarlarla devam edilir
+
+--metrics-port verilirse son okumalar Prometheus biçiminde sunulur (bkz. zeus_core.metrics); --push
+verilirse okumaların farkları merkezi bir toplayıcıya gönderilir (bkz. zeus_core.push).
+"""
+import os
+import sys
+import json
+import time
+import heapq
+import random
+import signal
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from zeus_core.acquisition import get_smart_budget
+from zeus_core.aio import acquire_smart_data
+from zeus_core.enumeration import DiskListError, get_disk_list
+from zeus_core.headless import HEADLESS_DEVICE_TYPES, add_trend, build_disk_report, format_text_report
+from zeus_core.history import record_history
+from zeus_core.hotplug import RESYNC_ACTION, open_uevent_monitor
+from zeus_core.metrics import DEFAULT_METRICS_ADDRESS, MetricsExporter
+from zeus_core.push import PushAgent
+from zeus_core.rules import RuleError, reload_rule_engine
+
+DEFAULT_DAEMON_INTERVAL = 300.0
+DEFAULT_DAEMON_JITTER = 0.1
+DEFAULT_DAEMON_WORKERS = 4
+DEFAULT_STOP_GRACE = 10.0
+
+# İlk okumaların yayıldığı en uzun süre (sn); aralık daha kısaysa aralık kadar
+STARTUP_SPREAD = 60.0
+
+# Uevent soketi açılamazsa (yetki) disk listesi bu aralıkla yeniden okunur (sn)
+RESCAN_INTERVAL = 300.0
+
+# Metrik metni, art arda biten okumalar için bu kadar bekleyip bir kez hazırlanır (sn)
+METRICS_RENDER_DELAY = 1.0
+
+
+class DaemonConfigError(ValueError):
+    """Arka plan kipi ayar dosyası geçersiz."""
+
+
+def _positive_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
+class DaemonSettings:
+    """Arka plan kipinin doğrulanmış ayarları (bkz. modül açıklaması)."""
+
+    __slots__ = ('interval', 'jitter', 'workers', 'stop_grace', 'intervals')
+
+    def __init__(self, config):
+        if not isinstance(config, dict):
+            raise DaemonConfigError("Ayar dosyası bir JSON nesnesi olmalı.")
+        self.interval = config.get('interval', get_default_interval())
+        self.jitter = config.get('jitter', DEFAULT_DAEMON_JITTER)
+        self.workers = config.get('workers', DEFAULT_DAEMON_WORKERS)
+        self.stop_grace = config.get('stop_grace', DEFAULT_STOP_GRACE)
+        if not _positive_number(self.interval):
+            raise DaemonConfigError("'interval' pozitif bir sayı olmalı.")
+        if not isinstance(self.jitter, (int, float)) or isinstance(self.jitter, bool) or not 0 <= self.jitter < 1:
+            raise DaemonConfigError("'jitter' 0 ile 1 arasında (1 hariç) bir sayı olmalı.")
+        if not isinstance(self.workers, int) or isinstance(self.workers, bool) or self.workers < 1:
+            raise DaemonConfigError("'workers' pozitif bir tamsayı olmalı.")
+        if not isinstance(self.stop_grace, (int, float)) or isinstance(self.stop_grace, bool) or self.stop_grace < 0:
+            raise DaemonConfigError("'stop_grace' negatif olmayan bir sayı olmalı.")
+        intervals = config.get('intervals', {})
+        if not isinstance(intervals, dict):
+            raise DaemonConfigError("'intervals' bir JSON nesnesi olmalı.")
+        for key, value in intervals.items():
+            if not _positive_number(value):
+                raise DaemonConfigError(f"'intervals' içinde '{key}' için aralık pozitif bir sayı olmalı.")
+        self.intervals = dict(intervals)
+
+    def interval_for(self, disk):
+        """Diskin yoklama aralığı: kimlik, yol veya ad için verilen aralık; yoksa genel aralık."""
+        for key in (disk.get('identity'), disk['path'], os.path.basename(disk['path'])):
+            if key and key in self.intervals:
+                return self.intervals[key]
+        return self.interval
+
+
+def get_default_interval():
+    """Genel yoklama aralığı (sn); ZEUS_DAEMON_INTERVAL ile değiştirilebilir."""
+    try:
+        interval = float(os.environ.get('ZEUS_DAEMON_INTERVAL', DEFAULT_DAEMON_INTERVAL))
+    except ValueError:
+        interval = DEFAULT_DAEMON_INTERVAL
+    return interval if interval > 0 else DEFAULT_DAEMON_INTERVAL
+
+
+def get_daemon_config_path():
+    """Ayar dosyasının yolu (ZEUS_DAEMON_CONFIG); verilmemişse None."""
+    return os.environ.get('ZEUS_DAEMON_CONFIG') or None
+
+
+def load_daemon_settings(path=None, overrides=None):
+    """
+    Ayar dosyasını okur; komut satırından gelen 'overrides' değerleri (None olmayanlar) dosyadakilerin
+    yerine geçer. Dosya okunamaz veya geçersizse DaemonConfigError fırlatılır.
+    """
+    config = {}
+    if path:
+        try:
+            with open(path, encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            raise DaemonConfigError(f"Ayar dosyası okunamadı ({path}): {e}") from e
+        if not isinstance(config, dict):
+            raise DaemonConfigError("Ayar dosyası bir JSON nesnesi olmalı.")
+    config = dict(config)
+    config.update({key: value for key, value in (overrides or {}).items() if value is not None})
+    return DaemonSettings(config)
+
+
+def next_poll_time(previous_due, interval, jitter, now, rng=random):
+    """
+    Bir sonraki okuma zamanı: önceki planlanan zamana aralığın ±jitter oranı kadar kaydırılmış aralık
+    eklenir. Okuma gecikmiş ve bu zaman geçmişse, geride kalan diskler aynı ana yığılmasın diye
+    zaman 'now' ile aralığın jitter payı arasına dağıtılır.
+    """
+    due = previous_due + interval * (1 + rng.uniform(-jitter, jitter))
+    if due < now:
+        due = now + rng.uniform(0, interval * jitter)
+    return due
+
+
+class PollScheduler:
+    """
+    Disklerin okuma zamanlarını tutar. Sıra bir yığındır (heapq); disk çıkarıldığında veya zamanı
+    değiştiğinde eski kayıt silinmez, sürüm numarasıyla geçersiz sayılır.
+    Disk kaydı: {'disk', 'interval', 'due', 'running', 'version'}
+    """
+
+    def __init__(self, settings, rng=random):
+        self.settings = settings
+        self.rng = rng
+        self.entries = {} # disk yolu -> kayıt
+        self.queue = [] # (zaman, sürüm, disk yolu)
+        self.version = 0
+
+    def _push(self, path, due):
+        entry = self.entries[path]
+        self.version += 1
+        entry['due'], entry['version'] = due, self.version
+        heapq.heappush(self.queue, (due, self.version, path))
+
+    def add(self, disk, now, spread=None):
+        """Diski ekler; ilk okuma şimdiden 'spread' saniye içinde rastgele bir ana konur."""
+        interval = self.settings.interval_for(disk)
+        spread = min(interval, STARTUP_SPREAD) if spread is None else spread
+        self.entries[disk['path']] = {'disk': disk, 'interval': interval, 'due': None, 'running': False, 'version': 0}
+        self._push(disk['path'], now + self.rng.uniform(0, spread))
+
+    def remove(self, path):
+        """Diski çıkarır; okuması sürüyorsa sonucu yeniden sıraya alınmaz."""
+        return self.entries.pop(path, None) is not None
+
+    def sync(self, disks, now):
+        """
+        Disk listesini ve ayarları uygular: yeni diskler eklenir, listede olmayanlar çıkarılır, var
+        olanların kaydı ve aralığı güncellenir (aralık kısaldıysa okuma öne alınır).
+        """
+        paths = {disk['path'] for disk in disks}
+        for path in [path for path in self.entries if path not in paths]:
+            self.remove(path)
+        for disk in disks:
+            entry = self.entries.get(disk['path'])
+            if entry is None:
+                self.add(disk, now)
+                continue
+            entry['disk'] = disk
+            interval = self.settings.interval_for(disk)
+            if interval != entry['interval']:
+                entry['interval'] = interval
+                if not entry['running'] and entry['due'] > now + interval:
+                    self._push(disk['path'], now + self.rng.uniform(0, interval * self.settings.jitter))
+
+    def pop_due(self, now):
+        """Zamanı gelmiş ve okuması sürmeyen disklerin kayıtlarını döndürür ve 'running' olarak işaretler."""
+        due_entries = []
+        while self.queue and self.queue[0][0] <= now:
+            _, version, path = heapq.heappop(self.queue)
+            entry = self.entries.get(path)
+            if entry is None or entry['version'] != version or entry['running']:
+                continue
+            entry['running'] = True
+            due_entries.append(entry)
+        return due_entries
+
+    def finished(self, path, now):
+        """Okuma bittiğinde diski bir sonraki zamana planlar."""
+        entry = self.entries.get(path)
+        if entry is None:
+            return
+        entry['running'] = False
+        self._push(path, next_poll_time(entry['due'], entry['interval'], self.settings.jitter, now, self.rng))
+
+    def next_due(self):
+        """En yakın geçerli okuma zamanı; sırada disk yoksa None."""
+        while self.queue:
+            due, version, path = self.queue[0]
+            entry = self.entries.get(path)
+            if entry is not None and entry['version'] == version and not entry['running']:
+                return due
+            heapq.heappop(self.queue)
+        return None
+
+
+class PollingDaemon:
+    """
+    Zamanlayıcıyı asyncio olay döngüsünde çalıştırır. Diskler zeus_core.aio ile okunur; geçmiş
+    yazımı (SQLite) döngüyü bekletmesin diye tek bir iş parçacığında, okuma sırasıyla yapılır.
+    """
+
+    def __init__(self, settings, load_settings=None, json_output=False, disk_filter=None,
+                 device_types=HEADLESS_DEVICE_TYPES, budget=None, out=None, exporter=None,
+                 pusher=None):
+        self.settings = settings
+        self.load_settings = load_settings
+        self.json_output = json_output
+        self.disk_filter = disk_filter
+        self.device_types = device_types
+        self.budget = budget or get_smart_budget()
+        self.out = out or sys.stdout
+        self.exporter = exporter
+        self.pusher = pusher
+        self.render_pending = False
+        self.scheduler = PollScheduler(settings)
+        self.semaphore = None
+        self.tasks = {} # görev -> disk yolu
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zeus-daemon-history")
+        self.wakeup = None
+        self.stopping = False
+        self.reload_requested = False
+        self.monitor = None
+        self.next_rescan = None
+
+    def warn(self, message):
+        print(f"Uyarı: {message}", file=sys.stderr, flush=True)
+
+    def request_stop(self):
+        """SIGTERM/SIGINT: ilk istekte sürenler beklenir, ikincisinde hemen durdurulur."""
+        if self.stopping:
+            for task in self.tasks:
+                task.cancel()
+        self.stopping = True
+        self.wakeup.set()
+
+    def request_reload(self):
+        self.reload_requested = True
+        self.wakeup.set()
+
+    def _list_disks(self):
+        try:
+            disks = get_disk_list()
+        except DiskListError as e:
+            self.warn(f"disk listesi alınamadı: {e}")
+            return None
+        if self.disk_filter:
+            disks = [disk for disk in disks if disk['path'] in self.disk_filter]
+        return disks
+
+    def refresh_disks(self, now):
+        disks = self._list_disks()
+        if disks is not None:
+            self.scheduler.sync(disks, now)
+            self.schedule_render()
+
+    def reload(self, now):
+        """SIGHUP: ayarları ve kuralları yeniden okur, disk listesini yeniler."""
+        self.reload_requested = False
+        if self.load_settings is not None:
+            try:
+                settings = self.load_settings()
+            except DaemonConfigError as e:
+                self.warn(f"{e} Önceki ayarlarla devam ediliyor.")
+            else:
+                if settings.workers != self.settings.workers:
+                    self.semaphore = asyncio.Semaphore(settings.workers) # Yeni okumalardan itibaren geçerli
+                self.settings = self.scheduler.settings = settings
+        try:
+            reload_rule_engine()
+        except RuleError as e:
+            self.warn(f"Kural dosyası geçersiz: {e} Önceki kurallarla devam ediliyor.")
+        self.refresh_disks(now)
+
+    def _on_uevent(self):
+        now = time.monotonic()
+        for event in self.monitor.read_events():
+            if event['action'] == RESYNC_ACTION: # Olaylar kayboldu: güncel liste zamanlayıcıya uygulanır
+                self.refresh_disks(now)
+                continue
+            path = event['path']
+            if self.disk_filter and path not in self.disk_filter:
+                continue
+            if event['action'] == "remove":
+                self.scheduler.remove(path)
+                self.schedule_render()
+            elif event['disk'] is not None:
+                entry = self.scheduler.entries.get(path)
+                if entry is None:
+                    self.scheduler.add(event['disk'], now, spread=self.settings.interval * self.settings.jitter)
+                else:
+                    entry['disk'] = event['disk'] # 'change': ortam değişmiş olabilir
+        self.wakeup.set()
+
+    def _record(self, report, history):
+        """
+        Yazıcı iş parçacığında: okumayı geçmişe yazar, güncellenen eğilimi rapora ekler ve varsa
+        toplayıcıya gönderilecek kuyruğa alır.
+        """
+        record_history(history)
+        add_trend(report, history[0][0])
+        if self.pusher is not None:
+            self.pusher.add(history)
+
+    def emit(self, report):
+        if self.json_output:
+            line = json.dumps({'generated_at': time.strftime("%Y-%m-%dT%H:%M:%S%z"), 'disk': report}, ensure_ascii=False)
+        else:
+            line = f"{time.strftime('%Y-%m-%d %H:%M:%S')} {format_text_report([report])}"
+        try:
+            print(line, file=self.out, flush=True)
+        except BrokenPipeError:
+            self.stopping = True # Çıktıyı okuyan süreç kapandı
+            self.wakeup.set()
+
+    def schedule_render(self):
+        """Metrik metninin yeniden hazırlanmasını planlar; bekleyen bir hazırlık varsa ona katılır."""
+        if self.exporter is not None and not self.render_pending:
+            self.render_pending = True
+            asyncio.get_running_loop().call_later(METRICS_RENDER_DELAY, self._render_metrics)
+
+    def _render_metrics(self):
+        self.render_pending = False
+        for path in [path for path in self.exporter.states if path not in self.scheduler.entries]:
+            self.exporter.remove(path) # Çıkarılmış diskin serileri sunulmaz
+        self.exporter.render()
+
+    async def _poll(self, entry):
+        loop = asyncio.get_running_loop()
+        disk = entry['disk']
+        async with self.semaphore:
+            if self.stopping:
+                return # Durdurma isteğinden sonra sıradaki okumalar başlatılmaz
+            started = time.monotonic() # Bütçe sıra beklerken değil, okuma başladığında işler
+            result = await acquire_smart_data(disk['path'], self.device_types, self.budget)
+            elapsed = time.monotonic() - started
+        history = []
+        report = build_disk_report(disk, *result, elapsed=elapsed, history=history)
+        if history:
+            await loop.run_in_executor(self.writer, self._record, report, history)
+        self.emit(report)
+        if self.exporter is not None:
+            self.exporter.update(report, time.time())
+            self.schedule_render()
+
+    def _poll_done(self, task):
+        path = self.tasks.pop(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.warn(f"'{path}' okunurken hata: {task.exception()}")
+        self.scheduler.finished(path, time.monotonic())
+        self.wakeup.set()
+
+    async def _drain(self):
+        """Süren okumaları en fazla stop_grace saniye bekler, kalanları iptal eder."""
+        if self.tasks:
+            await asyncio.wait(list(self.tasks), timeout=self.settings.stop_grace)
+        for task in list(self.tasks):
+            task.cancel()
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self.wakeup = asyncio.Event()
+        self.semaphore = asyncio.Semaphore(self.settings.workers)
+        signals = [(signal.SIGTERM, self.request_stop), (signal.SIGINT, self.request_stop)]
+        if hasattr(signal, "SIGHUP"):
+            signals.append((signal.SIGHUP, self.request_reload))
+        for signum, handler in signals:
+            loop.add_signal_handler(signum, handler)
+        if self.exporter is not None:
+            self.exporter.start()
+        if self.pusher is not None:
+            self.pusher.start()
+        self.monitor = open_uevent_monitor()
+        if self.monitor is not None:
+            loop.add_reader(self.monitor.fileno(), self._on_uevent)
+        try:
+            now = time.monotonic()
+            self.refresh_disks(now)
+            if self.monitor is None:
+                self.next_rescan = now + RESCAN_INTERVAL
+            while not self.stopping:
+                now = time.monotonic()
+                if self.reload_requested:
+                    self.reload(now)
+                if self.next_rescan is not None and now >= self.next_rescan:
+                    self.refresh_disks(now)
+                    self.next_rescan = now + RESCAN_INTERVAL
+                for entry in self.scheduler.pop_due(now):
+                    task = asyncio.ensure_future(self._poll(entry))
+                    self.tasks[task] = entry['disk']['path']
+                    task.add_done_callback(self._poll_done)
+                wake_at = [t for t in (self.scheduler.next_due(), self.next_rescan) if t is not None]
+                timeout = max(0.0, min(wake_at) - time.monotonic()) if wake_at else None
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self.wakeup.clear()
+            await self._drain()
+        finally:
+            for signum, _ in signals:
+                loop.remove_signal_handler(signum)
+            if self.monitor is not None:
+                loop.remove_reader(self.monitor.fileno())
+                self.monitor.close()
+            self.writer.shutdown(wait=True) # Süren geçmiş yazımı tamamlanır
+            if self.pusher is not None:
+                self.pusher.close() # Kuyrukta kalanlar son bir kez gönderilir
+            if self.exporter is not None:
+                self.exporter.close()
+
+
+def run_daemon(config_path=None, overrides=None, json_output=False, disk_filter=None, budget=None,
+               metrics_port=None, metrics_address=None, push_url=None):
+    """
+    Arka plan kipini durdurulana kadar çalıştırır. Ayar dosyası geçersizse veya metrik portu
+    açılamazsa 1 döndürür.
+    """
+    config_path = config_path or get_daemon_config_path()
+
+    def load_settings():
+        return load_daemon_settings(config_path, overrides)
+
+    try:
+        settings = load_settings()
+    except DaemonConfigError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    exporter = None
+    if metrics_port is not None:
+        try:
+            exporter = MetricsExporter(metrics_port, metrics_address or DEFAULT_METRICS_ADDRESS)
+        except OSError as e:
+            print(f"Hata: metrik sunucusu {metrics_address or DEFAULT_METRICS_ADDRESS}:{metrics_port} "
+                  f"adresinde açılamadı: {e}", file=sys.stderr)
+            return 1
+    pusher = PushAgent(push_url) if push_url else None
+    daemon = PollingDaemon(settings, load_settings, json_output=json_output, disk_filter=disk_filter, budget=budget,
+                           exporter=exporter, pusher=pusher)
+    asyncio.run(daemon.run())
+    return 0
@@ -0,0 +1,214 @@
+"""
+Diskleri lsblk çalıştırmadan doğrudan /sys/block altından listeler.
+sysfs kullanılamıyorsa get_disk_list() lsblk çıktısına geri döner.
+
+Her disk için boyut, dönen/SSD, çıkarılabilir, model, üretici, seri numarası, WWN ve
+bağlantı tipi (aygıt bağlantısının sysfs yolundan) okunur. sysfs kökü parametre ya da
+ZEUS_SYSFS_ROOT ortam değişkeniyle değiştirilebilir; böylece sahte bir dizin ağacıyla
+denenebilir.
+"""
+import os
+import subprocess
+
+DEFAULT_SYSFS_ROOT = "/sys"
+DEFAULT_UDEV_DATA_ROOT = "/run/udev/data"
+
+# lsblk'nin 'disk' tipinde göstermediği sanal aygıtlar
+VIRTUAL_DEVICE_PREFIXES = ("loop", "ram", "zram", "dm-", "md", "nbd", "sr")
+
+
+def get_sysfs_root():
+    """Kullanılacak sysfs kökünü döndürür."""
+    return os.environ.get('ZEUS_SYSFS_ROOT', DEFAULT_SYSFS_ROOT)
+
+
+def _read_sysfs(path):
+    """Bir sysfs dosyasını okur, yoksa veya okunamazsa boş metin döndürür."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _read_vpd_serial(path):
+    """SCSI VPD 0x80 sayfasından (Unit Serial Number) seri numarasını okur."""
+    try:
+        with open(path, 'rb') as f:
+            page = f.read()
+    except OSError:
+        return ""
+    if len(page) < 4:
+        return ""
+    length = (page[2] << 8) | page[3]
+    return page[4:4 + length].decode('ascii', errors='ignore').strip()
+
+
+def _read_udev_properties(dev_numbers, udev_root):
+    """udev veritabanından (b<major>:<minor>) E: satırlarını sözlük olarak okur."""
+    properties = {}
+    if not dev_numbers:
+        return properties
+    try:
+        with open(os.path.join(udev_root, f"b{dev_numbers}"), 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                if line.startswith("E:"):
+                    key, _, value = line[2:].rstrip("\n").partition("=")
+                    properties[key] = value
+    except OSError:
+        pass
+    return properties
+
+
+def disk_transport(block_path):
+    """Blok aygıtının sysfs yolundan bağlantı tipini (usb, nvme, sata, sas, scsi...) çıkarır."""
+    real_path = os.path.realpath(block_path)
+    if "/usb" in real_path:
+        return "usb"
+    if "/nvme" in real_path:
+        return "nvme"
+    if "/ata" in real_path:
+        return "sata"
+    if "/end_device-" in real_path or "/sas_" in real_path:
+        return "sas"
+    if "/virtio" in real_path:
+        return "virtio"
+    return "scsi"
+
+
+def _normalize_wwn(wwid):
+    """sysfs wwid değerini lsblk'deki WWN biçimine çevirir (naa.5000c5... -> 0x5000c5...)."""
+    if wwid.startswith("naa."):
+        return "0x" + wwid[4:].lower()
+    if wwid.startswith("eui."):
+        return wwid.lower()
+    return ""
+
+
+def disk_identity(disk_path, sysfs_root=None):
+    """
+    Diskin kalıcı kimliğini 'bağlantı:wwn' veya 'bağlantı:seri' biçiminde döndürür.
+    Bilgiler sysfs'ten okunur, hiçbir komut çalıştırılmaz. Kimlik bulunamazsa None döner.
+    """
+    sysfs_root = sysfs_root or get_sysfs_root()
+    name = os.path.basename(os.path.realpath(disk_path))
+    if not os.path.exists(os.path.join(sysfs_root, "block", name)):
+        return None
+    return read_block_disk(name, sysfs_root)['identity']
+
+
+def format_size(num_bytes):
+    """Boyutu lsblk gibi 1024 tabanlı kısa biçimde yazar (örn: 1.8T, 465.8G, 16G)."""
+    value = float(num_bytes)
+    for unit in ("B", "K", "M", "G", "T", "P", "E"):
+        if value < 1024 or unit == "E":
+            break
+        value /= 1024
+    if unit == "B":
+        return f"{int(value)}B"
+    text = f"{value:.1f}"
+    return (text[:-2] if text.endswith(".0") else text) + unit
+
+
+def read_block_disk(name, sysfs_root=None, udev_root=DEFAULT_UDEV_DATA_ROOT):
+    """/sys/block/<name> altındaki bilgileri okuyarak tek bir disk kaydı oluşturur."""
+    sysfs_root = sysfs_root or get_sysfs_root()
+    block_path = os.path.join(sysfs_root, "block", name)
+    device_path = os.path.join(block_path, "device")
+
+    sectors = _read_sysfs(os.path.join(block_path, "size"))
+    size_bytes = int(sectors) * 512 if sectors.isdigit() else 0
+    model = " ".join(_read_sysfs(os.path.join(device_path, "model")).split())
+    vendor = " ".join(_read_sysfs(os.path.join(device_path, "vendor")).split())
+    serial = (_read_sysfs(os.path.join(device_path, "serial"))
+              or _read_vpd_serial(os.path.join(device_path, "vpd_pg80")))
+    wwid = _read_sysfs(os.path.join(device_path, "wwid")) or _read_sysfs(os.path.join(block_path, "wwid"))
+    wwn = _normalize_wwn(wwid)
+
+    # sysfs'te bulunmayan seri/WWN için udev veritabanına bak (komut çalıştırmadan)
+    if not serial or not wwn:
+        udev = _read_udev_properties(_read_sysfs(os.path.join(block_path, "dev")), udev_root)
+        serial = serial or udev.get("ID_SERIAL_SHORT", "")
+        wwn = wwn or udev.get("ID_WWN_WITH_EXTENSION", udev.get("ID_WWN", ""))
+
+    transport = disk_transport(block_path)
+    identifier = wwid or serial
+    size = format_size(size_bytes)
+    full_model_vendor = " ".join(part for part in (model, vendor) if part)
+    return {
+        'path': "/dev/" + name.replace("!", "/"),
+        'name': f"{name} ({size}) - {full_model_vendor}".strip(),
+        'device': name,
+        'size': size,
+        'size_bytes': size_bytes,
+        'rotational': _read_sysfs(os.path.join(block_path, "queue", "rotational")) == "1",
+        'removable': _read_sysfs(os.path.join(block_path, "removable")) == "1",
+        'model': model,
+        'vendor': vendor,
+        'serial': " ".join(serial.split()),
+        'wwn': wwn,
+        'transport': transport,
+        'identity': f"{transport}:{' '.join(identifier.split())}" if identifier else None,
+    }
+
+
+def list_block_disks(sysfs_root=None, udev_root=DEFAULT_UDEV_DATA_ROOT):
+    """
+    /sys/block altındaki fiziksel diskleri listeler.
+    Bölümler /sys/block'ta yer almaz; loop, zram, dm, md gibi sanal aygıtlar atlanır.
+    sysfs okunamıyorsa None döner (çağıran lsblk'ye geri dönebilir).
+    """
+    sysfs_root = sysfs_root or get_sysfs_root()
+    block_root = os.path.join(sysfs_root, "block")
+    try:
+        # sda..sdz, sdaa.. sırası korunur (düz alfabetik sıralama sdaa'yı sdb'nin önüne koyar)
+        names = sorted(os.listdir(block_root), key=lambda n: (n[:2], len(n), n))
+    except OSError:
+        return None
+
+    disks = []
+    for name in names:
+        if name.startswith(VIRTUAL_DEVICE_PREFIXES):
+            continue
+        if "/devices/virtual/" in os.path.realpath(os.path.join(block_root, name)):
+            continue
+        disks.append(read_block_disk(name, sysfs_root, udev_root))
+    return disks
+
+
+class DiskListError(Exception):
+    """Diskler ne sysfs'ten ne de lsblk ile listelenebildiğinde fırlatılır; mesaj kullanıcıya gösterilir."""
+
+
+def list_lsblk_disks():
+    """lsblk çıktısından 'disk' tipindeki aygıtları listeler (sysfs'in okunamadığı sistemler için)."""
+    try:
+        # -o: Çıktı formatını belirler (İsim, Boyut, Tip, Model, Üretici), -n: Başlıkları göstermez
+        output = subprocess.check_output(['lsblk', '-o', 'NAME,SIZE,TYPE,MODEL,VENDOR', '-n'], stderr=subprocess.PIPE).decode('utf-8')
+    except FileNotFoundError:
+        raise DiskListError("lsblk komutu bulunamadı. Lütfen 'util-linux' paketinin yüklü olduğundan emin olun.")
+    except subprocess.CalledProcessError as e:
+        error_detail = e.stderr.decode('utf-8', errors='ignore').strip() if e.stderr else "Detay yok."
+        raise DiskListError(f"lsblk komutu çalıştırılırken sorun oluştu: {error_detail}")
+
+    disks = []
+    for line in output.splitlines():
+        parts = line.strip().split()
+        if len(parts) >= 3 and parts[2] == "disk": # Sadece 'disk' tipindeki cihazları al
+            disk_name = parts[0] # sda, sdb gibi
+            disk_size = parts[1] # 1T, 500G gibi
+            full_model_vendor = " ".join(parts[3:]).strip() # Model ve Vendor'ı birleştir
+            disks.append({'path': f"/dev/{disk_name}", 'name': f"{disk_name} ({disk_size}) - {full_model_vendor}".strip()})
+    return disks
+
+
+def get_disk_list(sysfs_root=None):
+    """
+    Sistemdeki fiziksel diskleri listeler.
+    Diskler doğrudan /sys/block'tan okunur; sysfs kullanılamıyorsa lsblk'ye geri dönülür.
+    İkisi de başarısız olursa DiskListError fırlatılır.
+    """
+    disks = list_block_disks(sysfs_root)
+    if disks is not None:
+        return disks
+    return list_lsblk_disks()
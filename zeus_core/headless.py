@@ -0,0 +1,166 @@
+"""
+Arayüzsüz disk taraması: tüm disklerin SMART verilerini okur, puanlar ve JSON (veya kısa metin) yazar.
+
+Qt, colorama ve asyncio yüklenmez (diskler zeus_core.acquisition ile iş parçacıklarında okunur);
+bu yüzden betiklerden, cron'dan veya izleme araçlarından hızla çağrılabilir:
+    python3 -m zeus_core --json
+    python3 Zeus_HDD_Doctor_CONSOLE.py --json
+--daemon ile diskler durdurulana kadar zamanlayıcıyla yoklanır (bkz. zeus_core.daemon; asyncio yalnızca
+bu kipte yüklenir).
+"""
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from zeus_core.acquisition import get_smart_budget, get_smart_data
+from zeus_core.enumeration import DiskListError, get_disk_list
+from zeus_core.history import disk_trend, history_disk_key, record_history
+from zeus_core.parsing import parse_smart_snapshot
+from zeus_core.scoring import UNKNOWN_STATUS, format_health_notes, health_grade, score_attributes
+from zeus_core.snapshots import is_standby_note
+from zeus_core.trends import DEGRADING_STATUS, format_trend_notes
+
+# Arayüzsüz taramada denenecek aygıt tipleri (GUI ile aynı, USB köprüleri dahil)
+HEADLESS_DEVICE_TYPES = ['sat', 'nvme', 'usb', 'usbjm', 'usbscsi', 'jmicron', 'scsi', 'ata']
+
+# Aynı anda sorgulanacak en fazla disk sayısı
+DEFAULT_HEADLESS_WORKERS = 8
+
+
+def build_disk_report(disk, attributes_output, info_output, error_message, elapsed=None, history=None):
+    """
+    Bir diskin okuma sonucunu JSON'a yazılabilir bir sözlüğe çevirir.
+    history listesi verilirse yeni okuma, geçmişe yazılmak üzere (anahtar, SmartSnapshot, puan) olarak eklenir.
+    """
+    report = {
+        'path': disk['path'],
+        'name': disk['name'],
+        'identity': disk.get('identity'),
+        'smart_available': False,
+        'standby': is_standby_note(error_message),
+        'info': {},
+        'attributes': [],
+        'score': None,
+        'status': UNKNOWN_STATUS,
+        'warnings': [],
+        'degrading': False,
+        'trend': None,
+        'notes': "",
+        'error': error_message or None,
+        'elapsed': round(elapsed, 3) if elapsed is not None else None,
+    }
+    if not (attributes_output and info_output):
+        return report
+
+    snapshot = parse_smart_snapshot(attributes_output, info_output)
+    report['info'] = snapshot.info
+    if snapshot.info.get("SMART Supported") != "Enabled":
+        return report
+    report['smart_available'] = True
+    report['attributes'] = [attr.to_dict() for attr in snapshot]
+    report['score'], report['warnings'] = score_attributes(snapshot)
+    report['status'], notes = health_grade(report['score'])
+    report['notes'] = format_health_notes(notes, report['warnings'])
+    if history is not None and not report['standby']: # Bekleme kipindeki diskin gösterilen kaydı eski bir okumadır
+        history.append((history_disk_key(disk.get('identity'), snapshot.info, disk['path']), snapshot, report['score']))
+    return report
+
+
+def add_trend(report, disk_key):
+    """Geçmişteki eğilim raporunu (zeus_core.trends) rapora ve notlara ekler."""
+    trend = disk_trend(disk_key)
+    if trend is None:
+        return
+    report['trend'] = trend
+    report['degrading'] = trend['degrading']
+    report['notes'] = format_trend_notes(report['notes'], trend)
+
+
+def _timed_read(disk, device_types, budget):
+    """Diski okur; get_smart_data üçlüsüne geçen süreyi ekler."""
+    started = time.monotonic()
+    attributes_output, info_output, error_message = get_smart_data(disk['path'], device_types, budget=budget)
+    return attributes_output, info_output, error_message, time.monotonic() - started
+
+
+def scan_disks(disks, device_types=HEADLESS_DEVICE_TYPES, budget=None, concurrency=DEFAULT_HEADLESS_WORKERS):
+    """Diskleri aynı anda okur, okumaları geçmişe yazar ve raporları disk listesindeki sırayla döndürür."""
+    budget = budget or get_smart_budget()
+    reports = [None] * len(disks)
+    history = []
+    history_keys = {} # rapor sırası -> geçmiş anahtarı
+    executor = ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(disks) or 1)))
+    try:
+        futures = {executor.submit(_timed_read, disk, device_types, budget): i for i, disk in enumerate(disks)}
+        for future in as_completed(futures):
+            i = futures[future]
+            recorded = len(history)
+            reports[i] = build_disk_report(disks[i], *future.result(), history=history)
+            if len(history) > recorded:
+                history_keys[i] = history[-1][0]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True) # Ctrl+C: sıradaki diskler başlatılmaz
+    record_history(history) # Tüm diskler tek işlemde
+    for i, disk_key in history_keys.items(): # Eğilim özetleri bu okumalarla güncellendi
+        add_trend(reports[i], disk_key)
+    return reports
+
+
+def format_text_report(reports):
+    """Raporları disk başına tek satırlık özet olarak yazar."""
+    lines = []
+    for report in reports:
+        score = "Bilinmiyor" if report['score'] is None else f"%{report['score']}"
+        standby_mark = " (bekleme modu, son okuma)" if report['standby'] else ""
+        degrading_mark = f" - {DEGRADING_STATUS}" if report['degrading'] else ""
+        lines.append(f"{report['path']}: {score} {report['status']}{degrading_mark}{standby_mark} - {report['name']}")
+        if report['score'] is None and report['error']:
+            lines.append(f"  {report['error']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Komut satırı girişi; hata olursa 1 döndürür."""
+    parser = argparse.ArgumentParser(prog="zeus_core", description="Zeus HDD Doctor arayüzsüz disk taraması")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yaz")
+    parser.add_argument("--disk", action="append", help="Yalnızca bu diski tara (örn: /dev/sda); birden fazla verilebilir")
+    parser.add_argument("--budget", type=float, help="Disk başına SMART okuma bütçesi (sn)")
+    parser.add_argument("--workers", type=int, help="Eşzamanlı sorgu sayısı")
+    parser.add_argument("--daemon", action="store_true", help="Diskleri durdurulana kadar aralıklarla yokla")
+    parser.add_argument("--interval", type=float, help="Arka plan kipinde yoklama aralığı (sn)")
+    parser.add_argument("--config", help="Arka plan kipi ayar dosyası (JSON)")
+    parser.add_argument("--metrics-port", type=int, help="Arka plan kipinde Prometheus metriklerini bu portta sun")
+    parser.add_argument("--metrics-address", help="Metrik sunucusunun dinleyeceği adres (varsayılan 127.0.0.1)")
+    parser.add_argument("--push", metavar="URL", help="Arka plan kipinde okumaları bu toplayıcıya gönder")
+    parser.add_argument("--collector", action="store_true", help="Ajanlardan okuma toplayan sunucuyu çalıştır")
+    parser.add_argument("--collector-port", type=int, help="Toplayıcı portu (varsayılan 9634)")
+    parser.add_argument("--collector-address", help="Toplayıcının dinleyeceği adres (varsayılan 127.0.0.1)")
+    args = parser.parse_args(argv)
+
+    if args.collector:
+        from zeus_core.collector import run_collector
+        return run_collector(args.collector_port, args.collector_address)
+
+    if args.daemon:
+        from zeus_core.daemon import run_daemon
+        return run_daemon(args.config, {'interval': args.interval, 'workers': args.workers},
+                          json_output=args.json, disk_filter=args.disk, budget=args.budget,
+                          metrics_port=args.metrics_port, metrics_address=args.metrics_address, push_url=args.push)
+
+    try:
+        disks = get_disk_list()
+    except DiskListError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    if args.disk:
+        disks = [disk for disk in disks if disk['path'] in args.disk]
+
+    reports = scan_disks(disks, budget=args.budget, concurrency=max(1, args.workers or DEFAULT_HEADLESS_WORKERS))
+    if args.json:
+        document = {'generated_at': time.strftime("%Y-%m-%dT%H:%M:%S%z"), 'disks': reports}
+        print(json.dumps(document, ensure_ascii=False, indent=2))
+    else:
+        print(format_text_report(reports))
+    return 0
@@ -0,0 +1,679 @@
+"""
+SMART okumalarının geçmişi: gömülü SQLite veritabanında (WAL kipi) zaman serisi olarak saklanır.
+
+Her başarılı okuma (bekleme kipindeki disklerin eski kayıtları ve önbellekten gösterilen sonuçlar
+hariç) disk anahtarı ve zaman damgasıyla yazılır. Disk anahtarı kalıcı disk kimliğidir
+(zeus_core.enumeration.disk_identity: 'bağlantı:wwn' veya 'bağlantı:seri'); bulunamazsa smartctl'nin
+verdiği seri numarası, o da yoksa disk yolu kullanılır.
+
+Tablolar:
+- disks: disk anahtarı, model, seri numarası, ilk/son görülme
+- readings: (disk, zaman) -> puan
+- attributes: (disk, öznitelik ID, zaman, tekrar) -> current, worst, threshold, raw
+- attribute_names: (disk, öznitelik ID) -> son görülen ad
+- trend_state: (disk, öznitelik ID) -> eğilim özeti (zeus_core.trends); her okumada güncellenir
+- rollups: (disk, öznitelik ID, çözünürlük, kova) -> saatlik/günlük özet (zeus_core.rollups)
+- rollup_state: (disk, öznitelik ID) -> özetlere işlenmiş son okuma
+- rollup_late: diskin en yeni okumasından eski zamanla sonradan yazılan okumalar (ör. toplayıcıya
+  gecikmeli gelen gönderimler); özetleme etkiledikleri kovaları yeniden hesaplayıp kuyruktan siler
+
+attributes tablosu birincil anahtarına göre kümelenmiştir (WITHOUT ROWID); "bu diskin 5 numaralı
+özniteliğinin son 30 günü" gibi sorgular tek bir indeks aralığı taramasıdır. Bir yoklamadaki tüm
+diskler tek bir işlemde (transaction) toplu olarak yazılır.
+
+Veritabanı varsayılan olarak önbellek dizinindeki history.sqlite3 dosyasıdır; ZEUS_HISTORY_DB başka
+bir dosya gösterebilir, ZEUS_HISTORY=0 kaydı kapatır.
+
+Tamamlanan saatler arka plandaki bir iş parçacığında (kendi bağlantısıyla) saatlik ve günlük özetlere
+işlenir; series() sorgusu istenen nokta aralığını yanıtlayan en kaba çözünürlüğü kullanır, henüz
+özetlenmemiş son okumaları da ekler. Her çözünürlüğün kendi saklama süresi vardır (gün, 0: sınırsız):
+ham okumalar ZEUS_HISTORY_RETENTION_DAYS (30), saatlik özetler ZEUS_HISTORY_HOURLY_RETENTION_DAYS
+(365), günlük özetler ZEUS_HISTORY_DAILY_RETENTION_DAYS (0). Ham okumalar özetlenmeden silinmez.
+Sonradan yazılan eski okumaların günleri ham okumalardan yeniden özetlenir; ham okumaları çoktan
+silinmiş günlere düşenler yalnızca kovanın en küçük/en büyük değerine ve okuma sayısına eklenir.
+Raw değerler ve puanlar ayrıca budanmayan sütunlu arşive de yazılır (zeus_core.archive); tam
+çözünürlükte yıllara yayılan seriler oradan okunur.
+"""
+import os
+import time
+import atexit
+import sqlite3
+import threading
+
+from zeus_core.archive import archive_enabled, get_snapshot_archive
+from zeus_core.probe_cache import get_cache_dir
+from zeus_core.rollups import (
+    DAILY, HOURLY, RAW, ROLLUP_RESOLUTIONS, aggregate_readings, bucket_start, choose_resolution, merge_bucket,
+    raw_rows, summarize_rows,
+)
+from zeus_core.rules import get_rule_engine
+from zeus_core.trends import evaluate_trends, update_trend_state
+
+HISTORY_DB_FILE = "history.sqlite3"
+
+# Ham okumaların saklandığı gün sayısı; ZEUS_HISTORY_RETENTION_DAYS ile değiştirilebilir (0: sınırsız)
+DEFAULT_RETENTION_DAYS = 30
+
+# Özetlerin saklama süreleri (gün, 0: sınırsız) ve değiştiren ortam değişkenleri
+ROLLUP_RETENTION = {
+    HOURLY: ('ZEUS_HISTORY_HOURLY_RETENTION_DAYS', 365),
+    DAILY: ('ZEUS_HISTORY_DAILY_RETENTION_DAYS', 0),
+}
+
+# Arka plan özetleme iş parçacığının bir işlemde işlediği seri (disk, öznitelik) sayısı
+ROLLUP_BATCH = 200
+
+# close() süren özetlemeyi en fazla bu kadar (saniye) bekler; özetleme gruplar arasında durur
+ROLLUP_STOP_TIMEOUT = 10
+
+# Süresi dolan kayıtların silinmesi en fazla bu aralıkla (saniye) yapılır
+PRUNE_INTERVAL = 86400
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS disks (
+    disk_id INTEGER PRIMARY KEY,
+    disk_key TEXT NOT NULL UNIQUE,
+    model TEXT,
+    serial TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS readings (
+    disk_id INTEGER NOT NULL,
+    taken_at REAL NOT NULL,
+    score INTEGER,
+    PRIMARY KEY (disk_id, taken_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS readings_taken_at ON readings (taken_at);
+CREATE TABLE IF NOT EXISTS attributes (
+    disk_id INTEGER NOT NULL,
+    attribute_id INTEGER NOT NULL,
+    taken_at REAL NOT NULL,
+    occurrence INTEGER NOT NULL,
+    current INTEGER,
+    worst INTEGER,
+    threshold INTEGER,
+    raw_value INTEGER,
+    PRIMARY KEY (disk_id, attribute_id, taken_at, occurrence)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS attribute_names (
+    disk_id INTEGER NOT NULL,
+    attribute_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (disk_id, attribute_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trend_state (
+    disk_id INTEGER NOT NULL,
+    attribute_id INTEGER NOT NULL,
+    first_raw INTEGER NOT NULL,
+    first_at REAL NOT NULL,
+    last_raw INTEGER NOT NULL,
+    last_at REAL NOT NULL,
+    recent_increase REAL NOT NULL,
+    change_at REAL,
+    PRIMARY KEY (disk_id, attribute_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollups (
+    disk_id INTEGER NOT NULL,
+    attribute_id INTEGER NOT NULL,
+    resolution INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    min_raw INTEGER NOT NULL,
+    max_raw INTEGER NOT NULL,
+    last_raw INTEGER NOT NULL,
+    delta INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    PRIMARY KEY (disk_id, attribute_id, resolution, bucket)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollup_state (
+    disk_id INTEGER NOT NULL,
+    attribute_id INTEGER NOT NULL,
+    last_at REAL NOT NULL,
+    last_raw INTEGER NOT NULL,
+    PRIMARY KEY (disk_id, attribute_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollup_late (
+    disk_id INTEGER NOT NULL,
+    attribute_id INTEGER NOT NULL,
+    taken_at REAL NOT NULL,
+    raw_value INTEGER NOT NULL,
+    PRIMARY KEY (disk_id, attribute_id, taken_at)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# SQLite tamsayı sütunlarının sınırları (raw değer sütunu array'e sığmadıysa denetlenir)
+_SQLITE_INT_MIN = -2 ** 63
+_SQLITE_INT_MAX = 2 ** 63 - 1
+
+
+def history_enabled():
+    """ZEUS_HISTORY=0 (veya no/false) ise okumalar geçmişe yazılmaz."""
+    return os.environ.get('ZEUS_HISTORY', '') not in ('0', 'no', 'false')
+
+
+def get_history_path():
+    """Geçmiş veritabanının yolu; ZEUS_HISTORY_DB ile değiştirilebilir."""
+    return os.environ.get('ZEUS_HISTORY_DB') or os.path.join(get_cache_dir(), HISTORY_DB_FILE)
+
+
+def _env_days(name, default):
+    try:
+        days = float(os.environ.get(name, default))
+    except ValueError:
+        days = default
+    return max(0.0, days)
+
+
+def get_retention_days():
+    """Ham okumaların saklanacağı gün sayısını döndürür (0: sınırsız)."""
+    return _env_days('ZEUS_HISTORY_RETENTION_DAYS', DEFAULT_RETENTION_DAYS)
+
+
+def get_rollup_retention_days():
+    """Özetlerin saklama süreleri: {çözünürlük: gün (0: sınırsız)}."""
+    return {resolution: _env_days(name, default) for resolution, (name, default) in ROLLUP_RETENTION.items()}
+
+
+def history_disk_key(identity, info, disk_path):
+    """Geçmiş kayıtlarının disk anahtarı: kalıcı kimlik, yoksa seri numarası, o da yoksa disk yolu."""
+    if identity:
+        return identity
+    serial = (info or {}).get("Serial Number")
+    return f"serial:{serial}" if serial else disk_path
+
+
+def _sqlite_int(value):
+    return value if _SQLITE_INT_MIN <= value <= _SQLITE_INT_MAX else None
+
+
+class HistoryStore:
+    """
+    Okuma geçmişini tutan SQLite veritabanı. Bağlantı ilk kullanımda açılır; veritabanı
+    oluşturulamazsa (salt okunur sistem, yetki yok) kayıtlar sessizce atlanır ve sorgular boş döner.
+    Birden fazla iş parçacığından güvenle kullanılabilir.
+    """
+
+    def __init__(self, path=None, retention_days=None, rollup_retention_days=None, background_rollup=True):
+        self.path = path or get_history_path()
+        self.retention_days = get_retention_days() if retention_days is None else retention_days
+        self.rollup_retention_days = (get_rollup_retention_days() if rollup_retention_days is None
+                                      else rollup_retention_days)
+        self.background_rollup = background_rollup # False: özetler yalnızca rollup() çağrılınca güncellenir
+        self._rollup_thread = None
+        self._rollup_lock = threading.Lock() # Aynı anda tek özetleme
+        self._rollup_stop = threading.Event() # close(): özetleme sonraki gruptan önce durur
+        self._conn = None
+        self._disk_ids = {}
+        self._named_disks = set() # Öznitelik adları bu süreçte yazılmış diskler
+        self._trend_states = {} # disk_id -> {öznitelik ID: özet}; ilk kullanımda veritabanından okunur
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL") # WAL'da işlem sonunda fsync yerine kontrol noktasında
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version != SCHEMA_VERSION:
+                    with conn:
+                        conn.executescript(SCHEMA)
+                        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                self._conn = False
+        return self._conn or None
+
+    def close(self):
+        thread = self._rollup_thread
+        if thread is not None:
+            self._rollup_stop.set() # Yarıda kalan özetleme sonraki açılışta kaldığı yerden sürer
+            thread.join(ROLLUP_STOP_TIMEOUT)
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+            self._conn = None
+            self._forget()
+
+    def _forget(self):
+        self._disk_ids.clear()
+        self._named_disks.clear()
+        self._trend_states.clear()
+
+    def _disk_id(self, conn, disk_key, info, seen_at):
+        disk_id = self._disk_ids.get(disk_key)
+        if disk_id is None:
+            conn.execute(
+                "INSERT INTO disks (disk_key, model, serial, first_seen, last_seen) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (disk_key) DO UPDATE SET model = excluded.model, serial = excluded.serial, "
+                "last_seen = excluded.last_seen",
+                (disk_key, info.get("Device Model"), info.get("Serial Number"), seen_at, seen_at))
+            disk_id = self._disk_ids[disk_key] = conn.execute(
+                "SELECT disk_id FROM disks WHERE disk_key = ?", (disk_key,)).fetchone()[0]
+        return disk_id
+
+    def record(self, entries):
+        """
+        Okumaları tek bir işlemde yazar. entries: (disk anahtarı, SmartSnapshot, puan) üçlüleri;
+        okuma zamanı SmartSnapshot.timestamp'tır. Yazılan okuma sayısını döndürür.
+        """
+        entries = list(entries)
+        if not entries:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            try:
+                with conn:
+                    written = self._write(conn, entries)
+                self._prune_if_due(conn)
+                self._start_rollup_if_due(conn)
+            except sqlite3.Error:
+                self._forget() # Geri alınan işlemde eklenen diskler, adlar ve özetler
+                return 0 # Veritabanı kilitli veya bozuk: okuma gösterilmeye devam eder
+        return written
+
+    def _load_trend_states(self, conn, disk_id):
+        states = self._trend_states.get(disk_id)
+        if states is None:
+            states = self._trend_states[disk_id] = {
+                row[0]: tuple(row[1:]) for row in conn.execute(
+                    "SELECT attribute_id, first_raw, first_at, last_raw, last_at, recent_increase, change_at "
+                    "FROM trend_state WHERE disk_id = ?", (disk_id,))}
+        return states
+
+    def _write(self, conn, entries):
+        readings, rows, names, last_seen, trend_rows, late_rows = [], [], [], [], [], []
+        trends = get_rule_engine().trends
+        latest = {} # disk_id -> en yeni okuma zamanı (başka süreçlerin yazdıkları dahil)
+        for disk_key, snapshot, score in entries:
+            taken_at = snapshot.timestamp
+            known = disk_key in self._disk_ids
+            disk_id = self._disk_id(conn, disk_key, snapshot.info, taken_at)
+            if known:
+                last_seen.append((taken_at, disk_id))
+            readings.append((disk_id, taken_at, score))
+            if disk_id not in latest:
+                latest[disk_id] = max((value for value in conn.execute(
+                    "SELECT (SELECT max(taken_at) FROM readings WHERE disk_id = ?), "
+                    "(SELECT max(last_at) FROM rollup_state WHERE disk_id = ?)", (disk_id, disk_id)).fetchone()
+                    if value is not None), default=None)
+            # Diskin daha yeni bir okumasından sonra gelen okuma özetlenmiş aralığa düşebilir: kuyruğa alınır
+            late = latest[disk_id] is not None and taken_at <= latest[disk_id]
+            if not late:
+                latest[disk_id] = taken_at
+            raw_values = snapshot.raw_values
+            if not hasattr(raw_values, 'typecode'): # array'e sığmayan değer var
+                raw_values = [_sqlite_int(value) for value in raw_values]
+            occurrences = {}
+            for attr_id, current, worst, threshold, raw_value in zip(
+                    snapshot.ids, snapshot.current, snapshot.worst, snapshot.threshold, raw_values):
+                occurrence = occurrences.get(attr_id, 0)
+                occurrences[attr_id] = occurrence + 1
+                rows.append((disk_id, attr_id, taken_at, occurrence, current, worst, threshold, raw_value))
+                if late and occurrence == 0 and raw_value is not None:
+                    late_rows.append((disk_id, attr_id, taken_at, raw_value))
+                if occurrence == 0 and attr_id in trends.attribute_ids and raw_value is not None:
+                    states = self._load_trend_states(conn, disk_id)
+                    state = update_trend_state(states.get(attr_id), raw_value, taken_at, trends.window_days)
+                    if state is not states.get(attr_id):
+                        states[attr_id] = state
+                        trend_rows.append((disk_id, attr_id) + state)
+            if disk_id not in self._named_disks:
+                names.extend((disk_id, attr_id, name) for attr_id, name in zip(snapshot.ids, snapshot.names))
+                self._named_disks.add(disk_id)
+
+        rows.sort()
+        conn.executemany("UPDATE disks SET last_seen = max(last_seen, ?) WHERE disk_id = ?", last_seen)
+        conn.executemany("INSERT OR REPLACE INTO readings (disk_id, taken_at, score) VALUES (?, ?, ?)", readings)
+        conn.executemany("INSERT OR REPLACE INTO attributes (disk_id, attribute_id, taken_at, occurrence, current, "
+                         "worst, threshold, raw_value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.executemany("INSERT OR REPLACE INTO attribute_names (disk_id, attribute_id, name) VALUES (?, ?, ?)", names)
+        conn.executemany("INSERT OR REPLACE INTO rollup_late (disk_id, attribute_id, taken_at, raw_value) "
+                         "VALUES (?, ?, ?, ?)", late_rows)
+        conn.executemany("INSERT OR REPLACE INTO trend_state (disk_id, attribute_id, first_raw, first_at, last_raw, "
+                         "last_at, recent_increase, change_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", trend_rows)
+        return len(readings)
+
+    def _prune_if_due(self, conn, now=None):
+        if not self.retention_days and not any(self.rollup_retention_days.values()):
+            return
+        now = time.time() if now is None else now
+        row = conn.execute("SELECT value FROM meta WHERE key = 'last_prune'").fetchone()
+        if row is not None and now - float(row[0]) < PRUNE_INTERVAL:
+            return
+        self._prune(conn, now)
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_prune', ?)", (str(now),))
+
+    def _prune(self, conn, now):
+        with conn:
+            if self.retention_days:
+                cutoff = now - self.retention_days * 86400
+                conn.execute("DELETE FROM readings WHERE taken_at < ?", (min(cutoff, self._rollup_until(conn) or 0.0),))
+                # Serisinin özetlerine henüz işlenmemiş ham okumalar saklama süresi dolsa da silinmez
+                conn.execute(
+                    "DELETE FROM attributes WHERE taken_at < ? AND (occurrence > 0 OR raw_value IS NULL OR taken_at <= "
+                    "(SELECT last_at FROM rollup_state s WHERE s.disk_id = attributes.disk_id "
+                    "AND s.attribute_id = attributes.attribute_id))", (cutoff,))
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('pruned_before', ?)",
+                             (str(max(cutoff, self._pruned_before(conn))),))
+            for resolution, days in self.rollup_retention_days.items():
+                if days:
+                    conn.execute("DELETE FROM rollups WHERE resolution = ? AND bucket < ?",
+                                 (resolution, now - days * 86400))
+
+    def prune(self, now=None):
+        """Saklama süresi dolan ham okumaları ve özetleri hemen siler."""
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                self._prune(conn, time.time() if now is None else now)
+
+    def _rollup_until(self, conn):
+        row = conn.execute("SELECT value FROM meta WHERE key = 'rollup_until'").fetchone()
+        return float(row[0]) if row is not None else None
+
+    @staticmethod
+    def _pruned_before(conn):
+        """Bu zamandan eski ham okumalar silinmiş olabilir; sonrakiler eksiksizdir."""
+        row = conn.execute("SELECT value FROM meta WHERE key = 'pruned_before'").fetchone()
+        return float(row[0]) if row is not None else float('-inf')
+
+    def _start_rollup_if_due(self, conn, now=None):
+        """Son özetlemeden bu yana yeni bir saat tamamlandıysa özetlemeyi arka planda başlatır."""
+        if not self.background_rollup or self._rollup_thread is not None and self._rollup_thread.is_alive():
+            return
+        now = time.time() if now is None else now
+        until = self._rollup_until(conn)
+        if until is not None and until >= bucket_start(now, HOURLY):
+            return
+        self._rollup_stop.clear()
+        self._rollup_thread = threading.Thread(target=self.rollup, args=(now,), name="zeus-history-rollup",
+                                               daemon=True)
+        self._rollup_thread.start()
+
+    def rollup(self, now=None):
+        """
+        Tamamlanmış saatlerdeki, henüz özetlenmemiş okumaları saatlik ve günlük özetlere işler ve işlenen
+        okuma sayısını döndürür. Kendi bağlantısıyla, seri gruplarıyla ayrı ve kısa işlemlerde çalışır;
+        record() en fazla bir grup bekler. close() çağrılırsa sonraki gruptan önce durur; yarıda kalan
+        özetleme sonraki çağrıda kaldığı yerden sürer.
+        """
+        with self._lock:
+            if self._connect() is None:
+                return 0
+        if not self._rollup_lock.acquire(blocking=False):
+            return 0
+        processed = 0
+        conn = None
+        try:
+            conn = sqlite3.connect(self.path, timeout=30)
+            cutoff = bucket_start(time.time() if now is None else now, HOURLY)
+            series = conn.execute("SELECT disk_id, attribute_id FROM attribute_names").fetchall()
+            for start in range(0, len(series), ROLLUP_BATCH):
+                if self._rollup_stop.is_set():
+                    return processed
+                with conn:
+                    # Grup okunup yazılırken araya okuma girmez (kuyruk ve özetler tutarlı kalır)
+                    conn.execute("BEGIN IMMEDIATE")
+                    complete_from = self._pruned_before(conn)
+                    for disk_id, attr_id in series[start:start + ROLLUP_BATCH]:
+                        processed += self._rollup_series(conn, disk_id, attr_id, cutoff, complete_from)
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('rollup_until', ?)", (str(cutoff),))
+        except sqlite3.Error:
+            pass # Veritabanı kilitli veya bozuk: sonraki özetlemede yeniden denenir
+        finally:
+            if conn is not None:
+                conn.close()
+            self._rollup_lock.release()
+        return processed
+
+    def _rollup_series(self, conn, disk_id, attr_id, cutoff, complete_from):
+        """Bir serinin kuyruktaki geç okumalarını ve 'cutoff'a kadarki yeni okumalarını özetlere işler."""
+        last_at, last_raw = conn.execute(
+            "SELECT last_at, last_raw FROM rollup_state WHERE disk_id = ? AND attribute_id = ?",
+            (disk_id, attr_id)).fetchone() or (None, None)
+        processed = 0
+        if last_at is not None:
+            # last_at'tan yenileri aşağıda sırasıyla işlenir; eskiler özetlenmiş kovalara düşer
+            late = conn.execute(
+                "SELECT taken_at, raw_value FROM rollup_late WHERE disk_id = ? AND attribute_id = ? AND taken_at <= ? "
+                "ORDER BY taken_at", (disk_id, attr_id, last_at)).fetchall()
+            if late:
+                last_raw = self._rollup_late(conn, disk_id, attr_id, late, last_at, last_raw, complete_from)
+                processed += len(late)
+        readings = self._unrolled_readings(conn, disk_id, attr_id, last_at, cutoff, inclusive=False)
+        if readings:
+            conn.executemany(
+                "INSERT INTO rollups (disk_id, attribute_id, resolution, bucket, min_raw, max_raw, last_raw, "
+                "delta, samples) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (disk_id, attribute_id, resolution, bucket) DO UPDATE SET "
+                "min_raw = min(min_raw, excluded.min_raw), max_raw = max(max_raw, excluded.max_raw), "
+                "last_raw = excluded.last_raw, delta = delta + excluded.delta, samples = samples + excluded.samples",
+                [(disk_id, attr_id, resolution) + bucket for resolution in ROLLUP_RESOLUTIONS
+                 for bucket in aggregate_readings(readings, last_raw, resolution)])
+            last_at, last_raw = readings[-1]
+            processed += len(readings)
+        if processed:
+            conn.execute("INSERT OR REPLACE INTO rollup_state (disk_id, attribute_id, last_at, last_raw) "
+                         "VALUES (?, ?, ?, ?)", (disk_id, attr_id, last_at, last_raw))
+            conn.execute("DELETE FROM rollup_late WHERE disk_id = ? AND attribute_id = ? AND taken_at <= ?",
+                         (disk_id, attr_id, last_at))
+        return processed
+
+    def _rollup_late(self, conn, disk_id, attr_id, late, last_at, last_raw, complete_from):
+        """
+        Özetlenmiş aralığa sonradan yazılan okumaları işler; serinin son raw değerini döndürür. Ham okumaları
+        eksiksiz günlerde, ilk geç okumanın gününden last_at'a kadarki kovalar yeniden hesaplanır. Daha eski
+        günlerde yalnızca en küçük/en büyük değer ve okuma sayısı güncellenir (değişim ve son değer, ham
+        okumalar olmadan sıraya yerleştirilemez).
+        """
+        complete_day = -(-complete_from // DAILY) * DAILY if complete_from != float('-inf') else complete_from
+        folded = [(taken_at, raw_value) for taken_at, raw_value in late if taken_at < complete_day]
+        conn.executemany(
+            "INSERT INTO rollups (disk_id, attribute_id, resolution, bucket, min_raw, max_raw, last_raw, delta, "
+            "samples) VALUES (?, ?, ?, ?, ?, ?, ?, 0, 1) ON CONFLICT (disk_id, attribute_id, resolution, bucket) "
+            "DO UPDATE SET min_raw = min(min_raw, excluded.min_raw), max_raw = max(max_raw, excluded.max_raw), "
+            "samples = samples + 1",
+            [(disk_id, attr_id, resolution, bucket_start(taken_at, resolution), raw_value, raw_value, raw_value)
+             for resolution in ROLLUP_RESOLUTIONS for taken_at, raw_value in folded])
+        if len(folded) == len(late):
+            return last_raw
+
+        first_day = bucket_start(late[len(folded)][0], DAILY)
+        row = conn.execute(
+            "SELECT last_raw FROM rollups WHERE disk_id = ? AND attribute_id = ? AND bucket < ? "
+            "ORDER BY bucket DESC LIMIT 1", (disk_id, attr_id, first_day)).fetchone()
+        readings = conn.execute(
+            "SELECT taken_at, raw_value FROM attributes WHERE disk_id = ? AND attribute_id = ? AND taken_at >= ? "
+            "AND taken_at <= ? AND occurrence = 0 AND raw_value IS NOT NULL ORDER BY taken_at",
+            (disk_id, attr_id, first_day, last_at)).fetchall()
+        conn.execute("DELETE FROM rollups WHERE disk_id = ? AND attribute_id = ? AND bucket >= ? AND bucket <= ?",
+                     (disk_id, attr_id, first_day, last_at))
+        conn.executemany(
+            "INSERT INTO rollups (disk_id, attribute_id, resolution, bucket, min_raw, max_raw, last_raw, delta, "
+            "samples) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(disk_id, attr_id, resolution) + bucket for resolution in ROLLUP_RESOLUTIONS
+             for bucket in aggregate_readings(readings, row[0] if row else None, resolution)])
+        return readings[-1][1] if readings else last_raw
+
+    @staticmethod
+    def _unrolled_readings(conn, disk_id, attribute_id, after, until, inclusive=True):
+        """Serinin 'after'dan sonraki (None: tümü) ve 'until'e kadarki (zaman, raw) okumaları."""
+        return conn.execute(
+            f"SELECT taken_at, raw_value FROM attributes WHERE disk_id = ? AND attribute_id = ? AND taken_at > ? "
+            f"AND taken_at {'<=' if inclusive else '<'} ? AND occurrence = 0 AND raw_value IS NOT NULL "
+            f"ORDER BY taken_at",
+            (disk_id, attribute_id, float('-inf') if after is None else after, until)).fetchall()
+
+    def _query(self, sql, params):
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return []
+            return conn.execute(sql, params).fetchall()
+
+    def disks(self):
+        """Geçmişi olan diskleri sözlük listesi olarak döndürür (son görülene göre, en yeni önce)."""
+        rows = self._query("SELECT disk_key, model, serial, first_seen, last_seen FROM disks ORDER BY last_seen DESC", ())
+        return [{'key': key, 'model': model, 'serial': serial, 'first_seen': first_seen, 'last_seen': last_seen}
+                for key, model, serial, first_seen, last_seen in rows]
+
+    def attribute_history(self, disk_key, attribute_id, since=None, until=None):
+        """Özniteliğin zaman aralığındaki değerleri: (zaman, current, worst, threshold, raw) listesi, eskiden yeniye."""
+        return self._query(
+            "SELECT a.taken_at, a.current, a.worst, a.threshold, a.raw_value FROM disks d "
+            "JOIN attributes a ON a.disk_id = d.disk_id AND a.attribute_id = ? AND a.taken_at BETWEEN ? AND ? "
+            "WHERE d.disk_key = ? AND a.occurrence = 0 ORDER BY a.taken_at",
+            (attribute_id, since or 0.0, until or float('inf'), disk_key))
+
+    def score_history(self, disk_key, since=None, until=None):
+        """Diskin zaman aralığındaki puanları: (zaman, puan) listesi, eskiden yeniye."""
+        return self._query(
+            "SELECT r.taken_at, r.score FROM disks d "
+            "JOIN readings r ON r.disk_id = d.disk_id AND r.taken_at BETWEEN ? AND ? "
+            "WHERE d.disk_key = ? ORDER BY r.taken_at",
+            (since or 0.0, until or float('inf'), disk_key))
+
+    def series(self, disk_key, attribute_id, since=None, until=None, step=None, now=None):
+        """
+        Özniteliğin zaman aralığındaki değerlerini, 'step' saniyelik nokta aralığını yanıtlayan en kaba
+        çözünürlükte döndürür (zeus_core.rollups.choose_resolution): (çözünürlük, kova listesi). Kova:
+        (başlangıç, en küçük, en büyük, son, değişim, okuma sayısı); ham veride her okuma bir kovadır.
+        Özetlere henüz işlenmemiş son okumalar sorgu sırasında kovalara eklenir.
+        """
+        now = time.time() if now is None else now
+        retention_days = {RAW: self.retention_days, **self.rollup_retention_days}
+        resolution = choose_resolution(since, step, now, retention_days)
+        since = since or 0.0
+        until = float('inf') if until is None else until
+        if resolution == RAW:
+            return RAW, raw_rows(self._query(
+                "SELECT a.taken_at, a.raw_value FROM disks d JOIN attributes a ON a.disk_id = d.disk_id "
+                "AND a.attribute_id = ? AND a.taken_at BETWEEN ? AND ? "
+                "WHERE d.disk_key = ? AND a.occurrence = 0 AND a.raw_value IS NOT NULL ORDER BY a.taken_at",
+                (attribute_id, since, until, disk_key)))
+
+        first_bucket = bucket_start(since, resolution)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return resolution, []
+            conn.execute("BEGIN") # Özetler ve son okumalar aynı anda okunur (özetleme sürerken de tutarlı)
+            try:
+                row = conn.execute("SELECT disk_id FROM disks WHERE disk_key = ?", (disk_key,)).fetchone()
+                if row is None:
+                    return resolution, []
+                disk_id = row[0]
+                buckets = conn.execute(
+                    "SELECT bucket, min_raw, max_raw, last_raw, delta, samples FROM rollups WHERE disk_id = ? "
+                    "AND attribute_id = ? AND resolution = ? AND bucket BETWEEN ? AND ? ORDER BY bucket",
+                    (disk_id, attribute_id, resolution, first_bucket, until)).fetchall()
+                last_at, last_raw = conn.execute(
+                    "SELECT last_at, last_raw FROM rollup_state WHERE disk_id = ? AND attribute_id = ?",
+                    (disk_id, attribute_id)).fetchone() or (None, None)
+                tail = self._unrolled_readings(conn, disk_id, attribute_id, last_at, until)
+            finally:
+                conn.execute("COMMIT")
+
+        rows = {bucket[0]: tuple(bucket) for bucket in buckets}
+        for bucket in aggregate_readings(tail, last_raw, resolution):
+            if bucket[0] >= first_bucket:
+                rows[bucket[0]] = merge_bucket(rows[bucket[0]], bucket) if bucket[0] in rows else bucket
+        return resolution, [rows[start] for start in sorted(rows)]
+
+    def trend_states(self, disk_key):
+        """Diskin eğilim özetleri: {öznitelik ID: (ilk raw, ilk zaman, son raw, son zaman, yakın artış, değişim zamanı)}."""
+        rows = self._query(
+            "SELECT t.attribute_id, t.first_raw, t.first_at, t.last_raw, t.last_at, t.recent_increase, t.change_at "
+            "FROM disks d JOIN trend_state t ON t.disk_id = d.disk_id WHERE d.disk_key = ?", (disk_key,))
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+    def attribute_names(self, disk_key):
+        """Diskin öznitelik ID'lerini son görülen adlarına eşleyen sözlük."""
+        rows = self._query(
+            "SELECT n.attribute_id, n.name FROM disks d JOIN attribute_names n ON n.disk_id = d.disk_id "
+            "WHERE d.disk_key = ?", (disk_key,))
+        return dict(rows)
+
+
+_history_store = None
+
+
+def get_history_store():
+    """
+    Süreç boyunca paylaşılan HistoryStore örneğini döndürür. Süreç kapanırken süren özetleme
+    beklenir ve bağlantı kapatılır (tek seferlik taramalarda da özetler güncel kalır).
+    """
+    global _history_store
+    if _history_store is None:
+        _history_store = HistoryStore()
+        atexit.register(_history_store.close)
+    return _history_store
+
+
+def record_history(entries):
+    """
+    (disk anahtarı, SmartSnapshot, puan) üçlülerini geçmişe ve uzun dönem arşivine (zeus_core.archive)
+    yazar; geçmiş kapalıysa hiçbir şey yapmaz.
+    """
+    if not history_enabled():
+        return 0
+    entries = list(entries)
+    if archive_enabled():
+        get_snapshot_archive().record(entries)
+    return get_history_store().record(entries)
+
+
+def attribute_series(disk_key, attribute_id, since=None, until=None, step=None):
+    """HistoryStore.series; geçmiş kapalıysa (RAW, [])."""
+    if not history_enabled():
+        return RAW, []
+    return get_history_store().series(disk_key, attribute_id, since, until, step)
+
+
+def history_summary(disk_key, since, points=24, now=None):
+    """
+    Diskin özniteliklerinin 'since'ten bu yana özeti; aralık 'points' kovaya bölünerek en kaba uygun
+    çözünürlük kullanılır. id, name, min, max, last, delta, samples, resolution sözlükleri listesi
+    (ID sırasıyla); geçmiş kapalıysa veya disk için kayıt yoksa boş liste.
+    """
+    if not history_enabled():
+        return []
+    store = get_history_store()
+    now = time.time() if now is None else now
+    summary = []
+    for attr_id, name in sorted(store.attribute_names(disk_key).items()):
+        resolution, rows = store.series(disk_key, attr_id, since, now, (now - since) / points, now)
+        totals = summarize_rows(rows)
+        if totals is not None:
+            minimum, maximum, last, delta, samples = totals
+            summary.append({'id': attr_id, 'name': name, 'min': minimum, 'max': maximum, 'last': last,
+                            'delta': delta, 'samples': samples, 'resolution': resolution})
+    return summary
+
+
+def disk_trend(disk_key):
+    """
+    Diskin eğilim raporunu (zeus_core.trends.evaluate_trends) döndürür; geçmiş kapalıysa veya disk
+    için henüz özet yoksa None.
+    """
+    if not history_enabled():
+        return None
+    store = get_history_store()
+    states = store.trend_states(disk_key)
+    if not states:
+        return None
+    return evaluate_trends(states, get_rule_engine().trends, store.attribute_names(disk_key))
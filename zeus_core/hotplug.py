@@ -0,0 +1,144 @@
+"""
+Çekirdeğin uevent netlink soketini dinleyerek disk takma/çıkarma olaylarını bildirir.
+
+GUI soketin dosya tanımlayıcısını Qt olay döngüsüne (QSocketNotifier) bağlar ve yalnızca
+değişen diski listeye ekler/listeden çıkarır; konsol aynı olay akışını iter_disk_events()
+ile uzun süre çalışan kiplerinde kullanır. Çok sayıda disk aynı anda takıldığında soketin alım
+kuyruğu taşabilir (ENOBUFS); kaybolan olaylar yerine tek bir 'resync' olayı bildirilir ve
+çağıran güncel disk listesini kendi girdileriyle karşılaştırır.
+"""
+import os
+import errno
+import socket
+import select
+
+from zeus_core.enumeration import VIRTUAL_DEVICE_PREFIXES, get_sysfs_root, read_block_disk
+
+NETLINK_KOBJECT_UEVENT = 15
+KERNEL_UEVENT_GROUP = 1
+RECEIVE_BUFFER_SIZE = 1024 * 1024
+# Tek bir uevent mesajı için okuma boyutu (çekirdekte en fazla 2 KiB)
+UEVENT_MESSAGE_SIZE = 8 * 1024
+
+DISK_ACTIONS = ("add", "remove", "change")
+RESYNC_ACTION = "resync"
+
+
+def parse_uevent(data):
+    """
+    Çekirdek uevent mesajını (başlık@yol\\0ANAHTAR=DEĞER\\0...) sözlüğe çevirir.
+    udev'in yeniden yayınladığı 'libudev' mesajları için None döner.
+    """
+    if data.startswith(b"libudev"):
+        return None
+    fields = data.split(b"\0")
+    event = {}
+    for field in fields[1:]:
+        key, sep, value = field.partition(b"=")
+        if sep:
+            event[key.decode('ascii', errors='ignore')] = value.decode('utf-8', errors='ignore')
+    if "ACTION" not in event:
+        header = fields[0].decode('utf-8', errors='ignore')
+        action, _, devpath = header.partition("@")
+        event["ACTION"], event["DEVPATH"] = action, devpath
+    return event
+
+
+def disk_event_from_uevent(event, sysfs_root=None):
+    """
+    uevent sözlüğünü disk olayına çevirir: {'action', 'device', 'path', 'disk'}.
+    Bölüm, sanal aygıt ve blok dışı olaylar için None döner. 'add' ve 'change' olaylarında
+    'disk' alanı zeus_core.enumeration ile okunmuş güncel kayıttır.
+    """
+    if not event or event.get("SUBSYSTEM") != "block" or event.get("DEVTYPE") != "disk":
+        return None
+    action = event.get("ACTION")
+    device = event.get("DEVNAME") or os.path.basename(event.get("DEVPATH", ""))
+    device = os.path.basename(device)
+    if action not in DISK_ACTIONS or not device or device.startswith(VIRTUAL_DEVICE_PREFIXES):
+        return None
+    if "/devices/virtual/" in event.get("DEVPATH", ""):
+        return None
+
+    disk = None
+    if action != "remove":
+        sysfs_root = sysfs_root or get_sysfs_root()
+        if not os.path.exists(os.path.join(sysfs_root, "block", device)):
+            return None # Olay ile okuma arasında disk çıkarılmış
+        disk = read_block_disk(device, sysfs_root)
+    return {'action': action, 'device': device, 'path': "/dev/" + device.replace("!", "/"), 'disk': disk}
+
+
+class UeventMonitor:
+    """
+    NETLINK_KOBJECT_UEVENT soketi üzerinden çekirdek olaylarını dinler.
+    Soket bloklamayan kipte açılır; fileno() select/QSocketNotifier ile kullanılabilir.
+    """
+
+    def __init__(self, sysfs_root=None):
+        self.sysfs_root = sysfs_root
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW | socket.SOCK_CLOEXEC, NETLINK_KOBJECT_UEVENT)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE)
+        self.sock.bind((0, KERNEL_UEVENT_GROUP)) # Port kimliğini çekirdek seçer
+        self.sock.setblocking(False)
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def close(self):
+        self.sock.close()
+
+    def read_events(self):
+        """
+        Sokette bekleyen tüm mesajları okur ve ilgili disk olaylarının listesini döndürür.
+        Alım kuyruğu taşmışsa olaylar kaybolmuştur; liste yerine yalnızca {'action': 'resync'}
+        olayı döner ve çağıran disk listesini baştan okuyup farkları uygular.
+        """
+        events = []
+        overflowed = False
+        while True:
+            try:
+                data = self.sock.recv(UEVENT_MESSAGE_SIZE)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                if e.errno != errno.ENOBUFS:
+                    raise
+                overflowed = True # Kuyrukta kalan mesajlar yine okunur; yeniden eşitleme hepsini kapsar
+                continue
+            disk_event = disk_event_from_uevent(parse_uevent(data), self.sysfs_root)
+            if disk_event:
+                events.append(disk_event)
+        if overflowed:
+            return [{'action': RESYNC_ACTION, 'device': None, 'path': None, 'disk': None}]
+        return events
+
+    def iter_events(self, timeout=None):
+        """
+        Disk olaylarını geldikçe üretir. timeout saniye boyunca olay gelmezse None üretir;
+        böylece çağıran döngü (ör. Ctrl+C veya durdurma isteği için) kontrolü geri alabilir.
+        """
+        while True:
+            readable, _, _ = select.select([self.sock], [], [], timeout)
+            if not readable:
+                yield None
+                continue
+            for disk_event in self.read_events():
+                yield disk_event
+
+
+def open_uevent_monitor(sysfs_root=None):
+    """Uevent izleyicisini açar; netlink kullanılamıyorsa (yetki, platform) None döner."""
+    try:
+        return UeventMonitor(sysfs_root)
+    except (OSError, AttributeError):
+        return None
+
+
+def iter_disk_events(timeout=None, monitor=None):
+    """Konsol ve arka plan kipleri için disk takma/çıkarma olay akışı."""
+    monitor = monitor or UeventMonitor()
+    try:
+        yield from monitor.iter_events(timeout)
+    finally:
+        monitor.close()
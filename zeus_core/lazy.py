@@ -0,0 +1,35 @@
+"""
+İsteğe bağlı arayüz paketlerinin (colorama gibi) ilk kullanımda yüklenmesi.
+
+Ön yüzler bu paketleri modül düzeyinde içe aktarırsa arayüzsüz tarama (--json) da yükleme
+süresini öder; LazyAttribute ile paket ancak bir özniteliğine ilk erişildiğinde yüklenir.
+"""
+import importlib
+
+# Yükleme sonrası kancası çalıştırılmış modüller (colorama.init gibi işlemler bir kez yapılır)
+_initialized_modules = set()
+
+
+class LazyAttribute:
+    """
+    'modül.öznitelik' için vekil nesne: vekilin bir özniteliği istendiğinde modül yüklenir ve
+    istek gerçek nesneye aktarılır (örn: Fore.RED). on_import(modül) yükleme sonrası bir kez çağrılır.
+    """
+
+    def __init__(self, module_name, attribute, on_import=None):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._on_import = on_import
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            module = importlib.import_module(self._module_name)
+            if self._on_import is not None and self._module_name not in _initialized_modules:
+                _initialized_modules.add(self._module_name)
+                self._on_import(module)
+            self._target = getattr(module, self._attribute)
+        return self._target
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
@@ -0,0 +1,176 @@
+"""
+Prometheus metrik dışa aktarıcısı (exporter): arka plan kipinin (zeus_core.daemon) son okumalarını
+HTTP üzerinden Prometheus metin biçiminde sunar.
+    python3 -m zeus_core --daemon --metrics-port 9633
+    curl http://127.0.0.1:9633/metrics
+
+Sorgu (scrape) smartctl çalıştırmaz: her diskin satırları okuması geldiğinde bir kez üretilir, tam
+metin art arda biten okumalardan sonra bu satırlardan bir kez birleştirilip bayt dizisi olarak
+saklanır; her sorgu yalnızca bu diziyi gönderir. Sunucu varsayılan olarak yalnızca
+127.0.0.1'i dinler.
+"""
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_METRICS_ADDRESS = "127.0.0.1"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (ad, tip, açıklama); metin bu sırayla yazılır
+METRIC_FAMILIES = (
+    ('zeus_disk_info', 'gauge', "Disk bilgileri (değer her zaman 1)"),
+    ('zeus_disk_smart_available', 'gauge', "SMART verisi okunabildiyse 1"),
+    ('zeus_disk_standby', 'gauge', "Disk bekleme kipindeyse 1 (değerler son okumadan)"),
+    ('zeus_disk_health_score', 'gauge', "Sağlık puanı (0-100)"),
+    ('zeus_disk_degrading', 'gauge', "Sayaç eğilimine göre disk hızla kötüleşiyorsa 1"),
+    ('zeus_smart_attribute_value', 'gauge', "SMART özniteliğinin normalize değeri"),
+    ('zeus_smart_attribute_worst', 'gauge', "SMART özniteliğinin en kötü normalize değeri"),
+    ('zeus_smart_attribute_threshold', 'gauge', "SMART özniteliğinin eşik değeri"),
+    ('zeus_smart_attribute_raw', 'gauge', "SMART özniteliğinin raw değeri"),
+    ('zeus_disk_acquisition_seconds', 'gauge', "Son SMART okumasının süresi (sn)"),
+    ('zeus_disk_last_poll_timestamp_seconds', 'gauge', "Son okumanın Unix zamanı"),
+    ('zeus_disk_polls_total', 'counter', "Disk okuma sayısı"),
+    ('zeus_disk_probe_failures_total', 'counter', "SMART verisi alınamayan okuma sayısı"),
+)
+
+ATTRIBUTE_METRICS = (
+    ('zeus_smart_attribute_value', "Current"),
+    ('zeus_smart_attribute_worst', "Worst"),
+    ('zeus_smart_attribute_threshold', "Threshold"),
+    ('zeus_smart_attribute_raw', "Raw_Value"),
+)
+
+
+def escape_label_value(value):
+    """Etiket değerini Prometheus metin biçimine göre kaçışlar (\\, " ve satır sonu)."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{escape_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+def is_probe_failure(report):
+    """SMART verisi hiç alınamayan okuma (bekleme kipindeki diskin eski kaydı hata sayılmaz)."""
+    return not report['smart_available'] and bool(report['error']) and not report['standby']
+
+
+def disk_samples(state):
+    """
+    Bir diskin metrik satırlarını hazırlar: {metrik adı: [satır, ...]}. state: {'report', 'polls',
+    'failures', 'polled_at'}. Satırlar diskin her okumasında bir kez üretilir (bkz. MetricsExporter).
+    """
+    samples = {}
+    report = state['report']
+    device = report['path']
+    disk_labels = _labels(device=device)
+    info = report['info'] or {}
+
+    def add(name, labels, value):
+        samples.setdefault(name, []).append(f"{name}{labels} {_number(value)}")
+
+    add('zeus_disk_info', _labels(device=device, model=info.get('Device Model', ''),
+                                  serial=info.get('Serial Number', ''), identity=report['identity'] or ''), 1)
+    add('zeus_disk_smart_available', disk_labels, report['smart_available'])
+    add('zeus_disk_standby', disk_labels, report['standby'])
+    if report['score'] is not None:
+        add('zeus_disk_health_score', disk_labels, report['score'])
+    if report['trend'] is not None:
+        add('zeus_disk_degrading', disk_labels, report['degrading'])
+    for attribute in report['attributes']:
+        attribute_labels = _labels(device=device, id=attribute["ID"], name=attribute["Name"])
+        for name, field in ATTRIBUTE_METRICS:
+            if isinstance(attribute[field], (int, float)):
+                add(name, attribute_labels, attribute[field])
+    if report['elapsed'] is not None:
+        add('zeus_disk_acquisition_seconds', disk_labels, report['elapsed'])
+    add('zeus_disk_last_poll_timestamp_seconds', disk_labels, round(state['polled_at'], 3))
+    add('zeus_disk_polls_total', disk_labels, state['polls'])
+    add('zeus_disk_probe_failures_total', disk_labels, state['failures'])
+    return samples
+
+
+def render_metrics(disk_sample_sets):
+    """Disklerin hazır satırlarını metrik ailelerine göre birleştirir; UTF-8 bayt dizisi döner."""
+    lines = []
+    for name, metric_type, description in METRIC_FAMILIES:
+        family = [sample for samples in disk_sample_sets for sample in samples.get(name, ())]
+        if not family:
+            continue
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.extend(family)
+    return ("\n".join(lines) + "\n").encode('utf-8') if lines else b""
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server_version = "zeus-hdd-doctor"
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.exporter.body # Hazır metin; sorgu başına hesap yapılmaz
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # Her sorgu için stderr'e satır yazılmaz
+
+
+class MetricsExporter:
+    """
+    Disklerin son okumalarını tutar ve hazırlanmış metni kendi iş parçacığındaki HTTP sunucusuyla
+    sunar. update()/remove() olay döngüsünden çağrılır; render() metni yeniden hazırlar ve tek bir
+    atamayla değiştirir, böylece sunucu iş parçacığı her zaman tam bir metin görür.
+    """
+
+    def __init__(self, port, address=DEFAULT_METRICS_ADDRESS):
+        self.states = {} # disk yolu -> {'report', 'polls', 'failures', 'polled_at', 'samples'}
+        self.body = b""
+        self.server = ThreadingHTTPServer((address, port), _MetricsHandler)
+        self.server.daemon_threads = True
+        self.server.exporter = self
+        self.thread = threading.Thread(target=self.server.serve_forever, name="zeus-metrics", daemon=True)
+
+    @property
+    def address(self):
+        return self.server.server_address[:2]
+
+    def start(self):
+        self.thread.start()
+        host, port = self.address
+        print(f"Metrikler: http://{host}:{port}/metrics", file=sys.stderr, flush=True)
+
+    def update(self, report, polled_at):
+        state = self.states.get(report['path'])
+        if state is None:
+            state = self.states[report['path']] = {'polls': 0, 'failures': 0}
+        state['report'] = report
+        state['polled_at'] = polled_at
+        state['polls'] += 1
+        if is_probe_failure(report):
+            state['failures'] += 1
+        state['samples'] = disk_samples(state)
+
+    def remove(self, path):
+        self.states.pop(path, None)
+
+    def render(self):
+        self.body = render_metrics([self.states[path]['samples'] for path in sorted(self.states)])
+
+    def close(self):
+        if self.thread.is_alive():
+            self.server.shutdown()
+        self.server.server_close()
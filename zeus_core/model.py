@@ -0,0 +1,118 @@
+"""
+SMART okumalarının bellekte az yer kaplayan veri modeli.
+
+- SmartAttribute: tek bir öznitelik; __slots__ ile sözlük yerine sabit alanlı nesne, adlar interned.
+- SmartSnapshot: bir diskin tek bir okuması; öznitelikler array tabanlı sütunlarda tutulur.
+  Eğilim (trend) hesapları için binlerce okuma bellekte tutulduğunda öznitelik başına birkaç
+  on bayt yer kaplar; satırlar yalnızca gezinirken SmartAttribute olarak oluşturulur.
+"""
+import sys
+import time
+from array import array
+
+PRE_FAIL = "Pre-fail"
+OLD_AGE = "Old_age"
+UPDATED_ALWAYS = "Always"
+UPDATED_OFFLINE = "Offline"
+
+# SmartSnapshot.flags bitleri
+FLAG_PREFAILURE = 0x01
+FLAG_UPDATED_ONLINE = 0x02
+
+
+class SmartAttribute:
+    """Tek bir SMART özniteliği (smartctl tablosunun bir satırı)."""
+
+    __slots__ = ('id', 'name', 'current', 'worst', 'threshold', 'type', 'updated', 'raw_value')
+
+    def __init__(self, id, name, current, worst, threshold, type=OLD_AGE, updated=UPDATED_ALWAYS, raw_value=0):
+        self.id = id
+        self.name = sys.intern(name) # Aynı ad tüm disklerde ve okumalarda tek bir metin nesnesini paylaşır
+        self.current = current
+        self.worst = worst
+        self.threshold = threshold
+        self.type = type
+        self.updated = updated
+        self.raw_value = raw_value
+
+    def __repr__(self):
+        return (f"SmartAttribute(id={self.id}, name={self.name!r}, current={self.current}, worst={self.worst}, "
+                f"threshold={self.threshold}, type={self.type!r}, updated={self.updated!r}, raw_value={self.raw_value})")
+
+    def __eq__(self, other):
+        if not isinstance(other, SmartAttribute):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def to_dict(self):
+        """smartctl sütun adlarıyla sözlük (JSON çıktısı için)."""
+        return {
+            "ID": self.id,
+            "Name": self.name,
+            "Current": self.current,
+            "Worst": self.worst,
+            "Threshold": self.threshold,
+            "Type": self.type,
+            "Updated": self.updated,
+            "Raw_Value": self.raw_value,
+        }
+
+
+def _int_column(typecode, values):
+    """Değerleri array'e yazar; sütun tipine sığmayan değer varsa tuple'a geri döner."""
+    try:
+        return array(typecode, values)
+    except OverflowError:
+        return tuple(values)
+
+
+class SmartSnapshot:
+    """
+    Bir diskin bir andaki okuması: zaman damgası, disk bilgileri (parse_smart_info sözlüğü)
+    ve sütunlar halinde öznitelikler. Gezinildiğinde ve indekslendiğinde SmartAttribute döndürür;
+    bu yüzden puanlama ve gösterim işlevlerine öznitelik listesi yerine verilebilir.
+    """
+
+    __slots__ = ('timestamp', 'info', 'names', 'ids', 'current', 'worst', 'threshold', 'raw_values', 'flags')
+
+    def __init__(self, attributes=(), info=None, timestamp=None):
+        attributes = list(attributes)
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.info = info if info is not None else {}
+        self.names = tuple(attr.name for attr in attributes)
+        self.ids = _int_column('H', (attr.id for attr in attributes))
+        self.current = _int_column('H', (attr.current for attr in attributes))
+        self.worst = _int_column('H', (attr.worst for attr in attributes))
+        self.threshold = _int_column('H', (attr.threshold for attr in attributes))
+        self.raw_values = _int_column('q', (attr.raw_value for attr in attributes))
+        self.flags = bytes((FLAG_PREFAILURE if attr.type == PRE_FAIL else 0)
+                           | (FLAG_UPDATED_ONLINE if attr.updated == UPDATED_ALWAYS else 0) for attr in attributes)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __bool__(self):
+        return bool(self.names)
+
+    def __getitem__(self, index):
+        flags = self.flags[index]
+        return SmartAttribute(
+            self.ids[index], self.names[index], self.current[index], self.worst[index], self.threshold[index],
+            PRE_FAIL if flags & FLAG_PREFAILURE else OLD_AGE,
+            UPDATED_ALWAYS if flags & FLAG_UPDATED_ONLINE else UPDATED_OFFLINE,
+            self.raw_values[index]
+        )
+
+    def __iter__(self):
+        for index in range(len(self.names)):
+            yield self[index]
+
+    def __repr__(self):
+        return f"SmartSnapshot(timestamp={self.timestamp}, attributes={len(self)}, info_keys={len(self.info)})"
+
+    def find(self, attribute_id):
+        """ID'si verilen özniteliği döndürür, yoksa None."""
+        for index, current_id in enumerate(self.ids):
+            if current_id == attribute_id:
+                return self[index]
+        return None
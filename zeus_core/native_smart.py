@@ -0,0 +1,480 @@
+"""
+smartctl çalıştırmadan SMART verisi okuyan isteğe bağlı yerel arka uç.
+
+SATA diskler için SG_IO üzerinden ATA PASS-THROUGH(16) ile IDENTIFY DEVICE,
+SMART READ DATA ve SMART READ THRESHOLDS komutları, NVMe diskler için yönetici
+(admin) ioctl'i ile Identify ve SMART/Health günlük sayfası okunur. Sonuç,
+smartctl -j çıktısının kullanılan alt kümesiyle aynı yapıda bir sözlüktür;
+böylece mevcut JSON ayrıştırma ve puanlama hattı değişmeden kullanılır.
+
+ioctl ve aygıt açma işlevleri NativeSmartBackend'e dışarıdan verilebilir;
+testlerde gerçek disk yerine sahte bir ioctl katmanı kullanılabilir.
+"""
+import os
+import re
+import time
+import ctypes
+import fcntl
+
+# SG_IO sabitleri (scsi/sg.h)
+SG_IO = 0x2285
+SG_DXFER_NONE = -1
+SG_DXFER_FROM_DEV = -3
+SG_INTERFACE_ID = ord('S')
+
+# ATA komutları
+ATA_PASS_THROUGH_16 = 0x85
+ATA_IDENTIFY_DEVICE = 0xEC
+ATA_CHECK_POWER_MODE = 0xE5
+ATA_SMART = 0xB0
+SMART_READ_DATA = 0xD0
+SMART_READ_THRESHOLDS = 0xD1
+
+# CHECK POWER MODE'un sector count yanıtında diskin dönmediğini bildiren değerler (Standby, Standby_y, NV önbellekli)
+ATA_STANDBY_POWER_MODES = (0x00, 0x01, 0x40, 0x41)
+
+# NVMe yönetici komutları (linux/nvme_ioctl.h): _IOWR('N', 0x41, struct nvme_admin_cmd)
+NVME_IOCTL_ADMIN_CMD = 0xC0484E41
+NVME_ADMIN_GET_LOG_PAGE = 0x02
+NVME_ADMIN_IDENTIFY = 0x06
+NVME_LOG_SMART = 0x02
+NVME_NSID_ALL = 0xFFFFFFFF
+
+SECTOR_SIZE = 512
+COMMAND_TIMEOUT_MS = 20000
+
+# smartctl'nin varsayılan öznitelik adları (drivedb olmadan gösterilenler)
+DEFAULT_ATTRIBUTE_NAMES = {
+    1: "Raw_Read_Error_Rate", 2: "Throughput_Performance", 3: "Spin_Up_Time",
+    4: "Start_Stop_Count", 5: "Reallocated_Sector_Ct", 7: "Seek_Error_Rate",
+    8: "Seek_Time_Performance", 9: "Power_On_Hours", 10: "Spin_Retry_Count",
+    11: "Calibration_Retry_Count", 12: "Power_Cycle_Count", 170: "Available_Reservd_Space",
+    171: "Program_Fail_Count", 172: "Erase_Fail_Count", 173: "Wear_Leveling_Count",
+    174: "Unexpect_Power_Loss_Ct", 175: "Program_Fail_Count_Chip", 177: "Wear_Leveling_Count",
+    179: "Used_Rsvd_Blk_Cnt_Tot", 180: "Unused_Rsvd_Blk_Cnt_Tot", 181: "Program_Fail_Cnt_Total",
+    182: "Erase_Fail_Count_Total", 183: "Runtime_Bad_Block", 184: "End-to-End_Error",
+    187: "Reported_Uncorrect", 188: "Command_Timeout", 189: "High_Fly_Writes",
+    190: "Airflow_Temperature_Cel", 191: "G-Sense_Error_Rate", 192: "Power-Off_Retract_Count",
+    193: "Load_Cycle_Count", 194: "Temperature_Celsius", 195: "Hardware_ECC_Recovered",
+    196: "Reallocated_Event_Count", 197: "Current_Pending_Sector", 198: "Offline_Uncorrectable",
+    199: "UDMA_CRC_Error_Count", 200: "Multi_Zone_Error_Rate", 220: "Disk_Shift",
+    222: "Loaded_Hours", 223: "Load_Retry_Count", 224: "Load_Friction",
+    225: "Load_Cycle_Count", 226: "Load-in_Time", 231: "Temperature_Celsius",
+    232: "Available_Reservd_Space", 233: "Media_Wearout_Indicator", 240: "Head_Flying_Hours",
+    241: "Total_LBAs_Written", 242: "Total_LBAs_Read", 254: "Free_Fall_Sensor",
+}
+
+# smartctl'nin varsayılan raw biçimlerinde gösterilen baştaki sayının bit genişliği
+# (raw16(raw16) -> 16, raw24(raw8) -> 24, tempminmax -> 8); listede olmayanlar raw48'dir
+RAW_DISPLAY_BITS = {
+    3: 16, 5: 16, 9: 24, 190: 8, 194: 8, 196: 16, 197: 16, 198: 16,
+}
+
+
+class NativeSmartError(Exception):
+    """Yerel arka uç diski okuyamadığında fırlatılır; çağıran smartctl'ye geri döner."""
+
+
+class DiskInStandby(NativeSmartError):
+    """Disk bekleme kipinde; uyandırmamak için okuma yapılmadı."""
+
+
+class SgIoHdr(ctypes.Structure):
+    """struct sg_io_hdr (scsi/sg.h)"""
+    _fields_ = [
+        ("interface_id", ctypes.c_int),
+        ("dxfer_direction", ctypes.c_int),
+        ("cmd_len", ctypes.c_ubyte),
+        ("mx_sb_len", ctypes.c_ubyte),
+        ("iovec_count", ctypes.c_ushort),
+        ("dxfer_len", ctypes.c_uint),
+        ("dxferp", ctypes.c_void_p),
+        ("cmdp", ctypes.c_void_p),
+        ("sbp", ctypes.c_void_p),
+        ("timeout", ctypes.c_uint),
+        ("flags", ctypes.c_uint),
+        ("pack_id", ctypes.c_int),
+        ("usr_ptr", ctypes.c_void_p),
+        ("status", ctypes.c_ubyte),
+        ("masked_status", ctypes.c_ubyte),
+        ("msg_status", ctypes.c_ubyte),
+        ("sb_len_wr", ctypes.c_ubyte),
+        ("host_status", ctypes.c_ushort),
+        ("driver_status", ctypes.c_ushort),
+        ("resid", ctypes.c_int),
+        ("duration", ctypes.c_uint),
+        ("info", ctypes.c_uint),
+    ]
+
+
+class NvmeAdminCmd(ctypes.Structure):
+    """struct nvme_admin_cmd (linux/nvme_ioctl.h)"""
+    _fields_ = [
+        ("opcode", ctypes.c_ubyte),
+        ("flags", ctypes.c_ubyte),
+        ("rsvd1", ctypes.c_ushort),
+        ("nsid", ctypes.c_uint),
+        ("cdw2", ctypes.c_uint),
+        ("cdw3", ctypes.c_uint),
+        ("metadata", ctypes.c_ulonglong),
+        ("addr", ctypes.c_ulonglong),
+        ("metadata_len", ctypes.c_uint),
+        ("data_len", ctypes.c_uint),
+        ("cdw10", ctypes.c_uint),
+        ("cdw11", ctypes.c_uint),
+        ("cdw12", ctypes.c_uint),
+        ("cdw13", ctypes.c_uint),
+        ("cdw14", ctypes.c_uint),
+        ("cdw15", ctypes.c_uint),
+        ("timeout_ms", ctypes.c_uint),
+        ("result", ctypes.c_uint),
+    ]
+
+
+def build_ata_pass_through_cdb(command, features=0, lba_mid=0, lba_high=0, sector_count=1):
+    """PIO Data-In protokolüyle tek sektör okuyan ATA PASS-THROUGH(16) komut bloğunu oluşturur."""
+    cdb = bytearray(16)
+    cdb[0] = ATA_PASS_THROUGH_16
+    cdb[1] = 4 << 1            # Protokol 4: PIO Data-In
+    cdb[2] = 0x0E              # t_dir=1 (aygıttan), byt_blok=1 (blok), t_length=2 (sector count alanı)
+    cdb[4] = features
+    cdb[6] = sector_count
+    cdb[10] = lba_mid
+    cdb[12] = lba_high
+    cdb[14] = command
+    return bytes(cdb)
+
+
+def build_ata_non_data_cdb(command):
+    """Veri aktarmayan, sonuç yazmaçlarını sense verisinde döndüren (CK_COND) ATA PASS-THROUGH(16) bloğu."""
+    cdb = bytearray(16)
+    cdb[0] = ATA_PASS_THROUGH_16
+    cdb[1] = 3 << 1            # Protokol 3: Non-data
+    cdb[2] = 0x20              # ck_cond=1: ATA yazmaçlarını her durumda döndür
+    cdb[14] = command
+    return bytes(cdb)
+
+
+def ata_return_sector_count(sense):
+    """
+    ATA PASS-THROUGH sense verisinden sector count yazmacını okur.
+    Tanımlayıcı biçimde (0x72) ATA Status Return tanımlayıcısı (0x09), sabit biçimde (0x70) bilgi alanı kullanılır.
+    """
+    response_code = sense[0] & 0x7F
+    if response_code in (0x72, 0x73):
+        offset, end = 8, min(len(sense), 8 + sense[7])
+        while offset + 1 < end:
+            if sense[offset] == 0x09 and offset + 5 < len(sense):
+                return sense[offset + 5]
+            offset += 2 + sense[offset + 1]
+        return None
+    if response_code in (0x70, 0x71) and len(sense) > 6:
+        return sense[6]
+    return None
+
+
+def _ata_string(data, start_word, end_word):
+    """IDENTIFY verisindeki bayt çiftleri yer değiştirmiş ATA metnini çözer."""
+    raw = bytearray(data[start_word * 2:end_word * 2])
+    raw[0::2], raw[1::2] = raw[1::2], raw[0::2]
+    return raw.decode('ascii', errors='ignore').strip(" \x00") # Boş alanlar sıfırla da doldurulabilir
+
+
+def _word(data, index):
+    return data[index * 2] | (data[index * 2 + 1] << 8)
+
+
+def smart_checksum_ok(data):
+    """SMART veri yapısının 512 baytlık toplamı 0 (mod 256) olmalıdır."""
+    return sum(data[:SECTOR_SIZE]) & 0xFF == 0
+
+
+def parse_ata_identify(data):
+    """ATA IDENTIFY DEVICE verisini smartctl -j alanlarına çevirir."""
+    info = {
+        "model_name": _ata_string(data, 27, 47),
+        "serial_number": _ata_string(data, 10, 20),
+        "firmware_version": _ata_string(data, 23, 27),
+    }
+    lba48 = _word(data, 100) | (_word(data, 101) << 16) | (_word(data, 102) << 32) | (_word(data, 103) << 48)
+    lba28 = _word(data, 60) | (_word(data, 61) << 16)
+    blocks = lba48 or lba28
+    if blocks:
+        info["user_capacity"] = {"blocks": blocks, "bytes": blocks * SECTOR_SIZE}
+    rotation = _word(data, 217)
+    if rotation == 1:
+        info["rotation_rate"] = 0
+    elif 0x0401 <= rotation <= 0xFFFE:
+        info["rotation_rate"] = rotation
+    info["smart_support"] = {
+        "available": bool(_word(data, 82) & 0x0001),
+        "enabled": bool(_word(data, 85) & 0x0001),
+    }
+    return info
+
+
+def parse_ata_smart_attributes(smart_data, threshold_data=None):
+    """
+    SMART READ DATA ve READ THRESHOLDS sektörlerini smartctl -j 'ata_smart_attributes.table'
+    yapısına çevirir. Her girdi 12 bayttır: ID, bayraklar (2), değer, en kötü, raw (6), ayrılmış.
+    """
+    thresholds = {}
+    if threshold_data:
+        for offset in range(2, 2 + 30 * 12, 12):
+            attr_id = threshold_data[offset]
+            if attr_id:
+                thresholds[attr_id] = threshold_data[offset + 1]
+
+    table = []
+    for offset in range(2, 2 + 30 * 12, 12):
+        attr_id = smart_data[offset]
+        if not attr_id:
+            continue
+        flags = smart_data[offset + 1] | (smart_data[offset + 2] << 8)
+        raw = int.from_bytes(smart_data[offset + 5:offset + 11], 'little')
+        display = raw & ((1 << RAW_DISPLAY_BITS.get(attr_id, 48)) - 1)
+        table.append({
+            "id": attr_id,
+            "name": DEFAULT_ATTRIBUTE_NAMES.get(attr_id, "Unknown_Attribute"),
+            "value": smart_data[offset + 3],
+            "worst": smart_data[offset + 4],
+            "thresh": thresholds.get(attr_id, 0),
+            "flags": {"value": flags, "prefailure": bool(flags & 0x01), "updated_online": bool(flags & 0x02)},
+            "raw": {"value": raw, "string": str(display)},
+        })
+    return table
+
+
+def parse_nvme_identify(controller_data, namespace_data=None):
+    """NVMe Identify Controller (ve varsa Namespace) verisini smartctl -j alanlarına çevirir."""
+    info = {
+        "model_name": bytes(controller_data[24:64]).decode('ascii', errors='ignore').strip(" \x00"),
+        "serial_number": bytes(controller_data[4:24]).decode('ascii', errors='ignore').strip(" \x00"),
+        "firmware_version": bytes(controller_data[64:72]).decode('ascii', errors='ignore').strip(" \x00"),
+    }
+    total_capacity = int.from_bytes(controller_data[280:296], 'little')
+    if total_capacity:
+        info["nvme_total_capacity"] = total_capacity
+    if namespace_data:
+        nsze = int.from_bytes(namespace_data[0:8], 'little')
+        lbaf_index = namespace_data[26] & 0x0F
+        lbads = namespace_data[128 + 4 * lbaf_index + 2]
+        if nsze and lbads:
+            info["user_capacity"] = {"blocks": nsze, "bytes": nsze << lbads}
+    return info
+
+
+def parse_nvme_smart_log(log):
+    """NVMe SMART/Health Information (günlük 0x02) sayfasını smartctl -j yapısına çevirir."""
+    def u128(offset):
+        return int.from_bytes(log[offset:offset + 16], 'little')
+
+    temperature_kelvin = log[1] | (log[2] << 8)
+    health = {
+        "critical_warning": log[0],
+        "temperature": temperature_kelvin - 273 if temperature_kelvin else 0,
+        "available_spare": log[3],
+        "available_spare_threshold": log[4],
+        "percentage_used": log[5],
+        "data_units_read": u128(32),
+        "data_units_written": u128(48),
+        "host_reads": u128(64),
+        "host_writes": u128(80),
+        "controller_busy_time": u128(96),
+        "power_cycles": u128(112),
+        "power_on_hours": u128(128),
+        "unsafe_shutdowns": u128(144),
+        "media_errors": u128(160),
+        "num_err_log_entries": u128(176),
+    }
+    return {
+        "nvme_smart_health_information_log": health,
+        "temperature": {"current": health["temperature"]},
+        "power_on_time": {"hours": health["power_on_hours"]},
+        "power_cycle_count": health["power_cycles"],
+    }
+
+
+def _attribute_summary(table):
+    """Power On Hours ve Power Cycle Count değerlerini smartctl -j'deki gibi üst seviyeye taşır."""
+    summary = {}
+    for entry in table:
+        if entry["id"] == 9:
+            summary["power_on_time"] = {"hours": int(entry["raw"]["string"])}
+        elif entry["id"] == 12:
+            summary["power_cycle_count"] = int(entry["raw"]["string"])
+        elif entry["id"] == 194:
+            summary["temperature"] = {"current": int(entry["raw"]["string"])}
+    return summary
+
+
+def is_nvme_device(disk_path):
+    """Aygıt yolunun NVMe diskine ait olup olmadığını adından anlar."""
+    return os.path.basename(os.path.realpath(disk_path)).startswith("nvme")
+
+
+def _nvme_namespace_id(disk_path):
+    """nvme0n1 gibi bir aygıt adından isim alanı numarasını çıkarır."""
+    match = re.match(r'nvme\d+n(\d+)', os.path.basename(os.path.realpath(disk_path)))
+    return int(match.group(1)) if match else 1
+
+
+class NativeSmartBackend:
+    """
+    SG_IO ve NVMe yönetici ioctl'leriyle SMART verisi okur.
+    ioctl, opener ve closer parametreleri sahte bir ioctl katmanıyla test için değiştirilebilir;
+    ioctl(fd, istek, yapı) imzası fcntl.ioctl ile aynıdır ve yapı yerinde güncellenmelidir.
+    """
+
+    def __init__(self, ioctl=None, opener=None, closer=None):
+        self.ioctl = ioctl or fcntl.ioctl
+        self.opener = opener or (lambda path: os.open(path, os.O_RDONLY | os.O_NONBLOCK))
+        self.closer = closer or os.close
+
+    # --- ATA ---
+
+    def _sg_io(self, fd, cdb_bytes, data_length):
+        """ATA PASS-THROUGH komutunu SG_IO ile gönderir; (veri, sense) döndürür."""
+        data = ctypes.create_string_buffer(max(data_length, 1))
+        cdb = ctypes.create_string_buffer(cdb_bytes, 16)
+        sense = ctypes.create_string_buffer(32)
+        hdr = SgIoHdr(
+            interface_id=SG_INTERFACE_ID,
+            dxfer_direction=SG_DXFER_FROM_DEV if data_length else SG_DXFER_NONE,
+            cmd_len=16,
+            mx_sb_len=len(sense),
+            dxfer_len=data_length,
+            dxferp=ctypes.addressof(data) if data_length else 0,
+            cmdp=ctypes.addressof(cdb),
+            sbp=ctypes.addressof(sense),
+            timeout=COMMAND_TIMEOUT_MS,
+        )
+        try:
+            self.ioctl(fd, SG_IO, hdr)
+        except OSError as e:
+            raise NativeSmartError(f"SG_IO başarısız: {e}")
+        # CHECK CONDITION, sense anahtarı NO SENSE / RECOVERED ERROR ise yalnızca ATA durum tanımlayıcısıdır
+        sense_key = 0
+        if hdr.status == 2 and hdr.sb_len_wr:
+            sense_bytes = sense.raw
+            sense_key = (sense_bytes[1] if sense_bytes[0] & 0x7F >= 0x72 else sense_bytes[2]) & 0x0F
+        if hdr.status not in (0, 2) or sense_key > 1 or hdr.host_status != 0 or (hdr.driver_status & ~0x08):
+            raise NativeSmartError(
+                f"ATA komutu 0x{cdb_bytes[14]:02x} başarısız (status={hdr.status}, host={hdr.host_status}, driver={hdr.driver_status})")
+        return data.raw[:data_length], sense.raw[:hdr.sb_len_wr]
+
+    def ata_command(self, fd, command, features=0, lba_mid=0, lba_high=0):
+        """Tek sektörlük bir ATA veri okuma komutunu SG_IO ile gönderir ve 512 baytı döndürür."""
+        data, _ = self._sg_io(fd, build_ata_pass_through_cdb(command, features, lba_mid, lba_high), SECTOR_SIZE)
+        return data
+
+    def ata_power_mode(self, fd):
+        """
+        CHECK POWER MODE ile diskin güç kipini okur (disk uyandırılmaz).
+        Sector count değerini döndürür; köprü yazmaçları döndürmüyorsa None.
+        """
+        _, sense = self._sg_io(fd, build_ata_non_data_cdb(ATA_CHECK_POWER_MODE), 0)
+        return ata_return_sector_count(sense) if sense else None
+
+    def read_ata(self, fd, disk_path):
+        identify = self.ata_command(fd, ATA_IDENTIFY_DEVICE)
+        result = parse_ata_identify(identify)
+        if not result["model_name"] and not result["serial_number"]:
+            raise NativeSmartError("IDENTIFY DEVICE boş veri döndürdü")
+        result["device"] = {"name": disk_path, "type": "native", "protocol": "ATA"}
+        if not result["smart_support"]["enabled"]:
+            return result
+
+        smart_data = self.ata_command(fd, ATA_SMART, SMART_READ_DATA, 0x4F, 0xC2)
+        if not smart_checksum_ok(smart_data):
+            raise NativeSmartError("SMART verisinin sağlama toplamı hatalı")
+        threshold_data = self.ata_command(fd, ATA_SMART, SMART_READ_THRESHOLDS, 0x4F, 0xC2)
+        if not smart_checksum_ok(threshold_data):
+            threshold_data = None
+        table = parse_ata_smart_attributes(smart_data, threshold_data)
+        result["ata_smart_attributes"] = {"revision": smart_data[0] | (smart_data[1] << 8), "table": table}
+        result.update(_attribute_summary(table))
+        return result
+
+    # --- NVMe ---
+
+    def nvme_admin(self, fd, opcode, nsid, cdw10, length):
+        """Bir NVMe yönetici komutu gönderir ve dönen veri tamponunu döndürür."""
+        data = ctypes.create_string_buffer(length)
+        cmd = NvmeAdminCmd(
+            opcode=opcode,
+            nsid=nsid,
+            addr=ctypes.addressof(data),
+            data_len=length,
+            cdw10=cdw10,
+            timeout_ms=COMMAND_TIMEOUT_MS,
+        )
+        try:
+            status = self.ioctl(fd, NVME_IOCTL_ADMIN_CMD, cmd)
+        except OSError as e:
+            raise NativeSmartError(f"NVMe yönetici komutu başarısız: {e}")
+        if status:
+            raise NativeSmartError(f"NVMe komutu 0x{opcode:02x} durum kodu döndürdü: 0x{status:x}")
+        return data.raw
+
+    def read_nvme(self, fd, disk_path):
+        controller = self.nvme_admin(fd, NVME_ADMIN_IDENTIFY, 0, 1, 4096)
+        try:
+            namespace = self.nvme_admin(fd, NVME_ADMIN_IDENTIFY, _nvme_namespace_id(disk_path), 0, 4096)
+        except NativeSmartError:
+            namespace = None
+        result = parse_nvme_identify(controller, namespace)
+        result["device"] = {"name": disk_path, "type": "native", "protocol": "NVMe"}
+        numd = SECTOR_SIZE // 4 - 1
+        log = self.nvme_admin(fd, NVME_ADMIN_GET_LOG_PAGE, NVME_NSID_ALL, (numd << 16) | NVME_LOG_SMART, SECTOR_SIZE)
+        result.update(parse_nvme_smart_log(log))
+        return result
+
+    def read(self, disk_path, check_standby=False):
+        """
+        Diskin kimlik ve SMART verisini smartctl -j biçiminde bir sözlük olarak döndürür.
+        Okunamazsa NativeSmartError fırlatır. check_standby verilirse ATA disk bekleme
+        kipindeyken hiçbir okuma yapılmadan DiskInStandby fırlatılır.
+        """
+        try:
+            fd = self.opener(disk_path)
+        except OSError as e:
+            raise NativeSmartError(f"'{disk_path}' açılamadı: {e}")
+        try:
+            if is_nvme_device(disk_path):
+                result = self.read_nvme(fd, disk_path) # NVMe diskler dönmediği için uyandırma sorunu yoktur
+            else:
+                if check_standby and self.ata_power_mode(fd) in ATA_STANDBY_POWER_MODES:
+                    raise DiskInStandby(f"'{disk_path}' bekleme kipinde")
+                result = self.read_ata(fd, disk_path)
+        finally:
+            self.closer(fd)
+        result["local_time"] = {"time_t": int(time.time()), "asctime": time.strftime("%a %b %d %H:%M:%S %Y %Z")}
+        return result
+
+
+_backend = None
+
+
+def native_smart_enabled():
+    """Yerel arka uç ZEUS_NATIVE_SMART=1 ortam değişkeniyle etkinleştirilir."""
+    return os.environ.get('ZEUS_NATIVE_SMART', '') in ('1', 'yes', 'true')
+
+
+def read_native_smart(disk_path, backend=None, check_standby=False):
+    """
+    Yerel arka uçla diski okur. Başarısız olursa None döner ve çağıran smartctl'ye geri döner
+    (ör. tanınmayan USB köprüleri, SAS diskler). check_standby verilirse bekleme kipindeki
+    disk için DiskInStandby fırlatılır.
+    """
+    global _backend
+    if backend is None:
+        if _backend is None:
+            _backend = NativeSmartBackend()
+        backend = _backend
+    try:
+        return backend.read(disk_path, check_standby)
+    except DiskInStandby:
+        raise
+    except NativeSmartError:
+        return None
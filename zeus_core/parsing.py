@@ -0,0 +1,259 @@
+"""
+smartctl çıktısının (metin veya -j) disk bilgisi ve öznitelik listesine ayrıştırılması.
+
+Öznitelikler zeus_core.model.SmartAttribute nesneleri, disk bilgileri ise smartctl'nin alan
+adlarıyla ("Device Model", "User Capacity" ...) anahtarlanmış bir sözlüktür. Yerel arka ucun
+(zeus_core.native_smart) sözlüğü de -j çıktısı gibi işlenir.
+"""
+import re
+import sys
+import json
+
+from zeus_core.model import OLD_AGE, PRE_FAIL, UPDATED_ALWAYS, UPDATED_OFFLINE, SmartAttribute, SmartSnapshot
+from zeus_core.smartctl import is_smart_json, load_smart_json
+
+# Raw değer metninin baştaki sayısı: '35 (Min/Max 20/45)', '23012h+14m+03.123s' gibi biçimler için
+RAW_VALUE_PREFIX_PATTERN = re.compile(r'^\s*(-?\d+)')
+
+# Ayrıştırıcıların düzenli ifadeleri modül yüklenirken bir kez derlenir (her çağrıda/satırda değil)
+ATTRIBUTE_HEADER_SOURCE = r'ID# ATTRIBUTE_NAME[^\n]*\n?'
+ATTRIBUTE_ROW_SOURCE = (
+    r'[ \t]*(\d+)[ \t]+(\S+)[ \t]+'            # 1: ID, 2: Name (End-to-End_Error gibi tireli adlar dahil)
+    r'\S+[ \t]+'                               # Flags (örn: 0x000f, or '---')
+    r'(\d+)[ \t]+(\d+)[ \t]+(\d+)[ \t]+'       # 3: Current, 4: Worst, 5: Threshold
+    r'(\S+)[ \t]+(\S+)[ \t]+'                  # 6: Type (Pre-fail, Old_age), 7: Updated (Always, Offline)
+    r'\S+[ \t]+'                               # When_Failed (-, In_the_past)
+    r'(?:0x([0-9A-Fa-f]+)|(-?\d+))[^\n]*\n?'    # 8: onaltılık raw, 9: raw metninin baştaki sayısı
+)
+LINE_SOURCE = r'([^\n]*)\n?'
+ATTRIBUTE_TABLE_END_MARKERS = ("SMART Error Log", "SMART Self-test Log", "Vendor Specific SMART Attributes")
+
+# Aynı desenlerin str ve bytes (boru çıktısı, memoryview) sürümleri: (başlık, satır, tüm satır, bitiş işaretleri)
+TEXT_TABLE_PATTERNS = (
+    re.compile(ATTRIBUTE_HEADER_SOURCE),
+    re.compile(ATTRIBUTE_ROW_SOURCE, re.ASCII),
+    re.compile(LINE_SOURCE),
+    ATTRIBUTE_TABLE_END_MARKERS,
+)
+BYTES_TABLE_PATTERNS = (
+    re.compile(ATTRIBUTE_HEADER_SOURCE.encode('ascii')),
+    re.compile(ATTRIBUTE_ROW_SOURCE.encode('ascii')),
+    re.compile(LINE_SOURCE.encode('ascii')),
+    tuple(marker.encode('ascii') for marker in ATTRIBUTE_TABLE_END_MARKERS),
+)
+BYTES_JSON_PATTERN = re.compile(rb'\s*\{')
+
+CAPACITY_BRACKET_PATTERN = re.compile(r'\[(.*?)\]')
+POWER_ON_HOURS_PATTERN = re.compile(r'(\d+)\s+hours')
+FIRST_NUMBER_PATTERN = re.compile(r'(\d+)')
+WEAR_LEVELING_PATTERN = re.compile(r'.*Wear_Leveling_Count\s+.*?\s+(\d+)')
+MEDIA_WEAROUT_PATTERN = re.compile(r'.*Media_Wearout_Indicator\s+.*?\s+(\d+)')
+
+# Tablodaki ad/tip/güncelleme sütunlarının interned metinleri (bytes anahtarlar için çözülmüş hali)
+_TOKEN_CACHE_LIMIT = 4096
+_token_cache = {}
+
+
+def format_capacity(num_bytes):
+    """Bayt değerini smartctl'nin köşeli parantez içindeki biçimine çevirir (örn: 2.00 TB)."""
+    value = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB", "TB", "PB"):
+        if value < 1000 or unit == "PB":
+            break
+        value /= 1000
+    if unit == "B":
+        return f"{int(value)} B"
+    if value >= 100:
+        return f"{value:.0f} {unit}"
+    if value >= 10:
+        return f"{value:.1f} {unit}"
+    return f"{value:.2f} {unit}"
+
+
+def parse_smart_attributes_json(smart_data):
+    """
+    smartctl -j çıktısındaki ATA öznitelik tablosunu parse_smart_attributes ile aynı yapıya çevirir.
+    Raw değeri olarak ham 48 bitlik sayı değil, smartctl'nin gösterdiği değerin baştaki sayısı alınır
+    (örn: '35 (Min/Max 20/45)' için 35); böylece metin ayrıştırıcının atladığı satırlar da korunur.
+    """
+    attributes = []
+    for entry in smart_data.get("ata_smart_attributes", {}).get("table", []):
+        flags = entry.get("flags", {})
+        raw = entry.get("raw", {})
+        raw_match = RAW_VALUE_PREFIX_PATTERN.match(str(raw.get("string", "")))
+        attributes.append(SmartAttribute(
+            entry.get("id", 0),
+            entry.get("name", "Unknown_Attribute"),
+            entry.get("value", 0),
+            entry.get("worst", 0),
+            entry.get("thresh", 0),
+            PRE_FAIL if flags.get("prefailure") else OLD_AGE,
+            UPDATED_ALWAYS if flags.get("updated_online") else UPDATED_OFFLINE,
+            int(raw_match.group(1)) if raw_match else raw.get("value", 0)
+        ))
+    return attributes
+
+
+def parse_smart_info_json(smart_data):
+    """smartctl -j çıktısından parse_smart_info ile aynı anahtarlara sahip disk bilgilerini çıkarır."""
+    info = {}
+    if "model_family" in smart_data:
+        info["Model Family"] = smart_data["model_family"]
+    if "model_name" in smart_data:
+        info["Device Model"] = smart_data["model_name"]
+    if "serial_number" in smart_data:
+        info["Serial Number"] = smart_data["serial_number"]
+    if "firmware_version" in smart_data:
+        info["Firmware Version"] = smart_data["firmware_version"]
+    capacity = smart_data.get("user_capacity", {}).get("bytes") or smart_data.get("nvme_total_capacity")
+    if capacity:
+        info["User Capacity"] = format_capacity(capacity)
+    if "rotation_rate" in smart_data:
+        rotation_rate = smart_data["rotation_rate"]
+        info["Rotation Rate"] = f"{rotation_rate} rpm" if rotation_rate else "Solid State Device"
+    if "enabled" in smart_data.get("smart_support", {}):
+        info["SMART Supported"] = "Enabled" if smart_data["smart_support"]["enabled"] else "Disabled"
+    if "asctime" in smart_data.get("local_time", {}):
+        info["Local Time"] = smart_data["local_time"]["asctime"]
+    if "hours" in smart_data.get("power_on_time", {}):
+        info["Power On Hours"] = f"{smart_data['power_on_time']['hours']} hours"
+    if "power_cycle_count" in smart_data:
+        info["Power Cycle Count"] = str(smart_data["power_cycle_count"])
+    nvme_log = smart_data.get("nvme_smart_health_information_log", {})
+    if "data_units_written" in nvme_log:
+        units = nvme_log["data_units_written"]
+        info["Data Units Written"] = f"{units:,} [{format_capacity(units * 512000)}]"
+    if "data_units_read" in nvme_log:
+        units = nvme_log["data_units_read"]
+        info["Data Units Read"] = f"{units:,} [{format_capacity(units * 512000)}]"
+    return info
+
+
+def _intern_token(token):
+    """Tablo sütunundaki metni (str veya bytes) interned str olarak döndürür; her değer bir kez çözülür."""
+    text = _token_cache.get(token)
+    if text is None:
+        text = sys.intern(token if isinstance(token, str) else token.decode('ascii'))
+        if len(_token_cache) < _TOKEN_CACHE_LIMIT:
+            _token_cache[token] = text
+    return text
+
+
+def attribute_from_match(match):
+    """Tablo satırı deseninin (TEXT/BYTES_TABLE_PATTERNS[1]) eşleşmesinden SmartAttribute oluşturur."""
+    attr_id, name, current, worst, threshold, attr_type, updated, hex_raw, raw = match.groups()
+    return SmartAttribute(
+        int(attr_id),
+        _intern_token(name),
+        int(current),
+        int(worst),
+        int(threshold),
+        _intern_token(attr_type),
+        _intern_token(updated),
+        int(hex_raw, 16) if hex_raw is not None else int(raw)
+    )
+
+
+def parse_attribute_table(data, patterns=TEXT_TABLE_PATTERNS):
+    """
+    smartctl -A metin tablosunu satırlara bölmeden ayrıştırır: başlık bir kez aranır, her satır
+    tamponun kendisi üzerinde verilen konumdan eşleştirilir (str, bytes, bytearray veya memoryview).
+    Raw değeri, -j ayrıştırıcısındaki gibi gösterilen değerin baştaki sayısıdır ('35 (Min/Max 20/45)'
+    için 35, '23012h+14m+03.123s' için 23012); '0x...' biçimi onaltılık okunur.
+    """
+    header_pattern, row_pattern, line_pattern, end_markers = patterns
+    header = header_pattern.search(data)
+    if header is None:
+        return []
+
+    attributes = []
+    position = header.end()
+    data_length = len(data)
+    while position < data_length:
+        match = row_pattern.match(data, position)
+        if match is None:
+            # Tablo satırı değil: boş satır veya sonraki bölüm tablonun sonudur, diğerleri atlanır
+            line = line_pattern.match(data, position)
+            text = line.group(1)
+            if not text.strip() or any(marker in text for marker in end_markers):
+                break
+            position = line.end()
+            continue
+        attributes.append(attribute_from_match(match))
+        position = match.end()
+    return attributes
+
+
+def parse_smart_attributes(smart_attributes_output):
+    """
+    smartctl -A çıktısını ayrıştırarak SMART özniteliklerini bir SmartAttribute listesi olarak döndürür.
+    smartctl -j çıktısı verilirse JSON ayrıştırıcısı kullanılır; metin ayrıştırma eski smartmontools içindir.
+    Çıktı, borudan okunduğu gibi bytes/memoryview olarak da verilebilir (önce metne çözülmesi gerekmez).
+    """
+    if isinstance(smart_attributes_output, (bytes, bytearray, memoryview)):
+        if BYTES_JSON_PATTERN.match(smart_attributes_output):
+            return parse_smart_attributes_json(json.loads(bytes(smart_attributes_output)))
+        return parse_attribute_table(smart_attributes_output, BYTES_TABLE_PATTERNS)
+    if is_smart_json(smart_attributes_output):
+        return parse_smart_attributes_json(load_smart_json(smart_attributes_output))
+    return parse_attribute_table(smart_attributes_output)
+
+
+def parse_smart_info(smart_info_output):
+    """
+    smartctl -i çıktısından disk bilgilerini ayrıştırır.
+    smartctl -j çıktısı verilirse JSON ayrıştırıcısı kullanılır.
+    """
+    if is_smart_json(smart_info_output):
+        return parse_smart_info_json(load_smart_json(smart_info_output))
+
+    info = {}
+    for line in smart_info_output.splitlines():
+        if "Model Family:" in line:
+            info["Model Family"] = line.split(":", 1)[1].strip()
+        elif "Device Model:" in line:
+            info["Device Model"] = line.split(":", 1)[1].strip()
+        elif "Serial Number:" in line:
+            info["Serial Number"] = line.split(":", 1)[1].strip()
+        elif "Firmware Version:" in line:
+            info["Firmware Version"] = line.split(":", 1)[1].strip()
+        elif "User Capacity:" in line:
+            match = CAPACITY_BRACKET_PATTERN.search(line) # Köşeli parantez içindeki kapasiteyi al
+            info["User Capacity"] = match.group(1) if match else line.split(":", 1)[1].strip().split("bytes")[0].strip()
+        elif "Rotation Rate:" in line:
+            info["Rotation Rate"] = line.split(":", 1)[1].strip()
+        elif "SMART support is:" in line:
+            info["SMART Supported"] = "Enabled" if "Enabled" in line else "Disabled"
+        elif "Local Time is:" in line:
+            info["Local Time"] = line.split(":", 1)[1].strip()
+        elif "Power On Hours:" in line:
+            match = POWER_ON_HOURS_PATTERN.search(line)
+            if match:
+                info["Power On Hours"] = match.group(1) + " hours"
+        elif "Power Cycle Count:" in line:
+            match = FIRST_NUMBER_PATTERN.search(line)
+            if match:
+                info["Power Cycle Count"] = match.group(1)
+        elif "Wear_Leveling_Count" in line: # SSD'ler için
+            match = WEAR_LEVELING_PATTERN.match(line)
+            if match:
+                info["Wear Leveling"] = match.group(1)
+        elif "Media_Wearout_Indicator" in line: # SSD'ler için
+            match = MEDIA_WEAROUT_PATTERN.match(line)
+            if match:
+                info["Media Wearout"] = match.group(1)
+        elif "Data Units Written:" in line:
+            info["Data Units Written"] = line.split(":", 1)[1].strip()
+        elif "Data Units Read:" in line:
+            info["Data Units Read"] = line.split(":", 1)[1].strip()
+    return info
+
+
+def parse_smart_snapshot(attributes_output, info_output, timestamp=None):
+    """
+    get_smart_data çıktılarını tek bir SmartSnapshot'a çevirir.
+    SMART desteği kapalı bildirilen disklerde öznitelikler ayrıştırılmaz (yalnızca disk bilgileri tutulur).
+    """
+    info = parse_smart_info(info_output)
+    attributes = parse_smart_attributes(attributes_output) if info.get("SMART Supported") == "Enabled" else []
+    return SmartSnapshot(attributes, info, timestamp)
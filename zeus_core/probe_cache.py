@@ -0,0 +1,95 @@
+"""
+Her disk için smartctl'de çalışan '-d' aygıt tipini kalıcı olarak saklar.
+
+Kayıtlar diskin kalıcı kimliğiyle (zeus_core.enumeration.disk_identity) tutulur; sonraki okumalarda
+kayıtlı tip önce denenir ve her tipin tek tek denenmesi gerekmez. Dosya önbellek dizinindeki
+probe_cache.json'dur; dizin ZEUS_CACHE_DIR ile değiştirilebilir (varsayılan /var/cache/zeus-hdd-doctor).
+GUI ve konsol aynı dosyayı kullanır; dosya geçici dosyaya yazılıp yeniden adlandırılarak atomik
+olarak güncellenir.
+"""
+import os
+import json
+import threading
+
+# Önbellek dizini; ZEUS_CACHE_DIR ortam değişkeni ile değiştirilebilir
+DEFAULT_CACHE_DIR = "/var/cache/zeus-hdd-doctor"
+PROBE_CACHE_FILE = "probe_cache.json"
+
+
+def get_cache_dir():
+    """GUI ve konsolun ortak kullandığı kalıcı önbellek dizinini döndürür."""
+    return os.environ.get('ZEUS_CACHE_DIR', DEFAULT_CACHE_DIR)
+
+
+def order_device_types(device_types, preferred_type):
+    """Önbellekte kayıtlı çalışan tipi başa alır, diğer tipleri sırası bozulmadan arkasına ekler."""
+    if not preferred_type:
+        return list(device_types)
+    return [preferred_type] + [t for t in device_types if t != preferred_type]
+
+
+class ProbeCache:
+    """
+    Her disk için smartctl'de çalışan '-d' tipini kalıcı olarak saklar.
+    Anahtar zeus_core.enumeration.disk_identity() değeridir; böylece disk başka bir porta takılsa da kayıt geçerli kalır.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_cache_dir(), PROBE_CACHE_FILE)
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+                self._entries = entries if isinstance(entries, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        # Geçici dosyaya yazıp yeniden adlandırarak GUI ve konsolun aynı anda yazmasında bozulmayı önle
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass # Önbellek yazılamazsa (salt okunur sistem, yetki yok) sessizce devam et
+
+    def preferred_type(self, identity):
+        """Disk için son çalışan aygıt tipini döndürür, kayıt yoksa None."""
+        if not identity:
+            return None
+        with self._lock:
+            return self._load().get(identity)
+
+    def record_success(self, identity, dev_type):
+        """Çalışan aygıt tipini kaydeder; değişmediyse dosyaya tekrar yazılmaz."""
+        if not identity:
+            return
+        with self._lock:
+            entries = self._load()
+            if entries.get(identity) != dev_type:
+                entries[identity] = dev_type
+                self._save()
+
+    def forget(self, identity):
+        """Diskin kaydını siler."""
+        with self._lock:
+            if self._load().pop(identity, None) is not None:
+                self._save()
+
+
+_probe_cache = None
+
+
+def get_probe_cache():
+    """Süreç boyunca paylaşılan ProbeCache örneğini döndürür."""
+    global _probe_cache
+    if _probe_cache is None:
+        _probe_cache = ProbeCache()
+    return _probe_cache
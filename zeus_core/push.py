@@ -0,0 +1,297 @@
+"""
+Ajan → toplayıcı (collector) gönderim hattı: birçok sunucuda çalışan arka plan kipleri (ajanlar)
+okumalarını merkezi bir toplayıcıya gönderir; toplayıcı hepsini tek bir geçmiş veritabanına yazar
+(bkz. zeus_core.collector).
+    toplayıcı: python3 -m zeus_core --collector --collector-port 9634
+    ajan:      python3 -m zeus_core --daemon --push http://127.0.0.1:9634/push
+
+Yalnızca değişenler gönderilir: ajan her disk için gönderilmiş son durumu tutar ve yeni okumayı onunla
+karşılaştırır; kuyruğa yalnızca değişen öznitelikler, puan ve disk bilgileri (fark kaydı) eklenir,
+hiçbir şey değişmemişse okuma gönderilmez. Kuyruk ZEUS_PUSH_INTERVAL (10) saniyede bir (veya PUSH_BATCH_SIZE
+kayıt birikince) tek bir istekle, zlib ile sıkıştırılmış kompakt JSON olarak gönderilir; bant genişliği
+ve toplayıcının işi disk sayısıyla değil değişim hızıyla artar.
+
+Her gönderimin oturumu ('session', ajan başlarken rastgele), sıra numarası ('seq') ve dayandığı onaylı
+sıra numarası ('base') vardır. Toplayıcı yalnızca bildiği son sıraya dayanan gönderimi uygular; yanıtı
+kaybolan gönderim tekrar gelirse yeniden uygulamadan onaylar. Toplayıcı yeniden başlatılmışsa (409)
+veya ajan uzun süre gönderemeyip kuyruk taştıysa disklerin son durumu baştan, tam olarak gönderilir
+(base 0).
+
+Fark kaydı: {'k': disk anahtarı, 't': okuma zamanı, 's': puan, 'i': disk bilgileri,
+'a': [[id, tekrar, current, worst, threshold, raw(, bayraklar, ad)], ...], 'r': [[id, tekrar], ...]}
+'s', 'i', 'a' ve 'r' yalnızca değiştiklerinde bulunur; bayraklar ve ad yalnızca yeni özniteliklerde.
+"""
+import os
+import sys
+import json
+import zlib
+import socket
+import threading
+import urllib.error
+import urllib.request
+
+from zeus_core.model import (
+    FLAG_PREFAILURE, FLAG_UPDATED_ONLINE, OLD_AGE, PRE_FAIL, UPDATED_ALWAYS, UPDATED_OFFLINE, SmartAttribute,
+    SmartSnapshot
+)
+
+PROTOCOL_VERSION = 1
+CONTENT_TYPE = "application/json"
+CONTENT_ENCODING = "deflate"
+
+# Gönderim aralığı (sn; ZEUS_PUSH_INTERVAL ile değiştirilebilir) ve bir istekteki en fazla fark kaydı
+DEFAULT_PUSH_INTERVAL = 10.0
+PUSH_BATCH_SIZE = 5000
+
+# Gönderilemeyen kayıt bu sayıyı aşarsa kuyruk atılır ve son durum baştan gönderilir
+MAX_PENDING = 100000
+
+PUSH_TIMEOUT = 10.0
+
+# Her okumada değişen, geçmiş için anlamı olmayan disk bilgileri; farka katılmaz
+VOLATILE_INFO_FIELDS = ("Local Time",)
+
+
+class PushError(ValueError):
+    """Gönderim verisi çözülemedi veya geçersiz."""
+
+
+def get_push_interval():
+    """Gönderim aralığı (sn)."""
+    try:
+        interval = float(os.environ.get('ZEUS_PUSH_INTERVAL', DEFAULT_PUSH_INTERVAL))
+    except ValueError:
+        interval = DEFAULT_PUSH_INTERVAL
+    return interval if interval > 0 else DEFAULT_PUSH_INTERVAL
+
+
+def snapshot_state(snapshot, score):
+    """
+    Okumayı karşılaştırılabilir duruma çevirir: {'score', 'info', 'attributes', 'taken_at'};
+    attributes (id, tekrar) -> (current, worst, threshold, raw, bayraklar, ad), okuma sırasıyla.
+    """
+    attributes = {}
+    occurrences = {}
+    for attr_id, name, current, worst, threshold, raw_value, flags in zip(
+            snapshot.ids, snapshot.names, snapshot.current, snapshot.worst, snapshot.threshold,
+            snapshot.raw_values, snapshot.flags):
+        occurrence = occurrences.get(attr_id, 0)
+        occurrences[attr_id] = occurrence + 1
+        attributes[(attr_id, occurrence)] = (current, worst, threshold, raw_value, flags, name)
+    info = {key: value for key, value in snapshot.info.items() if key not in VOLATILE_INFO_FIELDS}
+    return {'score': score, 'info': info, 'attributes': attributes, 'taken_at': snapshot.timestamp}
+
+
+def diff_states(old, new):
+    """İki durum arasındaki fark kaydı alanları ('k' ve 't' hariç); değişiklik yoksa boş sözlük."""
+    delta = {}
+    if old is None:
+        old = {'score': None, 'info': None, 'attributes': {}}
+    if new['score'] != old['score']:
+        delta['s'] = new['score']
+    if new['info'] != old['info']:
+        delta['i'] = new['info']
+    rows = []
+    old_attributes = old['attributes']
+    for key, values in new['attributes'].items():
+        previous = old_attributes.get(key)
+        if previous == values:
+            continue
+        if previous is not None and previous[4:] == values[4:]:
+            rows.append([key[0], key[1], values[0], values[1], values[2], values[3]])
+        else:
+            rows.append([key[0], key[1], values[0], values[1], values[2], values[3], values[4], values[5]])
+    if rows:
+        delta['a'] = rows
+    removed = [list(key) for key in old_attributes if key not in new['attributes']]
+    if removed:
+        delta['r'] = removed
+    return delta
+
+
+def apply_delta(state, entry):
+    """Fark kaydını duruma uygular (durum yerinde değişir); durum yoksa yeni durum oluşturulur."""
+    if state is None:
+        state = {'score': None, 'info': {}, 'attributes': {}}
+    if 's' in entry:
+        state['score'] = entry['s']
+    if 'i' in entry:
+        state['info'] = entry['i']
+    attributes = state['attributes']
+    for key in entry.get('r', ()):
+        attributes.pop(tuple(key), None)
+    for row in entry.get('a', ()):
+        key = (row[0], row[1])
+        if len(row) == 8:
+            attributes[key] = tuple(row[2:])
+        else:
+            previous = attributes.get(key)
+            if previous is None:
+                raise PushError(f"{key} özniteliği için önceki durum yok.")
+            attributes[key] = tuple(row[2:6]) + previous[4:]
+    return state
+
+
+def state_snapshot(state, taken_at):
+    """Durumdan geçmişe yazılacak SmartSnapshot oluşturur."""
+    return SmartSnapshot([
+        SmartAttribute(key[0], name, current, worst, threshold,
+                       PRE_FAIL if flags & FLAG_PREFAILURE else OLD_AGE,
+                       UPDATED_ALWAYS if flags & FLAG_UPDATED_ONLINE else UPDATED_OFFLINE,
+                       raw_value)
+        for key, (current, worst, threshold, raw_value, flags, name) in state['attributes'].items()
+    ], dict(state['info']), timestamp=taken_at)
+
+
+def encode_batch(document):
+    """Gönderim belgesini kompakt JSON olarak zlib ile sıkıştırır."""
+    return zlib.compress(json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode('utf-8'))
+
+
+def decode_batch(body):
+    """encode_batch'in tersi; geçersiz veri için PushError fırlatır."""
+    try:
+        document = json.loads(zlib.decompress(body).decode('utf-8'))
+    except (zlib.error, ValueError) as e:
+        raise PushError(f"Gönderim çözülemedi: {e}") from e
+    if not isinstance(document, dict) or document.get('version') != PROTOCOL_VERSION:
+        raise PushError("Desteklenmeyen gönderim sürümü.")
+    for field in ('host', 'session'):
+        if not isinstance(document.get(field), str):
+            raise PushError(f"'{field}' alanı eksik.")
+    for field in ('seq', 'base'):
+        if not isinstance(document.get(field), int):
+            raise PushError(f"'{field}' alanı eksik.")
+    if not isinstance(document.get('entries'), list):
+        raise PushError("'entries' alanı eksik.")
+    return document
+
+
+class PushAgent:
+    """
+    Okumaları fark kayıtlarına çevirip kuyruğa alır ve kendi iş parçacığında toplayıcıya gönderir.
+    add() herhangi bir iş parçacığından çağrılabilir ve ağı beklemez.
+    """
+
+    def __init__(self, url, host=None, interval=None, batch_size=PUSH_BATCH_SIZE, timeout=PUSH_TIMEOUT):
+        self.url = url
+        self.host = host or socket.gethostname()
+        self.interval = interval or get_push_interval()
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.session = os.urandom(8).hex()
+        self.tip = {} # disk anahtarı -> kuyruktakiler dahil son durum
+        self.pending = [] # henüz gönderilmemiş fark kayıtları
+        self.inflight = None # (seq, base, kayıtlar): onay bekleyen gönderim; aynen yeniden denenir
+        self.acked_seq = 0
+        self.next_seq = 1
+        self.stats = {'readings': 0, 'entries': 0, 'batches': 0, 'bytes': 0, 'failures': 0, 'resyncs': 0}
+        self.stopping = False
+        self.failing = False
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name="zeus-push", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def add(self, entries):
+        """(disk anahtarı, SmartSnapshot, puan) okumalarını kuyruğa ekler (yalnızca farkları)."""
+        with self.cond:
+            for disk_key, snapshot, score in entries:
+                self.stats['readings'] += 1
+                state = snapshot_state(snapshot, score)
+                delta = diff_states(self.tip.get(disk_key), state)
+                self.tip[disk_key] = state
+                if delta:
+                    delta['k'], delta['t'] = disk_key, snapshot.timestamp
+                    self.pending.append(delta)
+            if len(self.pending) > MAX_PENDING:
+                self._resync()
+            if len(self.pending) >= self.batch_size:
+                self.cond.notify()
+
+    def _resync(self):
+        """Kuyruğu atar; disklerin son durumu tam olarak ve onaylı bir sıraya dayanmadan (base 0) gönderilir."""
+        self.stats['resyncs'] += 1
+        self.inflight = None
+        self.acked_seq = 0
+        self.pending = []
+        for disk_key, state in self.tip.items():
+            delta = diff_states(None, state)
+            delta['k'], delta['t'] = disk_key, state['taken_at']
+            self.pending.append(delta)
+
+    def _next_batch(self):
+        """Onay bekleyen gönderim yoksa kuyruktan yenisini oluşturur; gönderilecek belge (yoksa None)."""
+        if self.inflight is None:
+            if not self.pending:
+                return None
+            entries, self.pending = self.pending[:self.batch_size], self.pending[self.batch_size:]
+            self.inflight = (self.next_seq, self.acked_seq, entries)
+            self.next_seq += 1
+        seq, base, entries = self.inflight
+        return {'version': PROTOCOL_VERSION, 'host': self.host, 'session': self.session,
+                'seq': seq, 'base': base, 'entries': entries}
+
+    def _post(self, body):
+        """Gönderimi yapar; toplayıcının HTTP durum kodunu döndürür (bağlantı hatasında None)."""
+        request = urllib.request.Request(self.url, data=body, method="POST", headers={
+            "Content-Type": CONTENT_TYPE, "Content-Encoding": CONTENT_ENCODING})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+        except (urllib.error.URLError, OSError) as e:
+            if not self.failing: # Toplayıcı kapalıyken her denemede uyarı yazılmaz
+                print(f"Uyarı: toplayıcıya gönderilemedi ({self.url}): {e}", file=sys.stderr, flush=True)
+            return None
+
+    def flush(self):
+        """
+        Kuyrukta bekleyenleri gönderir (sender iş parçacığından veya kapanırken). Bir istek başarısız
+        olursa durur; kalanlar sonraki denemeye kalır. Tümü onaylandıysa True döner.
+        """
+        while True:
+            with self.cond:
+                document = self._next_batch()
+                if document is None:
+                    return True
+            body = encode_batch(document)
+            status = self._post(body)
+            with self.cond:
+                if self.inflight is None or self.inflight[0] != document['seq']:
+                    continue # Bu arada kuyruk taştı ve baştan gönderim başladı
+                was_failing, self.failing = self.failing, status not in (200, 409)
+                if status == 200:
+                    self.acked_seq = document['seq']
+                    self.inflight = None
+                    self.stats['batches'] += 1
+                    self.stats['entries'] += len(document['entries'])
+                    self.stats['bytes'] += len(body)
+                elif status == 409: # Toplayıcı bu oturumun durumunu bilmiyor (yeniden başlatılmış)
+                    self._resync()
+                else:
+                    self.stats['failures'] += 1
+                    if status is not None and not was_failing:
+                        print(f"Uyarı: toplayıcı gönderimi reddetti (HTTP {status}).", file=sys.stderr, flush=True)
+                    return False
+
+    def _run(self):
+        while True:
+            with self.cond:
+                if not self.stopping:
+                    self.cond.wait(self.interval)
+                if self.stopping:
+                    return
+            self.flush()
+
+    def close(self):
+        """Gönderici iş parçacığını durdurur ve kuyruktakileri son bir kez göndermeyi dener."""
+        with self.cond:
+            self.stopping = True
+            self.cond.notify()
+        if self.thread.is_alive():
+            self.thread.join()
+        self.flush()
@@ -0,0 +1,99 @@
+"""
+SMART okuma sonuçları için süreç içi önbellek (TTL + stale-while-revalidate).
+
+Kayıtlar diskin kalıcı kimliğiyle (zeus_core.enumeration.disk_identity) tutulur; disk başka bir
+porta takılıp yolu değişse de kayıt bulunur. Süresi (TTL) dolmamış kayıt 'taze'dir ve smartctl
+çalıştırılmadan kullanılır; süresi dolmuş kayıt 'eski'dir, hemen gösterilir ve çağıran arka planda
+yeniden okutur. İsabet/ıska sayıları stats() ile alınabilir.
+"""
+import os
+import time
+import threading
+
+from zeus_core.enumeration import disk_identity
+
+# Kaydın taze sayıldığı süre (saniye); ZEUS_SMART_CACHE_TTL ile değiştirilebilir
+DEFAULT_CACHE_TTL = 300.0
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+def get_cache_ttl():
+    """Önbellek kayıtlarının taze sayıldığı süreyi döndürür."""
+    try:
+        ttl = float(os.environ.get('ZEUS_SMART_CACHE_TTL', DEFAULT_CACHE_TTL))
+    except ValueError:
+        ttl = DEFAULT_CACHE_TTL
+    return max(0.0, ttl)
+
+
+def smart_cache_key(disk_path):
+    """Diskin önbellek anahtarı: kalıcı kimlik, bulunamazsa disk yolu."""
+    return disk_identity(disk_path) or disk_path
+
+
+class SmartResultCache:
+    """
+    get_smart_data sonuçlarını (attributes_output, info_output, error_message) saklar.
+    Birden fazla iş parçacığından güvenle kullanılabilir.
+    """
+
+    def __init__(self, ttl=None, clock=time.monotonic):
+        self.ttl = get_cache_ttl() if ttl is None else ttl
+        self.clock = clock
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        """
+        (sonuç, durum) döndürür; durum FRESH, STALE ya da kayıt yoksa None'dır.
+        STALE sonuç gösterilebilir ancak çağıranın yeniden okuma başlatması beklenir.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, None
+            stored_at, result = entry
+            if self.clock() - stored_at < self.ttl:
+                self.hits += 1
+                return result, FRESH
+            self.stale_hits += 1
+            return result, STALE
+
+    def store(self, key, result):
+        """Yeni okunan sonucu kaydeder; süresi yeniden başlar."""
+        with self._lock:
+            self._entries[key] = (self.clock(), result)
+
+    def invalidate(self, key):
+        """Tek bir diskin kaydını siler (disk çıkarıldığında veya zorla yenilemede)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Tüm kayıtları siler; sayaçlar korunur."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """İsabet, eski isabet ve ıska sayılarını ve kayıt sayısını sözlük olarak döndürür."""
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'hit_ratio': (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            }
+
+
+def format_cache_stats(stats):
+    """stats() sonucunu durum çubuğu/konsol için kısa bir metne çevirir."""
+    return (f"Önbellek: {stats['hits']} isabet, {stats['stale_hits']} eski, {stats['misses']} ıska "
+            f"(%{stats['hit_ratio'] * 100:.0f}, {stats['entries']} kayıt)")
@@ -0,0 +1,85 @@
+"""
+Okuma geçmişinin saatlik ve günlük özetleri (rollup) ve sorgu çözünürlüğünün seçimi.
+
+Her disk ve öznitelik için raw değerler saatlik ve günlük kovalarda (bucket) özetlenir:
+(kova başı, en küçük, en büyük, son, değişim, okuma sayısı). Değişim, kovadaki her okumanın bir
+önceki okumaya (önceki kovadaki dahil) göre farklarının toplamıdır; sayaç özniteliklerinde kovadaki
+artışı verir. Özetler birleştirilebilir: aynı kovanın iki parçası merge_bucket ile tek özete iner;
+bu yüzden yeni okumalar var olan kovalara eklenebilir. Kovalar UTC'ye göre hizalanır.
+
+Özetler zeus_core.history'de saklanır ve arka planda güncellenir; burada yalnızca hesaplar vardır.
+"""
+
+RAW = 0
+HOURLY = 3600
+DAILY = 86400
+ROLLUP_RESOLUTIONS = (HOURLY, DAILY)
+RESOLUTION_NAMES = {RAW: "ham", HOURLY: "saatlik", DAILY: "günlük"}
+
+
+def bucket_start(taken_at, resolution):
+    """Zamanın düştüğü kovanın başlangıcı (saniye)."""
+    return int(taken_at // resolution) * resolution
+
+
+def aggregate_readings(readings, previous_raw, resolution):
+    """
+    Zaman sırasındaki (zaman, raw) okumalarını kovalara özetler. previous_raw ilk okumadan önceki
+    değerdir (yoksa None; ilk okumanın değişimi 0 sayılır). Kova demetleri listesi döner.
+    """
+    buckets = []
+    current = None
+    for taken_at, raw_value in readings:
+        delta = 0 if previous_raw is None else raw_value - previous_raw
+        previous_raw = raw_value
+        start = bucket_start(taken_at, resolution)
+        if current is not None and current[0] == start:
+            current = (start, min(current[1], raw_value), max(current[2], raw_value), raw_value,
+                       current[4] + delta, current[5] + 1)
+        else:
+            if current is not None:
+                buckets.append(current)
+            current = (start, raw_value, raw_value, raw_value, delta, 1)
+    if current is not None:
+        buckets.append(current)
+    return buckets
+
+
+def merge_bucket(earlier, later):
+    """Aynı kovanın iki özetini birleştirir; 'later' daha yeni okumaları içerir."""
+    return (earlier[0], min(earlier[1], later[1]), max(earlier[2], later[2]), later[3],
+            earlier[4] + later[4], earlier[5] + later[5])
+
+
+def raw_rows(readings):
+    """Ham (zaman, raw) okumalarını kova demeti biçimine çevirir (her okuma tek kişilik bir kova)."""
+    rows = []
+    previous_raw = None
+    for taken_at, raw_value in readings:
+        rows.append((taken_at, raw_value, raw_value, raw_value,
+                     0 if previous_raw is None else raw_value - previous_raw, 1))
+        previous_raw = raw_value
+    return rows
+
+
+def choose_resolution(since, step, now, retention_days):
+    """
+    Sorguyu yanıtlayan en kaba çözünürlüğü seçer. step: istenen nokta aralığı (saniye; None ise ham
+    veri). retention_days: {çözünürlük: saklama günü (0 sınırsız)}; 'since' bir çözünürlüğün saklama
+    süresinden eskiyse o çözünürlükte veri kalmadığından daha kabası seçilir.
+    """
+    resolutions = (RAW,) + ROLLUP_RESOLUTIONS
+    index = max(i for i, resolution in enumerate(resolutions) if resolution <= (step or 0))
+    for resolution in resolutions[index:]:
+        days = retention_days.get(resolution, 0)
+        if not days or since is None or since >= now - days * 86400:
+            return resolution
+    return resolutions[-1]
+
+
+def summarize_rows(rows):
+    """Kova demetlerini tek özete indirir: (en küçük, en büyük, son, değişim, okuma sayısı); boşsa None."""
+    if not rows:
+        return None
+    return (min(row[1] for row in rows), max(row[2] for row in rows), rows[-1][3],
+            sum(row[4] for row in rows), sum(row[5] for row in rows))
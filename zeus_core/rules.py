@@ -0,0 +1,378 @@
+"""
+Yapılandırma dosyasından yüklenen sağlık puanlama kuralları.
+
+Kurallar zeus_core/health_rules.json dosyasındadır; ZEUS_HEALTH_RULES ortam değişkeni başka bir
+dosya gösterebilir. Dosya yüklenirken bir kez derlenir: koşullar karşılaştırma işlevlerine çevrilir
+ve her öznitelik (ID, ad) için geçerli kurallar bir dağıtım tablosunda tutulur; böylece puanlamada
+her öznitelik tek bir sözlük araması yapar. GUI, konsol ve toplu puanlama (batch_scoring) aynı
+derlenmiş kuralları kullanır.
+
+Kural biçimi:
+- 'name': kuralın adı (profiller aynı adlı kuralı değiştirir)
+- 'category': uyarının türü (CATEGORY_FLAGS anahtarlarından biri)
+- 'ids': öznitelik ID'lerinin listesi veya tüm öznitelikler için "*"
+- 'name_contains': adında bu metin geçen öznitelikler de kurala girer
+- 'levels': sırayla denenen seviyeler; ilk tutan seviyenin 'penalty' cezası düşülür ve 'warning'
+  uyarısı eklenir. 'when' koşullarının hepsi tutmalıdır: [alan, işlem, sayı veya alan]
+
+Profiller ('profiles') disk bilgisindeki alanlara ('Model Family', 'Device Model') düzenli ifadeyle
+eşleşir; ilk eşleşen profilin kuralları varsayılan kurallara uygulanır.
+
+'trends' bölümü okuma geçmişinden hızlı bozulma tespitinin ayarlarıdır (bkz. zeus_core.trends).
+"""
+import os
+import re
+import sys
+import json
+import math
+import operator
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "health_rules.json")
+
+# Koşullarda kullanılabilecek öznitelik alanları
+RULE_FIELDS = ('id', 'current', 'worst', 'threshold', 'raw_value')
+
+# operator işlevleri hem sayılarla hem NumPy dizileriyle çalışır (bkz. batch_scoring)
+RULE_OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+# Uyarı türleri ve toplu puanlamadaki warning_flags bitleri
+CATEGORY_FLAGS = {
+    'threshold': 0x01,
+    'critical_raw': 0x02,
+    'temperature': 0x04,
+    'wear_leveling': 0x08,
+    'media_wearout': 0x10,
+    'other': 0x80,
+}
+
+# Uyarı metninin derlenirken denendiği örnek değerler
+_WARNING_SAMPLE = {'name': "Ornek", 'id': 0, 'current': 0, 'worst': 0, 'threshold': 0, 'raw_value': 0}
+
+
+class RuleError(ValueError):
+    """Kural dosyası okunamadığında veya kurallar geçersiz olduğunda."""
+
+
+class RuleCheck:
+    """
+    Bir koşul: alan işlem (sayı veya diğer alan). Skaler puanlamada Python ifadesine derlenir,
+    toplu puanlamada compare işlevi NumPy dizilerine uygulanır.
+    """
+
+    __slots__ = ('field', 'op', 'compare', 'other_field', 'value')
+
+    def __init__(self, condition):
+        if not isinstance(condition, (list, tuple)) or len(condition) != 3:
+            raise RuleError(f"Koşul [alan, işlem, değer] biçiminde olmalı: {condition!r}")
+        field, op, value = condition
+        if field not in RULE_FIELDS:
+            raise RuleError(f"Bilinmeyen alan: {field!r} (geçerli alanlar: {', '.join(RULE_FIELDS)})")
+        if op not in RULE_OPERATORS:
+            raise RuleError(f"Bilinmeyen işlem: {op!r}")
+        self.field = field
+        self.op = op
+        self.compare = RULE_OPERATORS[op]
+        self.other_field = self.value = None
+        if isinstance(value, str):
+            if value not in RULE_FIELDS:
+                raise RuleError(f"Bilinmeyen alan: {value!r}")
+            self.other_field = value
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+            self.value = value
+        else:
+            raise RuleError(f"Karşılaştırma değeri sayı veya alan adı olmalı: {value!r}")
+
+    def expression(self):
+        """Koşulun Python ifadesi; alan ve işlemler yukarıdaki listelerden geldiği için güvenlidir."""
+        other = repr(self.value) if self.other_field is None else f"attr.{self.other_field}"
+        return f"attr.{self.field} {self.op} {other}"
+
+
+class RuleLevel:
+    """Kuralın bir seviyesi: koşullar, ceza ve uyarı metni."""
+
+    __slots__ = ('checks', 'penalty', 'warning')
+
+    def __init__(self, config):
+        conditions = config.get('when')
+        if not isinstance(conditions, list) or not conditions:
+            raise RuleError("Her seviyede en az bir 'when' koşulu olmalı.")
+        self.checks = tuple(RuleCheck(condition) for condition in conditions)
+        self.penalty = config.get('penalty', 0)
+        if not isinstance(self.penalty, int) or isinstance(self.penalty, bool):
+            raise RuleError(f"Ceza tamsayı olmalı: {self.penalty!r}")
+        self.warning = config.get('warning', "")
+        try:
+            self.warning.format(**_WARNING_SAMPLE)
+        except (AttributeError, KeyError, IndexError, ValueError) as e:
+            raise RuleError(f"Geçersiz uyarı metni {self.warning!r}: {e}") from e
+
+    def expression(self):
+        return " and ".join(f"({check.expression()})" for check in self.checks)
+
+    def format_warning(self, attr):
+        return self.warning.format(name=attr.name, id=attr.id, current=attr.current, worst=attr.worst,
+                                   threshold=attr.threshold, raw_value=attr.raw_value)
+
+
+class HealthRule:
+    """Derlenmiş kural: hangi özniteliklere uygulandığı ve sırayla denenen seviyeleri."""
+
+    __slots__ = ('name', 'category', 'flag', 'ids', 'name_contains', 'levels', 'first_match')
+
+    def __init__(self, config):
+        if not isinstance(config, dict) or not config.get('name'):
+            raise RuleError(f"Kuralın adı olmalı: {config!r}")
+        self.name = config['name']
+        self.category = config.get('category', 'other')
+        if self.category not in CATEGORY_FLAGS:
+            raise RuleError(f"'{self.name}' kuralında bilinmeyen tür: {self.category!r}")
+        self.flag = CATEGORY_FLAGS[self.category]
+        ids = config.get('ids', [])
+        if ids == "*":
+            self.ids = None # Tüm öznitelikler
+        elif isinstance(ids, list) and all(isinstance(i, int) for i in ids):
+            self.ids = frozenset(ids)
+        else:
+            raise RuleError(f"'{self.name}' kuralında 'ids' tamsayı listesi veya \"*\" olmalı.")
+        self.name_contains = config.get('name_contains') or None
+        if self.ids is not None and not self.ids and self.name_contains is None:
+            raise RuleError(f"'{self.name}' kuralı hiçbir özniteliğe uygulanmıyor ('ids' veya 'name_contains' gerekli).")
+        levels = config.get('levels')
+        if not isinstance(levels, list) or not levels:
+            raise RuleError(f"'{self.name}' kuralında en az bir seviye ('levels') olmalı.")
+        try:
+            self.levels = tuple(RuleLevel(level) for level in levels)
+        except RuleError as e:
+            raise RuleError(f"'{self.name}' kuralı: {e}") from e
+        self.first_match = self._compile_levels()
+
+    def applies_to(self, attr_id, name):
+        return (self.ids is None or attr_id in self.ids
+                or (self.name_contains is not None and self.name_contains in name))
+
+    def _compile_levels(self):
+        """
+        Seviyeleri tek bir işleve derler: first_match(attr) özniteliğin tuttuğu ilk seviyeyi, hiçbiri
+        tutmazsa None döndürür. Her öznitelikte koşul başına ayrı işlev çağrısı yapılmaz.
+        """
+        source = "lambda attr: " + "".join(f"levels[{i}] if {level.expression()} else "
+                                           for i, level in enumerate(self.levels)) + "None"
+        return eval(compile(source, f"<kural {self.name}>", 'eval'), {'__builtins__': {}, 'levels': self.levels})
+
+
+def _compile_evaluator(rules):
+    """
+    Bir özniteliğe uygulanan kuralları tek bir işleve derler: evaluate(attr, warnings) tutan her
+    kuralın ilk seviyesinin uyarısını listeye ekler ve toplam cezayı döndürür.
+    """
+    namespace = {'__builtins__': {}}
+    lines = ["def evaluate(attr, warnings):", "    penalty = 0"]
+    for r, rule in enumerate(rules):
+        for l, level in enumerate(rule.levels):
+            namespace[f"warning_{r}_{l}"] = level.format_warning
+            lines.append(f"    {'elif' if l else 'if'} {level.expression()}:")
+            lines.append(f"        penalty += {level.penalty}")
+            lines.append(f"        warnings.append(warning_{r}_{l}(attr))")
+    lines.append("    return penalty")
+    exec(compile("\n".join(lines), "<sağlık kuralları>", 'exec'), namespace)
+    return namespace['evaluate']
+
+
+class RuleSet:
+    """
+    Bir disk ailesi için geçerli kurallar. Dağıtım tablosu (ID, ad) ikilisini o özniteliğe uygulanan
+    kuralların derlenmiş değerlendiricisine eşler; böylece puanlamada her öznitelik için tek sözlük
+    araması ve tek işlev çağrısı yapılır. Kurallar ada göre de eşleşebildiği (ör. adında "Temperature"
+    geçenler) için tablo bir (ID, ad) ikilisi ilk görüldüğünde doldurulur; aynı kural demetini
+    paylaşan ikililer aynı değerlendiriciyi kullanır.
+    """
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        self._rules_for = {}
+        self._evaluators = {}
+        self._compiled = {}
+
+    def rules_for(self, attr_id, name):
+        """Özniteliğe uygulanan kuralları yapılandırmadaki sırayla döndürür."""
+        key = (attr_id, name)
+        rules = self._rules_for.get(key)
+        if rules is None:
+            rules = self._rules_for[key] = tuple(rule for rule in self.rules if rule.applies_to(attr_id, name))
+        return rules
+
+    def _evaluator(self, key):
+        rules = self.rules_for(*key)
+        evaluate = self._compiled.get(rules)
+        if evaluate is None:
+            evaluate = self._compiled[rules] = _compile_evaluator(rules)
+        self._evaluators[key] = evaluate
+        return evaluate
+
+    def check(self, attr):
+        """Öznitelikte tutan (kural, seviye) ikililerini döndürür."""
+        hits = []
+        for rule in self.rules_for(attr.id, attr.name):
+            level = rule.first_match(attr)
+            if level is not None:
+                hits.append((rule, level))
+        return hits
+
+    def score(self, attributes):
+        """Özniteliklerden puanı (0-100) ve uyarıların listesini hesaplar."""
+        score = 100
+        warnings = []
+        evaluators = self._evaluators
+        for attr in attributes:
+            key = (attr.id, attr.name)
+            evaluate = evaluators.get(key)
+            if evaluate is None:
+                evaluate = self._evaluator(key)
+            score -= evaluate(attr, warnings)
+        return max(0, min(100, score)), warnings # Puanı 0-100 arasına sıkıştır
+
+
+def _compile_rules(configs):
+    if not isinstance(configs, list):
+        raise RuleError("'rules' bir liste olmalı.")
+    rules = [HealthRule(config) for config in configs]
+    names = [rule.name for rule in rules]
+    if len(set(names)) != len(names):
+        raise RuleError("Aynı adla birden fazla kural tanımlanmış.")
+    return rules
+
+
+def _apply_profile(rules, profile_rules, disabled):
+    """Profilin kurallarını varsayılan kurallara uygular: aynı adlı kural yerinde değişir, yenileri sona eklenir."""
+    replacements = {rule.name: rule for rule in profile_rules}
+    merged = [replacements.pop(rule.name, rule) for rule in rules if rule.name not in disabled]
+    merged.extend(rule for rule in profile_rules if rule.name in replacements)
+    return merged
+
+
+class TrendSettings:
+    """
+    Eğilim (hızlı bozulma) ayarları:
+    - 'ids': raw değeri bozulmayla artan sayaç öznitelikleri (yeniden atanan/bekleyen sektörler vb.)
+    - 'window_days': artışların toplandığı pencere (gün); eski artışların ağırlığı bu sürede e'ye bölünür
+    - 'min_increase': penceredeki artış en az bu kadarsa disk "hızla kötüleşiyor" sayılır
+    """
+
+    __slots__ = ('attribute_ids', 'window_days', 'min_increase')
+
+    def __init__(self, config):
+        if not isinstance(config, dict):
+            raise RuleError("'trends' bir JSON nesnesi olmalı.")
+        ids = config.get('ids', [])
+        if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+            raise RuleError("'trends' bölümünde 'ids' tamsayı listesi olmalı.")
+        self.attribute_ids = frozenset(ids)
+        self.window_days = config.get('window_days', 7)
+        self.min_increase = config.get('min_increase', 5)
+        for key, value in (('window_days', self.window_days), ('min_increase', self.min_increase)):
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or not value > 0:
+                raise RuleError(f"'trends' bölümünde '{key}' pozitif bir sayı olmalı.")
+
+
+class RuleEngine:
+    """Kural dosyasının derlenmiş hali; diske göre (profil) kural kümesini seçer."""
+
+    def __init__(self, config, source=None):
+        self.source = source
+        if not isinstance(config, dict):
+            raise RuleError("Kural dosyası bir JSON nesnesi olmalı.")
+        base_rules = _compile_rules(config.get('rules'))
+        self.default = RuleSet(base_rules)
+        self.trends = TrendSettings(config.get('trends', {}))
+        self.profiles = []
+        for profile in config.get('profiles', []):
+            if not isinstance(profile, dict):
+                raise RuleError(f"Profil bir JSON nesnesi olmalı: {profile!r}")
+            name = profile.get('name', "?")
+            match = profile.get('match')
+            if not isinstance(match, dict) or not match:
+                raise RuleError(f"'{name}' profilinde 'match' alanı olmalı.")
+            try:
+                patterns = [(field, re.compile(pattern)) for field, pattern in match.items()]
+            except (re.error, TypeError) as e:
+                raise RuleError(f"'{name}' profilinde geçersiz düzenli ifade: {e}") from e
+            rules = _apply_profile(base_rules, _compile_rules(profile.get('rules', [])),
+                                   set(profile.get('disabled_rules', [])))
+            self.profiles.append((name, patterns, RuleSet(rules)))
+        self._selected = {}
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            raise RuleError(f"Kural dosyası okunamadı ({path}): {e}") from e
+        return cls(config, path)
+
+    @staticmethod
+    def _profile_matches(patterns, disk_info):
+        for field, pattern in patterns:
+            value = disk_info.get(field)
+            if value and pattern.search(value):
+                return True
+        return False
+
+    def rule_set_for(self, disk_info):
+        """Disk bilgisine ('Model Family', 'Device Model') göre kural kümesini döndürür."""
+        if not disk_info or not self.profiles:
+            return self.default
+        key = tuple(disk_info.get(field) for field in ('Model Family', 'Device Model'))
+        rule_set = self._selected.get(key)
+        if rule_set is None:
+            rule_set = self.default
+            for _, patterns, profile_rules in self.profiles:
+                if self._profile_matches(patterns, disk_info):
+                    rule_set = profile_rules
+                    break
+            self._selected[key] = rule_set
+        return rule_set
+
+
+def get_rules_path():
+    """Kural dosyasının yolu; ZEUS_HEALTH_RULES ile değiştirilebilir."""
+    return os.environ.get('ZEUS_HEALTH_RULES') or DEFAULT_RULES_PATH
+
+
+_rule_engine = None
+
+
+def get_rule_engine():
+    """
+    Süreç boyunca paylaşılan RuleEngine örneğini döndürür. Kullanıcının verdiği dosya geçersizse
+    uyarı yazılır ve programla gelen kurallar kullanılır.
+    """
+    global _rule_engine
+    if _rule_engine is None:
+        path = get_rules_path()
+        try:
+            _rule_engine = RuleEngine.load(path)
+        except RuleError as e:
+            if path == DEFAULT_RULES_PATH:
+                raise
+            print(f"Uyarı: {e}. Varsayılan kurallar kullanılıyor.", file=sys.stderr)
+            _rule_engine = RuleEngine.load(DEFAULT_RULES_PATH)
+    return _rule_engine
+
+
+def reload_rule_engine():
+    """
+    Kural dosyasını yeniden okur (ör. arka plan kipinde SIGHUP ile). Dosya geçersizse RuleError
+    fırlatılır ve önceki kurallar kullanılmaya devam eder.
+    """
+    global _rule_engine
+    _rule_engine = RuleEngine.load(get_rules_path())
+    return _rule_engine
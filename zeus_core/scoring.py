@@ -0,0 +1,56 @@
+"""
+SMART özniteliklerinden 0-100 arası sağlık puanı ve durum derecesi hesaplanması.
+
+Renk/arayüz bilgisi içermez; GUI durumu renkli bir etikete, konsol colorama koduna çevirir.
+Puanlama kuralları zeus_core/health_rules.json dosyasından yüklenir (bkz. zeus_core.rules).
+"""
+from zeus_core.rules import get_rule_engine
+
+# (en düşük puan, durum, not): puan en düşük değere eşit veya büyükse o derece verilir
+HEALTH_GRADES = (
+    (85, "MÜKEMMEL", "Disk durumu MÜKEMMEL. Herhangi bir işlem gerekli değildir."),
+    (70, "İYİ", "Disk durumu İYİ. Bazı önemsiz uyarılar mevcut olabilir. Düzenli kontrol önerilir."),
+    (60, "ORTA", "Disk durumu ORTA. Bazı sorunlar tespit edildi. Verilerinizi yedeklemeniz ve diski gözlemlemeniz önerilir."),
+    (0, "KÖTÜ / KRİTİK", "Disk durumu KÖTÜ veya KRİTİK. Acil yedekleme yapın ve diski değiştirin. Veri kaybı riski çok yüksek!"),
+)
+
+# SMART verisine erişilemeyen diskler için
+UNKNOWN_SCORE = "Bilinmiyor"
+UNKNOWN_STATUS = "BİLİNMİYOR"
+UNKNOWN_NOTES = "Aygıtın SMART verilerine erişilemediği için sağlık durumu bilinmiyor."
+
+
+def score_attributes(attributes, disk_info=None):
+    """
+    Özniteliklerden (SmartAttribute listesi veya SmartSnapshot) puanı (0-100) ve
+    tespit edilen uyarıların listesini hesaplar. Kurallar disk bilgisine göre (model ailesi) seçilir;
+    disk_info verilmezse SmartSnapshot'ın kendi disk bilgisi kullanılır.
+    """
+    if disk_info is None:
+        disk_info = getattr(attributes, 'info', None)
+    return get_rule_engine().rule_set_for(disk_info).score(attributes)
+
+
+def health_grade(score):
+    """Puana karşılık gelen (durum, not) ikilisini döndürür."""
+    for min_score, health_status, notes in HEALTH_GRADES:
+        if score >= min_score:
+            return health_status, notes
+    return HEALTH_GRADES[-1][1], HEALTH_GRADES[-1][2]
+
+
+def format_health_notes(notes, warnings):
+    """Derece notunun altına uyarıları madde madde ekler."""
+    if not warnings:
+        return notes
+    return notes + "\n\nTespit Edilen Uyarılar:\n" + "\n".join([f"- {w}" for w in warnings])
+
+
+def calculate_health_score(attributes, disk_info):
+    """
+    SMART özniteliklerine göre basit bir sağlık puanı hesaplar (0-100).
+    (puan, durum, notlar) döndürür; notlar derece açıklamasını ve uyarıları içerir.
+    """
+    score, warnings = score_attributes(attributes, disk_info)
+    health_status, notes = health_grade(score)
+    return score, health_status, format_health_notes(notes, warnings)
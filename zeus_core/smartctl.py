@@ -0,0 +1,140 @@
+"""
+smartctl çağrısı ve çıktısının yorumlanmasıyla ilgili, GUI ve konsolun ortak kullandığı yardımcılar.
+"""
+import json
+import os
+import subprocess
+
+# smartctl'nin --json desteği: None = henüz bilinmiyor, True/False = denendi
+SMARTCTL_JSON_SUPPORTED = None
+
+# -n standby: disk bekleme/uyku kipindeyse smartctl diski döndürmeden çıkar
+STANDBY_CHECK_ARGS = ['-n', 'standby']
+STANDBY_MESSAGES = ("Device is in STANDBY mode", "Device is in SLEEP mode")
+
+# Son çözülen JSON çıktısı; aynı çıktı hem öznitelik hem bilgi ayrıştırmasında kullanıldığı için bir kez çözülür
+_last_smart_json = (None, None)
+
+
+def is_smart_json(smart_output):
+    """smartctl çıktısının JSON (-j) biçiminde (veya yerel arka ucun sözlüğü) olup olmadığını kontrol eder."""
+    if isinstance(smart_output, dict):
+        return True
+    return smart_output.lstrip().startswith("{")
+
+
+def load_smart_json(smart_output):
+    """smartctl -j çıktısını sözlüğe çevirir. Aynı çıktı art arda verilirse tekrar çözülmez."""
+    global _last_smart_json
+    if isinstance(smart_output, dict):
+        return smart_output # Yerel arka uç sonucu zaten çözülmüş durumda
+    cached_output, cached_data = _last_smart_json
+    if cached_output is smart_output:
+        return cached_data
+    data = json.loads(smart_output)
+    _last_smart_json = (smart_output, data)
+    return data
+
+
+def standby_check_enabled():
+    """
+    Bekleme kipindeki disklerin uyandırılmaması istenip istenmediğini döndürür (varsayılan: evet).
+    ZEUS_WAKE_STANDBY=1 ile diskler her okumada uyandırılır.
+    """
+    return os.environ.get('ZEUS_WAKE_STANDBY', '') not in ('1', 'yes', 'true')
+
+
+def smartctl_command(disk_path, dev_type, use_json):
+    """Tek seferlik okuma için smartctl komut satırını oluşturur."""
+    standby_args = STANDBY_CHECK_ARGS if standby_check_enabled() else []
+    return ['smartctl', '-a'] + (['-j'] if use_json else []) + standby_args + ['-d', dev_type, disk_path]
+
+
+def smartctl_in_standby(smart_output):
+    """smartctl diski bekleme/uyku kipinde bulduğu için okumayı atladıysa True döndürür."""
+    if isinstance(smart_output, dict):
+        return False
+    return any(message in smart_output for message in STANDBY_MESSAGES)
+
+
+def json_attempt_failed(returncode, smart_output):
+    """
+    -j ile yapılan denemenin, smartctl bu seçeneği tanımadığı için başarısız olup olmadığını söyler.
+    Öyleyse SMARTCTL_JSON_SUPPORTED False yapılır ve çağıran metin kipinde yeniden dener.
+    """
+    global SMARTCTL_JSON_SUPPORTED
+    if is_smart_json(smart_output):
+        SMARTCTL_JSON_SUPPORTED = True
+        return False
+    if returncode & 0x01:
+        SMARTCTL_JSON_SUPPORTED = False # Komut satırı hatası: -j desteklenmiyor
+        return True
+    return False
+
+
+def json_mode_enabled():
+    """smartctl'nin -j ile çalıştırılıp çalıştırılmayacağını döndürür."""
+    return SMARTCTL_JSON_SUPPORTED is not False
+
+
+def run_smartctl(disk_path, dev_type, timeout):
+    """
+    Diski tek bir 'smartctl -a' çağrısıyla okur. smartctl --json destekliyorsa -j ile çalıştırılır;
+    eski smartmontools sürümleri -j seçeneğini tanımazsa aynı tip metin çıktısıyla yeniden denenir.
+    (returncode, çıktı, stderr) döndürür.
+    """
+    if json_mode_enabled():
+        result = subprocess.run(smartctl_command(disk_path, dev_type, True), stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout)
+        smart_output = result.stdout.decode('utf-8', errors='ignore')
+        if not json_attempt_failed(result.returncode, smart_output):
+            return result.returncode, smart_output, result.stderr.decode('utf-8', errors='ignore')
+    result = subprocess.run(smartctl_command(disk_path, dev_type, False), stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout)
+    return result.returncode, result.stdout.decode('utf-8', errors='ignore'), result.stderr.decode('utf-8', errors='ignore')
+
+
+def smartctl_error_detail(smart_output, stderr_output):
+    """smartctl hata çıktısından okunabilir bir açıklama çıkarır (JSON ise mesaj listesinden)."""
+    if is_smart_json(smart_output):
+        try:
+            messages = load_smart_json(smart_output).get("smartctl", {}).get("messages", [])
+            detail = " ".join(m.get("string", "") for m in messages).strip()
+            if detail:
+                return detail
+        except ValueError:
+            pass
+    return stderr_output.strip() or smart_output.strip()
+
+
+def smart_support_disabled(info_output):
+    """Disk bilgisinde SMART desteğinin kapalı olduğu bildiriliyorsa True döndürür."""
+    if is_smart_json(info_output):
+        return load_smart_json(info_output).get("smart_support", {}).get("enabled") is False
+    return "SMART support is: Disabled" in info_output or "SMART Disabled" in info_output
+
+
+def split_smart_output(smart_output):
+    """
+    Tek seferde alınan 'smartctl -a' çıktısını (öznitelik bölümü, bilgi bölümü) olarak ikiye ayırır.
+    """
+    if is_smart_json(smart_output):
+        return smart_output, smart_output # JSON çıktısı her iki ayrıştırıcıya da olduğu gibi verilir
+    info_start = smart_output.find("=== START OF INFORMATION SECTION ===")
+    if info_start == -1:
+        return smart_output, smart_output
+    data_start = smart_output.find("=== START OF", info_start + 1)
+    if data_start == -1:
+        return "", smart_output
+    return smart_output[data_start:], smart_output[:data_start]
+
+
+def smartctl_output_usable(returncode, smart_output):
+    """
+    smartctl çıkış kodunu değerlendirir.
+    Bit 0-1 kesin hatadır; bit 2 ancak bilgi bölümü de yoksa hata sayılır.
+    Diğer bitler diskin durumunu bildirir, veri geçerlidir.
+    """
+    if returncode & 0x03:
+        return False
+    if returncode & 0x04 and "=== START OF INFORMATION SECTION ===" not in smart_output and '"model_name"' not in smart_output:
+        return False
+    return True
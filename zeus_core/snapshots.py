@@ -0,0 +1,100 @@
+"""
+Her diskin son başarılı SMART okumasını kalıcı olarak saklar.
+
+Disk bekleme (standby) kipindeyken onu uyandırmak yerine bu kayıt gösterilir; böylece
+soğuk arşiv diskleri her yoklamada döndürülmez.
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+
+from zeus_core.probe_cache import get_cache_dir
+
+SNAPSHOT_DIR = "snapshots"
+
+# Veri döndürülürken üçüncü alanda verilen bilgi notunun başı (hata değil, verinin eski olduğunu bildirir)
+STANDBY_NOTE = "Disk bekleme (standby) modunda, uyandırılmadı."
+
+
+def snapshot_key(disk_path, identity):
+    """Kaydın anahtarı: kalıcı disk kimliği, bulunamazsa disk yolu."""
+    return identity or disk_path
+
+
+class SnapshotStore:
+    """
+    Son okumaları disk başına ayrı bir JSON dosyasında tutar; bir diskin kaydı yazılırken
+    diğer disklerin dosyalarına dokunulmaz.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.path.join(get_cache_dir(), SNAPSHOT_DIR)
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".json")
+
+    def save(self, key, attributes_output, info_output):
+        """Başarılı bir okumayı kaydeder. Metin çıktısı, smartctl -j metni veya yerel arka uç sözlüğü olabilir."""
+        snapshot = {
+            'key': key,
+            'timestamp': time.time(),
+            'attributes_output': attributes_output,
+            'info_output': info_output,
+        }
+        path = self._path(key)
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp_path, path)
+            except OSError:
+                pass # Kayıt yazılamazsa (salt okunur sistem, yetki yok) sessizce devam et
+
+    def load(self, key):
+        """Diskin son kaydını döndürür, yoksa None."""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get('key') != key:
+            return None
+        return snapshot
+
+
+_snapshot_store = None
+
+
+def get_snapshot_store():
+    """Süreç boyunca paylaşılan SnapshotStore örneğini döndürür."""
+    global _snapshot_store
+    if _snapshot_store is None:
+        _snapshot_store = SnapshotStore()
+    return _snapshot_store
+
+
+def remember_smart_data(disk_path, identity, attributes_output, info_output):
+    """Başarılı okumayı, disk ileride bekleme kipine geçerse gösterilmek üzere kaydeder."""
+    get_snapshot_store().save(snapshot_key(disk_path, identity), attributes_output, info_output)
+
+
+def standby_result(disk_path, identity):
+    """
+    Bekleme kipindeki disk için get_smart_data üçlüsünü oluşturur: son kayıt varsa veriler ve
+    STANDBY_NOTE ile başlayan bir not, yoksa yalnızca açıklayıcı bir hata.
+    """
+    snapshot = get_snapshot_store().load(snapshot_key(disk_path, identity))
+    if snapshot is None:
+        return None, None, f"{STANDBY_NOTE} '{disk_path}' için daha önce kaydedilmiş SMART verisi yok."
+    stamp = time.strftime("%d.%m.%Y %H:%M", time.localtime(snapshot['timestamp']))
+    return snapshot['attributes_output'], snapshot['info_output'], f"{STANDBY_NOTE} {stamp} tarihli son okuma gösteriliyor."
+
+
+def is_standby_note(message):
+    """get_smart_data'nın üçüncü alanı bekleme kipi notu ise True döndürür."""
+    return bool(message) and message.startswith(STANDBY_NOTE)
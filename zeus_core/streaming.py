@@ -0,0 +1,84 @@
+"""
+smartctl metin çıktısının, süreç çalışırken gelen parçalarından artımlı ayrıştırılması.
+
+Yavaş USB köprülerinde smartctl'nin bitmesi saniyeler sürebilir; smartctl her satırı yazar yazmaz
+boşalttığı (flush) için disk bilgileri ve öznitelik satırları geldikçe gösterilebilir. Olaylar sözlüktür:
+
+- {'event': 'attempt', 'device_type': ...}: yeni bir aygıt tipiyle okuma başladı, önceki olaylar geçersiz
+- {'event': 'info', 'key': ..., 'value': ...}: parse_smart_info anahtarlarıyla bir disk bilgisi; bilgi
+  bölümü bitince hepsi birlikte bildirilir (aynı alan birden çok satırda geçebilir: "SMART support is:
+  Available" ardından "Enabled"), smartctl bu bölümü tek seferde yazdığından gecikme yok denecek kadar azdır
+- {'event': 'attribute', 'attribute': SmartAttribute}: öznitelik tablosunun bir satırı
+
+Akış yalnızca gösterim içindir: okuma bitince tam çıktı her zamanki gibi ayrıştırılır ve puanlanır.
+smartctl -j tüm belgeyi sonda yazdığından akışlı okumalar metin kipinde yapılır; NVMe diskleri hızlı
+yanıt verdiği, öznitelik tablosu olmadığı ve -j çıktısı daha fazla bilgi içerdiği için akışa alınmaz.
+"""
+import os
+
+from zeus_core.parsing import BYTES_TABLE_PATTERNS, attribute_from_match, parse_smart_info
+
+INFO_SECTION_MARKER = b"=== START OF INFORMATION SECTION ==="
+SECTION_MARKER = b"=== START OF"
+
+
+def streaming_supported(disk_path, dev_type):
+    """Disk bu aygıt tipiyle akışlı (metin kipinde) okunacaksa True döndürür."""
+    return dev_type != 'nvme' and not os.path.basename(disk_path).startswith('nvme')
+
+
+def attempt_event(dev_type):
+    return {'event': 'attempt', 'device_type': dev_type}
+
+
+class SmartStreamParser:
+    """
+    smartctl -a metin çıktısını parça parça alır; feed() tamamlanan satırlardan üretilen olayların
+    listesini döndürür. Bölümler split_smart_output ile aynı ayrılır: bilgi bölümünden disk bilgileri,
+    veri bölümündeki öznitelik tablosundan satırlar çıkarılır.
+    """
+
+    def __init__(self):
+        self.pending = b""
+        self.section = 'info' # 'info' -> 'data' -> 'table' -> 'done'
+        self.info = {}
+
+    def feed(self, chunk):
+        lines = (self.pending + chunk).split(b"\n")
+        self.pending = lines.pop() # Yarım kalan son satır sonraki parçayla tamamlanır
+        events = []
+        for line in lines:
+            self._parse_line(line, events)
+        return events
+
+    def close(self):
+        """Çıktı bittiğinde satır sonu olmadan kalan son satırı ve henüz bildirilmemiş disk bilgilerini işler."""
+        events = []
+        if self.pending:
+            self._parse_line(self.pending, events)
+            self.pending = b""
+        if self.section == 'info': # Veri bölümü hiç gelmedi (ör. bekleme kipi, hata)
+            self._finish_info(events)
+        return events
+
+    def _finish_info(self, events):
+        for key, value in self.info.items():
+            events.append({'event': 'info', 'key': key, 'value': value})
+
+    def _parse_line(self, line, events):
+        header_pattern, row_pattern, _, end_markers = BYTES_TABLE_PATTERNS
+        if self.section == 'info':
+            if line.startswith(SECTION_MARKER) and not line.startswith(INFO_SECTION_MARKER):
+                self.section = 'data'
+                self._finish_info(events)
+                return
+            self.info.update(parse_smart_info(line.decode('utf-8', errors='ignore')))
+        elif self.section == 'data':
+            if header_pattern.search(line):
+                self.section = 'table'
+        elif self.section == 'table':
+            match = row_pattern.match(line)
+            if match is not None:
+                events.append({'event': 'attribute', 'attribute': attribute_from_match(match)})
+            elif not line.strip() or any(marker in line for marker in end_markers):
+                self.section = 'done'
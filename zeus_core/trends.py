@@ -0,0 +1,91 @@
+"""
+Okuma geçmişinden sayaç özniteliklerinin eğilimi ve hızlı bozulma tespiti.
+
+Anlık puanlama yalnızca son okumayı görür: yeniden atanan sektör sayısı bir gecede 0'dan 40'a çıkan
+disk ile yıllardır 1'de duran disk aynı cezayı alır. Burada her disk ve izlenen öznitelik (ayarlar
+zeus_core/health_rules.json 'trends' bölümünde) için küçük bir özet tutulur ve her yeni okumada
+artımlı olarak güncellenir; geçmişin tamamı yeniden okunmaz (özetler zeus_core.history'de saklanır).
+
+Özet (durum) demeti: (ilk raw, ilk zaman, son raw, son zaman, yakın artış, değişim zamanı)
+- yakın artış: artışların üstel ağırlıklı toplamı; her artış 'window_days' günde e'ye bölünür, yani
+  yaklaşık son pencerede görülen artıştır
+- değişim zamanı: sayacın, durağan geçen bir dönemden sonra yeniden artmaya başladığı okuma
+"""
+import math
+import time
+
+DEGRADING_STATUS = "HIZLA KÖTÜLEŞİYOR"
+
+# Yakın artış bu değerin altındaysa sayaç durağan sayılır; sonraki artış yeni bir değişim noktasıdır
+STABLE_LIMIT = 0.5
+
+
+def new_trend_state(raw_value, taken_at):
+    return (raw_value, taken_at, raw_value, taken_at, 0.0, None)
+
+
+def update_trend_state(state, raw_value, taken_at, window_days):
+    """
+    Özeti yeni okumayla günceller ve yeni demeti döndürür. Eski tarihli okumalar özeti değiştirmez;
+    sayaç azalmışsa (disk/bellenim sıfırladı) özet yeniden başlatılır.
+    """
+    if state is None:
+        return new_trend_state(raw_value, taken_at)
+    first_raw, first_at, last_raw, last_at, recent_increase, change_at = state
+    if taken_at <= last_at:
+        return state
+    increase = raw_value - last_raw
+    if increase < 0:
+        return new_trend_state(raw_value, taken_at)
+    recent_increase *= math.exp(-(taken_at - last_at) / (window_days * 86400))
+    if increase > 0 and recent_increase < STABLE_LIMIT:
+        change_at = taken_at
+    return (first_raw, first_at, raw_value, taken_at, recent_increase + increase, change_at)
+
+
+def _format_time(timestamp):
+    return time.strftime("%d.%m.%Y %H:%M", time.localtime(timestamp))
+
+
+def evaluate_trends(states, settings, names=None):
+    """
+    Diskin özetlerinden eğilim raporu oluşturur (değerler diskin son okumasındaki haliyle). Sözlük:
+    - 'degrading': en az bir öznitelik hızla artıyorsa True
+    - 'attributes': öznitelik başına id, name, raw_value, recent_increase, rate_per_day,
+      total_increase, since, change_at, degrading
+    - 'warnings': hızla artan öznitelikler için uyarı metinleri
+    """
+    names = names or {}
+    attributes, warnings = [], []
+    for attr_id in sorted(states):
+        if attr_id not in settings.attribute_ids:
+            continue # Ayarlardan çıkarılmış öznitelik
+        first_raw, first_at, last_raw, last_at, recent_increase, change_at = states[attr_id]
+        degrading = recent_increase >= settings.min_increase
+        attribute = {
+            'id': attr_id,
+            'name': names.get(attr_id, f"ID {attr_id}"),
+            'raw_value': last_raw,
+            'recent_increase': round(recent_increase, 1),
+            'rate_per_day': round(recent_increase / settings.window_days, 2),
+            'total_increase': last_raw - first_raw,
+            'since': first_at,
+            'change_at': change_at,
+            'degrading': degrading,
+        }
+        attributes.append(attribute)
+        if degrading:
+            warning = (f"'{attribute['name']}' (ID:{attr_id}) hızla artıyor: son {settings.window_days:g} günde "
+                       f"+{recent_increase:.0f} (günde ~{attribute['rate_per_day']:g}), şu an {last_raw}.")
+            if change_at is not None:
+                warning += f" Artış {_format_time(change_at)} tarihinde başladı."
+            warnings.append(warning)
+    return {'degrading': bool(warnings), 'attributes': attributes, 'warnings': warnings}
+
+
+def format_trend_notes(notes, trend):
+    """Hızlı bozulma uyarılarını notların altına ekler (scoring.format_health_notes gibi)."""
+    if not trend or not trend['warnings']:
+        return notes
+    return (notes + f"\n\nDisk {DEGRADING_STATUS} (son okumalara göre):\n"
+            + "\n".join([f"- {w}" for w in trend['warnings']]))